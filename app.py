@@ -6,6 +6,7 @@ this script wires the pieces together. Run with ``streamlit run app.py``.
 import streamlit as st
 
 from ui.config_tabs import load_demo_data_once, render_application
+from ui.memory import enforce_session_budget
 from ui.state import init_session_state, show_flash
 from ui.theme import apply_app_theme, render_hero
 
@@ -37,3 +38,4 @@ if test_mode:
     load_demo_data_once()
 
 render_application()
+enforce_session_budget()
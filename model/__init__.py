@@ -1,5 +1,9 @@
-from .optimiser import build_schedule, respects_min_gap
-from .fairness import format_fairness_log, calculate_points
+"""Scheduling model: configuration, solver, fairness and exports.
+
+The package re-exports its entry points lazily, so importing one submodule
+(``model.data_models``, say) does not load the solver and pandas with it.
+"""
+from importlib import import_module
 
 __all__ = [
     "build_schedule",
@@ -8,3 +12,22 @@ __all__ = [
     "calculate_points",
 ]
 
+_HOMES = {
+    "build_schedule": "optimiser",
+    "respects_min_gap": "optimiser",
+    "format_fairness_log": "fairness",
+    "calculate_points": "fairness",
+}
+
+
+def __getattr__(name: str):
+    home = _HOMES.get(name)
+    if home is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{home}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
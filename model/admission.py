@@ -0,0 +1,232 @@
+"""Process-wide admission control for concurrent solves.
+
+Every CP-SAT solve starts a multi-worker search. When several sessions press
+Generate at once, those searches oversubscribe the host's cores and every one
+of them reaches worse fairness in the same wall time. Instead, solves ask
+:func:`solve_admission` for a share of the cores before they start:
+
+* A solve is admitted while enough cores are free, and it is granted a
+  ``num_workers`` share. The free cores are split evenly over the solves
+  waiting for them, with a floor of ``min_share`` so that no search runs too
+  thin to make progress. A solve that finds nothing running gets the whole
+  box.
+* Excess solves wait in a queue that is fair across sessions. A solve's turn
+  is how many of its session's solves were already waiting or running when it
+  joined, and turns are served in order (ties by arrival). So a session that
+  queues several solves at once, or re-queues segment after segment, never
+  holds back another session's first.
+* Shares are fixed for a solve's lifetime. The chunked runner re-queues every
+  segment, so shares are re-dealt at segment boundaries as load changes.
+* A waiting ticket that stops polling (its tab was closed) is dropped after
+  ``stale_sec`` seconds.
+
+Standard library only; callers poll :meth:`SolveAdmission.try_admit` so a
+waiting UI stays responsive, and :meth:`SolveAdmission.admitted` blocks for
+headless callers.
+"""
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Mapping, NamedTuple
+
+__all__ = [
+    "AdmissionLoad",
+    "SolveAdmission",
+    "SolveTicket",
+    "batch_split",
+    "host_cores",
+    "solve_admission",
+]
+
+_DEFAULT_MIN_SHARE = 2   # CP-SAT's portfolio needs a few workers to be useful
+_DEFAULT_STALE_SEC = 30.0
+
+
+class SolveTicket:
+    """One solve's place in the queue, and its core share once admitted."""
+
+    __slots__ = ("id", "session", "last_seen", "workers", "turn", "arrival")
+
+    def __init__(self, ticket_id: int, session: str) -> None:
+        self.id = ticket_id
+        self.session = session
+        self.last_seen = time.monotonic()
+        self.workers: int | None = None
+        self.turn = 0
+        self.arrival = ticket_id
+
+    def __repr__(self) -> str:
+        return f"SolveTicket({self.id}, {self.session!r}, workers={self.workers})"
+
+
+class AdmissionLoad(NamedTuple):
+    """A snapshot of the scheduler for the Diagnostics workspace."""
+
+    capacity: int
+    cores_in_use: int
+    running: int
+    queued: int
+    sessions_waiting: int
+
+
+def host_cores(environ: Mapping[str, str] | None = None) -> int:
+    """Cores solves may use: ``SOLVE_MAX_CORES`` if set, else the CPUs this
+    process may run on."""
+    environ = os.environ if environ is None else environ
+    try:
+        configured = int(environ.get("SOLVE_MAX_CORES", "0"))
+    except ValueError:
+        configured = 0
+    if configured > 0:
+        return configured
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except AttributeError:  # pragma: no cover - not on Linux
+        return os.cpu_count() or 1
+
+
+def batch_split(
+    cores: int, jobs: int, requested: int | None = None,
+    *, min_share: int = _DEFAULT_MIN_SHARE,
+) -> tuple[int, int]:
+    """``(processes, num_workers)`` for running ``jobs`` solves side by side.
+
+    The same floor as admitted solves: every solve gets at least
+    ``min_share`` of the ``cores`` (all of them on a smaller host), so the
+    process count — ``requested``, or as many as that allows — is capped to
+    match and the cores are split evenly over it.
+    """
+    cores = max(1, cores)
+    floor = max(1, min(min_share, cores))
+    processes = max(1, min(requested or cores, cores // floor, jobs))
+    return processes, max(floor, cores // processes)
+
+
+class SolveAdmission:
+    """Hands out CPU shares to concurrent solves (see the module docstring)."""
+
+    def __init__(
+        self,
+        capacity: int | None = None,
+        *,
+        min_share: int = _DEFAULT_MIN_SHARE,
+        stale_sec: float = _DEFAULT_STALE_SEC,
+    ) -> None:
+        self.capacity = max(1, int(capacity if capacity is not None else host_cores()))
+        self.min_share = max(1, min(int(min_share), self.capacity))
+        self.stale_sec = stale_sec
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._waiting: List[SolveTicket] = []
+        self._running: Dict[int, SolveTicket] = {}
+
+    def enqueue(self, session: str) -> SolveTicket:
+        """Join the queue on behalf of ``session``."""
+        ticket = SolveTicket(next(self._ids), session)
+        with self._lock:
+            self._join(ticket)
+        return ticket
+
+    def _join(self, ticket: SolveTicket) -> None:
+        """Queue ``ticket`` behind its session's waiting and running solves."""
+        ahead = itertools.chain(self._waiting, self._running.values())
+        ticket.turn = sum(t.session == ticket.session for t in ahead)
+        ticket.arrival = next(self._ids)
+        self._waiting.append(ticket)
+
+    def _order(self) -> List[SolveTicket]:
+        """Waiting tickets in admission order: by turn, then by arrival."""
+        return sorted(self._waiting, key=lambda t: (t.turn, t.arrival))
+
+    def _drop_stale(self) -> None:
+        cutoff = time.monotonic() - self.stale_sec
+        self._waiting = [t for t in self._waiting if t.last_seen >= cutoff]
+
+    def _grants(self) -> Iterator[tuple[SolveTicket, int]]:
+        """The shares the head of the queue would get right now."""
+        free = self.capacity - sum(t.workers or 0 for t in self._running.values())
+        running = len(self._running)
+        order = self._order()
+        for left, ticket in zip(range(len(order), 0, -1), order):
+            if running and free < self.min_share:
+                return
+            share = max(self.min_share, free // left)
+            yield ticket, min(share, free)
+            free -= share
+            running += 1
+
+    def try_admit(self, ticket: SolveTicket) -> int | None:
+        """The ticket's ``num_workers`` share if it may start now, else None.
+
+        Waiting callers poll this; each call also marks the ticket as alive.
+        """
+        with self._lock:
+            if ticket.workers is not None:
+                return ticket.workers
+            ticket.last_seen = time.monotonic()
+            self._drop_stale()
+            if ticket not in self._waiting:  # dropped as stale: rejoin at the back
+                self._join(ticket)
+            for candidate, share in self._grants():
+                if candidate is ticket:
+                    self._waiting.remove(ticket)
+                    ticket.workers = share
+                    self._running[ticket.id] = ticket
+                    return share
+            return None
+
+    def position(self, ticket: SolveTicket) -> int:
+        """1 for the next solve to start, 2 for the one after; 0 once running."""
+        with self._lock:
+            if ticket.workers is not None:
+                return 0
+            order = self._order()
+            return order.index(ticket) + 1 if ticket in order else len(order) + 1
+
+    def release(self, ticket: SolveTicket | None) -> None:
+        """Leave the queue, or give the cores back once the solve is done."""
+        if ticket is None:
+            return
+        with self._lock:
+            self._running.pop(ticket.id, None)
+            if ticket in self._waiting:
+                self._waiting.remove(ticket)
+
+    def load(self) -> AdmissionLoad:
+        with self._lock:
+            self._drop_stale()
+            return AdmissionLoad(
+                capacity=self.capacity,
+                cores_in_use=sum(t.workers or 0 for t in self._running.values()),
+                running=len(self._running),
+                queued=len(self._waiting),
+                sessions_waiting=len({t.session for t in self._waiting}),
+            )
+
+    @contextmanager
+    def admitted(self, session: str, poll: float = 0.25) -> Iterator[int]:
+        """Block until admitted, yield the ``num_workers`` share, then release."""
+        ticket = self.enqueue(session)
+        try:
+            while (workers := self.try_admit(ticket)) is None:
+                time.sleep(poll)
+            yield workers
+        finally:
+            self.release(ticket)
+
+
+_ADMISSION: SolveAdmission | None = None
+_ADMISSION_LOCK = threading.Lock()
+
+
+def solve_admission() -> SolveAdmission:
+    """The process-wide scheduler every session's solves go through."""
+    global _ADMISSION
+    with _ADMISSION_LOCK:
+        if _ADMISSION is None:
+            _ADMISSION = SolveAdmission()
+        return _ADMISSION
@@ -0,0 +1,112 @@
+"""Asyncio front end to :func:`model.optimiser.build_schedule`.
+
+:func:`solve_async` runs the blocking solve on an executor thread (CP-SAT
+releases the GIL while it searches) and yields :class:`SolveEvent` s while it
+runs: phase changes, each new incumbent with its objective and the search's
+bound, bound improvements, and a ``"tick"`` every ``tick`` seconds carrying the
+time left. The last event is ``"finished"`` with the schedule. Several solves
+can run side by side in one event loop::
+
+    async for event in solve_async(data, time_limit_sec=120):
+        if event.kind == "incumbent":
+            print(event.objective, event.best_bound)
+        elif event.kind == "finished":
+            df = event.schedule
+
+Cancellation is cooperative: ``progress.cancel()`` (from any thread) stops the
+search and the solve still finishes with the best schedule found so far.
+Leaving the ``async for`` early, or cancelling the task iterating it, stops
+the search too and waits for the solver thread to exit, so no search outlives
+its consumer. A solve stopped before its first schedule raises
+:class:`~model.optimiser.SolveCancelled`; any other solve error is raised from
+the iteration.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from concurrent.futures import Executor
+from typing import Any, AsyncIterator, NamedTuple
+
+from .data_models import InputData
+from .optimiser import Ledger, SolveProgress, build_schedule
+
+__all__ = ["SolveEvent", "solve_async"]
+
+
+class SolveEvent(NamedTuple):
+    """One step of an async solve; the numbers are a snapshot at that step."""
+
+    kind: str                  # "phase", "incumbent", "bound", "tick" or "finished"
+    phase: str                 # "preparing", "searching", "extracting", "done"
+    elapsed: float             # seconds since solve_async started
+    time_left: float | None    # search budget left, once searching
+    solutions: int
+    objective: float | None    # the incumbent's, lower = fairer
+    best_bound: float | None
+    schedule: Any = None       # the DataFrame, on "finished" only
+
+
+async def solve_async(
+    data: InputData,
+    env: str | None = None,
+    ledger: Ledger | None = None,
+    *,
+    progress: SolveProgress | None = None,
+    tick: float = 1.0,
+    executor: Executor | None = None,
+    **build_kwargs: Any,
+) -> AsyncIterator[SolveEvent]:
+    """Solve ``data`` off the event loop, yielding progress as it goes.
+
+    ``build_kwargs`` are passed to :func:`build_schedule` (``time_limit_sec``,
+    ``num_workers``, ``warm_start_df``, ...). ``progress`` lets the caller
+    cancel the solve from elsewhere; ``executor`` defaults to the loop's.
+    """
+    loop = asyncio.get_running_loop()
+    progress = progress if progress is not None else SolveProgress()
+    started = time.monotonic()
+    queue: asyncio.Queue[SolveEvent | None] = asyncio.Queue()
+
+    def snapshot(kind: str, schedule: Any = None) -> SolveEvent:
+        return SolveEvent(
+            kind, progress.phase, time.monotonic() - started, progress.time_left(),
+            progress.solution_count, progress.objective, progress.best_bound, schedule,
+        )
+
+    def listener(kind: str) -> None:
+        # On the solver thread: snapshot here, so each event is consistent.
+        event = snapshot(kind)
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, event)
+        except RuntimeError:  # pragma: no cover - the loop closed under us
+            pass
+
+    progress.listener = listener
+    future = loop.run_in_executor(
+        executor,
+        functools.partial(build_schedule, data, env, ledger, progress=progress, **build_kwargs),
+    )
+    # Queued after every event the solver thread sent, so it marks the end.
+    future.add_done_callback(lambda _: queue.put_nowait(None))
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), tick)
+            except asyncio.TimeoutError:
+                if progress.cancelled:
+                    progress.cancel()  # again: a stop can race the search's start
+                yield snapshot("tick")
+                continue
+            if event is None:
+                break
+            yield event
+        yield snapshot("finished", future.result())
+    finally:
+        if not future.done():
+            progress.cancel()
+            await asyncio.wait({future})
+            if not future.cancelled():
+                future.exception()  # retrieved: the consumer already left
+        progress.listener = None
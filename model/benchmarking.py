@@ -7,13 +7,17 @@ well-defined cases without importing a script or scraping printed output.
 
 from __future__ import annotations
 
+import os
+import re
+import subprocess
+import sys
 import time
 from dataclasses import dataclass
 from datetime import date, timedelta
 from typing import Iterable, Literal
 
 from .data_models import InputData, ShiftTemplate
-from .optimiser import ORTOOLS_AVAILABLE, build_schedule
+from .optimiser import ORTOOLS_AVAILABLE, PhaseTimings, build_schedule
 
 DEFAULT_TARGET_SECONDS = 60.0
 
@@ -72,13 +76,38 @@ class BenchmarkCase:
         return f"{self.people} people x {self.days} days x {self.shifts} shifts"
 
 
+# Display names for :class:`~model.optimiser.PhaseTimings` phases, in run order.
+PHASE_LABELS: dict[str, str] = {
+    "validation": "Validation",
+    "nf_closures": "Night float + closures",
+    "resolve_targets": "resolve_targets",
+    "variables": "Variables",
+    "constraints": "Constraints",
+    "objective": "Objective",
+    "warm_start": "Warm start",
+    "presolve": "CP-SAT presolve",
+    "search": "CP-SAT search",
+    "extraction": "Extraction",
+    "min_gap_check": "respects_min_gap",
+}
+
+
 @dataclass(frozen=True, slots=True)
 class BenchmarkResult:
-    """Structured outcome of a completed benchmark run."""
+    """Structured outcome of a completed benchmark run.
+
+    ``phases`` is the per-phase breakdown as ``(phase, seconds)`` pairs in run
+    order (see :data:`PHASE_LABELS`); ``variables`` and ``constraints`` are the
+    CP-SAT model's size and ``objective`` the final objective.
+    """
 
     case: BenchmarkCase
     elapsed_seconds: float
     solver_status: str | None
+    phases: tuple[tuple[str, float], ...] = ()
+    variables: int | None = None
+    constraints: int | None = None
+    objective: float | None = None
 
     @property
     def within_target(self) -> bool:
@@ -88,6 +117,18 @@ class BenchmarkResult:
     def flag(self) -> Literal["OK", "SLOW"]:
         return "OK" if self.within_target else "SLOW"
 
+    def phase_rows(self) -> list[tuple[str, float, float]]:
+        """``(label, seconds, share of elapsed)`` per phase, then the unaccounted rest."""
+        total = self.elapsed_seconds or 1.0
+        rows = [
+            (PHASE_LABELS.get(phase, phase), seconds, seconds / total)
+            for phase, seconds in self.phases
+        ]
+        if rows:
+            other = max(0.0, self.elapsed_seconds - sum(seconds for _, seconds, _ in rows))
+            rows.append(("Other", other, other / total))
+        return rows
+
 
 # The historical CLI sweep, exposed as immutable typed cases. Keeping the
 # suite small and bounded avoids an accidental multi-minute run when a UI
@@ -147,12 +188,21 @@ def run_benchmark(case: BenchmarkCase, *, env: str = "prod") -> BenchmarkResult:
     if not benchmark_available():
         raise RuntimeError("OR-Tools not installed; timings would be meaningless.")
     data = build_benchmark_input(case)
+    timings = PhaseTimings()
     started = time.perf_counter()
-    frame = build_schedule(data, env=env)
+    frame = build_schedule(data, env=env, timings=timings)
     elapsed = time.perf_counter() - started
     raw_status = frame.attrs.get("solver_status")
     status = None if raw_status is None else str(raw_status)
-    return BenchmarkResult(case=case, elapsed_seconds=elapsed, solver_status=status)
+    return BenchmarkResult(
+        case=case,
+        elapsed_seconds=elapsed,
+        solver_status=status,
+        phases=tuple(timings.seconds.items()),
+        variables=timings.variables,
+        constraints=timings.constraints,
+        objective=timings.objective,
+    )
 
 
 def run_benchmark_suite(
@@ -164,13 +214,120 @@ def run_benchmark_suite(
     return [run_benchmark(case, env=env) for case in cases]
 
 
+# Cold-start imports. A fresh app worker pays for every module imported before
+# the first page renders, so the heavy optional dependencies load on first use
+# instead; these measurements keep it that way.
+
+# Dependencies the app defers to first use; any of them loaded at startup is a
+# cold-start regression.
+DEFERRED_IMPORTS: tuple[str, ...] = (
+    "ortools", "openpyxl", "reportlab", "altair", "arabic_reshaper", "bidi",
+)
+
+# What each startup target runs under ``python -X importtime``, from the
+# repository root: the Streamlit entry point executed bare (its first script
+# run, as a cold worker does it) and the solver's import path alone.
+STARTUP_TARGETS: dict[str, tuple[str, ...]] = {
+    "app": ("app.py",),
+    "model": ("-c", "from model import build_schedule"),
+}
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s*(\d+) \|\s*(\d+) \| ( *)(\S+)\s*$")
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass(frozen=True, slots=True)
+class ImportTiming:
+    """One module's line of ``-X importtime`` output (times in microseconds)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int  # 0 for an import made directly by the target
+
+
+@dataclass(frozen=True, slots=True)
+class StartupResult:
+    """The imports one startup target made, best of the measured runs."""
+
+    target: str
+    timings: tuple[ImportTiming, ...]
+
+    @property
+    def total_seconds(self) -> float:
+        """Time spent importing: the sum of the top-level imports."""
+        return sum(t.cumulative_us for t in self.timings if t.depth == 0) / 1e6
+
+    def heaviest(self, n: int = 10) -> list[ImportTiming]:
+        """The ``n`` most expensive top-level imports, slowest first."""
+        top = [t for t in self.timings if t.depth == 0]
+        return sorted(top, key=lambda t: t.cumulative_us, reverse=True)[:n]
+
+    @property
+    def deferred_loaded(self) -> tuple[str, ...]:
+        """The :data:`DEFERRED_IMPORTS` this target loaded anyway."""
+        loaded = {t.module.partition(".")[0] for t in self.timings}
+        return tuple(name for name in DEFERRED_IMPORTS if name in loaded)
+
+
+def parse_importtime(text: str) -> tuple[ImportTiming, ...]:
+    """Parse ``python -X importtime`` output, ignoring every other line."""
+    timings = []
+    for line in text.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            timings.append(
+                ImportTiming(module, int(self_us), int(cumulative_us), len(indent) // 2)
+            )
+    return tuple(timings)
+
+
+def measure_startup(
+    target: str = "app", *, repeat: int = 3, python: str = sys.executable
+) -> StartupResult:
+    """Import-time ``target`` (see :data:`STARTUP_TARGETS`) in fresh interpreters.
+
+    Each run is a new process, so nothing is cached between them but the
+    bytecode on disk; the fastest of ``repeat`` runs is kept, the usual guard
+    against a noisy host. A run that fails raises ``RuntimeError`` with the end
+    of its error output.
+    """
+    args = STARTUP_TARGETS[target]
+    best: StartupResult | None = None
+    for _ in range(max(1, repeat)):
+        proc = subprocess.run(
+            [python, "-X", "importtime", *args],
+            cwd=_REPO_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=300,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(
+                f"{target} startup failed (exit {proc.returncode}): {proc.stderr[-2000:]}"
+            )
+        result = StartupResult(target, parse_importtime(proc.stderr))
+        if best is None or result.total_seconds < best.total_seconds:
+            best = result
+    assert best is not None
+    return best
+
+
 __all__ = [
     "BenchmarkCase",
     "BenchmarkResult",
     "DEFAULT_TARGET_SECONDS",
+    "DEFERRED_IMPORTS",
+    "ImportTiming",
+    "PHASE_LABELS",
     "SAFE_BENCHMARK_PRESETS",
+    "STARTUP_TARGETS",
+    "StartupResult",
     "benchmark_available",
     "build_benchmark_input",
+    "measure_startup",
+    "parse_importtime",
     "run_benchmark",
     "run_benchmark_suite",
 ]
@@ -19,13 +19,21 @@ Requires ``reportlab`` (guarded import, like the schedule PDF).
 from __future__ import annotations
 
 import io
+import zipfile
+from concurrent.futures import Executor, as_completed
+from functools import lru_cache
+from typing import Callable, Sequence
 from xml.sax.saxutils import escape, quoteattr
 
 from .data_models import InputData
-from .ics import google_calendar_url, ics_data_uri, resident_ics, resident_events
+from .ics import events_by_resident, google_calendar_url, ics_data_uri, member_names, resident_ics
 from .utils import friendly_date
 
-__all__ = ["calendar_handout_pdf_bytes"]
+__all__ = [
+    "calendar_handout_pdf_bytes",
+    "resident_calendar_pdf_bytes",
+    "resident_pdfs_zip",
+]
 
 _INK = "#2f2a24"
 _MUTED = "#6d6459"
@@ -39,11 +47,64 @@ def _short_date(day) -> str:
     return friendly_date(day)
 
 
+@lru_cache(maxsize=1)
+def _handout_styles() -> dict:
+    """The handout's paragraph styles, built once and shared between builds."""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+
+    styles = getSampleStyleSheet()
+    return {
+        "name": ParagraphStyle(
+            "Name", parent=styles["Normal"], fontName="Helvetica-Bold",
+            fontSize=8.6, leading=10.4, textColor=colors.HexColor(_INK),
+            spaceBefore=5, spaceAfter=1,
+        ),
+        "row": ParagraphStyle(
+            "Row", parent=styles["Normal"], fontSize=7.6, leading=9.4,
+            textColor=colors.HexColor(_INK), leftIndent=5,
+        ),
+        "head": ParagraphStyle(
+            "Head", parent=styles["Normal"], fontName="Helvetica-Bold",
+            fontSize=14, leading=17, textColor=colors.HexColor(_INK),
+        ),
+        "note": ParagraphStyle(
+            "Note", parent=styles["Normal"], fontSize=7.8, leading=10,
+            textColor=colors.HexColor(_MUTED),
+        ),
+    }
+
+
+def _resident_lines(person: str, events: Sequence[dict], data: InputData, styles) -> list:
+    """A resident's name line (with "Add all") and one calendar link per on-call."""
+    from reportlab.platypus import Paragraph
+
+    # ``events`` is already resolved, so the frame itself is never read.
+    add_all = quoteattr(ics_data_uri(resident_ics(None, data, person, events=events)))
+    lines = [
+        Paragraph(
+            f"{escape(person)}"
+            f"<font size=7 color='{_MUTED}'>  {len(events)} on-call(s)</font>"
+            f"  <link href={add_all}>"
+            f"<font color='{_LINK}'><u>Add all</u></font></link>",
+            styles["name"],
+        )
+    ]
+    for event in events:
+        url = quoteattr(google_calendar_url(event["day"], event["label"], person))
+        lines.append(Paragraph(
+            f"<link href={url}><font color='{_LINK}'>"
+            f"{escape(_short_date(event['day']))}</font></link>"
+            f"  <font color='{_MUTED}'>{escape(event['label'])}</font>",
+            styles["row"],
+        ))
+    return lines
+
+
 def calendar_handout_pdf_bytes(df, data: InputData) -> bytes:
     """Render the compact per-resident on-call handout to PDF bytes."""
     from reportlab.lib import colors
     from reportlab.lib.pagesizes import A4
-    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
     from reportlab.lib.units import cm
     from reportlab.platypus import (
         BaseDocTemplate,
@@ -54,24 +115,8 @@ def calendar_handout_pdf_bytes(df, data: InputData) -> bytes:
         Spacer,
     )
 
-    styles = getSampleStyleSheet()
-    name_style = ParagraphStyle(
-        "Name", parent=styles["Normal"], fontName="Helvetica-Bold",
-        fontSize=8.6, leading=10.4, textColor=colors.HexColor(_INK),
-        spaceBefore=5, spaceAfter=1,
-    )
-    row_style = ParagraphStyle(
-        "Row", parent=styles["Normal"], fontSize=7.6, leading=9.4,
-        textColor=colors.HexColor(_INK), leftIndent=5,
-    )
-    head_style = ParagraphStyle(
-        "Head", parent=styles["Normal"], fontName="Helvetica-Bold",
-        fontSize=14, leading=17, textColor=colors.HexColor(_INK),
-    )
-    note_style = ParagraphStyle(
-        "Note", parent=styles["Normal"], fontSize=7.8, leading=10,
-        textColor=colors.HexColor(_MUTED),
-    )
+    styles = _handout_styles()
+    head_style, note_style = styles["head"], styles["note"]
 
     buffer = io.BytesIO()
     margin = 1.1 * cm
@@ -130,30 +175,13 @@ def calendar_handout_pdf_bytes(df, data: InputData) -> bytes:
 
     story = []
     listed = 0
+    index = events_by_resident(df, data)
     for person in list(data.juniors) + list(data.seniors):
-        events = resident_events(df, data, person)
+        events = index.get(person)
         if not events:
             continue
         listed += 1
-        add_all = quoteattr(ics_data_uri(resident_ics(df, data, person)))
-        block = [
-            Paragraph(
-                f"{escape(person)}"
-                f"<font size=7 color='{_MUTED}'>  {len(events)} on-call(s)</font>"
-                f"  <link href={add_all}>"
-                f"<font color='{_LINK}'><u>Add all</u></font></link>",
-                name_style,
-            )
-        ]
-        for event in events:
-            url = quoteattr(google_calendar_url(event["day"], event["label"], person))
-            block.append(Paragraph(
-                f"<link href={url}><font color='{_LINK}'>"
-                f"{escape(_short_date(event['day']))}</font></link>"
-                f"  <font color='{_MUTED}'>{escape(event['label'])}</font>",
-                row_style,
-            ))
-        story.append(KeepTogether(block))
+        story.append(KeepTogether(_resident_lines(person, events, data, styles)))
 
     if not listed:
         story.append(Paragraph("No assignments in this schedule.", head_style))
@@ -169,3 +197,153 @@ def calendar_handout_pdf_bytes(df, data: InputData) -> bytes:
         ))
     doc.build(story)
     return buffer.getvalue()
+
+
+# A personal page's date columns: at most this many across A4.
+_MAX_PAGE_COLUMNS = 6
+
+
+def _fit_rows(events: Sequence[dict], width: float, height: float, base_style):
+    """``(columns, font size)`` fitting every date row into ``width`` × ``height``.
+
+    Picks the column count giving the largest type — never above the base
+    style's — at which no row wraps and no column runs off the bottom.
+    """
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    ratio = base_style.leading / base_style.fontSize
+    indent = base_style.leftIndent
+    # Width of the widest row at 1pt; a Paragraph never renders it wider.
+    unit_width = max(
+        stringWidth(f"{_short_date(e['day'])}  {e['label']}", "Helvetica", 1)
+        for e in events
+    )
+    best = (1, 0.0)
+    for columns in range(1, _MAX_PAGE_COLUMNS + 1):
+        rows = -(-len(events) // columns)
+        col_w = width / columns
+        size = min(
+            base_style.fontSize,
+            (col_w - indent) / unit_width,
+            height / (rows * ratio),
+        )
+        if size > best[1]:
+            best = (columns, size)
+    columns, size = best
+    return columns, size * 0.98  # headroom for rounding in the layout
+
+
+def resident_calendar_pdf_bytes(person: str, events: Sequence[dict], data: InputData) -> bytes:
+    """One resident's personal on-call page as single-page PDF bytes.
+
+    ``events`` is their entry in :func:`~model.ics.events_by_resident`; the
+    page carries the same "Add all" and per-date links as the handout. The
+    dates flow into as many columns, in as small type, as it takes to keep a
+    whole block (a year of nights included) on one page.
+    """
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.lib.units import cm
+    from reportlab.platypus import (
+        BaseDocTemplate,
+        Frame,
+        FrameBreak,
+        PageTemplate,
+        Paragraph,
+        Spacer,
+    )
+
+    styles = _handout_styles()
+    buffer = io.BytesIO()
+    margin = 1.5 * cm
+    doc = BaseDocTemplate(
+        buffer, pagesize=A4,
+        leftMargin=margin, rightMargin=margin,
+        topMargin=margin, bottomMargin=margin,
+        title=f"On-call calendar — {person}",
+    )
+    # The heading, the note and the "Add all" line sit above the dates.
+    head_h = 3.6 * cm
+    body_h = doc.height - head_h
+    columns, size = (1, styles["row"].fontSize)
+    if events:
+        columns, size = _fit_rows(events, doc.width, body_h, styles["row"])
+    row_style = ParagraphStyle(
+        "PageRow", parent=styles["row"], fontSize=size,
+        leading=size * styles["row"].leading / styles["row"].fontSize,
+    )
+    col_w = doc.width / columns
+    frames = [Frame(
+        margin, margin + body_h, doc.width, head_h, id="head",
+        leftPadding=0, rightPadding=0, topPadding=0, bottomPadding=0,
+    )]
+    frames += [
+        Frame(
+            margin + i * col_w, margin, col_w, body_h, id=f"col{i}",
+            leftPadding=0, rightPadding=0, topPadding=0, bottomPadding=0,
+        )
+        for i in range(columns)
+    ]
+    doc.addPageTemplates([PageTemplate(id="page", frames=frames)])
+
+    span = f"{friendly_date(data.start_date)} – {friendly_date(data.end_date)}"
+    name_line, *rows = _resident_lines(person, events, data, {**styles, "row": row_style})
+    story = [
+        Paragraph(f"On-call calendar — {escape(person)}", styles["head"]),
+        Paragraph(f"Block {escape(span)}", styles["note"]),
+        Paragraph(
+            "Tap a date to add that shift to your calendar; “Add all” adds every "
+            "shift at once where your PDF reader allows it.",
+            styles["note"],
+        ),
+        Spacer(1, 2),
+        name_line,
+        FrameBreak(),
+        *rows,
+    ]
+    doc.build(story)
+    return buffer.getvalue()
+
+
+def resident_pdfs_zip(
+    df,
+    data: InputData,
+    *,
+    executor: Executor | None = None,
+    progress: Callable[[int, int], None] | None = None,
+) -> bytes:
+    """A ZIP of personal calendar PDFs, one per resident with an on-call.
+
+    The schedule is indexed once (:func:`~model.ics.events_by_resident`);
+    each page is a separate task on ``executor`` (rendered in turn when
+    None) and is written into the archive as soon as it is done, so pages
+    render on every core the executor has. ``progress(done, total)`` is
+    called after each page.
+    """
+    index = events_by_resident(df, data)
+    members = member_names(
+        (p for p in list(data.juniors) + list(data.seniors) if index.get(p)), ".pdf"
+    )
+    total = len(members)
+    if progress is not None:
+        progress(0, total)
+    if executor is None:
+        pages = (
+            (name, resident_calendar_pdf_bytes(person, index[person], data))
+            for name, person in sorted(members.items())
+        )
+    else:
+        futures = {
+            executor.submit(
+                resident_calendar_pdf_bytes, person, index[person], data
+            ): name
+            for name, person in sorted(members.items())
+        }
+        pages = ((futures[f], f.result()) for f in as_completed(futures))
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for done, (name, blob) in enumerate(pages, start=1):
+            archive.writestr(name, blob)
+            if progress is not None:
+                progress(done, total)
+    return buffer.getvalue()
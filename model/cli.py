@@ -0,0 +1,349 @@
+"""Headless command line for the scheduler.
+
+``python -m model.cli solve`` solves one or many saved configs (the JSON the
+app's *Save config* writes) without the Streamlit UI. Each config may be
+paired with the fairness ledger carried over from its previous block. Jobs run
+in parallel across a process pool. Each solve gets an even share of the host's
+cores as CP-SAT workers, at least two each like an admitted solve (see
+:func:`~model.admission.batch_split`), so the jobs don't oversubscribe the
+machine and no search runs on a single worker.
+
+For every config the command writes, under ``OUT/<config name>/``:
+
+* ``schedule.csv``, ``schedule.xlsx`` and ``schedule.pdf``. Excel and PDF are
+  skipped (and noted in the summary) when openpyxl or ReportLab is missing.
+* ``fairness_log.txt``.
+* ``fairness_ledger_through_<end date>.json``, the updated ledger to carry
+  into the next block.
+
+It also writes ``OUT/summary.json``, which lists each job's status, solver
+status, objective, unfilled slots, timings and any error. The exit status is
+non-zero when any job failed, so an unattended monthly run can alert on it.
+
+Usage::
+
+    python -m model.cli solve cardio.json neuro.json --out blocks/2026-11
+    python -m model.cli solve cardio.json --ledger cardio_ledger.json \\
+        --time-limit 300 --jobs 4 --out out/
+
+``python -m model.cli serve`` instead keeps a solver warm behind a local
+HTTP/JSON API (see :mod:`model.service`).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence
+
+__all__ = [
+    "FORMATS",
+    "SolveJob",
+    "job_outputs",
+    "main",
+    "missing_dependency",
+    "run_solve_job",
+    "solve_many",
+]
+
+FORMATS = ("csv", "excel", "pdf", "log", "ledger")
+_OPTIONAL = {"excel": "openpyxl", "pdf": "reportlab"}
+
+
+@dataclass(frozen=True)
+class SolveJob:
+    """One config to solve and where its outputs go."""
+
+    config: Path
+    out_dir: Path
+    ledger: Path | None = None
+    time_limit: float | None = None     # None: the env/size-derived budget
+    env: str = "prod"
+    label_carryover: bool = True
+    num_workers: int | None = None
+    formats: tuple[str, ...] = FORMATS
+
+
+def _write(path: Path, payload: str | bytes) -> None:
+    if isinstance(payload, str):
+        path.write_text(payload, encoding="utf-8")
+    else:
+        path.write_bytes(payload)
+
+
+def missing_dependency(kind: str) -> str | None:
+    """The optional package an output kind needs but cannot import, if any."""
+    module = _OPTIONAL.get(kind)
+    return module if module and find_spec(module) is None else None
+
+
+def job_outputs(df, data, ledger, block, formats: Sequence[str] = FORMATS):
+    """``{kind: (file name, build)}`` for a solved schedule; ``build()``
+    returns the file's text or bytes. Shared by this CLI and the HTTP service."""
+    from .exporters import spreadsheet_safe_frame
+    from .fairness import calculate_points, format_fairness_log
+    from .ledger import ledger_to_json, update_ledger
+
+    points = calculate_points(df, data)
+    outputs: Dict[str, tuple[str, Callable[[], str | bytes]]] = {}
+    if "csv" in formats:
+        outputs["csv"] = ("schedule.csv", lambda: spreadsheet_safe_frame(df).to_csv(index=False))
+    if "excel" in formats:
+        def excel() -> bytes:
+            from .exporters import schedule_to_excel_bytes
+
+            return schedule_to_excel_bytes(
+                df, data, points=points, prior_ledger=ledger, block=block
+            )
+
+        outputs["excel"] = ("schedule.xlsx", excel)
+    if "pdf" in formats:
+        def pdf() -> bytes:
+            from .exporters import schedule_to_pdf_bytes
+
+            return schedule_to_pdf_bytes(
+                df, data, points=points, prior_ledger=ledger, block=block
+            )
+
+        outputs["pdf"] = ("schedule.pdf", pdf)
+    if "log" in formats:
+        outputs["log"] = (
+            "fairness_log.txt",
+            lambda: format_fairness_log(df, data, points=points, block=block),
+        )
+    if "ledger" in formats:
+        outputs["ledger"] = (
+            f"fairness_ledger_through_{data.end_date.isoformat()}.json",
+            lambda: ledger_to_json(update_ledger(ledger, df, data, block=block)),
+        )
+    return outputs
+
+
+def run_solve_job(job: SolveJob) -> Dict[str, Any]:
+    """Solve one config and write its outputs; returns its summary entry.
+
+    Never raises for a bad config or a failed solve: the error is reported in
+    the entry so the other jobs of a batch still complete.
+    """
+    summary: Dict[str, Any] = {
+        "config": str(job.config),
+        "ledger": str(job.ledger) if job.ledger else None,
+        "output": str(job.out_dir),
+        "status": "failed",
+        "solver_status": None,
+        "objective": None,
+        "unfilled": None,
+        "files": [],
+        "skipped": [],
+        "timings": {},
+        "error": None,
+    }
+    timings = summary["timings"]
+    started = time.perf_counter()
+    try:
+        from .config_io import input_data_from_json
+        from .ledger import ledger_from_json
+        from .optimiser import build_schedule
+        from .resolved import resolve_block
+
+        data = input_data_from_json(job.config.read_text(encoding="utf-8"))
+        ledger = (
+            ledger_from_json(job.ledger.read_text(encoding="utf-8")) if job.ledger else None
+        )
+        block = resolve_block(data, ledger, label_carryover=job.label_carryover)
+        timings["load"] = round(time.perf_counter() - started, 3)
+
+        mark = time.perf_counter()
+        df = build_schedule(
+            data, env=job.env, ledger=ledger, label_carryover=job.label_carryover,
+            time_limit_sec=job.time_limit, block=block, num_workers=job.num_workers,
+        )
+        timings["solve"] = round(time.perf_counter() - mark, 3)
+        attrs = getattr(df, "attrs", {}) or {}
+        timings["solver_wall"] = attrs.get("wall_time_sec")
+        summary["solver_status"] = attrs.get("solver_status")
+        summary["objective"] = attrs.get("objective")
+        shift_cols = [c for c in df.columns if c not in ("Date", "Day")]
+        summary["unfilled"] = int((df[shift_cols] == "Unfilled").sum().sum()) if shift_cols else 0
+
+        mark = time.perf_counter()
+        job.out_dir.mkdir(parents=True, exist_ok=True)
+        outputs = job_outputs(df, data, ledger, block, job.formats)
+        for kind, (name, build) in outputs.items():
+            missing = missing_dependency(kind)
+            if missing:
+                summary["skipped"].append(f"{kind}: {missing} is not installed")
+                continue
+            _write(job.out_dir / name, build())
+            summary["files"].append(name)
+        timings["exports"] = round(time.perf_counter() - mark, 3)
+        summary["status"] = "ok"
+    except Exception as exc:  # noqa: BLE001 - reported per job
+        summary["error"] = str(exc) or type(exc).__name__
+    timings["total"] = round(time.perf_counter() - started, 3)
+    return summary
+
+
+def _out_dirs(configs: Sequence[Path], out: Path) -> List[Path]:
+    """One output directory per config, named after it and never shared."""
+    dirs: List[Path] = []
+    taken: set[str] = set()
+    for config in configs:
+        name, n = config.stem, 1
+        while name in taken:
+            n += 1
+            name = f"{config.stem}-{n}"
+        taken.add(name)
+        dirs.append(out / name)
+    return dirs
+
+
+def solve_many(jobs: Sequence[SolveJob], processes: int, on_done=None) -> List[Dict[str, Any]]:
+    """Run ``jobs`` across ``processes`` worker processes; summaries come back
+    in the order the jobs were given. ``on_done`` is called with each summary
+    as its job finishes."""
+    if processes <= 1 or len(jobs) <= 1:
+        results = []
+        for job in jobs:
+            results.append(run_solve_job(job))
+            if on_done is not None:
+                on_done(results[-1])
+        return results
+    ordered: List[Dict[str, Any] | None] = [None] * len(jobs)
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = {pool.submit(run_solve_job, job): i for i, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            ordered[futures[future]] = future.result()
+            if on_done is not None:
+                on_done(ordered[futures[future]])
+    return [entry for entry in ordered if entry is not None]
+
+
+def _solve_command(args: argparse.Namespace) -> int:
+    from .admission import batch_split, host_cores
+
+    configs = [Path(p) for p in args.configs]
+    ledgers = [Path(p) for p in args.ledger or ()]
+    if ledgers and len(ledgers) != len(configs):
+        raise SystemExit(
+            f"--ledger was given {len(ledgers)} time(s) for {len(configs)} config(s); "
+            "pass one ledger per config, in the same order, or none"
+        )
+    formats = tuple(args.formats.split(",")) if args.formats else FORMATS
+    unknown = sorted(set(formats) - set(FORMATS))
+    if unknown:
+        raise SystemExit(f"unknown format(s): {', '.join(unknown)}")
+    processes, num_workers = batch_split(host_cores(), len(configs), args.jobs)
+    out = Path(args.out)
+    jobs = [
+        SolveJob(
+            config=config, out_dir=out_dir,
+            ledger=ledgers[i] if ledgers else None,
+            time_limit=args.time_limit, env=args.env,
+            label_carryover=not args.no_label_carryover,
+            num_workers=num_workers,
+            formats=formats,
+        )
+        for i, (config, out_dir) in enumerate(zip(configs, _out_dirs(configs, out)))
+    ]
+
+    def report(entry: Dict[str, Any]) -> None:
+        if entry["status"] == "ok":
+            print(
+                f"ok      {entry['config']}: {entry['solver_status']}, "
+                f"objective {entry['objective']}, {entry['unfilled']} unfilled, "
+                f"{entry['timings']['total']:.1f}s -> {entry['output']}"
+            )
+        else:
+            print(f"FAILED  {entry['config']}: {entry['error']}")
+
+    started = time.perf_counter()
+    results = solve_many(jobs, processes, on_done=report)
+    out.mkdir(parents=True, exist_ok=True)
+    summary = {
+        "jobs": results,
+        "processes": processes,
+        "workers_per_job": jobs[0].num_workers if jobs else None,
+        "elapsed": round(time.perf_counter() - started, 3),
+    }
+    (out / "summary.json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    failed = sum(entry["status"] != "ok" for entry in results)
+    print(f"{len(results) - failed}/{len(results)} solved; summary in {out / 'summary.json'}")
+    return 1 if failed else 0
+
+
+def _serve_command(args: argparse.Namespace) -> int:
+    from .service import SolveService, make_server, warm_up
+
+    if not warm_up():
+        print("warning: OR-Tools is not installed; solves will fail", file=sys.stderr)
+    try:
+        server = make_server(
+            args.host, args.port, SolveService(env=args.env, ttl=args.ttl_hours * 3600),
+            verbose=args.verbose,
+        )
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
+    print(f"Serving solves on http://{args.host}:{server.server_port} (Ctrl+C to stop)",
+          flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.service.shutdown()
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m model.cli", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    solve = commands.add_parser("solve", help="solve saved configs and write their outputs")
+    solve.add_argument("configs", nargs="+", help="config JSON files saved by the app")
+    solve.add_argument("--out", required=True, help="output directory")
+    solve.add_argument(
+        "--ledger", action="append",
+        help="prior fairness ledger; repeat once per config, in the same order",
+    )
+    solve.add_argument(
+        "--time-limit", type=float,
+        help="solver budget per job in seconds (default: sized to each roster)",
+    )
+    solve.add_argument(
+        "--jobs", type=int,
+        help="configs solved in parallel (default and cap: one per two cores, "
+        "at most one per config)",
+    )
+    solve.add_argument("--env", default=os.environ.get("ENV", "prod"),
+                       help="time-limit profile when --time-limit is not given")
+    solve.add_argument("--no-label-carryover", action="store_true",
+                       help="balance only total/weekend history, not per-shift-type")
+    solve.add_argument("--formats", help=f"comma-separated subset of {','.join(FORMATS)}")
+    solve.set_defaults(run=_solve_command)
+
+    serve = commands.add_parser("serve", help="serve solves over a local HTTP/JSON API")
+    serve.add_argument("--host", default="127.0.0.1", help="loopback address to bind")
+    serve.add_argument("--port", type=int, default=8765, help="port (0 picks a free one)")
+    serve.add_argument("--env", default=os.environ.get("ENV", "prod"),
+                       help="time-limit profile for jobs that give no time_limit")
+    serve.add_argument("--ttl-hours", type=float, default=1.0,
+                       help="forget finished jobs this long after they finish")
+    serve.add_argument("--verbose", action="store_true", help="log every request")
+    serve.set_defaults(run=_serve_command)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parser().parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -22,9 +22,9 @@ Pure and stub-safe (no pandas / OR-Tools / Streamlit).
 from __future__ import annotations
 
 from datetime import date
-from typing import Dict, List, Set, Tuple
+from typing import AbstractSet, Dict, List, Set, Tuple
 
-from .data_models import InputData, shift_closed
+from .data_models import InputData
 from .night_float import nf_cells_from_attr
 from .points import block_days
 
@@ -43,14 +43,15 @@ def resolve_closures(data: InputData) -> Set[Slot]:
     closed: Set[Slot] = set()
     if not getattr(data, "closures", None):
         return closed
-    for day in block_days(data):
-        for shift in data.shifts:
-            if shift_closed(day, shift, data):
-                closed.add((day, shift.label))
+    days = block_days(data)
+    view = data.compiled()
+    for label in dict.fromkeys(s.label for s in data.shifts):
+        mask = view.closed_mask(label)
+        closed.update((day, label) for index, day in enumerate(days) if mask >> index & 1)
     return closed
 
 
-def closed_cells_to_attr(closed: Set[Slot]) -> Dict[str, List[str]]:
+def closed_cells_to_attr(closed: AbstractSet[Slot]) -> Dict[str, List[str]]:
     """``{(date, label)}`` → a JSON/Arrow-serializable ``{date-iso: [labels]}``."""
     out: Dict[str, List[str]] = {}
     for day, label in closed:
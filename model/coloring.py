@@ -9,11 +9,15 @@ from __future__ import annotations
 
 import colorsys
 import re
-from typing import Dict, Mapping, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Mapping, Tuple
 
-from .data_models import InputData
+from .data_models import InputData, ShiftTemplate
 from .utils import effective_points, is_weekend, weekend_holiday_dates
 
+if TYPE_CHECKING:
+    from .resolved import ResolvedBlock
+
 __all__ = [
     "COLOR_MODES", "DEFAULT_PALETTE", "is_hex_color", "schedule_cell_colors",
     "theme_palette",
@@ -54,8 +58,12 @@ def _hex_to_rgb(hexstr: str) -> Tuple[int, int, int]:
     return (int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16))
 
 
+@lru_cache(maxsize=1024)
 def _blend(hue: Tuple[int, int, int], ratio: float) -> str:
-    """Blend white with ``hue`` by ``ratio`` (0 = white, 1 = full hue)."""
+    """Blend white with ``hue`` by ``ratio`` (0 = white, 1 = full hue).
+
+    Memoised: a grid only ever uses a handful of (hue, ratio) pairs.
+    """
     ratio = max(0.0, min(1.0, ratio))
     r, g, b = (round(255 + (channel - 255) * ratio) for channel in hue)
     return f"#{r:02x}{g:02x}{b:02x}"
@@ -89,81 +97,116 @@ def theme_palette(base: str, current: Mapping[str, str] | None = None) -> Dict[s
     return palette
 
 
+def _slot_fill(
+    mode: str,
+    shift: ShiftTemplate,
+    weekend: bool,
+    ratio: float,
+    hues: Mapping[str, Tuple[int, int, int]],
+) -> str | None:
+    """The fill of an assigned cell in ``mode`` (None: left unshaded)."""
+    role_hue = hues["senior"] if shift.role == "Senior" else hues["junior"]
+    if mode == "role_weekend_3":
+        # Three independent colours: seniors, juniors, and one for every
+        # weekend/holiday shift (regardless of role). Each is a palette
+        # picker the user can recolour.
+        return _blend(hues["weekend"], 0.5) if weekend else _blend(role_hue, 0.4)
+    if mode == "role_weekend":
+        # Role hue chooses the colour; juniors read paler than seniors
+        # and weekend cells are a darker shade of the same role hue.
+        # The junior/senior palette pickers still drive the two hues.
+        if shift.role == "Senior":
+            blend = 0.70 if weekend else 0.45
+        else:
+            blend = 0.48 if weekend else 0.25
+        return _blend(role_hue, blend)
+    if mode == "role":
+        return _blend(role_hue, 0.35)
+    if mode == "weekend":
+        return _blend(hues["weekend"], 0.5) if weekend else None
+    if mode == "points":
+        return _blend(hues["points"], 0.2 + 0.6 * ratio)
+    # "auto": weekend hue vs weekday hue, intensity by points
+    hue = hues["weekend"] if weekend else hues["points"]
+    base = 0.25 if weekend else 0.08
+    return _blend(hue, base + 0.55 * ratio)
+
+
 def schedule_cell_colors(
-    df, data: InputData, mode: str = "auto", palette: Dict[str, str] | None = None
+    df,
+    data: InputData,
+    mode: str = "auto",
+    palette: Dict[str, str] | None = None,
+    *,
+    block: "ResolvedBlock | None" = None,
 ) -> Dict[Tuple[int, str], str]:
     """Return a colour per assigned/unfilled schedule cell for the given mode.
 
     ``palette`` overrides any of the named colour roles in ``DEFAULT_PALETTE``
     (``weekend``/``points``/``senior``/``junior``/``unfilled``); missing or empty
-    entries fall back to the default.
+    entries fall back to the default. Each slot's points and weekend status
+    come from the block's slot table (``block`` when given), classified once;
+    a fill is worked out once per slot.
     """
+    from .resolved import block_for  # local: the resolver chain is heavy
+
     pal = dict(DEFAULT_PALETTE)
     if palette:
         pal.update({k: v for k, v in palette.items() if k in pal and is_hex_color(v)})
-    weekend_hue = _hex_to_rgb(pal["weekend"])
-    point_hue = _hex_to_rgb(pal["points"])
-    senior_hue = _hex_to_rgb(pal["senior"])
-    junior_hue = _hex_to_rgb(pal["junior"])
+    hues = {role: _hex_to_rgb(pal[role]) for role in ("weekend", "points", "senior", "junior")}
     unfilled = pal["unfilled"]
 
-    records = df.to_dict("records")
+    columns = list(df.columns)
+    n_rows = len(df)
+
+    def column(label):
+        # Column-wise, not per-row dicts: a missing column reads as all-empty.
+        if label not in columns:
+            return [None] * n_rows
+        values = df[label]
+        return values.tolist() if hasattr(values, "tolist") else list(values)
+
+    days = column("Date")
+    table = block_for(data, block).slot_table
     weekend_dates = weekend_holiday_dates(data)
     # Every holiday date (not only weekend-flagged ones): holidays carry more
     # points, so they are shaded like weekends to flag that at a glance.
     holiday_dates = {h[0] for h in (getattr(data, "holidays", None) or [])}
-    max_pts = 1.0
-    for row in records:
-        for shift in data.shifts:
-            max_pts = max(max_pts, effective_points(row.get("Date"), shift, data))
 
+    # Points per slot; dates outside the table (e.g. Timestamps) classify here.
+    slot_pts: Dict[Tuple[object, str], float] = {}
+    for shift in data.shifts:
+        for day in days:
+            key = (day, shift.label)
+            if key not in slot_pts:
+                slot = table.get(key)
+                slot_pts[key] = (
+                    slot.points if slot is not None else effective_points(day, shift, data)
+                )
+    max_pts = max([1.0, *slot_pts.values()])
+
+    fills: Dict[Tuple[object, str], str | None] = {}
     colors: Dict[Tuple[int, str], str] = {}
-    for i, row in enumerate(records):
-        day = row.get("Date")
-        for shift in data.shifts:
-            value = row.get(shift.label)
+    shift_columns = [(shift, column(shift.label)) for shift in data.shifts]
+    for i, day in enumerate(days):
+        for shift, values in shift_columns:
+            label, value = shift.label, values[i]
             if value == "Closed":
                 continue  # stood-down shift: no fill (reads as a plain cell)
             if value in (None, "Unfilled"):
-                colors[(i, shift.label)] = unfilled
+                colors[(i, label)] = unfilled
                 continue
             if mode == "none":
                 continue
-            weekend = (
-                is_weekend(day, shift, data.weekend_days, weekend_dates)
-                or day in holiday_dates
-            )
-            ratio = effective_points(day, shift, data) / max_pts
-            if mode == "role_weekend_3":
-                # Three independent colours: seniors, juniors, and one for every
-                # weekend/holiday shift (regardless of role). Each is a palette
-                # picker the user can recolour.
-                if weekend:
-                    colors[(i, shift.label)] = _blend(weekend_hue, 0.5)
-                else:
-                    hue = senior_hue if shift.role == "Senior" else junior_hue
-                    colors[(i, shift.label)] = _blend(hue, 0.4)
-            elif mode == "role_weekend":
-                # Role hue chooses the colour; juniors read paler than seniors
-                # and weekend cells are a darker shade of the same role hue.
-                # The junior/senior palette pickers still drive the two hues.
-                hue = senior_hue if shift.role == "Senior" else junior_hue
-                if shift.role == "Senior":
-                    blend = 0.70 if weekend else 0.45
-                else:
-                    blend = 0.48 if weekend else 0.25
-                colors[(i, shift.label)] = _blend(hue, blend)
-            elif mode == "role":
-                colors[(i, shift.label)] = _blend(
-                    senior_hue if shift.role == "Senior" else junior_hue, 0.35
-                )
-            elif mode == "weekend":
-                if weekend:
-                    colors[(i, shift.label)] = _blend(weekend_hue, 0.5)
-            elif mode == "points":
-                colors[(i, shift.label)] = _blend(point_hue, 0.2 + 0.6 * ratio)
-            else:  # "auto": weekend hue vs weekday hue, intensity by points
-                hue = weekend_hue if weekend else point_hue
-                base = 0.25 if weekend else 0.08
-                colors[(i, shift.label)] = _blend(hue, base + 0.55 * ratio)
+            key = (day, label)
+            if key not in fills:
+                slot = table.get(key)
+                weekend = (
+                    slot.weekend if slot is not None
+                    else is_weekend(day, shift, data.weekend_days, weekend_dates)
+                ) or day in holiday_dates
+                fills[key] = _slot_fill(mode, shift, weekend, slot_pts[key] / max_pts, hues)
+            fill = fills[key]
+            if fill is not None:
+                colors[(i, label)] = fill
     return colors
@@ -28,6 +28,7 @@ from .data_models import (
 )
 
 __all__ = [
+    "input_data_payload",
     "input_data_to_json",
     "input_data_from_json",
     "display_from_json",
@@ -215,16 +216,13 @@ def _leaves_from_json(items) -> List[Leave]:
     return out
 
 
-def input_data_to_json(data: InputData, display: dict | None = None) -> str:
-    """Serialise an :class:`InputData` configuration to a JSON string.
+def input_data_payload(data: InputData) -> dict:
+    """The JSON-ready sections of a configuration, one per saved field.
 
     Solver-derived fields (the ``target_*`` values) are intentionally omitted;
-    only user-entered configuration is saved. ``display`` (optional) is a
-    cosmetic section — palette colours, custom columns and their values,
-    column order — stored under a ``"display"`` key so a saved config restores
-    the look as well as the maths. Loaders that predate it ignore the key.
+    only user-entered configuration is saved.
     """
-    payload = {
+    return {
         "start_date": data.start_date.isoformat(),
         "end_date": data.end_date.isoformat(),
         "shifts": [
@@ -343,6 +341,17 @@ def input_data_to_json(data: InputData, display: dict | None = None) -> str:
             else None
         ),
     }
+
+
+def input_data_to_json(data: InputData, display: dict | None = None) -> str:
+    """Serialise an :class:`InputData` configuration to a JSON string.
+
+    The sections are :func:`input_data_payload`'s. ``display`` (optional) is a
+    cosmetic section — palette colours, custom columns and their values,
+    column order — stored under a ``"display"`` key so a saved config restores
+    the look as well as the maths. Loaders that predate it ignore the key.
+    """
+    payload = input_data_payload(data)
     if display:
         payload["display"] = display
     return json.dumps(payload, indent=2)
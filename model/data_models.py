@@ -1,6 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, is_dataclass
 from datetime import date, timedelta
-from typing import List, NamedTuple, Sequence, Tuple, Dict
+from functools import cached_property
+from itertools import chain, repeat
+from types import MappingProxyType
+from typing import FrozenSet, List, Mapping, NamedTuple, Sequence, Tuple, Dict
 
 
 class Leave(NamedTuple):
@@ -287,31 +290,15 @@ def normalized_closures(closures):
 
 def shift_closed(day: date, shift, data) -> bool:
     """True if ``shift`` on ``day`` is closed (stood down) by any closure."""
-    for c in normalized_closures(getattr(data, "closures", None)):
-        if c.label != shift.label:
-            continue
-        if not (c.start <= day <= c.end):
-            continue
-        if c.weekdays and day.weekday() not in c.weekdays:
-            continue
-        return True
-    return False
+    return data.compiled().is_closed(day, shift.label)
 
 
 def nf_covered(day: date, shift, data) -> bool:
     """True if ``shift`` on ``day`` is covered by the night-float overlay."""
     if not shift.night_float:
         return False
-    cov = None
-    for entry in normalized_nf_coverage(data.nf_coverage):
-        if entry.label == shift.label:
-            cov = entry
-            break
-    if cov is None:
-        return False  # eligible but no coverage configured → scheduled as regular
-    if day in cov.exclude_dates:
-        return False
-    return day in cov.include_dates or day.weekday() in cov.weekdays
+    # Eligible but no coverage configured → scheduled as regular.
+    return data.compiled().is_nf_day(day, shift.label)
 
 
 def is_regular_night_call(day: date, shift, data) -> bool:
@@ -441,3 +428,339 @@ class InputData:
     target_total_map: Dict[str, float] | None = None
     target_night_float: Dict[str, float] | None = None
 
+    def compiled(self) -> "CompiledInput":
+        """This configuration's :class:`CompiledInput`, built on first call.
+
+        The view is a snapshot: treat the configuration as final once it is
+        compiled, and derive edits with ``dataclasses.replace`` (a new
+        ``InputData`` compiles afresh) rather than in place.
+        """
+        view = self.__dict__.get("_compiled")
+        if view is None:
+            view = self.__dict__["_compiled"] = CompiledInput.of(self)
+        return view
+
+    def __getstate__(self):
+        # Copies and pickles drop the view; it is rebuilt from the fields.
+        state = dict(self.__dict__)
+        state.pop("_compiled", None)
+        return state
+
+
+# The entry collections a CompiledInput snapshots and normalises.
+_COMPILED_COLLECTIONS = (
+    "leaves",
+    "rotators",
+    "perks",
+    "blackouts",
+    "reductions",
+    "nf_coverage",
+    "nf_assignments",
+    "closures",
+)
+
+
+def _grouped(pairs) -> Mapping[str, tuple]:
+    out: Dict[str, list] = {}
+    for key, item in pairs:
+        out.setdefault(key, []).append(item)
+    return MappingProxyType({key: tuple(items) for key, items in out.items()})
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledInput:
+    """A read-only view of an :class:`InputData` with its entries normalised.
+
+    The ``normalized_*`` generators used to be re-run from the raw entries at
+    every call site, some of them per resident and per day. The view takes a
+    snapshot of the raw entries once and normalises each collection on first
+    access, memoising it with its per-person and per-label indexes; a
+    malformed entry still raises where its collection is first read. Tuples
+    and read-only mappings throughout, so one view is safely shared; it hashes
+    by identity.
+    """
+
+    raw: Mapping[str, tuple]
+    named_groups: Mapping[str, Tuple[str, ...]]
+    nf_rest_days: int
+    start_date: date
+    end_date: date
+    roles: Mapping[str, str]  # resident -> "Junior" / "Senior"
+
+    @classmethod
+    def of(cls, data: InputData) -> "CompiledInput":
+        """Snapshot ``data``'s entries (use :meth:`InputData.compiled` to share one)."""
+        raw = {name: tuple(getattr(data, name) or ()) for name in _COMPILED_COLLECTIONS}
+        if isinstance(data.nf_coverage, dict):
+            raw["nf_coverage"] = tuple(data.nf_coverage.items())
+        groups = {
+            group: tuple(members or ()) for group, members in (data.named_groups or {}).items()
+        }
+        roles = {p: "Junior" for p in data.juniors}
+        roles.update({p: "Senior" for p in data.seniors})
+        return cls(
+            MappingProxyType(raw),
+            MappingProxyType(groups),
+            data.nf_rest_days,
+            data.start_date,
+            data.end_date,
+            MappingProxyType(roles),
+        )
+
+    @cached_property
+    def leaves(self) -> Tuple[Leave, ...]:
+        return tuple(normalized_leaves(self.raw["leaves"]))
+
+    @cached_property
+    def rotators(self) -> Tuple[RotatorWindow, ...]:
+        return tuple(normalized_rotators(self.raw["rotators"]))
+
+    @cached_property
+    def perks(self) -> Tuple[Perk, ...]:
+        return tuple(normalized_perks(self.raw["perks"]))
+
+    @cached_property
+    def blackouts(self) -> Tuple[Blackout, ...]:
+        return tuple(normalized_blackouts(self.raw["blackouts"]))
+
+    @cached_property
+    def reductions(self) -> Tuple[LoadReduction, ...]:
+        return tuple(normalized_reductions(self.raw["reductions"]))
+
+    @cached_property
+    def nf_coverage(self) -> Tuple[NightFloatCoverage, ...]:
+        return tuple(normalized_nf_coverage(self.raw["nf_coverage"]))
+
+    @cached_property
+    def nf_assignments(self) -> Tuple[NightFloatAssignment, ...]:
+        return tuple(normalized_nf_assignments(
+            self.raw["nf_assignments"], default_rest=self.nf_rest_days
+        ))
+
+    @cached_property
+    def closures(self) -> Tuple[ShiftClosure, ...]:
+        return tuple(normalized_closures(self.raw["closures"]))
+
+    def members(self, entry) -> Tuple[str, ...]:
+        """Who a blackout or reduction covers: its group's current members, or its own."""
+        if entry.group is not None:
+            return self.named_groups.get(entry.group, ())
+        return entry.members
+
+    @cached_property
+    def leaves_by_person(self) -> Mapping[str, Tuple[Leave, ...]]:
+        return _grouped((leave.name, leave) for leave in self.leaves)
+
+    @cached_property
+    def rotators_by_person(self) -> Mapping[str, Tuple[RotatorWindow, ...]]:
+        return _grouped((window.name, window) for window in self.rotators)
+
+    @cached_property
+    def perks_by_person(self) -> Mapping[str, Tuple[Perk, ...]]:
+        return _grouped((perk.name, perk) for perk in self.perks)
+
+    @cached_property
+    def blackouts_by_person(self) -> Mapping[str, Tuple[Blackout, ...]]:
+        """Each person's blackouts, in entry order, once each."""
+        return _grouped(
+            (person, b) for b in self.blackouts for person in dict.fromkeys(self.members(b))
+        )
+
+    @cached_property
+    def reductions_by_person(self) -> Mapping[str, Tuple[LoadReduction, ...]]:
+        """Each person's load reductions, in entry order, once each."""
+        return _grouped(
+            (person, r) for r in self.reductions for person in dict.fromkeys(self.members(r))
+        )
+
+    @cached_property
+    def blackout_windows(self) -> Mapping[str, Tuple[Tuple[date, date, bool], ...]]:
+        """As :func:`blackout_person_windows`: ``{name: ((start, end, compensated),)}``."""
+        return _grouped(
+            (person, (b.start, b.end, b.compensated))
+            for b in self.blackouts
+            for person in self.members(b)
+        )
+
+    @cached_property
+    def blackout_night_before(self) -> Mapping[str, FrozenSet[date]]:
+        """As :func:`blackout_night_before_dates`, with frozen date sets."""
+        nights: Dict[str, set] = {}
+        for b in self.blackouts:
+            if b.night_before:
+                for person in self.members(b):
+                    nights.setdefault(person, set()).add(b.start - timedelta(days=1))
+        return MappingProxyType({name: frozenset(days) for name, days in nights.items()})
+
+    @cached_property
+    def nf_coverage_by_label(self) -> Mapping[str, NightFloatCoverage]:
+        """The coverage pattern per shift label (the first entry for a label wins)."""
+        out: Dict[str, NightFloatCoverage] = {}
+        for entry in self.nf_coverage:
+            out.setdefault(entry.label, entry)
+        return MappingProxyType(out)
+
+    @cached_property
+    def closures_by_label(self) -> Mapping[str, Tuple[ShiftClosure, ...]]:
+        return _grouped((c.label, c) for c in self.closures)
+
+    # -- Calendar rules as day bitmasks ------------------------------------
+    # Bit ``i`` of a mask is block day ``start_date + i``; days outside the
+    # block fall back to the entry scan.
+
+    @property
+    def span(self) -> int:
+        """Number of days in the block."""
+        return max((self.end_date - self.start_date).days + 1, 0)
+
+    def day_index(self, day: date) -> int | None:
+        """``day``'s bit position, or None outside the block."""
+        index = (day - self.start_date).days
+        return index if 0 <= index < self.span else None
+
+    def _range_mask(self, start: date, end: date) -> int:
+        lo = max((start - self.start_date).days, 0)
+        hi = min((end - self.start_date).days, self.span - 1)
+        return ((1 << (hi - lo + 1)) - 1) << lo if lo <= hi else 0
+
+    def _weekday_mask(self, weekdays) -> int:
+        mask = 0
+        first = self.start_date.weekday()
+        for weekday in set(weekdays) & set(range(7)):
+            for index in range((weekday - first) % 7, self.span, 7):
+                mask |= 1 << index
+        return mask
+
+    def _dates_mask(self, days) -> int:
+        mask = 0
+        for day in days:
+            index = self.day_index(day)
+            if index is not None:
+                mask |= 1 << index
+        return mask
+
+    @cached_property
+    def _memo(self) -> dict:
+        # Per-label masks and coverer lookups, built on first request: a label
+        # no shift asks about is never compiled.
+        return {}
+
+    def closed_mask(self, label: str) -> int:
+        """The block days some closure stands ``label`` down."""
+        key = ("closed", label)
+        mask = self._memo.get(key)
+        if mask is None:
+            mask = 0
+            for c in self.closures_by_label.get(label, ()):
+                window = self._range_mask(c.start, c.end)
+                mask |= window & self._weekday_mask(c.weekdays) if c.weekdays else window
+            self._memo[key] = mask
+        return mask
+
+    def nf_mask(self, label: str) -> int:
+        """The block days ``label``'s night-float pattern covers."""
+        key = ("nf", label)
+        mask = self._memo.get(key)
+        if mask is None:
+            cov = self.nf_coverage_by_label.get(label)
+            mask = 0
+            if cov is not None:
+                mask = self._weekday_mask(cov.weekdays) | self._dates_mask(cov.include_dates)
+                mask &= ~self._dates_mask(cov.exclude_dates)
+            self._memo[key] = mask
+        return mask
+
+    def nf_coverers(self, label: str, role: str) -> Tuple[str | None, ...]:
+        """Each block day's night-float coverer for shift ``label`` of ``role``.
+
+        The first assignment by ``(start, name)`` whose window, role and labels
+        fit covers the day; None where no assignment does. Only meaningful on
+        the days :meth:`nf_mask` marks as covered.
+        """
+        key = ("coverers", label, role)
+        days = self._memo.get(key)
+        if days is None:
+            filled: List[str | None] = [None] * self.span
+            for a in sorted(self.nf_assignments, key=lambda a: (a.start, a.name)):
+                if self.roles.get(a.name) != role or (a.labels and label not in a.labels):
+                    continue
+                lo = max((a.start - self.start_date).days, 0)
+                hi = min((a.end - self.start_date).days, self.span - 1)
+                for index in range(lo, hi + 1):
+                    if filled[index] is None:
+                        filled[index] = a.name
+            days = self._memo[key] = tuple(filled)
+        return days
+
+    def is_closed(self, day: date, label: str) -> bool:
+        """Whether a closure stands ``label`` down on ``day``."""
+        index = self.day_index(day)
+        if index is not None:
+            return bool(self.closed_mask(label) >> index & 1)
+        return any(
+            c.start <= day <= c.end and (not c.weekdays or day.weekday() in c.weekdays)
+            for c in self.closures_by_label.get(label, ())
+        )
+
+    def is_nf_day(self, day: date, label: str) -> bool:
+        """Whether ``label``'s night-float pattern covers ``day``."""
+        index = self.day_index(day)
+        if index is not None:
+            return bool(self.nf_mask(label) >> index & 1)
+        cov = self.nf_coverage_by_label.get(label)
+        if cov is None or day in cov.exclude_dates:
+            return False
+        return day in cov.include_dates or day.weekday() in cov.weekdays
+
+
+
+# -- Content keys ----------------------------------------------------------
+
+_PLAIN = frozenset({str, int, bool, date, type(None)})
+_PLAIN_OR_FLOAT = _PLAIN | {float}
+
+
+def _scalars(values) -> tuple | None:
+    """A key for a flat run of scalars, or None if any isn't a plain scalar."""
+    values = tuple(values)
+    types = tuple(map(type, values))  # True, 1 and 1.0 save differently
+    kinds = set(types)
+    if kinds <= _PLAIN:
+        return (values, types)
+    if kinds <= _PLAIN_OR_FLOAT:
+        return (tuple(map(repr, values)), types)  # so do 0.0 and -0.0
+    return None
+
+
+def content_key(value):
+    """A hashable stand-in for a configuration value, equal only when the contents are.
+
+    Stricter than equality or the saved JSON (a reordered mapping, or 1 in
+    place of 1.0, is a different key), so equal keys always mean the same
+    saved section and the same answers from anything that reads it. Flat runs
+    of scalars — name lists, leave records, ledger rows — are keyed in bulk.
+    """
+    kind = type(value)
+    if kind in _PLAIN:
+        return (kind, value)
+    if kind is float:
+        return (kind, repr(value))
+    if isinstance(value, (list, tuple)):
+        flat = _scalars(value)
+        if flat is None and all(map(isinstance, value, repeat(tuple))):
+            records = _scalars(chain.from_iterable(value))
+            if records is not None:
+                flat = records + (tuple(map(type, value)), tuple(map(len, value)))
+        if flat is None:
+            flat = tuple(map(content_key, value))
+        return (kind, flat)
+    if isinstance(value, dict):
+        flat = _scalars(chain.from_iterable(value.items()))
+        if flat is None:
+            flat = tuple((content_key(k), content_key(v)) for k, v in value.items())
+        return (dict, flat)
+    if isinstance(value, (set, frozenset)):
+        return (frozenset, frozenset(map(content_key, value)))
+    if is_dataclass(value):
+        return (kind, tuple(content_key(getattr(value, f.name)) for f in fields(value)))
+    return (kind, repr(value))
@@ -13,10 +13,12 @@ import io
 import json
 import math
 import os
+import threading
 import unicodedata
-from datetime import date as _date
+from datetime import date as _date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Mapping, Sequence, Tuple
+from typing import Dict, List, Mapping, NamedTuple, Sequence, Tuple
 from xml.sax.saxutils import escape
 
 try:
@@ -28,6 +30,7 @@ from .coloring import DEFAULT_PALETTE, schedule_cell_colors
 from .data_models import InputData
 from .fairness import ResidentPoints, calculate_points
 from .points import classify_slot
+from .resolved import ResolvedBlock, block_for
 from .utils import compact_date_range, friendly_date, weekend_holiday_dates
 
 __all__ = [
@@ -35,6 +38,8 @@ __all__ = [
     "build_assignment_frame",
     "build_cumulative_frame",
     "build_policy_snapshot_frame",
+    "ReportComponents",
+    "report_components",
     "spreadsheet_safe_text",
     "spreadsheet_safe_frame",
     "schedule_to_excel_bytes",
@@ -81,15 +86,39 @@ def spreadsheet_safe_text(value):
     return value
 
 
+# ``spreadsheet_safe_text``'s rule as one pattern: a leading tab / CR / LF, or
+# a formula sigil after optional leading whitespace.
+_FORMULA_LEAD = r"[\t\r\n]|[ \t\r\n]*[=+\-@]"
+
+
+def _safe_column(column):
+    """:func:`spreadsheet_safe_text` over a whole Series at once.
+
+    Numeric, boolean and datetime columns cannot hold text and are returned
+    as-is, as are text columns with nothing to neutralise.
+    """
+    if column.dtype.kind in "biufcmM":
+        return column
+    try:
+        risky = column.str.match(_FORMULA_LEAD, na=False)
+    except AttributeError:  # no text in this column at all
+        return column
+    if not risky.any():
+        return column
+    safe = column.copy()
+    safe[risky] = "'" + column[risky]
+    return safe
+
+
 def spreadsheet_safe_frame(frame):
     """Copy a DataFrame and neutralise formula-like values and headers."""
     safe = frame.copy()
     safe.columns = [spreadsheet_safe_text(column) for column in safe.columns]
     for index in range(len(safe.columns)):
-        safe.isetitem(
-            index,
-            [spreadsheet_safe_text(value) for value in safe.iloc[:, index]],
-        )
+        column = safe.iloc[:, index]
+        neutral = _safe_column(column)
+        if neutral is not column:
+            safe.isetitem(index, neutral.array)
     return safe
 
 
@@ -107,7 +136,14 @@ def _pdf_safe_text(value, *, unicode_font: bool = False) -> str:
     unsupported characters are preserved as reversible ``U+XXXX`` tokens
     rather than disappearing. Excel always retains the original Unicode text.
     """
-    text = _fmt(value).translate(_PDF_PUNCTUATION)
+    return _shape_pdf_text(_fmt(value), unicode_font)
+
+
+@lru_cache(maxsize=4096)
+def _shape_pdf_text(text: str, unicode_font: bool) -> str:
+    # Memoised: the same resident names and labels fill most cells of a
+    # report, and reshaping/normalising each occurrence dominated the build.
+    text = text.translate(_PDF_PUNCTUATION)
     if unicode_font:
         # ReportLab does not shape right-to-left scripts itself. The small
         # optional runtime helpers are direct dependencies of the app, but the
@@ -132,8 +168,25 @@ def _pdf_safe_text(value, *, unicode_font: bool = False) -> str:
     return "".join(out)
 
 
-def _register_pdf_fonts():
-    """Register an installed Unicode font, with safe base-font fallback."""
+_PDF_FONTS: Tuple[str, str, bool] | None = None
+_PDF_FONTS_LOCK = threading.Lock()
+
+
+def _register_pdf_fonts() -> Tuple[str, str, bool]:
+    """Register an installed Unicode font, with safe base-font fallback.
+
+    ReportLab's font registry is process-wide, so the probe and registration
+    run once per process (under a lock, as exports build concurrently) and
+    later calls return the same ``(normal, bold, unicode)`` answer.
+    """
+    global _PDF_FONTS
+    with _PDF_FONTS_LOCK:
+        if _PDF_FONTS is None:
+            _PDF_FONTS = _probe_pdf_fonts()
+        return _PDF_FONTS
+
+
+def _probe_pdf_fonts() -> Tuple[str, str, bool]:
     from reportlab.pdfbase import pdfmetrics
     from reportlab.pdfbase.ttfonts import TTFont
 
@@ -174,6 +227,8 @@ def build_fairness_frame(
     df=None,
     prior_ledger=None,
     ledger_policy=None,
+    *,
+    block: ResolvedBlock | None = None,
 ) -> "pd.DataFrame":
     """Return a per-resident fairness table (total, weekend, NF, per-label).
 
@@ -184,7 +239,8 @@ def build_fairness_frame(
     when the ledger carries a per-label history), showing the multi-block
     picture the carryover balancing works from. A ``Notes`` column carries the
     same load annotations as the fairness log (groups, perks, exemptions,
-    blackouts, reductions, leaves).
+    blackouts, reductions, leaves). ``block`` is the
+    :class:`~model.resolved.ResolvedBlock` of ``data`` when the caller has it.
     """
     from .fairness import (  # shared target resolution / annotations
         _resolved_target,
@@ -212,7 +268,9 @@ def build_fairness_frame(
     if df is not None:
         from .ledger import update_ledger
 
-        ending_ledger = update_ledger(prior, df, data, policy=ledger_policy)
+        ending_ledger = update_ledger(
+            prior, df, data, policy=ledger_policy, block=block
+        )
         show_cumulative = show_cumulative or any(
             abs(
                 float((ending_ledger.get(name) or {}).get(dim, 0.0))
@@ -364,6 +422,8 @@ def build_cumulative_frame(
     prior_ledger,
     data: InputData,
     ledger_policy=None,
+    *,
+    block: ResolvedBlock | None = None,
 ) -> "pd.DataFrame":
     """Long-form rows for the cumulative standing chart.
 
@@ -377,7 +437,7 @@ def build_cumulative_frame(
 
     prior = prior_ledger or {}
     policy = DEFAULT_POLICY if ledger_policy is None else ledger_policy
-    adjustments = block_adjustments(prior, data)
+    adjustments = block_adjustments(prior, data, block=block)
     rows = []
     for name in sorted(points):
         before = float((prior.get(name) or {}).get("total", 0.0))
@@ -727,16 +787,195 @@ def _authoritative_frame(display_df, authoritative_df=None):
     return authoritative_df if authoritative_df is not None else display_df
 
 
-def _resolve_validation_issues(df, data: InputData, supplied=None) -> List[str]:
+def _resolve_validation_issues(
+    df, data: InputData, supplied=None, block: ResolvedBlock | None = None
+) -> List[str]:
     if supplied is not None:
         return [str(issue) for issue in supplied]
     from .validation import validate_schedule
 
-    return list(validate_schedule(df, data))
+    return list(validate_schedule(df, data, block=block))
+
+
+class ReportComponents(NamedTuple):
+    """The parts of the Excel/PDF report that no display option can change.
+
+    Built by :func:`report_components` from the authoritative result alone,
+    so one set serves both reports and every recolour or column change.
+    ``assignments`` is None when the frame has no Date column.
+    """
+
+    fairness: "pd.DataFrame"
+    assignments: "pd.DataFrame | None"
+    policy: "pd.DataFrame"
+    print_policy: "pd.DataFrame"
+    quality: Mapping[str, float]
+    issues: List[str]
+
+
+def report_components(
+    df: "pd.DataFrame",
+    data: InputData,
+    points: Dict[str, ResidentPoints] | None = None,
+    prior_ledger=None,
+    *,
+    validation_issues: Sequence[str] | None = None,
+    policy_snapshot: Mapping[str, object] | None = None,
+    ledger_policy=None,
+    block: ResolvedBlock | None = None,
+) -> ReportComponents:
+    """Build the display-independent report parts of the result ``df``.
+
+    ``policy`` is the detailed Excel snapshot, ``print_policy`` the PDF's.
+    """
+    from .fairness import schedule_quality
+
+    block = block_for(data, block)
+    points = points if points is not None else calculate_points(df, data)
+    issues = _resolve_validation_issues(df, data, validation_issues, block)
+    return ReportComponents(
+        fairness=build_fairness_frame(
+            points, data, df, prior_ledger, ledger_policy=ledger_policy, block=block,
+        ),
+        assignments=build_assignment_frame(df, data) if "Date" in df.columns else None,
+        policy=build_policy_snapshot_frame(
+            data, df, issues, policy_snapshot, ledger_policy=ledger_policy,
+            include_config_details=True, prior_ledger=prior_ledger,
+        ),
+        print_policy=build_policy_snapshot_frame(
+            data, df, issues, policy_snapshot, ledger_policy=ledger_policy
+        ),
+        quality=schedule_quality(df, data, points=points),
+        issues=issues,
+    )
 
 
 # --- Excel --------------------------------------------------------------------
 
+# Number formats ``DataFrame.to_excel`` gives date / datetime cells; the
+# streaming writer below keeps them so the workbook reads exactly as before.
+_EXCEL_DATE_FORMAT = "YYYY-MM-DD"
+_EXCEL_DATETIME_FORMAT = "YYYY-MM-DD HH:MM:SS"
+
+
+def _excel_value(value) -> Tuple[object, str | None]:
+    """``(cell value, number format)`` for ``value``, as ``to_excel`` writes it.
+
+    Missing values become empty cells, numpy scalars plain Python numbers,
+    infinities the text ``inf``; anything that is not a number, bool or date
+    is written as its ``str``.
+    """
+    from pandas.api.types import is_bool, is_float, is_integer, is_scalar
+
+    if is_scalar(value) and _is_missing(value):
+        return "", None
+    if is_integer(value):
+        return int(value), None
+    if is_float(value):
+        value = float(value)
+        if math.isinf(value):
+            return ("inf" if value > 0 else "-inf"), None
+        return value, None
+    if is_bool(value):
+        return bool(value), None
+    if isinstance(value, datetime):
+        return value, _EXCEL_DATETIME_FORMAT
+    if isinstance(value, _date):
+        return value, _EXCEL_DATE_FORMAT
+    if isinstance(value, timedelta):
+        return value.total_seconds() / 86400, "0"
+    return str(value), None
+
+
+def _excel_width(column, values, wide_cols=(), wrap_cols=()) -> float:
+    """Column width: content length + 2, clamped by the column's kind."""
+    content_width = max([len(_fmt(column))] + [len(_fmt(v)) for v in values]) + 2
+    if column in wrap_cols:
+        return max(24, min(60, content_width))
+    if column in wide_cols:
+        return max(16, min(36, content_width))
+    return max(10, min(28, content_width))
+
+
+def _write_excel_sheet(
+    workbook,
+    title: str,
+    frame: "pd.DataFrame",
+    *,
+    wide_cols: Sequence[str] = (),
+    wrap_cols: Sequence[str] = (),
+    number_formats: Mapping[str, str] | None = None,
+    fills: Mapping[Tuple[int, int], str] | None = None,
+) -> None:
+    """Stream ``frame`` into a new write-only sheet of ``workbook``.
+
+    Widths, the frozen header + first column, the filter range and the
+    header style are all settled from the frame before the first row goes
+    out (a write-only sheet cannot be revisited); each data cell then gets
+    its number format, wrap and fill as it is written, so no cell model of
+    the sheet is ever held in memory. ``number_formats`` overrides the
+    format of whole columns by name; ``fills`` maps 0-based
+    ``(row, column)`` positions to hex colours.
+    """
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Font, PatternFill
+    from openpyxl.utils import get_column_letter
+
+    worksheet = workbook.create_sheet(title)
+    columns = list(frame.columns)
+    for col_idx, column in enumerate(columns, start=1):
+        worksheet.column_dimensions[get_column_letter(col_idx)].width = _excel_width(
+            column, frame.iloc[:, col_idx - 1], wide_cols, wrap_cols
+        )
+    worksheet.freeze_panes = "B2"
+    last_row = len(frame) + 1 if columns else 1
+    worksheet.auto_filter.ref = f"A1:{get_column_letter(max(len(columns), 1))}{last_row}"
+    worksheet.sheet_view.showGridLines = False
+
+    header_fill = PatternFill(start_color="333333", end_color="333333", fill_type="solid")
+    header_font = Font(bold=True, color="FFFFFF")
+    header = []
+    for column in columns:
+        cell = WriteOnlyCell(worksheet, value=_excel_value(column)[0])
+        cell.fill = header_fill
+        cell.font = header_font
+        header.append(cell)
+    worksheet.append(header)
+
+    wrap = Alignment(wrap_text=True, vertical="top")
+    wrapped = {i for i, column in enumerate(columns) if column in wrap_cols}
+    formats = {
+        i: (number_formats or {})[column]
+        for i, column in enumerate(columns)
+        if column in (number_formats or {})
+    }
+    fill_for: Dict[str, object] = {}
+    fills = fills or {}
+    for row_idx, row in enumerate(frame.itertuples(index=False, name=None)):
+        out = []
+        for col_idx, raw in enumerate(row):
+            value, number_format = _excel_value(raw)
+            number_format = formats.get(col_idx, number_format)
+            hexcolor = fills.get((row_idx, col_idx))
+            if number_format is None and hexcolor is None and col_idx not in wrapped:
+                out.append(value)
+                continue
+            cell = WriteOnlyCell(worksheet, value=value)
+            if number_format is not None:
+                cell.number_format = number_format
+            if col_idx in wrapped:
+                cell.alignment = wrap
+            if hexcolor is not None:
+                if hexcolor not in fill_for:
+                    rgb = hexcolor.lstrip("#").upper()
+                    fill_for[hexcolor] = PatternFill(
+                        start_color=rgb, end_color=rgb, fill_type="solid"
+                    )
+                cell.fill = fill_for[hexcolor]
+            out.append(cell)
+        worksheet.append(out)
+
+
 def schedule_to_excel_bytes(
     df: "pd.DataFrame",
     data: InputData,
@@ -749,6 +988,9 @@ def schedule_to_excel_bytes(
     validation_issues: Sequence[str] | None = None,
     policy_snapshot: Mapping[str, object] | None = None,
     ledger_policy=None,
+    block: ResolvedBlock | None = None,
+    components: ReportComponents | None = None,
+    cell_colors: Mapping[Tuple[int, str], str] | None = None,
 ) -> bytes:
     """Serialise the schedule, fairness summary, and per-call audit to .xlsx.
 
@@ -756,26 +998,24 @@ def schedule_to_excel_bytes(
     date formatting, explicit "Unfilled" in empty slots, cells shaded to match
     the on-screen view); sheet "Fairness" is the per-resident summary with a
     wrapped Notes column; sheet "Per-call" (when the frame still carries its
-    Date column) is the slot-by-slot audit. Requires ``openpyxl``.
+    Date column) is the slot-by-slot audit. ``block`` (the
+    :class:`~model.resolved.ResolvedBlock` of ``data``) is shared by the
+    fairness and validation sections. Sheets are streamed through openpyxl's
+    write-only mode, so a long block costs no per-cell object model.
+    ``components`` (from :func:`report_components`) and ``cell_colors`` (the
+    ``schedule_cell_colors`` map) skip rebuilding what the caller already
+    holds. Requires ``openpyxl``.
     """
-    from openpyxl.styles import Alignment, Font, PatternFill
-    from openpyxl.utils import get_column_letter
+    from openpyxl import Workbook
 
     source_df = _authoritative_frame(df, authoritative_df)
-    points = points if points is not None else calculate_points(source_df, data)
-    fairness = build_fairness_frame(
-        points, data, source_df, prior_ledger, ledger_policy=ledger_policy
-    )
-    issues = _resolve_validation_issues(source_df, data, validation_issues)
-    policy = build_policy_snapshot_frame(
-        data,
-        source_df,
-        issues,
-        policy_snapshot,
-        ledger_policy=ledger_policy,
-        include_config_details=True,
-        prior_ledger=prior_ledger,
-    )
+    block = block_for(data, block)
+    if components is None:
+        components = report_components(
+            source_df, data, points, prior_ledger,
+            validation_issues=validation_issues, policy_snapshot=policy_snapshot,
+            ledger_policy=ledger_policy, block=block,
+        )
 
     # Render copy only: an empty shift cell prints as an explicit "Unfilled";
     # the caller's frame (used for fairness maths) is never touched.
@@ -788,74 +1028,38 @@ def schedule_to_excel_bytes(
             for v in render_df[label]
         ]
     render_df = spreadsheet_safe_frame(render_df)
-    fairness = spreadsheet_safe_frame(fairness)
-    policy = spreadsheet_safe_frame(policy)
 
-    header_fill = PatternFill(start_color="333333", end_color="333333", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF")
-
-    def _polish(worksheet, frame, wide_cols=(), wrap_cols=()):
-        worksheet.freeze_panes = "B2"
-        worksheet.auto_filter.ref = worksheet.dimensions
-        worksheet.sheet_view.showGridLines = False
-        for col_idx, column in enumerate(frame.columns, start=1):
-            head = worksheet.cell(row=1, column=col_idx)
-            head.fill = header_fill
-            head.font = header_font
-            letter = get_column_letter(col_idx)
-            content_width = max(
-                [len(_fmt(column))]
-                + [len(_fmt(worksheet.cell(row=row_idx, column=col_idx).value))
-                   for row_idx in range(2, len(frame) + 2)]
-            ) + 2
-            if column in wrap_cols:
-                width = max(24, min(60, content_width))
-                for row_idx in range(2, len(frame) + 2):
-                    worksheet.cell(row=row_idx, column=col_idx).alignment = (
-                        Alignment(wrap_text=True, vertical="top")
-                    )
-            elif column in wide_cols:
-                width = max(16, min(36, content_width))
-            else:
-                width = max(10, min(28, content_width))
-            worksheet.column_dimensions[letter].width = width
-
-    buffer = io.BytesIO()
-    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
-        render_df.to_excel(writer, sheet_name="Schedule", index=False)
-        fairness.to_excel(writer, sheet_name="Fairness", index=False)
-        schedule_ws = writer.sheets["Schedule"]
-        _polish(schedule_ws, render_df, wide_cols=("Date", "Day"))
-        if "Date" in render_df.columns:
-            date_col = list(render_df.columns).index("Date") + 1
-            for row_idx in range(2, len(render_df) + 2):
-                schedule_ws.cell(row=row_idx, column=date_col).number_format = "ddd dd mmm"
-        _polish(
-            writer.sheets["Fairness"], fairness,
-            wide_cols=("Resident",), wrap_cols=("Notes",),
-        )
-        if color_mode and color_mode != "none":
-            for (row_idx, label), hexcolor in schedule_cell_colors(source_df, data, color_mode, palette).items():
-                if label in render_columns:
-                    rgb = hexcolor.lstrip("#").upper()
-                    schedule_ws.cell(
-                        row=row_idx + 2,
-                        column=render_columns.index(label) + 1,
-                    ).fill = PatternFill(
-                        start_color=rgb, end_color=rgb, fill_type="solid"
-                    )
-        if "Date" in source_df.columns:
-            per_call = spreadsheet_safe_frame(build_assignment_frame(source_df, data))
-            per_call.to_excel(writer, sheet_name="Per-call", index=False)
-            _polish(
-                writer.sheets["Per-call"], per_call,
-                wide_cols=("Date", "Shift", "Status", "Resident"),
+    fills: Dict[Tuple[int, int], str] = {}
+    if color_mode and color_mode != "none":
+        if cell_colors is None:
+            cell_colors = schedule_cell_colors(
+                source_df, data, color_mode, palette, block=block
             )
-        policy.to_excel(writer, sheet_name="Policy & validation", index=False)
-        _polish(
-            writer.sheets["Policy & validation"], policy,
-            wide_cols=("Setting",), wrap_cols=("Value",),
+        for (row_idx, label), hexcolor in cell_colors.items():
+            if label in render_columns:
+                fills[(row_idx, render_columns.index(label))] = hexcolor
+
+    workbook = Workbook(write_only=True)
+    _write_excel_sheet(
+        workbook, "Schedule", render_df,
+        wide_cols=("Date", "Day"), number_formats={"Date": "ddd dd mmm"},
+        fills=fills,
+    )
+    _write_excel_sheet(
+        workbook, "Fairness", spreadsheet_safe_frame(components.fairness),
+        wide_cols=("Resident",), wrap_cols=("Notes",),
+    )
+    if components.assignments is not None:
+        _write_excel_sheet(
+            workbook, "Per-call", spreadsheet_safe_frame(components.assignments),
+            wide_cols=("Date", "Shift", "Status", "Resident"),
         )
+    _write_excel_sheet(
+        workbook, "Policy & validation", spreadsheet_safe_frame(components.policy),
+        wide_cols=("Setting",), wrap_cols=("Value",),
+    )
+    buffer = io.BytesIO()
+    workbook.save(buffer)
     return buffer.getvalue()
 
 
@@ -864,6 +1068,66 @@ def schedule_to_excel_bytes(
 _WEEKEND_ROW_TINT = "#f6efdc"   # soft parchment behind weekend rows
 
 
+@lru_cache(maxsize=None)
+def _pdf_styles(font_name: str, bold_font_name: str) -> Dict[str, object]:
+    """The report's paragraph styles, built once per font pair and shared.
+
+    Styles are read-only during a build, so concurrent exports can share them.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+
+    styles = getSampleStyleSheet()
+    cell = ParagraphStyle("cell", fontName=font_name, fontSize=7, leading=8.5)
+    return {
+        "title": styles["Title"],
+        "cell": cell,
+        "cell_dim": ParagraphStyle(
+            "cell_dim", parent=cell, fontName=font_name,
+            textColor=colors.HexColor("#8a8378"),
+        ),
+        "head": ParagraphStyle(
+            "head", fontName=bold_font_name, fontSize=7, leading=8.5,
+            textColor=colors.white,
+        ),
+        "meta": ParagraphStyle(
+            "meta", fontName=font_name, fontSize=8.5, leading=11,
+            textColor=colors.HexColor("#4a4438"),
+        ),
+        "note": ParagraphStyle(
+            "note", fontName=font_name, fontSize=7.5, leading=10
+        ),
+        "section": ParagraphStyle(
+            "section", parent=styles["Heading2"], fontName=bold_font_name,
+            keepWithNext=True,
+        ),
+    }
+
+
+@lru_cache(maxsize=1)
+def _pdf_table_base():
+    """The grid/header/padding commands every report table starts from."""
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+
+    return TableStyle([
+        ("GRID", (0, 0), (-1, -1), 0.4, colors.HexColor("#b9b2a4")),
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#333333")),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ("LEFTPADDING", (0, 0), (-1, -1), 3),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 3),
+        ("TOPPADDING", (0, 0), (-1, -1), 2),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
+    ])
+
+
+@lru_cache(maxsize=256)
+def _pdf_color(hexcolor: str):
+    from reportlab.lib import colors
+
+    return colors.HexColor(hexcolor)
+
+
 def schedule_to_pdf_bytes(
     df: "pd.DataFrame",
     data: InputData,
@@ -876,6 +1140,9 @@ def schedule_to_pdf_bytes(
     validation_issues: Sequence[str] | None = None,
     policy_snapshot: Mapping[str, object] | None = None,
     ledger_policy=None,
+    block: ResolvedBlock | None = None,
+    components: ReportComponents | None = None,
+    cell_colors: Mapping[Tuple[int, str], str] | None = None,
 ) -> bytes:
     """Render the full report to a landscape-A4 PDF.
 
@@ -886,11 +1153,11 @@ def schedule_to_pdf_bytes(
     markers) → numbered Notes block. Column widths are content-aware (name
     columns wide, numerics narrow) instead of evenly split, and cell text is
     XML-escaped so names with ``&``/``<`` can't break the renderer.
-    Requires ``reportlab``.
+    ``block``, ``components`` and ``cell_colors`` are shared as in
+    :func:`schedule_to_excel_bytes`. Requires ``reportlab``.
     """
     from reportlab.lib import colors
     from reportlab.lib.pagesizes import A4, landscape
-    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
     from reportlab.lib.units import cm
     from reportlab.platypus import (
         KeepTogether,
@@ -901,41 +1168,22 @@ def schedule_to_pdf_bytes(
         TableStyle,
     )
 
-    from .fairness import schedule_quality
-
     source_df = _authoritative_frame(df, authoritative_df)
-    points = points if points is not None else calculate_points(source_df, data)
-    fairness = build_fairness_frame(
-        points, data, source_df, prior_ledger, ledger_policy=ledger_policy
-    )
-    quality = schedule_quality(source_df, data, points=points)
-    issues = _resolve_validation_issues(source_df, data, validation_issues)
-    policy = build_policy_snapshot_frame(
-        data, source_df, issues, policy_snapshot, ledger_policy=ledger_policy
-    )
+    block = block_for(data, block)
+    if components is None:
+        components = report_components(
+            source_df, data, points, prior_ledger,
+            validation_issues=validation_issues, policy_snapshot=policy_snapshot,
+            ledger_policy=ledger_policy, block=block,
+        )
+    fairness, quality, issues = components.fairness, components.quality, components.issues
+    policy = components.print_policy
 
     font_name, bold_font_name, unicode_font = _register_pdf_fonts()
-    styles = getSampleStyleSheet()
-    cell = ParagraphStyle("cell", fontName=font_name, fontSize=7, leading=8.5)
-    cell_dim = ParagraphStyle(
-        "cell_dim", parent=cell, fontName=font_name,
-        textColor=colors.HexColor("#8a8378"),
-    )
-    head = ParagraphStyle(
-        "head", fontName=bold_font_name, fontSize=7, leading=8.5,
-        textColor=colors.white,
-    )
-    meta = ParagraphStyle(
-        "meta", fontName=font_name, fontSize=8.5, leading=11,
-        textColor=colors.HexColor("#4a4438"),
-    )
-    note_style = ParagraphStyle(
-        "note", fontName=font_name, fontSize=7.5, leading=10
-    )
-    section_style = ParagraphStyle(
-        "section", parent=styles["Heading2"], fontName=bold_font_name,
-        keepWithNext=True,
-    )
+    pdf_styles = _pdf_styles(font_name, bold_font_name)
+    cell, cell_dim, head = pdf_styles["cell"], pdf_styles["cell_dim"], pdf_styles["head"]
+    meta, note_style = pdf_styles["meta"], pdf_styles["note"]
+    section_style = pdf_styles["section"]
 
     page = landscape(A4)
     usable_width = page[0] - 2 * cm
@@ -987,20 +1235,13 @@ def schedule_to_pdf_bytes(
         table = Table(
             [header] + body, colWidths=_widths(columns, first_col_cm), repeatRows=1
         )
-        style = [
-            ("GRID", (0, 0), (-1, -1), 0.4, colors.HexColor("#b9b2a4")),
-            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#333333")),
-            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-            ("LEFTPADDING", (0, 0), (-1, -1), 3),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 3),
-            ("TOPPADDING", (0, 0), (-1, -1), 2),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
-        ]
+        table.setStyle(_pdf_table_base())
+        style = []
         if weekend_rows:
             for row_idx in sorted(weekend_rows):
                 style.append((
                     "BACKGROUND", (0, row_idx + 1), (-1, row_idx + 1),
-                    colors.HexColor(_WEEKEND_ROW_TINT),
+                    _pdf_color(_WEEKEND_ROW_TINT),
                 ))
         elif not cell_bg:
             style.append((
@@ -1009,14 +1250,16 @@ def schedule_to_pdf_bytes(
             ))
         if cell_bg:
             # Per-cell shading to match the on-screen view; header stays dark.
+            positions = {label: col for col, label in reversed(list(enumerate(columns)))}
             for (row_idx, label), hexcolor in cell_bg.items():
-                if label in columns:
-                    col = columns.index(label)
+                col = positions.get(label)
+                if col is not None:
                     style.append(
                         ("BACKGROUND", (col, row_idx + 1), (col, row_idx + 1),
-                         colors.HexColor(hexcolor))
+                         _pdf_color(hexcolor))
                     )
-        table.setStyle(TableStyle(style))
+        if style:
+            table.setStyle(TableStyle(style))
         return table
 
     def _legend_flowable():
@@ -1061,15 +1304,16 @@ def schedule_to_pdf_bytes(
         canvas.drawRightString(page[0] - cm, 0.6 * cm, f"Page {document.page}")
         canvas.restoreState()
 
-    schedule_bg = (
-        schedule_cell_colors(source_df, data, color_mode, palette)
-        if color_mode and color_mode != "none"
-        else None
-    )
+    schedule_bg = None
+    if color_mode and color_mode != "none":
+        schedule_bg = (
+            cell_colors if cell_colors is not None
+            else schedule_cell_colors(source_df, data, color_mode, palette, block=block)
+        )
     sched_cols, sched_rows, weekend_rows = schedule_print_view(df, data)
     markers, footnotes = annotation_footnotes(fairness)
 
-    elements = [Paragraph("Idea Gold Schedule", styles["Title"])]
+    elements = [Paragraph("Idea Gold Schedule", pdf_styles["title"])]
     for line in report_header_lines(data, source_df, quality, issues):
         elements.append(
             Paragraph(
@@ -1,20 +1,13 @@
 from __future__ import annotations
 
-from typing import Dict, List, TypedDict
+from typing import TYPE_CHECKING, Dict, List, TypedDict
 
 try:
     import pandas as pd
 except ImportError:  # pragma: no cover - fallback when pandas missing
     from .pandas_stub import pd
 
-from .data_models import (
-    ShiftTemplate,
-    InputData,
-    normalized_blackouts,
-    normalized_leaves,
-    normalized_perks,
-    normalized_reductions,
-)
+from .data_models import ShiftTemplate, InputData
 from .points import classify_slot, slot_points
 from .utils import (
     compact_date_range,
@@ -23,6 +16,9 @@ from .utils import (
     weekend_holiday_dates,
 )
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .resolved import ResolvedBlock
+
 __all__ = [
     "ResidentPoints",
     "calculate_points",
@@ -30,6 +26,7 @@ __all__ = [
     "format_fairness_log",
     "fairness_range_lines",
     "load_annotation_notes",
+    "points_spread",
     "preference_satisfaction",
     "schedule_quality",
     "quality_diagnosis",
@@ -206,6 +203,19 @@ def fairness_range_lines(points: Dict[str, ResidentPoints]) -> List[str]:
     return lines
 
 
+def points_spread(df: pd.DataFrame, data: InputData) -> float:
+    """A small fairness score (lower = fairer): the total-points range plus half
+    the weekend range. Solve runners use it only to compare two schedules of
+    the same block when no exact solver objective is available."""
+    try:
+        pts = calculate_points(df, data)
+        totals = [v.get("total", 0.0) for v in pts.values()] or [0.0]
+        weekends = [v.get("weekend", 0.0) for v in pts.values()] or [0.0]
+        return (max(totals) - min(totals)) + 0.5 * (max(weekends) - min(weekends))
+    except Exception:  # pragma: no cover - never let scoring break a solve
+        return float("inf")
+
+
 def _resolved_target(df, key: str, fallback):
     """Prefer a solver-resolved target stashed on ``df.attrs`` over the input.
 
@@ -232,23 +242,15 @@ def load_annotation_notes(person: str, data: InputData) -> List[str]:
         factor = (data.group_factors or {}).get(group)
         if factor is not None and factor != 1.0:
             notes.append(f"[{group} ×{factor:.2f}]")
-    for perk in normalized_perks(data.perks):
-        if perk.name != person:
-            continue
+    view = data.compiled()
+    for perk in view.perks_by_person.get(person, ()):
         start = perk.start.isoformat() if perk.start else ""
         end = perk.end.isoformat() if perk.end else "forever"
         notes.append(f"[perk ×{perk.factor:.2f} {start}→{end}]")
     labels = (data.exempt_shifts or {}).get(person)
     if labels:
         notes.append(f"[exempt: {', '.join(sorted(labels))}]")
-    for b in normalized_blackouts(data.blackouts):
-        covered = (
-            (data.named_groups or {}).get(b.group, ())
-            if b.group is not None
-            else b.members
-        )
-        if person not in covered:
-            continue
+    for b in view.blackouts_by_person.get(person, ()):
         # Compact date range (e.g. "12–17 Jul") — the full ISO form made these
         # tokens so long they wrecked the fairness table and PDF layout.
         note = f"[blackout {b.group or 'ad-hoc'} {compact_date_range(b.start, b.end)}"
@@ -257,14 +259,7 @@ def load_annotation_notes(person: str, data: InputData) -> List[str]:
         if not b.compensated:
             note += " uncomp"
         notes.append(note + "]")
-    for red in normalized_reductions(data.reductions):
-        covered = (
-            (data.named_groups or {}).get(red.group, ())
-            if red.group is not None
-            else red.members
-        )
-        if person not in covered:
-            continue
+    for red in view.reductions_by_person.get(person, ()):
         mode = "same-total" if red.keep_total else "repay-later"
         notes.append(
             f"[reduced {', '.join(sorted(red.labels))} ×{red.factor:.2f} "
@@ -289,15 +284,13 @@ def load_annotation_notes(person: str, data: InputData) -> List[str]:
         notes.append(f"[avoids: {', '.join(partners)}]")
     # Leave summary, clipped to the block (a window outside it has no effect).
     comp_days = uncomp_days = 0
-    for name, start, end, compensated in normalized_leaves(data.leaves):
-        if name != person:
-            continue
-        lo = max(start, data.start_date)
-        hi = min(end, data.end_date)
+    for leave in view.leaves_by_person.get(person, ()):
+        lo = max(leave.start, data.start_date)
+        hi = min(leave.end, data.end_date)
         days = (hi - lo).days + 1
         if days <= 0:
             continue
-        if compensated:
+        if leave.compensated:
             comp_days += days
         else:
             uncomp_days += days
@@ -315,7 +308,11 @@ def _load_annotations(person: str, data: InputData) -> str:
 
 
 def format_fairness_log(
-    df: pd.DataFrame, data: InputData, points: Dict[str, ResidentPoints] | None = None
+    df: pd.DataFrame,
+    data: InputData,
+    points: Dict[str, ResidentPoints] | None = None,
+    *,
+    block: "ResolvedBlock | None" = None,
 ) -> str:
     """Generate a human-readable fairness log.
 
@@ -323,7 +320,9 @@ def format_fairness_log(
     (slots filled / unfilled), flags any resident whose total load is more than
     one point off their target as ``[OVER]`` / ``[UNDER]``, and ends with an
     explicit list of unfilled slots — so coverage gaps and unfair outliers can't
-    be missed when skimming the log.
+    be missed when skimming the log. ``block`` (a
+    :class:`~model.resolved.ResolvedBlock` of ``data``) is reused by the
+    constraint check.
     """
     pts = points or calculate_points(df, data)
     target_total = _resolved_target(df, "target_total", data.target_total)
@@ -431,7 +430,7 @@ def format_fairness_log(
 
     # Fold constraint checks in so a hand-edited schedule's violations surface here.
     from .validation import validate_schedule  # lazy: validation imports optimiser
-    issues = validate_schedule(df, data)
+    issues = validate_schedule(df, data, block=block)
     if issues:
         lines.append("Constraint violations:")
         lines.extend(f"  {issue}" for issue in issues)
@@ -576,13 +575,16 @@ def schedule_quality(
     }
 
 
-def quality_diagnosis(df: pd.DataFrame, data: InputData, quality: Dict[str, float]) -> list:
+def quality_diagnosis(
+    df: pd.DataFrame, data: InputData, quality: Dict[str, float], *, block: "ResolvedBlock | None" = None
+) -> list:
     """Plain-language reasons a quality score is low, with what to change.
 
     Reads the solve metadata on ``df.attrs``, the score components, and the
     configuration's structural warnings, and turns them into actionable
     sentences ("the solver stopped early — raise the time limit", "min_gap
     caps each resident at N shifts", ...). Empty when nothing needs saying.
+    ``block`` is reused by the configuration advisories.
     """
     # Lazy import: validation imports the optimiser (and this module sits
     # below both), so importing it at module level would create a cycle.
@@ -602,7 +604,7 @@ def quality_diagnosis(df: pd.DataFrame, data: InputData, quality: Dict[str, floa
         )
 
     structural = [
-        w for w in config_warnings(data)
+        w for w in config_warnings(data, block=block)
         if "min_gap" in w or "Structural workload" in w or "very tight" in w
         or "unfilled" in w.lower()
     ]
@@ -24,17 +24,19 @@ import io
 import re
 import zipfile
 from datetime import date, datetime, timedelta, timezone
-from typing import Dict, List
+from typing import Dict, List, Sequence
 from urllib.parse import urlencode
 
 from .data_models import InputData
 
 __all__ = [
+    "events_by_resident",
     "resident_events",
     "resident_ics",
     "schedule_calendars_zip",
     "google_calendar_url",
     "ics_data_uri",
+    "member_names",
 ]
 
 _PRODID = "-//Idea Gold Scheduler//Rota//EN"
@@ -76,27 +78,54 @@ def _slug(text: str) -> str:
     return slug or "resident"
 
 
-def resident_events(df, data: InputData, person: str) -> List[dict]:
-    """This resident's assignments as ``{day, label}`` dicts, date-ordered."""
-    events: List[dict] = []
+def member_names(people, extension: str) -> Dict[str, str]:
+    """``{file name: resident}`` for an archive, one distinct name each.
+
+    Names are slugs, so different residents can share one (every non-ASCII
+    name slugs to ``resident``); later ones get ``-2``, ``-3``… in roster
+    order. A resident listed twice gets one file.
+    """
+    members: Dict[str, str] = {}
+    for person in dict.fromkeys(people):
+        stem = _slug(person)
+        name, n = f"{stem}{extension}", 1
+        while name in members:
+            n += 1
+            name = f"{stem}-{n}{extension}"
+        members[name] = person
+    return members
+
+
+def events_by_resident(df, data: InputData) -> Dict[str, List[dict]]:
+    """Every resident's assignments as ``{day, label}`` dicts, date-ordered.
+
+    One pass over the frame builds the whole index (name → events), so
+    exporting every resident costs one scan rather than one per resident.
+    Names that appear in no cell are absent; only string cells are indexed.
+    """
+    index: Dict[str, List[dict]] = {}
+    labels = [shift.label for shift in data.shifts]
     for row in df.to_dict("records"):
         day = row.get("Date")
         if isinstance(day, datetime):
             day = day.date()  # datetime / pandas Timestamp -> plain date
         if not isinstance(day, date):
             continue
-        for shift in data.shifts:
-            if row.get(shift.label) == person:
-                events.append({"day": day, "label": shift.label})
-    events.sort(key=lambda e: (e["day"], e["label"]))
-    return events
+        for label in labels:
+            person = row.get(label)
+            if isinstance(person, str):
+                index.setdefault(person, []).append({"day": day, "label": label})
+    for events in index.values():
+        events.sort(key=lambda e: (e["day"], e["label"]))
+    return index
 
 
-def resident_ics(
-    df, data: InputData, person: str, *, now: datetime | None = None
-) -> str:
-    """One resident's calendar as .ics text (all-day event per assignment)."""
-    stamp = (now or datetime.now(timezone.utc)).strftime("%Y%m%dT%H%M%SZ")
+def resident_events(df, data: InputData, person: str) -> List[dict]:
+    """This resident's assignments as ``{day, label}`` dicts, date-ordered."""
+    return events_by_resident(df, data).get(person, [])
+
+
+def _calendar_text(person: str, events: Sequence[dict], stamp: str) -> str:
     lines: List[str] = [
         "BEGIN:VCALENDAR",
         "VERSION:2.0",
@@ -104,7 +133,7 @@ def resident_ics(
         "CALSCALE:GREGORIAN",
         f"X-WR-CALNAME:{_escape(f'On-call — {person}')}",
     ]
-    for event in resident_events(df, data, person):
+    for event in events:
         day: date = event["day"]
         label = event["label"]
         uid = f"{day.isoformat()}-{_slug(label)}-{_slug(person)}@idea-gold-scheduler"
@@ -127,6 +156,28 @@ def resident_ics(
     return "\r\n".join(folded) + "\r\n"
 
 
+def _stamp(now: datetime | None) -> str:
+    return (now or datetime.now(timezone.utc)).strftime("%Y%m%dT%H%M%SZ")
+
+
+def resident_ics(
+    df,
+    data: InputData,
+    person: str,
+    *,
+    now: datetime | None = None,
+    events: Sequence[dict] | None = None,
+) -> str:
+    """One resident's calendar as .ics text (all-day event per assignment).
+
+    Pass ``events`` (from :func:`events_by_resident`) when it is already in
+    hand to skip rescanning the frame.
+    """
+    if events is None:
+        events = resident_events(df, data, person)
+    return _calendar_text(person, events, _stamp(now))
+
+
 def google_calendar_url(day: date, label: str, person: str | None = None) -> str:
     """A pre-filled "add this on-call to Google Calendar" link.
 
@@ -157,14 +208,19 @@ def ics_data_uri(ics_text: str) -> str:
 
 
 def schedule_calendars_zip(df, data: InputData, *, now: datetime | None = None) -> bytes:
-    """A ZIP with one .ics per resident who holds at least one assignment."""
-    stamp_now = now or datetime.now(timezone.utc)
-    files: Dict[str, str] = {}
-    for person in list(data.juniors) + list(data.seniors):
-        if resident_events(df, data, person):
-            files[f"{_slug(person)}.ics"] = resident_ics(df, data, person, now=stamp_now)
+    """A ZIP with one .ics per resident who holds at least one assignment.
+
+    The frame is indexed once; each calendar is rendered and written straight
+    into the archive, so only one resident's text is held at a time.
+    """
+    stamp = _stamp(now)
+    index = events_by_resident(df, data)
+    members = member_names(
+        (p for p in list(data.juniors) + list(data.seniors) if index.get(p)), ".ics"
+    )
     buffer = io.BytesIO()
     with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
-        for name, text in sorted(files.items()):
-            archive.writestr(name, text)
+        for name in sorted(members):
+            person = members[name]
+            archive.writestr(name, _calendar_text(person, index[person], stamp))
     return buffer.getvalue()
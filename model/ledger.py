@@ -49,12 +49,14 @@ from __future__ import annotations
 import difflib
 import json
 from dataclasses import dataclass
-from typing import Any, Dict, Mapping, Sequence, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Sequence, Tuple
 
 from .data_models import InputData
 from .fairness import calculate_label_counts, calculate_points
 from .points import slot_points
-from .weights import availability_weights
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .resolved import ResolvedBlock
 
 __all__ = [
     "DIMENSIONS",
@@ -93,7 +95,9 @@ def empty_ledger() -> Dict[str, Dict[str, float]]:
     return {}
 
 
-def block_adjustments(prior, data: InputData) -> Dict[str, Dict[str, float]]:
+def block_adjustments(
+    prior, data: InputData, *, block: "ResolvedBlock | None" = None
+) -> Dict[str, Dict[str, float]]:
     """Per-resident ledger adjustments for this block's configuration.
 
     Pure and schedule-free: the credits/debits are *target-side* quantities
@@ -120,9 +124,11 @@ def block_adjustments(prior, data: InputData) -> Dict[str, Dict[str, float]]:
     tracks their genuinely lighter load instead of running away from it. For a
     first block (``prior`` empty) the two are identical, so the one-time
     excusal guarantee — and every exact-number test — is unchanged.
+
+    ``block`` is the :class:`~model.resolved.ResolvedBlock` of ``data`` when
+    the caller already has one.
     """
-    from .closures import resolve_closures  # local: avoids a module cycle
-    from .night_float import resolve_night_float  # local: avoids a module cycle
+    from .resolved import block_for  # local: avoids a module cycle
 
     participants = list(data.juniors) + list(data.seniors)
     out: Dict[str, Dict[str, float]] = {
@@ -138,10 +144,10 @@ def block_adjustments(prior, data: InputData) -> Dict[str, Dict[str, float]]:
 
     # Regular demand only — reserved (night-float-covered or closed) cells are
     # outside the point pool.
-    nf_cells, _gaps, _leaves = resolve_night_float(data)
-    reserved = set(nf_cells) | resolve_closures(data)
+    block = block_for(data, block)
+    reserved = block.reserved_cells
     slots = [s for s in slot_points(data) if (s.day, s.shift.label) not in reserved]
-    weights = availability_weights(data)
+    weights = block.availability_weights
 
     # Excused credits are resolved inside each role pool — the residents who can
     # actually absorb the work — so a junior excusal never debits seniors who
@@ -197,7 +203,12 @@ def block_adjustments(prior, data: InputData) -> Dict[str, Dict[str, float]]:
 
 
 def update_ledger(
-    prior, df, data: InputData, *, policy: LedgerPolicy | None = None
+    prior,
+    df,
+    data: InputData,
+    *,
+    policy: LedgerPolicy | None = None,
+    block: "ResolvedBlock | None" = None,
 ) -> Dict[str, Dict[str, Any]]:
     """Return ``prior`` plus the fairness-countable points from this block.
 
@@ -223,7 +234,7 @@ def update_ledger(
             entry["nf_days"] = int(vals["nf_days"])
         updated[person] = entry
     adjustments = (
-        block_adjustments(prior, data)
+        block_adjustments(prior, data, block=block)
         if (policy.no_refund_penalties or policy.no_catchup_excused)
         else {}
     )
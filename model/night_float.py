@@ -20,14 +20,9 @@ Pure and stub-safe (no pandas / OR-Tools / Streamlit).
 from __future__ import annotations
 
 from datetime import date, timedelta
-from typing import Dict, List, Set, Tuple
-
-from .data_models import (
-    InputData,
-    Leave,
-    nf_covered,
-    normalized_nf_assignments,
-)
+from typing import Dict, List, Mapping, Set, Tuple
+
+from .data_models import InputData, Leave
 from .points import block_days
 
 __all__ = [
@@ -41,7 +36,7 @@ __all__ = [
 Slot = Tuple[date, str]
 
 
-def nf_cells_to_attr(nf_cells: Dict[Slot, str]) -> Dict[str, Dict[str, str]]:
+def nf_cells_to_attr(nf_cells: Mapping[Slot, str]) -> Dict[str, Dict[str, str]]:
     """``{(date, label): name}`` → a JSON/Arrow-serializable nested dict.
 
     ``df.attrs`` is serialized by pandas/Streamlit, which rejects tuple keys, so
@@ -75,7 +70,7 @@ def nf_leave_windows(data: InputData) -> List[Leave]:
     so every consumer (weights, solver, ledger) agrees without threading state.
     """
     windows: List[Leave] = []
-    for a in normalized_nf_assignments(data.nf_assignments, default_rest=data.nf_rest_days):
+    for a in data.compiled().nf_assignments:
         rest = max(0, int(a.rest_days))
         windows.append(Leave(a.name, a.start, a.end + timedelta(days=rest), False))
     return windows
@@ -84,48 +79,37 @@ def nf_leave_windows(data: InputData) -> List[Leave]:
 def resolve_night_float(
     data: InputData,
 ) -> Tuple[Dict[Slot, str], Set[Slot], List[Leave]]:
-    """Return ``(nf_cells, gap_slots, leaves)`` for the block (see module doc)."""
-    assignments = list(
-        normalized_nf_assignments(data.nf_assignments, default_rest=data.nf_rest_days)
-    )
-    # Deterministic coverer selection: earliest start, then name.
-    assignments.sort(key=lambda a: (a.start, a.name))
-    # A coverer only covers night-float shifts of their own role (a junior never
-    # ends up written onto a senior night-float shift, and vice versa).
-    role_of: Dict[str, str] = {p: "Junior" for p in data.juniors}
-    role_of.update({p: "Senior" for p in data.seniors})
-
+    """Return ``(nf_cells, gap_slots, leaves)`` for the block (see module doc).
+
+    Coverage patterns and coverers come from the compiled view
+    (:meth:`~model.data_models.CompiledInput.nf_mask` and
+    :meth:`~model.data_models.CompiledInput.nf_coverers`): the earliest
+    assignment (then name) whose window, role and labels fit covers a cell. A
+    coverer only covers night-float shifts of their own role, and an empty
+    ``labels`` means all of them.
+    """
+    view = data.compiled()
+    nf_shifts = [
+        (shift.label, view.nf_mask(shift.label), view.nf_coverers(shift.label, shift.role))
+        for shift in data.shifts
+        if shift.night_float
+    ]
     nf_cells: Dict[Slot, str] = {}
     gap_slots: Set[Slot] = set()
-    for day in block_days(data):
-        for shift in data.shifts:
-            if not nf_covered(day, shift, data):
-                continue
-            coverer = _coverer_for(day, shift, assignments, role_of)
-            if coverer is None:
-                gap_slots.add((day, shift.label))  # → regular fallback
-            else:
-                nf_cells[(day, shift.label)] = coverer
+    if nf_shifts:
+        for index, day in enumerate(block_days(data)):
+            for label, covered, coverers in nf_shifts:
+                if not covered >> index & 1:
+                    continue
+                coverer = coverers[index]
+                if coverer is None:
+                    gap_slots.add((day, label))  # → regular fallback
+                else:
+                    nf_cells[(day, label)] = coverer
 
     return nf_cells, gap_slots, nf_leave_windows(data)
 
 
-def _coverer_for(day: date, shift, assignments, role_of: Dict[str, str]) -> str | None:
-    """The assignment covering ``shift`` on ``day``, role-matched.
-
-    An empty ``labels`` means "all night-float shifts of the coverer's role", so
-    a junior with a blanket assignment covers only junior night-float shifts.
-    """
-    for a in assignments:
-        if not (a.start <= day <= a.end):
-            continue
-        if role_of.get(a.name) != shift.role:
-            continue  # a coverer only covers their own role's NF shifts
-        if not a.labels or shift.label in a.labels:
-            return a.name
-    return None
-
-
 def nf_duty_days(nf_cells: Dict[Slot, str]) -> Dict[str, int]:
     """Per-resident count of NF slots covered (informational, outside fairness)."""
     out: Dict[str, int] = {}
@@ -1,21 +1,35 @@
 from dataclasses import replace
+from importlib.util import find_spec
 import os
-from typing import Any, Dict, List, Mapping, Sequence, Tuple, cast
+import re
+import time
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple, cast
 
 # CP-SAT variable handles are opaque (real ortools IntVar or the _Var stub
 # below), so they are typed as Any throughout.
 CpVar = Any
 
-ORTOOLS_AVAILABLE = True
 try:
     import pandas as pd
 except ImportError:  # pragma: no cover - fallback when pandas missing
     from .pandas_stub import pd
 
-try:
-    from ortools.sat.python import cp_model
-except ImportError:  # pragma: no cover - simple fallback if ortools missing
-    ORTOOLS_AVAILABLE = False
+from .data_models import InputData, is_regular_night_call
+from .closures import closed_cells_to_attr, reserved_cell_keys
+from .night_float import nf_cells_to_attr
+from .points import POINT_SCALE, SlotPoints, block_days, classify_slot, scaled, slot_points
+from .reductions import ReductionCap, eligible_for_shift, reduction_caps
+from .resolved import ResolvedBlock, block_for, resolve_block
+from .utils import weekend_holiday_dates
+from .weights import availability_weights
+
+# OR-Tools loads on first use (``_cp_model``) rather than with this module, so
+# a page that only shows the editors never pays for it. Whether it is
+# installed is known up front without importing it.
+ORTOOLS_AVAILABLE = find_spec("ortools") is not None
+
+
+def _stub_cp_model():  # pragma: no cover - simple fallback if ortools missing
     class _Var:
         def __init__(self):
             self.value = 0
@@ -116,7 +130,7 @@ except ImportError:  # pragma: no cover - simple fallback if ortools missing
         def Value(self, var):
             return var.value
 
-    cp_model = type(
+    return type(
         "cp_model",
         (),
         {
@@ -130,24 +144,30 @@ except ImportError:  # pragma: no cover - simple fallback if ortools missing
         },
     )
 
-from .data_models import (
-    InputData,
-    blackout_night_before_dates,
-    blackout_person_windows,
-    is_regular_night_call,
-    normalized_leaves,
-    normalized_rotators,
-)
-from .closures import closed_cells_to_attr, reserved_cell_keys, resolve_closures
-from .night_float import (
-    nf_cells_to_attr,
-    nf_leave_windows,
-    resolve_night_float,
-)
-from .points import POINT_SCALE, SlotPoints, block_days, classify_slot, scaled, slot_points
-from .reductions import eligible_for_shift, reduction_caps, reduction_target_relief
-from .utils import weekend_holiday_dates
-from .weights import availability_weights
+
+def _cp_model():
+    """The CP-SAT module (or the stub above), imported on first use."""
+    global ORTOOLS_AVAILABLE
+    module = globals().get("cp_model")
+    if module is None:
+        try:
+            from ortools.sat.python import cp_model as module
+        except ImportError:  # pragma: no cover - simple fallback if ortools missing
+            ORTOOLS_AVAILABLE = False
+            module = _stub_cp_model()
+        globals()["cp_model"] = module
+    return module
+
+
+def __getattr__(name: str):
+    # ``optimiser.cp_model`` stays a module attribute, loaded on first access.
+    if name == "cp_model":
+        return _cp_model()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class SolveCancelled(RuntimeError):
+    """The solve was cancelled before it found any schedule."""
 
 
 class SolveProgress:
@@ -157,12 +177,88 @@ class SolveProgress:
     Only the solver thread writes and only the UI thread reads; the writes are
     single attribute assignments (atomic under the GIL), so no lock is needed
     for a display that tolerates reading a value one update stale.
+
+    Besides the incumbent count it carries the incumbent's ``objective``, the
+    search's ``best_bound`` and the ``phase`` (``"preparing"``, ``"searching"``,
+    ``"extracting"``, ``"done"``). ``listener``, if set, is called on the
+    solver thread with the kind of each change (``"phase"``, ``"incumbent"``,
+    ``"bound"``); it must be quick. :meth:`cancel` may be called from any
+    thread and stops the search, keeping the best schedule found so far.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, listener: Callable[[str], None] | None = None) -> None:
         self.solution_count = 0
         self.last_improvement_sec: float | None = None
         self.done = False
+        self.objective: float | None = None
+        self.best_bound: float | None = None
+        self.phase = "pending"
+        self.time_limit_sec: float | None = None
+        self.search_started: float | None = None   # time.monotonic()
+        self.cancelled = False
+        self.listener = listener
+        self._stop: Callable[[], None] | None = None
+
+    def time_left(self) -> float | None:
+        """Seconds of search budget left, once the search has started."""
+        if self.search_started is None or not self.time_limit_sec:
+            return None
+        return max(0.0, self.time_limit_sec - (time.monotonic() - self.search_started))
+
+    def cancel(self) -> None:
+        """Stop the search cooperatively; safe to call more than once."""
+        self.cancelled = True
+        stop = self._stop
+        if stop is not None:
+            stop()
+
+    def _set_phase(self, phase: str) -> None:
+        self.phase = phase
+        self._notify("phase")
+
+    def _notify(self, kind: str) -> None:
+        if self.listener is not None:
+            self.listener(kind)
+
+
+class PhaseTimings:
+    """Where one :func:`build_schedule` call spent its time; pass one in to fill it.
+
+    ``seconds`` maps each phase to its wall time, in the order they ran:
+    ``"validation"``, ``"nf_closures"`` (night-float overlay and closures),
+    ``"resolve_targets"``, ``"variables"``, ``"constraints"``, ``"objective"``,
+    ``"warm_start"`` (only with a warm start), ``"presolve"`` and ``"search"``
+    (CP-SAT's own split of its wall time), ``"extraction"`` and
+    ``"min_gap_check"``. ``variables`` and ``constraints`` give the CP-SAT
+    model's size and ``objective`` the final objective.
+
+    Passing one turns on CP-SAT's search log (captured, never printed) to learn
+    where presolve ended, so it is meant for benchmarks rather than live solves.
+    """
+
+    def __init__(self) -> None:
+        self.seconds: Dict[str, float] = {}
+        self.variables: int | None = None
+        self.constraints: int | None = None
+        self.objective: float | None = None
+
+    def lap(self, phase: str, since: float) -> float:
+        """Add the time from ``since`` to ``phase``; returns now, the next ``since``."""
+        now = time.perf_counter()
+        self.seconds[phase] = self.seconds.get(phase, 0.0) + now - since
+        return now
+
+
+# CP-SAT's log line marking the end of presolve, e.g. "Starting search at 0.42s".
+_SEARCH_START = re.compile(r"Starting search at ([0-9.]+)s")
+
+
+def _search_started_at(log_lines: Sequence[str]) -> float | None:
+    for line in log_lines:
+        match = _SEARCH_START.search(line)
+        if match:
+            return float(match.group(1))
+    return None
 
 
 def _make_improvement_tracker(sink: "SolveProgress | None" = None):
@@ -174,7 +270,7 @@ def _make_improvement_tracker(sink: "SolveProgress | None" = None):
     time won't help). Returns ``None`` when the backend has no callback support
     (the lightweight test stub), in which case the caller solves without one.
     """
-    base = getattr(cp_model, "CpSolverSolutionCallback", None)
+    base = getattr(_cp_model(), "CpSolverSolutionCallback", None)
     if base is None:
         return None
 
@@ -193,6 +289,14 @@ def _make_improvement_tracker(sink: "SolveProgress | None" = None):
             if sink is not None:
                 sink.solution_count = self.solution_count
                 sink.last_improvement_sec = self.last_improvement_sec
+                try:
+                    sink.objective = float(self.ObjectiveValue())
+                    sink.best_bound = float(self.BestObjectiveBound())
+                except (AttributeError, TypeError, ValueError):  # pragma: no cover
+                    pass
+                sink._notify("incumbent")
+                if sink.cancelled:
+                    self.StopSearch()
 
     return _ImprovementTracker()
 
@@ -248,11 +352,21 @@ class SchedulerSolver:
     def __init__(
         self,
         data: InputData,
-        nf_cells: Dict[Tuple, str] | None = None,
-        closed_cells: set | None = None,
+        nf_cells: Mapping[Tuple, str] | None = None,
+        closed_cells: set | frozenset | None = None,
+        *,
+        block: ResolvedBlock | None = None,
+        timings: PhaseTimings | None = None,
     ):
+        # A caller-supplied sink also asks solve() for CP-SAT's presolve split.
+        self._search_log = timings is not None
+        self.timings = timings if timings is not None else PhaseTimings()
         self.data = data
-        self.model = cp_model.CpModel()
+        # Shared resolved configuration (caps, blackout and NF windows); one
+        # resolved from a different InputData is replaced by a fresh one.
+        self.block = block_for(data, block)
+        self.model = _cp_model().CpModel()
+        clock = time.perf_counter()  # the first CpModel loads OR-Tools: not a build phase
         self.SCALE = POINT_SCALE
         self.people = data.juniors + data.seniors + ["Unfilled"]
         self.days = block_days(data)
@@ -300,6 +414,7 @@ class SchedulerSolver:
         self.max_dev: CpVar | None = None
         self.build_variables()
         self.compute_points()
+        clock = self.timings.lap("variables", clock)
         # expose internals for stub solver (may fail on real CpModel)
         try:
             self.model.people = self.people
@@ -322,7 +437,15 @@ class SchedulerSolver:
         self.add_cap_constraints()
         self.add_extra_point_constraints()
         self.add_reduction_constraints()
+        clock = self.timings.lap("constraints", clock)
         self.build_objective()
+        self.timings.lap("objective", clock)
+        try:
+            proto = self.model.Proto()
+            self.timings.variables = len(proto.variables)
+            self.timings.constraints = len(proto.constraints)
+        except AttributeError:  # the stub model has no proto
+            pass
 
     def _is_regular(self, d_idx: int, s_idx: int) -> bool:
         """A slot handled by the regular scheduler (not reserved).
@@ -512,7 +635,7 @@ class SchedulerSolver:
         can never make the model infeasible — uncovered slots fall to
         ``Unfilled``.
         """
-        caps = reduction_caps(self.data)
+        caps = self.block.reduction_caps
         if not caps:
             return
         person_idx = {p: i for i, p in enumerate(self.people[:-1])}
@@ -592,13 +715,14 @@ class SchedulerSolver:
         re-scanning every leave per (day, shift, person) triple.
         """
         rotator_windows: Dict[str, list] = {}
-        for res, start, end in normalized_rotators(self.data.rotators):
+        view = self.data.compiled()
+        for res, start, end in view.rotators:
             rotator_windows.setdefault(res, []).append((start, end))
         leave_windows: Dict[str, list] = {}
-        for res, start, end, _comp in normalized_leaves(self.data.leaves):
+        for res, start, end, _comp in view.leaves:
             leave_windows.setdefault(res, []).append((start, end))
         # A night floater is off regular shifts during their NF block + rest.
-        for res, start, end, _comp in nf_leave_windows(self.data):
+        for res, start, end, _comp in self.block.nf_leaves:
             leave_windows.setdefault(res, []).append((start, end))
 
         blocked: Dict[int, set] = {}
@@ -625,10 +749,8 @@ class SchedulerSolver:
         never regular slots, so blackouts never touch them. The compensated
         flag only affects the fairness share (model.weights), never blocking.
         """
-        windows = blackout_person_windows(self.data.blackouts, self.data.named_groups)
-        night_dates = blackout_night_before_dates(
-            self.data.blackouts, self.data.named_groups
-        )
+        windows = self.block.blackout_windows
+        night_dates = self.block.blackout_night_before
         if not windows and not night_dates:
             return {}
         blocked: Dict[int, set] = {}
@@ -845,7 +967,13 @@ class SchedulerSolver:
                     except Exception:  # pragma: no cover - defensive
                         return
 
-    def solve(self, time_limit_sec: float | None = None, progress: "SolveProgress | None" = None):
+    def solve(
+        self,
+        time_limit_sec: float | None = None,
+        progress: "SolveProgress | None" = None,
+        num_workers: int | None = None,
+    ):
+        cp_model = _cp_model()
         solver = cp_model.CpSolver()
         if not hasattr(solver, "OPTIMAL"):
             solver.OPTIMAL = getattr(cp_model, "OPTIMAL", 0)
@@ -866,8 +994,25 @@ class SchedulerSolver:
             solver.parameters.random_seed = int(getattr(self.data, "seed", 0))
         except (AttributeError, ValueError, TypeError):
             pass
+        # An admitted solve's CPU share (see model.admission); CP-SAT's own
+        # default of every core oversubscribes a host shared by sessions.
+        if num_workers:
+            try:
+                solver.parameters.num_workers = int(num_workers)
+            except (AttributeError, ValueError, TypeError):
+                pass
+        search_log: List[str] = []
+        if self._search_log:
+            try:
+                solver.parameters.log_search_progress = True
+                solver.parameters.log_to_stdout = False
+                solver.log_callback = search_log.append
+            except (AttributeError, TypeError):  # stub solver
+                pass
         solved_with_response = True
         tracker = _make_improvement_tracker(progress)
+        if progress is not None:
+            self._attach_progress(solver, progress, time_limit_sec)
         try:
             if tracker is not None:
                 status = solver.Solve(self.model, tracker)
@@ -880,6 +1025,12 @@ class SchedulerSolver:
             unfilled_idx = len(self.people) - 1
             for (p_idx, _, _), var in vars_dict.items():
                 setattr(var, "value", int(p_idx == unfilled_idx))
+        finally:
+            if progress is not None:
+                progress._stop = None
+        if progress is not None:
+            progress._set_phase("extracting")
+        extraction_started = time.perf_counter()
         ok_statuses = {
             getattr(cp_model, "OPTIMAL", None),
             getattr(cp_model, "FEASIBLE", None),
@@ -891,6 +1042,8 @@ class SchedulerSolver:
             name_func = getattr(solver, "StatusName", lambda s: str(s))
             status_name = name_func(status)
             if status_name not in {"OPTIMAL", "FEASIBLE"}:
+                if status_name == "UNKNOWN" and progress is not None and progress.cancelled:
+                    raise SolveCancelled("The solve was stopped before it found a schedule.")
                 if status_name == "UNKNOWN":
                     # The solver hit the time limit before finding any feasible
                     # schedule; this is a budget problem, not proven infeasibility.
@@ -964,10 +1117,37 @@ class SchedulerSolver:
             df.attrs["wall_time_sec"] = wall_time
             df.attrs["last_improvement_sec"] = last_improvement
             df.attrs["objective"] = objective
+            df.attrs["cancelled"] = bool(progress is not None and progress.cancelled)
         except (AttributeError, TypeError):  # pragma: no cover - stub frames
             pass
+        if isinstance(wall_time, (int, float)):
+            started = _search_started_at(search_log)
+            presolve = wall_time if started is None else min(started, wall_time)
+            self.timings.seconds["presolve"] = presolve
+            self.timings.seconds["search"] = wall_time - presolve
+        self.timings.objective = objective
+        self.timings.lap("extraction", extraction_started)
         return df
 
+    @staticmethod
+    def _attach_progress(solver, progress: SolveProgress, time_limit_sec: float | None) -> None:
+        """Let ``progress`` see the search bound and stop the search."""
+        if progress.cancelled:
+            raise SolveCancelled("The solve was cancelled before it started.")
+        stop = getattr(solver, "StopSearch", None)
+        progress._stop = stop
+        if stop is not None and hasattr(solver, "best_bound_callback"):
+            def on_bound(bound: float) -> None:
+                progress.best_bound = float(bound)
+                progress._notify("bound")
+                if progress.cancelled:
+                    stop()
+
+            solver.best_bound_callback = on_bound
+        progress.time_limit_sec = time_limit_sec
+        progress.search_started = time.monotonic()
+        progress._set_phase("searching")
+
 
 Ledger = Mapping[str, Mapping[str, float]]
 
@@ -1039,6 +1219,8 @@ def _apply_reduction_targets(
     target_total_map: Dict[str, float] | None,
     target_night_float: Dict[str, float] | None,
     role_members: Mapping[str, Sequence[str]],
+    *,
+    block: ResolvedBlock | None = None,
 ) -> Tuple[Dict[str, float] | None, Dict[str, float] | None]:
     """Fold "work less now" reductions into the total / night-float targets.
 
@@ -1050,14 +1232,15 @@ def _apply_reduction_targets(
     redistributed within the member's role pool — the only residents eligible
     for the shifts being shed.
     """
-    caps = [c for c in reduction_caps(data) if not c.keep_total]
+    block = block_for(data, block)
+    caps = [c for c in block.reduction_caps if not c.keep_total]
     if not caps:
         return target_total_map, target_night_float
 
     if target_total_map:
         # Duplicate/overlapping rows never lower the same person's target twice
         # for the same regular work.
-        totals_delta = reduction_target_relief(data)
+        totals_delta = block.reduction_relief
         target_total_map = dict(target_total_map)
         for members in role_members.values():
             sub = {p: totals_delta[p] for p in members if p in totals_delta}
@@ -1122,6 +1305,7 @@ def _auto_label_targets(
     availability: Mapping[str, float],
     excluded: set | None = None,
     prior_labels: Mapping[str, Mapping[str, float]] | None = None,
+    caps: Sequence[ReductionCap] | None = None,
 ) -> Dict[Tuple[str, str], float]:
     """Per-(resident, label) fair share of each shift type's points.
 
@@ -1150,7 +1334,9 @@ def _auto_label_targets(
     """
     participants = list(data.juniors) + list(data.seniors)
     pref_people = set(data.preferred_shifts or {}) | set(data.preferred_day_type or {})
-    capped = {(cap.person, lbl) for cap in reduction_caps(data) for lbl in cap.labels}
+    if caps is None:
+        caps = reduction_caps(data)
+    capped = {(cap.person, lbl) for cap in caps for lbl in cap.labels}
     excluded = excluded or set()
 
     label_points: Dict[str, float] = {}
@@ -1193,9 +1379,10 @@ def resolve_targets(
     data: InputData,
     ledger: Ledger | None = None,
     nf_cells: Mapping | None = None,
-    closed_cells: set | None = None,
+    closed_cells: set | frozenset | None = None,
     *,
     label_carryover: bool = True,
+    block: ResolvedBlock | None = None,
 ) -> InputData:
     """Return a copy of ``data`` with all fairness targets resolved.
 
@@ -1224,7 +1411,14 @@ def resolve_targets(
     imbalance is repaid via the total/weekend dimensions alone. Only applies
     below the ``LABEL_TARGET_MAX_CELLS`` gate and when the caller has not set
     ``target_label`` explicitly.
+
+    ``block`` (a :class:`~model.resolved.ResolvedBlock` for ``data``) supplies
+    the availability weights and reduction caps instead of re-deriving them,
+    and the overlay/closed cells when those are not passed explicitly.
     """
+    block = block_for(data, block)
+    if nf_cells is None and closed_cells is None:
+        nf_cells, closed_cells = block.nf_cells, block.closed_cells
     nf_cells = nf_cells or {}
     # Cells outside the regular point pool: NF-covered plus closed (see
     # model.closures) — the fair-share targets are computed on the open demand.
@@ -1250,7 +1444,7 @@ def resolve_targets(
                 pool_weekend[slot.shift.role] += slot.points
         total_points = pool_total["Junior"] + pool_total["Senior"]
 
-        availability = _availability_weights(data)
+        availability = block.availability_weights
         role_weight = {
             role: sum(availability.get(p, 0.0) for p in members)
             for role, members in role_members.items()
@@ -1313,7 +1507,7 @@ def resolve_targets(
 
         if data.reductions:
             target_total_map, target_night_float = _apply_reduction_targets(
-                data, target_total_map, target_night_float, role_members
+                data, target_total_map, target_night_float, role_members, block=block
             )
 
         if target_label is None:
@@ -1333,7 +1527,8 @@ def resolve_targets(
                     }
                 target_label = (
                     _auto_label_targets(
-                        data, availability, excluded, prior_labels=prior_labels
+                        data, availability, excluded, prior_labels=prior_labels,
+                        caps=block.reduction_caps,
                     )
                     or None
                 )
@@ -1359,6 +1554,9 @@ def build_schedule(
     time_limit_sec: float | None = None,
     warm_start_df=None,
     progress: "SolveProgress | None" = None,
+    block: ResolvedBlock | None = None,
+    num_workers: int | None = None,
+    timings: PhaseTimings | None = None,
 ) -> pd.DataFrame:
     """Build schedule with optional environment based time limit.
 
@@ -1371,11 +1569,26 @@ def build_schedule(
     ``time_limit_sec`` overrides the env/size-derived solver budget — large
     rosters may need far more than the default 60 s to move past a first
     feasible-but-uneven incumbent.
+    ``block`` is the :class:`~model.resolved.ResolvedBlock` of this ``data``
+    and ``ledger`` when the caller already has one (the reports reuse it);
+    one resolved from anything else is ignored.
+    ``num_workers`` caps the CP-SAT search workers (default: every core);
+    callers sharing a host pass the share :mod:`model.admission` granted.
+    ``progress`` receives live progress and can cancel the search (see
+    :class:`SolveProgress`); a solve cancelled before its first schedule
+    raises :class:`SolveCancelled`.
+    ``timings`` (a :class:`PhaseTimings`) is filled with the per-phase
+    breakdown, the model size and the final objective.
     """
     # Lazy import avoids a module-level cycle (validation imports this module).
     from .validation import validate_input
 
+    if progress is not None:
+        progress._set_phase("preparing")
+    phases = timings if timings is not None else PhaseTimings()
+    clock = time.perf_counter()
     problems = validate_input(data)
+    clock = phases.lap("validation", clock)
     if problems:
         detail = "\n".join(f"- {p}" for p in problems)
         raise ValueError(f"Invalid configuration:\n{detail}")
@@ -1388,25 +1601,35 @@ def build_schedule(
     # _blocked_day_indices read data.nf_assignments), so no leaves are appended
     # here — this keeps the ledger consistent when it re-derives adjustments
     # from the same config.
-    nf_cells, _gap_slots, _nf_leaves = resolve_night_float(data)
     # Closed cells: shifts stood down for the block. Like NF-covered cells they
     # are removed from regular demand and excluded from the point/fairness pools.
-    closed_cells = resolve_closures(data)
+    # Both, and everything else derived from the configuration, are resolved
+    # once on the block and shared with target resolution and the solver.
+    if (
+        block is None
+        or block.data is not data
+        or block.ledger is not ledger
+        or block.label_carryover != bool(label_carryover)
+    ):
+        block = resolve_block(data, ledger, label_carryover=label_carryover)
+    nf_cells = block.nf_cells
+    closed_cells = block.closed_cells
+    clock = phases.lap("nf_closures", clock)
     # The resolved targets are exposed on ``df.attrs`` below.
-    solve_data = resolve_targets(
-        data, ledger, nf_cells=nf_cells, closed_cells=closed_cells,
-        label_carryover=label_carryover,
-    )
+    solve_data = block.solve_data
+    phases.lap("resolve_targets", clock)
     target_total = solve_data.target_total
     target_total_map = solve_data.target_total_map
     target_weekend = solve_data.target_weekend
     target_night_float = solve_data.target_night_float
-    using_stub = not ORTOOLS_AVAILABLE
     solver = SchedulerSolver(
         solve_data,
         nf_cells=nf_cells,
         closed_cells=closed_cells,
+        block=block.with_data(solve_data),
+        timings=timings,
     )
+    using_stub = not ORTOOLS_AVAILABLE  # settled once the solver loaded CP-SAT
     env = (env or os.environ.get("ENV", "prod")).lower()
     limit: float = (
         float(time_limit_sec)
@@ -1414,8 +1637,10 @@ def build_schedule(
         else compute_time_limit(env, len(participants) or 1, day_count, len(data.shifts) or 1)
     )
     if warm_start_df is not None:
+        clock = time.perf_counter()
         solver.add_warm_start(warm_start_df)
-    df = solver.solve(time_limit_sec=limit, progress=progress)
+        phases.lap("warm_start", clock)
+    df = solver.solve(time_limit_sec=limit, progress=progress, num_workers=num_workers)
     df.attrs["time_limit_sec"] = limit
     df.attrs["solver_warning"] = None
     df.attrs["target_total"] = target_total
@@ -1428,9 +1653,14 @@ def build_schedule(
         df.attrs["solver_warning"] = (
             "OR-Tools not installed; using fallback output with unfilled shifts."
         )
-        return df
-    if not respects_min_gap(df, data.min_gap, data.shifts):
-        raise RuntimeError("Schedule violates min_gap constraint")
+    else:
+        clock = time.perf_counter()
+        gap_ok = respects_min_gap(df, data.min_gap, data.shifts)
+        phases.lap("min_gap_check", clock)
+        if not gap_ok:
+            raise RuntimeError("Schedule violates min_gap constraint")
+    if progress is not None:
+        progress._set_phase("done")
     return df
 
 
@@ -21,9 +21,9 @@ used by the solver, validation, and reporting alike).
 from __future__ import annotations
 
 from datetime import date
-from typing import Dict, FrozenSet, List, NamedTuple, Tuple
+from typing import AbstractSet, Dict, FrozenSet, Iterable, List, Mapping, NamedTuple, Tuple
 
-from .data_models import InputData, ShiftTemplate, normalized_reductions
+from .data_models import InputData, ShiftTemplate
 from .points import block_days, classify_slot
 from .utils import weekend_holiday_dates
 from .weights import availability_weights
@@ -73,7 +73,22 @@ def eligible_for_shift(person: str, shift: ShiftTemplate, data: InputData) -> bo
 _eligible = eligible_for_shift
 
 
-def reduction_caps(data: InputData) -> List[ReductionCap]:
+def _reserved_cells(data: InputData) -> set:
+    """NF-overlay plus closed cells: outside every regular point pool."""
+    # Local imports avoid an import-time cycle.
+    from .closures import resolve_closures
+    from .night_float import resolve_night_float
+
+    nf_cells, _gaps, _leaves = resolve_night_float(data)
+    return set(nf_cells) | resolve_closures(data)
+
+
+def reduction_caps(
+    data: InputData,
+    *,
+    weights: Mapping[str, float] | None = None,
+    reserved: AbstractSet[Tuple[date, str]] | None = None,
+) -> List[ReductionCap]:
     """Resolve every reduction entry into per-person caps.
 
     The fair share mirrors how the fairness targets are computed: the
@@ -82,30 +97,29 @@ def reduction_caps(data: InputData) -> List[ReductionCap]:
     membership resolves at call time; windows are clipped to the block.
     Overlapping reductions emit multiple caps — all are enforced, so the
     tightest wins.
+
+    ``weights`` / ``reserved`` accept already-resolved availability weights and
+    reserved cells (see :class:`~model.resolved.ResolvedBlock`).
     """
-    entries = list(normalized_reductions(data.reductions))
+    view = data.compiled()
+    entries = view.reductions
     if not entries:
         return []
-    weights = availability_weights(data)
-    named_groups = data.named_groups or {}
+    if weights is None:
+        weights = availability_weights(data)
     weekend_dates = weekend_holiday_dates(data)
     days = block_days(data) if data.end_date >= data.start_date else []
     shift_by_label = {s.label: s for s in data.shifts}
     roster = list(data.juniors) + list(data.seniors)
     # Reserved overlay/closure cells carry no regular points and cannot be part
-    # of a regular-work reduction. Local imports avoid an import-time cycle.
-    from .closures import resolve_closures
-    from .night_float import resolve_night_float
-
-    nf_cells, _gaps, _leaves = resolve_night_float(data)
-    reserved = set(nf_cells) | resolve_closures(data)
+    # of a regular-work reduction.
+    if reserved is None:
+        reserved = _reserved_cells(data)
 
     caps: List[ReductionCap] = []
     for red in entries:
         labels = frozenset(lbl for lbl in red.labels if lbl in shift_by_label)
-        members = (
-            named_groups.get(red.group, ()) if red.group is not None else red.members
-        )
+        members = view.members(red)
         start = max(red.start, data.start_date)
         end = min(red.end, data.end_date)
         if not labels or not members or end < start:
@@ -156,7 +170,13 @@ def reduction_caps(data: InputData) -> List[ReductionCap]:
     return list(dict.fromkeys(caps))
 
 
-def reduction_target_relief(data: InputData) -> Dict[str, float]:
+def reduction_target_relief(
+    data: InputData,
+    *,
+    caps: Iterable[ReductionCap] | None = None,
+    weights: Mapping[str, float] | None = None,
+    reserved: AbstractSet[Tuple[date, str]] | None = None,
+) -> Dict[str, float]:
     """Return overlap-normalised relief for ``keep_total=False`` reductions.
 
     All hard caps remain active, so the tightest applicable cap wins. For target
@@ -164,21 +184,26 @@ def reduction_target_relief(data: InputData) -> Dict[str, float]:
     the strongest applicable reduction wins. Duplicate and partially
     overlapping rows therefore cannot lower a resident's total target twice for
     the same work.
+
+    ``caps``, ``weights`` and ``reserved`` accept already-resolved inputs, as
+    in :func:`reduction_caps`.
     """
-    caps = [cap for cap in reduction_caps(data) if not cap.keep_total]
+    if caps is None and not data.reductions:
+        return {}
+    if weights is None:
+        weights = availability_weights(data)
+    if reserved is None:
+        reserved = _reserved_cells(data)
+    if caps is None:
+        caps = reduction_caps(data, weights=weights, reserved=reserved)
+    caps = [cap for cap in caps if not cap.keep_total]
     if not caps:
         return {}
 
-    from .closures import resolve_closures
-    from .night_float import resolve_night_float
-
-    nf_cells, _gaps, _leaves = resolve_night_float(data)
-    reserved = set(nf_cells) | resolve_closures(data)
     weekend_dates = weekend_holiday_dates(data)
     shift_by_label = {s.label: s for s in data.shifts}
     days = block_days(data) if data.end_date >= data.start_date else []
 
-    weights = availability_weights(data)
     roster = list(data.juniors) + list(data.seniors)
     atom_relief: Dict[Tuple[str, date, str], float] = {}
     for cap in caps:
@@ -0,0 +1,207 @@
+"""One resolved view of a block's configuration, shared by every consumer.
+
+A single ``build_schedule`` plus its reporting used to re-derive the same
+configuration state over and over: the night-float overlay, closures,
+availability weights and reduction caps were each resolved by the solver,
+target resolution, validation, the ledger and the exporters independently.
+:class:`ResolvedBlock` resolves each of them **at most once** per
+``(InputData, ledger)`` and hands the same values to everyone, so the solver
+and its reports cannot drift apart either.
+
+Each attribute is computed lazily on first access and then memoised on the
+instance: validating a manual edit pays for the overlay and the caps, never
+for the fairness targets it does not read. The block itself is frozen and the
+collections it exposes are read-only, so sharing one between the solver, the
+Results page and background exports is safe.
+
+Every consumer accepts an optional ``block=``; without one it resolves a
+private block on the spot, exactly as before. Pass a block only together with
+the ``InputData`` it was resolved from. A block pickles with everything it
+has resolved so far, so it can be handed to a worker process too.
+
+Pure and stub-safe (no pandas / OR-Tools / Streamlit); target resolution is
+imported lazily from :mod:`model.optimiser`.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from datetime import date
+from functools import cached_property
+from types import MappingProxyType
+from typing import FrozenSet, Mapping, Tuple
+
+from .closures import resolve_closures
+from .data_models import InputData, Leave
+from .night_float import resolve_night_float
+from .points import SlotPoints, slot_points
+from .reductions import ReductionCap, reduction_caps, reduction_target_relief
+from .weights import availability_weights
+
+__all__ = ["ResolvedBlock", "resolve_block", "block_for"]
+
+Slot = Tuple[date, str]
+
+
+# Where a pickled block lists the state entries it turned into plain dicts.
+_READ_ONLY_KEY = "__read_only__"
+
+
+@dataclass(frozen=True, eq=False)
+class ResolvedBlock:
+    """Configuration state derived once from ``data`` (and ``ledger``).
+
+    ``data`` is the caller's configuration, untouched; :attr:`solve_data` is
+    the copy with every fairness target resolved (what the solver optimises).
+    """
+
+    data: InputData
+    ledger: Mapping | None = None
+    label_carryover: bool = True
+
+    @cached_property
+    def _night_float(self):
+        nf_cells, gap_slots, leaves = resolve_night_float(self.data)
+        return MappingProxyType(nf_cells), frozenset(gap_slots), tuple(leaves)
+
+    @cached_property
+    def nf_cells(self) -> Mapping[Slot, str]:
+        """Night-float overlay cells → coverer (removed from regular demand)."""
+        return self._night_float[0]
+
+    @cached_property
+    def nf_gaps(self) -> FrozenSet[Slot]:
+        """NF-pattern cells with no coverer (they fall back to regular)."""
+        return self._night_float[1]
+
+    @cached_property
+    def nf_leaves(self) -> Tuple[Leave, ...]:
+        """Each NF assignment as an uncompensated leave over duty + rest."""
+        return self._night_float[2]
+
+    @cached_property
+    def closed_cells(self) -> FrozenSet[Slot]:
+        """Stood-down ``(date, label)`` cells."""
+        return frozenset(resolve_closures(self.data))
+
+    @cached_property
+    def reserved_cells(self) -> FrozenSet[Slot]:
+        """Every non-regular cell: NF overlay plus closures."""
+        return frozenset(self.nf_cells) | self.closed_cells
+
+    @cached_property
+    def availability_weights(self) -> Mapping[str, float]:
+        """Per-resident fairness weight (see :mod:`model.weights`)."""
+        return MappingProxyType(availability_weights(self.data))
+
+    @cached_property
+    def reduction_caps(self) -> Tuple[ReductionCap, ...]:
+        """Every reduction entry resolved into per-person caps."""
+        return tuple(reduction_caps(
+            self.data, weights=self.availability_weights, reserved=self.reserved_cells
+        ))
+
+    @cached_property
+    def reduction_relief(self) -> Mapping[str, float]:
+        """Overlap-normalised total-target relief of ``keep_total=False`` caps."""
+        return MappingProxyType(reduction_target_relief(
+            self.data,
+            caps=self.reduction_caps,
+            weights=self.availability_weights,
+            reserved=self.reserved_cells,
+        ))
+
+    @cached_property
+    def blackout_windows(self) -> Mapping[str, Tuple[Tuple[date, date, bool], ...]]:
+        """Blackouts expanded per person: ``{name: ((start, end, compensated),)}``."""
+        return self.data.compiled().blackout_windows
+
+    @cached_property
+    def blackout_night_before(self) -> Mapping[str, FrozenSet[date]]:
+        """Per-person dates whose night on-calls a blackout blocks."""
+        return self.data.compiled().blackout_night_before
+
+    @cached_property
+    def slot_table(self) -> Mapping[Slot, SlotPoints]:
+        """Every block slot classified once: ``{(day, label): SlotPoints}``."""
+        return MappingProxyType({
+            (slot.day, slot.shift.label): slot for slot in slot_points(self.data)
+        })
+
+    @cached_property
+    def solve_data(self) -> InputData:
+        """``data`` with every fairness target resolved (``resolve_targets``)."""
+        from .optimiser import resolve_targets  # local: the optimiser imports us
+
+        return resolve_targets(
+            self.data, self.ledger, label_carryover=self.label_carryover, block=self,
+        )
+
+    def __getstate__(self):
+        # The read-only views are ``MappingProxyType``s, which do not pickle:
+        # ship plain copies and wrap them again in ``__setstate__``.
+        state = dict(self.__dict__)
+        read_only = []
+        for name, value in state.items():
+            if isinstance(value, MappingProxyType):
+                state[name] = dict(value)
+                read_only.append(name)
+        night_float = state.get("_night_float")
+        if night_float is not None:
+            state["_night_float"] = (dict(night_float[0]),) + night_float[1:]
+        state[_READ_ONLY_KEY] = read_only
+        return state
+
+    def __setstate__(self, state) -> None:
+        state = dict(state)
+        for name in state.pop(_READ_ONLY_KEY, ()):
+            state[name] = MappingProxyType(state[name])
+        night_float = state.get("_night_float")
+        if night_float is not None:
+            state["_night_float"] = (MappingProxyType(night_float[0]),) + night_float[1:]
+        self.__dict__.update(state)
+
+    def forget(self) -> None:
+        """Drop every resolved value; each is recomputed on its next use.
+
+        The block stays valid and keeps its configuration, so a caller short of
+        memory can shed the derived maps without rebuilding the block.
+        """
+        for name in list(self.__dict__):
+            if name not in ("data", "ledger", "label_carryover"):
+                del self.__dict__[name]
+
+    def with_data(self, data: InputData) -> "ResolvedBlock":
+        """A block for ``data`` that keeps this block's resolved state.
+
+        For a copy of the same configuration that differs only in fields none of
+        the resolved state reads — the solver seed of a chunked-solve segment,
+        or the resolved targets themselves — so the next consumer does not
+        resolve it all again.
+        """
+        clone = replace(self, data=data)
+        for name, value in self.__dict__.items():
+            if name not in ("data", "ledger", "label_carryover", "solve_data"):
+                clone.__dict__[name] = value
+        return clone
+
+
+def resolve_block(
+    data: InputData,
+    ledger: Mapping | None = None,
+    *,
+    label_carryover: bool = True,
+) -> ResolvedBlock:
+    """Return the :class:`ResolvedBlock` for ``data`` and ``ledger``."""
+    return ResolvedBlock(data, ledger, bool(label_carryover))
+
+
+def block_for(data: InputData, block: ResolvedBlock | None = None) -> ResolvedBlock:
+    """``block`` when it was resolved from this very ``data``, else a new one.
+
+    Consumers call this on their optional ``block=`` argument: a block built
+    from a different configuration object is never trusted, it just costs the
+    caller the reuse.
+    """
+    if block is not None and block.data is data:
+        return block
+    return resolve_block(data)
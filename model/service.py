@@ -0,0 +1,456 @@
+"""Local HTTP/JSON solve service.
+
+``python -m model.cli serve`` starts a long-running server that other tools on
+the same machine can schedule through, without the Streamlit UI. It pays the
+interpreter and OR-Tools start-up once, not on every call. Solves run on a
+thread pool in the server process: CP-SAT releases the GIL while it searches,
+and each solve takes its core share from :mod:`model.admission`, just as the
+app's sessions do. A job joins that fair queue when it is submitted, and a
+dispatcher thread hands it to the pool only once it is admitted, so clients
+take turns rather than running in submission order.
+
+Endpoints (JSON unless noted)::
+
+    POST   /jobs                 submit {"config": ..., "ledger": ..., "time_limit": s,
+                                 "label_carryover": bool, "client": name} -> 202 {"id", "url"}
+    GET    /jobs                 every job's status
+    GET    /jobs/<id>            one job's status
+    GET    /jobs/<id>/events     progress stream (NDJSON): a status line whenever it
+                                 changes, ending when the job finishes
+    GET    /jobs/<id>/schedule   the schedule as JSON rows
+    GET    /jobs/<id>/<file>     schedule.csv, schedule.xlsx, schedule.pdf,
+                                 fairness_log.txt or ledger.json (the updated ledger)
+    DELETE /jobs/<id>            forget the job, stopping its search if it is running
+    GET    /health               OR-Tools availability and the solver load
+
+``config`` is the app's saved-config JSON (``input_data_to_json``), either as
+an object or as a string. ``ledger`` is optional, in the ledger download's
+format. ``client`` names the caller's turn in the fair solve queue and
+defaults to the caller's address.
+
+The server binds to loopback only and keeps everything in memory. Results
+live until they are deleted or until ``ttl`` seconds after they finish
+(default one hour), so nothing about residents is written to disk.
+
+Binding to loopback does not keep web pages out: a page can rebind its own
+host name to 127.0.0.1, or post a form to it. So every request must name a
+loopback host and the server's own port in ``Host`` (421 otherwise), and
+``POST /jobs`` must be ``Content-Type: application/json`` (415 otherwise),
+which a cross-site form cannot send without the browser asking first.
+"""
+from __future__ import annotations
+
+import json
+import re
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Mapping, Tuple
+
+from .admission import SolveAdmission, SolveTicket, solve_admission
+from .cli import job_outputs, missing_dependency
+from .config_io import input_data_from_json
+from .data_models import InputData
+from .ledger import ledger_from_json
+from .optimiser import SolveProgress
+
+__all__ = ["LOOPBACK_HOSTS", "SolveService", "make_server", "warm_up"]
+
+LOOPBACK_HOSTS = frozenset({"127.0.0.1", "::1", "localhost"})
+_MAX_BODY = 32 * 1024 * 1024
+_EVENT_POLL_SEC = 0.5
+_FILES = {
+    "schedule.csv": ("csv", "text/csv; charset=utf-8"),
+    "schedule.xlsx": (
+        "excel", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ),
+    "schedule.pdf": ("pdf", "application/pdf"),
+    "fairness_log.txt": ("log", "text/plain; charset=utf-8"),
+    "ledger.json": ("ledger", "application/json"),
+}
+
+
+class _Job:
+    """One submitted solve and, once finished, its schedule and artifacts."""
+
+    def __init__(self, job_id: str, client: str, data: InputData, ledger, *,
+                 time_limit: float | None, label_carryover: bool) -> None:
+        self.id = job_id
+        self.client = client
+        self.data = data
+        self.ledger = ledger
+        self.time_limit = time_limit
+        self.label_carryover = label_carryover
+        self.state = "queued"
+        self.progress = SolveProgress()
+        self.ticket: SolveTicket | None = None
+        self.workers: int | None = None
+        self.submitted = time.time()
+        self.started: float | None = None
+        self.finished: float | None = None
+        self.df: Any = None
+        self.block: Any = None
+        self.error: str | None = None
+        self.artifacts: Dict[str, Tuple[str, bytes]] = {}
+        self.lock = threading.Lock()
+
+
+class SolveService:
+    """The job table behind the HTTP handler; usable directly in-process."""
+
+    def __init__(
+        self,
+        admission: SolveAdmission | None = None,
+        *,
+        env: str = "prod",
+        ttl: float = 3600.0,
+    ) -> None:
+        self.admission = admission if admission is not None else solve_admission()
+        self.env = env
+        self.ttl = ttl
+        self._jobs: Dict[str, _Job] = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.admission.capacity, thread_name_prefix="solve"
+        )
+        self._wake = threading.Event()
+        self._closed = False
+        self._dispatcher: threading.Thread | None = None
+
+    def submit(self, payload: Mapping[str, Any], client: str) -> _Job:
+        """Queue a solve; raises ValueError for a malformed request."""
+        config = payload.get("config")
+        if config is None:
+            raise ValueError("'config' is required")
+        data = input_data_from_json(config if isinstance(config, str) else json.dumps(config))
+        ledger = payload.get("ledger")
+        if ledger is not None:
+            ledger = ledger_from_json(ledger if isinstance(ledger, str) else json.dumps(ledger))
+        time_limit = payload.get("time_limit")
+        if time_limit is not None:
+            if isinstance(time_limit, bool) or not isinstance(time_limit, (int, float)):
+                raise ValueError("'time_limit' must be a number of seconds")
+            time_limit = float(time_limit)
+        job = _Job(
+            secrets.token_hex(8), str(payload.get("client") or client), data, ledger,
+            time_limit=time_limit,
+            label_carryover=bool(payload.get("label_carryover", True)),
+        )
+        job.ticket = self.admission.enqueue(job.client)
+        with self._lock:
+            self._sweep()
+            self._jobs[job.id] = job
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(
+                    target=self._dispatch, name="solve-dispatch", daemon=True
+                )
+                self._dispatcher.start()
+        self._wake.set()
+        return job
+
+    def get(self, job_id: str) -> _Job | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self) -> List[_Job]:
+        with self._lock:
+            self._sweep()
+            return list(self._jobs.values())
+
+    def discard(self, job_id: str) -> bool:
+        with self._lock:
+            job = self._jobs.pop(job_id, None)
+        if job is not None:
+            job.progress.cancel()
+            if job.ticket is not None and job.state == "queued":
+                self.admission.release(job.ticket)  # never started: leave the queue
+        return job is not None
+
+    def _sweep(self) -> None:
+        cutoff = time.time() - self.ttl
+        for job_id in [j.id for j in self._jobs.values() if (j.finished or 1e18) < cutoff]:
+            del self._jobs[job_id]
+
+    def _dispatch(self) -> None:
+        """Start each queued job on the pool once admission grants its share.
+
+        Polling every queued ticket also keeps it from going stale; the
+        admission's own order decides which of them is granted.
+        """
+        while not self._closed:
+            self._wake.wait(_EVENT_POLL_SEC)
+            self._wake.clear()
+            with self._lock:  # so a job discarded meanwhile is not re-queued
+                for job in [j for j in self._jobs.values() if j.workers is None]:
+                    assert job.ticket is not None
+                    workers = self.admission.try_admit(job.ticket)
+                    if workers is not None:
+                        job.workers = workers
+                        self._pool.submit(self._run, job)
+
+    def _run(self, job: _Job) -> None:
+        from .optimiser import build_schedule
+        from .resolved import resolve_block
+
+        ticket, workers = job.ticket, job.workers
+        try:
+            if self.get(job.id) is None:
+                return  # deleted just as it was admitted
+            job.started = time.time()
+            job.state = "solving"
+            job.block = resolve_block(job.data, job.ledger, label_carryover=job.label_carryover)
+            job.df = build_schedule(
+                job.data, env=self.env, ledger=job.ledger,
+                label_carryover=job.label_carryover, time_limit_sec=job.time_limit,
+                progress=job.progress, block=job.block, num_workers=workers,
+            )
+            job.state = "done"
+        except Exception as exc:  # noqa: BLE001 - reported to the client
+            job.error = str(exc) or type(exc).__name__
+            job.state = "failed"
+        finally:
+            self.admission.release(ticket)
+            job.finished = time.time()
+            self._wake.set()
+
+    def status(self, job: _Job) -> Dict[str, Any]:
+        attrs = getattr(job.df, "attrs", None) or {}
+        unfilled = None
+        if job.df is not None:
+            cols = [c for c in job.df.columns if c not in ("Date", "Day")]
+            unfilled = int((job.df[cols] == "Unfilled").sum().sum()) if cols else 0
+        return {
+            "id": job.id,
+            "client": job.client,
+            "state": job.state,
+            "queue_position": (
+                self.admission.position(job.ticket)
+                if job.state == "queued" and job.ticket is not None else 0
+            ),
+            "workers": job.workers,
+            "elapsed": round((job.finished or time.time()) - job.started, 3)
+            if job.started else 0.0,
+            "time_limit": attrs.get("time_limit_sec", job.time_limit),
+            "phase": job.progress.phase,
+            "time_left": job.progress.time_left() if job.state == "solving" else None,
+            "solutions": job.progress.solution_count,
+            "last_improvement_sec": job.progress.last_improvement_sec,
+            "best_bound": job.progress.best_bound,
+            "solver_status": attrs.get("solver_status"),
+            "objective": attrs.get("objective", job.progress.objective),
+            "unfilled": unfilled,
+            "error": job.error,
+        }
+
+    def artifact(self, job: _Job, name: str) -> Tuple[str, bytes]:
+        """``(download name, bytes)`` of one file for a finished job."""
+        kind = _FILES[name][0]
+        with job.lock:
+            if kind not in job.artifacts:
+                missing = missing_dependency(kind)
+                if missing:
+                    raise LookupError(f"{name} needs {missing}, which is not installed")
+                filename, build = job_outputs(
+                    job.df, job.data, job.ledger, job.block, (kind,)
+                )[kind]
+                payload = build()
+                job.artifacts[kind] = (
+                    filename, payload.encode("utf-8") if isinstance(payload, str) else payload
+                )
+            return job.artifacts[kind]
+
+    def shutdown(self) -> None:
+        self._closed = True
+        self._wake.set()
+        with self._lock:
+            for job in self._jobs.values():
+                if job.workers is None:
+                    self.admission.release(job.ticket)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _rows(df) -> List[Dict[str, Any]]:
+    return [
+        {k: v.isoformat() if isinstance(v, date) else v for k, v in row.items()}
+        for row in df.to_dict("records")
+    ]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_Server"
+    server_version = "SchedulerService/1"
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002 - stdlib name
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, payload: bytes, content_type: str, extra=()) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        for header, value in extra:
+            self.send_header(header, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _json(self, status: int, payload: Any) -> None:
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json")
+
+    def _error(self, status: HTTPStatus, message: str) -> None:
+        self._json(status, {"error": message})
+
+    def _trusted_host(self) -> bool:
+        """True when ``Host`` names a loopback host on this server's port.
+
+        Otherwise answers 421, so a DNS-rebound page cannot read results.
+        """
+        match = re.fullmatch(
+            r"(\[[^\]]+\]|[^:]+)(?::(\d+))?", (self.headers.get("Host") or "").strip()
+        )
+        if match is not None:
+            host = match.group(1).strip("[]").lower()
+            port = int(match.group(2) or 80)
+            if host in LOOPBACK_HOSTS and port == self.server.server_port:
+                return True
+        self._error(HTTPStatus.MISDIRECTED_REQUEST, "Host must be this loopback server")
+        return False
+
+    def _job(self, job_id: str) -> _Job | None:
+        job = self.server.service.get(job_id)
+        if job is None:
+            self._error(HTTPStatus.NOT_FOUND, f"no job {job_id}")
+        return job
+
+    def do_POST(self) -> None:
+        if not self._trusted_host():
+            return
+        if self.path.rstrip("/") != "/jobs":
+            return self._error(HTTPStatus.NOT_FOUND, "POST /jobs to submit a solve")
+        content_type = (self.headers.get("Content-Type") or "").split(";", 1)[0]
+        if content_type.strip().lower() != "application/json":
+            return self._error(
+                HTTPStatus.UNSUPPORTED_MEDIA_TYPE, "send the request as application/json"
+            )
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > _MAX_BODY:
+            return self._error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "request body too large")
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(payload, dict):
+                raise ValueError("the request body must be a JSON object")
+            job = self.server.service.submit(payload, client=self.client_address[0])
+        except ValueError as exc:  # includes json.JSONDecodeError
+            return self._error(HTTPStatus.BAD_REQUEST, str(exc))
+        self._json(HTTPStatus.ACCEPTED, {"id": job.id, "url": f"/jobs/{job.id}"})
+
+    def do_DELETE(self) -> None:
+        if not self._trusted_host():
+            return
+        match = re.fullmatch(r"/jobs/([0-9a-f]+)/?", self.path)
+        if match and self.server.service.discard(match.group(1)):
+            return self._json(HTTPStatus.OK, {"deleted": match.group(1)})
+        self._error(HTTPStatus.NOT_FOUND, "no such job")
+
+    def do_GET(self) -> None:
+        if not self._trusted_host():
+            return
+        service = self.server.service
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path == "/health":
+            from .optimiser import ORTOOLS_AVAILABLE
+
+            return self._json(HTTPStatus.OK, {
+                "ok": True, "ortools": ORTOOLS_AVAILABLE,
+                "load": service.admission.load()._asdict(),
+            })
+        if path == "/jobs":
+            return self._json(HTTPStatus.OK, [service.status(job) for job in service.jobs()])
+        match = re.fullmatch(r"/jobs/([0-9a-f]+)(?:/([\w.]+))?", path)
+        if match is None:
+            return self._error(HTTPStatus.NOT_FOUND, "unknown path")
+        job = self._job(match.group(1))
+        if job is None:
+            return
+        resource = match.group(2)
+        if resource is None:
+            return self._json(HTTPStatus.OK, service.status(job))
+        if resource == "events":
+            return self._stream(job)
+        if job.state != "done":
+            return self._error(HTTPStatus.CONFLICT, f"job is {job.state}, not done")
+        if resource == "schedule":
+            return self._json(HTTPStatus.OK, _rows(job.df))
+        if resource not in _FILES:
+            return self._error(HTTPStatus.NOT_FOUND, f"no file {resource}")
+        try:
+            filename, payload = service.artifact(job, resource)
+        except LookupError as exc:
+            return self._error(HTTPStatus.NOT_IMPLEMENTED, str(exc))
+        self._send(
+            HTTPStatus.OK, payload, _FILES[resource][1],
+            [("Content-Disposition", f'attachment; filename="{filename}"')],
+        )
+
+    def _stream(self, job: _Job) -> None:
+        """NDJSON progress lines until the job finishes (HTTP/1.0: the stream
+        ends when the connection closes)."""
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        last = None
+        while True:
+            status = self.server.service.status(job)
+            changed = {k: v for k, v in status.items() if k not in ("elapsed", "time_left")}
+            if changed != last:
+                last = changed
+                try:
+                    self.wfile.write(json.dumps(status).encode("utf-8") + b"\n")
+                    self.wfile.flush()
+                except OSError:
+                    return  # the client went away
+            if job.finished is not None:
+                return
+            time.sleep(_EVENT_POLL_SEC)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, service: SolveService, verbose: bool) -> None:
+        if address[0] not in LOOPBACK_HOSTS:
+            raise ValueError(
+                f"refusing to bind {address[0]!r}: the solve service is local-only "
+                f"(use one of {', '.join(sorted(LOOPBACK_HOSTS))})"
+            )
+        if address[0] == "::1":
+            import socket
+
+            self.address_family = socket.AF_INET6
+        super().__init__(address, _Handler)
+        self.service = service
+        self.verbose = verbose
+
+
+def make_server(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    service: SolveService | None = None,
+    *,
+    verbose: bool = False,
+) -> _Server:
+    """A ready-to-``serve_forever`` server; ``port=0`` picks a free port."""
+    return _Server((host, port), service or SolveService(), verbose)
+
+
+def warm_up() -> bool:
+    """Import the solver and the exporters now rather than on the first call;
+    returns whether OR-Tools is available."""
+    from . import exporters, optimiser  # noqa: F401
+
+    optimiser.cp_model  # loads OR-Tools (or settles on the stub)
+    return optimiser.ORTOOLS_AVAILABLE
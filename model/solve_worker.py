@@ -0,0 +1,654 @@
+"""Opt-in out-of-process solve worker backed by a spool directory.
+
+Off unless the deployment sets ``SOLVE_SPOOL_DIR``: by default the app solves
+in the session's own script thread and keeps nothing on disk (see *Privacy and
+persistence* in the README). When a deployer opts in, Generate writes the
+solve request (config, ledger, budget, warm start) into the spool and a local
+worker process, launched on demand, runs it. The UI only submits, polls and
+fetches, so a solve outlives a page reload, a recycled app worker or an app
+restart, and the script thread stays free while CP-SAT saturates the CPU.
+
+Spool layout, one directory per job under ``<root>/jobs``::
+
+    request.pkl   the SolveRequest, written once at submit
+    claim         the id of the worker running the job, and its generation
+    claim.<n>     marker: generation n was taken over from a stale worker
+    state.json    progress and outcome, rewritten every heartbeat
+    best.pkl      checkpoint: the best schedule so far (compact frame)
+    result.pkl    the final schedule (compact frame), written last
+    cancel        marker: stop and keep the best schedule
+
+* Job ids sort in submission order, so workers take jobs first come, first
+  served; the claim file keeps two workers off the same job. A fresh job is
+  claimed by creating it exclusively; a stale claim is taken over by
+  creating the next generation's marker exclusively, then replacing the
+  claim and reading it back, so exactly one worker resumes an orphan. A
+  claim that does not parse counts as held and is never taken over.
+* The worker checkpoints the best incumbent after every segment and writes a
+  heartbeat every second, which also stops the running segment within a
+  second of a cancel or a discard. A job whose heartbeat goes stale (its worker died)
+  is claimed again and resumes from the checkpoint with its spent budget, so
+  a crash costs at most one segment.
+* The worker runs one job at a time, and each segment takes its
+  ``num_workers`` share from the worker process's own admission
+  (:mod:`model.admission`): ``SOLVE_MAX_CORES`` cores if the deployment sets
+  it, else every core the worker may run on.
+* Frames are stored compactly: dates as ordinals, every other column coded
+  against one shared vocabulary of names, the whole payload compressed.
+* Every write is atomic (temp file, then ``os.replace``) and the directory is
+  created ``0700``. Jobs are removed once fetched; anything left behind is
+  swept after ``SOLVE_SPOOL_TTL_HOURS`` (default 24).
+
+Standard library only, apart from the solver itself in the worker process.
+The spool is a plain value, so the UI holds nothing but a job id.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import pickle
+import re
+import secrets
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from array import array
+from dataclasses import dataclass, replace
+from datetime import date
+from pathlib import Path
+from typing import Any, Mapping, NamedTuple
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - fallback when pandas missing
+    from .pandas_stub import pd
+
+from .admission import solve_admission
+from .data_models import InputData
+from .fairness import points_spread
+
+__all__ = [
+    "SolveRequest",
+    "SolveSpool",
+    "SpoolResult",
+    "SpoolStatus",
+    "pack_frame",
+    "run_worker",
+    "spool_from_env",
+    "unpack_frame",
+]
+
+_DEFAULT_CHECKPOINT_SEC = 120.0
+_DEFAULT_TTL_HOURS = 24.0
+_HEARTBEAT_SEC = 1.0
+_STALE_SEC = 15.0       # a heartbeat this old means the worker is gone
+_STALE_ROUNDS = 3       # no-improvement segments before stopping early
+_TEMP_PREFIX = ".tmp-"
+
+# Written into the claims this process makes.
+_WORKER_ID = f"{os.getpid()}-{secrets.token_hex(4)}"
+_FINAL_STATES = frozenset({"done", "cancelled", "failed"})
+_JOB_ID = re.compile(r"\d{20}-[0-9a-f]{16}")
+# A claim that does not parse (still being written): held, never stale.
+_UNREADABLE_CLAIM = ("", -1)
+
+
+@dataclass(frozen=True)
+class SolveRequest:
+    """Everything a worker needs to run one solve."""
+
+    data: InputData
+    ledger: Any = None
+    label_carryover: bool = True
+    env: str = "prod"
+    target: float = 60.0          # total solver budget in seconds
+    warm_start_df: Any = None
+    baseline_score: float | None = None  # exact objective of ``warm_start_df``
+    seed_offset: int = 0
+
+
+class SpoolStatus(NamedTuple):
+    """A job's progress as last written by its worker."""
+
+    state: str                     # queued, running, done, cancelled, failed
+    target: float = 0.0
+    elapsed: float = 0.0           # budget spent, including the live segment
+    wall_total: float = 0.0        # solver wall time over finished segments
+    segments: int = 0
+    improvements: int = 0
+    objective: float | None = None
+    solver_status: str | None = None
+    last_improve_wall: float | None = None
+    error: str | None = None
+    infeasible: bool = False       # the error is a proven infeasibility
+    cancel: bool = False
+    updated: float = 0.0
+
+    @property
+    def finished(self) -> bool:
+        return self.state in _FINAL_STATES
+
+
+class SpoolResult(NamedTuple):
+    """A fetched job: its request, best schedule (or None) and final status."""
+
+    request: SolveRequest
+    df: Any
+    status: SpoolStatus
+
+
+def pack_frame(df) -> bytes:
+    """Serialise a schedule frame compactly (see the module docstring)."""
+    vocab: dict[Any, int] = {}
+    columns = []
+    for name in df.columns:
+        values = list(df[name])
+        if values and all(type(v) is date for v in values):
+            columns.append((name, "date", array("l", [v.toordinal() for v in values])))
+            continue
+        codes = array("I", [vocab.setdefault(v, len(vocab)) for v in values])
+        columns.append((name, "code", codes))
+    attrs = dict(getattr(df, "attrs", None) or {})
+    payload = (tuple(vocab), columns, attrs)
+    return zlib.compress(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def unpack_frame(blob: bytes):
+    """The frame :func:`pack_frame` stored."""
+    vocab, columns, attrs = pickle.loads(zlib.decompress(blob))
+    table = {}
+    for name, kind, values in columns:
+        if kind == "date":
+            table[name] = [date.fromordinal(v) for v in values]
+        else:
+            table[name] = [vocab[v] for v in values]
+    df = pd.DataFrame(table, columns=[name for name, _kind, _values in columns])
+    try:
+        df.attrs.update(attrs)
+    except AttributeError:  # pragma: no cover - stub frames
+        pass
+    return df
+
+
+def _write_atomic(path: Path, blob: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(prefix=_TEMP_PREFIX, dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(blob)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+@dataclass(frozen=True)
+class SolveSpool:
+    """A spool directory of solve jobs shared by the UI and its worker."""
+
+    root: Path
+    checkpoint_sec: float = _DEFAULT_CHECKPOINT_SEC
+    ttl_sec: float = _DEFAULT_TTL_HOURS * 3600
+
+    @property
+    def _jobs(self) -> Path:
+        return self.root / "jobs"
+
+    @property
+    def _alive(self) -> Path:
+        return self.root / "worker.alive"
+
+    def _dir(self, job_id: str) -> Path:
+        if not _JOB_ID.fullmatch(job_id or ""):
+            raise ValueError(f"invalid job id {job_id!r}")
+        return self._jobs / job_id
+
+    # -- UI side ---------------------------------------------------------------
+
+    def submit(self, request: SolveRequest, *, start_worker: bool = True) -> str:
+        """Queue ``request`` and make sure a worker is running; returns its id."""
+        self._jobs.mkdir(mode=0o700, parents=True, exist_ok=True)
+        job_id = f"{time.time_ns():020d}-{secrets.token_hex(8)}"
+        job = self._dir(job_id)
+        job.mkdir(mode=0o700)
+        _write_atomic(job / "request.pkl", pickle.dumps(request, pickle.HIGHEST_PROTOCOL))
+        if start_worker:
+            self.ensure_worker()
+        return job_id
+
+    def status(self, job_id: str) -> SpoolStatus | None:
+        """The job's latest status, or None if it no longer exists."""
+        try:
+            job = self._dir(job_id)
+        except ValueError:  # e.g. a mangled id from a bookmarked URL
+            return None
+        try:
+            raw = json.loads((job / "state.json").read_text())
+        except (OSError, ValueError):
+            if not (job / "request.pkl").exists():
+                return None
+            raw = {"state": "queued"}
+        known = {k: raw[k] for k in SpoolStatus._fields if k in raw}
+        status = SpoolStatus(**known)
+        if not status.finished and (job / "cancel").exists():
+            status = status._replace(cancel=True)
+        return status
+
+    def cancel(self, job_id: str) -> None:
+        """Ask the worker to stop the job and keep its best schedule."""
+        try:
+            (self._dir(job_id) / "cancel").touch()
+        except OSError:
+            pass
+
+    def fetch(self, job_id: str) -> SpoolResult | None:
+        """The finished job, or a running one's checkpoint; None if neither."""
+        status = self.status(job_id)
+        if status is None:
+            return None
+        job = self._dir(job_id)
+        try:
+            request = pickle.loads((job / "request.pkl").read_bytes())
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        for name in ("result.pkl", "best.pkl"):
+            try:
+                blob = (job / name).read_bytes()
+            except OSError:
+                continue
+            return SpoolResult(request, unpack_frame(blob), status)
+        if status.finished:
+            return SpoolResult(request, None, status)
+        return None
+
+    def discard(self, job_id: str) -> None:
+        """Delete the job and everything it wrote."""
+        shutil.rmtree(self._dir(job_id), ignore_errors=True)
+
+    def worker_alive(self) -> bool:
+        try:
+            return time.time() - self._alive.stat().st_mtime < _STALE_SEC
+        except OSError:
+            return False
+
+    def ensure_worker(self) -> None:
+        """Launch a detached worker unless one is already beating."""
+        if self.worker_alive():
+            return
+        self.root.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self._alive.touch()  # claim the launch so a concurrent submit doesn't
+        package_root = Path(__file__).resolve().parent.parent
+        with open(self.root / "worker.log", "ab") as log:
+            subprocess.Popen(
+                [sys.executable, "-m", "model.solve_worker", str(self.root)],
+                cwd=package_root, stdin=subprocess.DEVNULL, stdout=log,
+                stderr=subprocess.STDOUT, start_new_session=True,
+                env={**os.environ, "SOLVE_SPOOL_DIR": str(self.root)},
+            )
+
+    # -- worker side -----------------------------------------------------------
+
+    def _stale(self, job: Path) -> bool:
+        """True once neither the heartbeat nor the claim has moved for a while."""
+        newest = None
+        for name in ("state.json", "claim"):
+            try:
+                mtime = (job / name).stat().st_mtime
+            except OSError:
+                continue
+            newest = mtime if newest is None else max(newest, mtime)
+        return newest is None or time.time() - newest > _STALE_SEC
+
+    @staticmethod
+    def _finished(job: Path) -> bool:
+        try:
+            return json.loads((job / "state.json").read_text()).get("state") in _FINAL_STATES
+        except (OSError, ValueError):
+            return False
+
+    @staticmethod
+    def _read_claim(job: Path) -> tuple[str, int] | None:
+        """``(worker, generation)`` of the job's claim, None without one, or
+        ``_UNREADABLE_CLAIM`` when it does not parse."""
+        try:
+            raw = (job / "claim").read_text()
+        except OSError:
+            return None
+        try:
+            held = json.loads(raw)
+            return str(held["worker"]), int(held["generation"])
+        except (ValueError, TypeError, KeyError):
+            return _UNREADABLE_CLAIM
+
+    @staticmethod
+    def _claim_blob(worker: str, generation: int) -> bytes:
+        return json.dumps({"worker": worker, "generation": generation}).encode()
+
+    def _take_over(self, job: Path, generation: int, worker: str) -> bool:
+        """Replace a stale claim of ``generation``; True if ``worker`` now holds it.
+
+        Only the worker that creates the next generation's marker may replace
+        the claim, so of several that found it stale at once, one wins.
+        """
+        marker = job / f"claim.{generation + 1}"
+        try:
+            fd = os.open(marker, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+        except OSError:
+            return False  # another worker is taking it over
+        os.close(fd)
+        try:
+            _write_atomic(job / "claim", self._claim_blob(worker, generation + 1))
+        except OSError:
+            return False  # discarded meanwhile
+        held = self._read_claim(job)
+        return held is not None and held[0] == worker
+
+    def claim_next(self, worker: str | None = None) -> str | None:
+        """Claim the oldest runnable job: never started, or orphaned by a
+        worker whose heartbeat went stale. ``worker`` defaults to this
+        process's id."""
+        worker = worker or _WORKER_ID
+        try:
+            candidates = sorted(p for p in self._jobs.iterdir() if not p.name.startswith("."))
+        except OSError:
+            return None
+        for job in candidates:
+            if not (job / "request.pkl").exists() or self._finished(job):
+                continue
+            claim = job / "claim"
+            # Read the claim before judging it, so a takeover is of what was stale.
+            held = self._read_claim(job)
+            if held is not None:
+                if (held != _UNREADABLE_CLAIM and self._stale(job)
+                        and self._take_over(job, held[1], worker)):
+                    return job.name
+                continue
+            try:
+                fd = os.open(claim, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+            except OSError:
+                continue  # another worker got there first
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(self._claim_blob(worker, 0))
+            return job.name
+        return None
+
+    def sweep(self) -> None:
+        """Remove jobs untouched for longer than the retention window."""
+        cutoff = time.time() - self.ttl_sec
+        try:
+            jobs = list(self._jobs.iterdir())
+        except OSError:
+            return
+        for job in jobs:
+            try:
+                newest = max(p.stat().st_mtime for p in [job, *job.iterdir()])
+            except (OSError, ValueError):
+                continue
+            if newest < cutoff:
+                shutil.rmtree(job, ignore_errors=True)
+
+
+def spool_from_env(environ: Mapping[str, str] | None = None) -> SolveSpool | None:
+    """The spool the deployment configured, or None (the default: solve in the
+    session). ``SOLVE_SPOOL_DIR`` enables it; ``SOLVE_SPOOL_CHECKPOINT_SEC``
+    sets the segment length and ``SOLVE_SPOOL_TTL_HOURS`` the retention of
+    jobs nobody fetched."""
+    environ = os.environ if environ is None else environ
+    root = environ.get("SOLVE_SPOOL_DIR", "").strip()
+    if not root:
+        return None
+
+    def number(name: str, default: float) -> float:
+        try:
+            return max(0.0, float(environ.get(name, default)))
+        except ValueError:
+            return default
+
+    return SolveSpool(
+        Path(root).expanduser(),
+        checkpoint_sec=number("SOLVE_SPOOL_CHECKPOINT_SEC", _DEFAULT_CHECKPOINT_SEC) or 1.0,
+        ttl_sec=number("SOLVE_SPOOL_TTL_HOURS", _DEFAULT_TTL_HOURS) * 3600,
+    )
+
+
+class _Heartbeat:
+    """Keeps ``worker.alive`` and the running job's ``state.json`` fresh,
+    folds the live segment's progress into the state it writes, and stops the
+    live segment once the job is cancelled or discarded."""
+
+    def __init__(self, spool: SolveSpool) -> None:
+        self.spool = spool
+        self.lock = threading.Lock()
+        self.job: Path | None = None
+        self.state: dict[str, Any] = {}
+        self.segment_start: float | None = None
+        self.sink: Any = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> "_Heartbeat":
+        self.spool.root.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.spool._alive.touch()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(_HEARTBEAT_SEC):
+            try:
+                self.spool._alive.touch()
+            except OSError:
+                pass
+            self.write()
+            with self.lock:
+                job, sink = self.job, self.sink
+            if sink is not None and job is not None and (
+                not job.exists() or (job / "cancel").exists()
+            ):
+                sink.cancel()
+
+    def write(self, **changes: Any) -> None:
+        """Merge ``changes`` into the job state and write it out."""
+        with self.lock:
+            if self.job is None:
+                return
+            self.state.update(changes)
+            out = dict(self.state, updated=time.time())
+            if self.segment_start is not None and out["state"] == "running":
+                live = min(time.monotonic() - self.segment_start, out.get("this_chunk", 0.0))
+                out["elapsed"] = out.get("elapsed", 0.0) + live
+                found = int(getattr(self.sink, "solution_count", 0) or 0)
+                out["improvements"] = out.get("improvements", 0) + max(
+                    0, found - out.get("warm", 0)
+                )
+            try:
+                _write_atomic(self.job / "state.json", json.dumps(out).encode())
+            except OSError:
+                pass  # discarded by the UI meanwhile; the run loop notices
+
+
+def _run_job(spool: SolveSpool, job_id: str, beat: _Heartbeat) -> None:
+    """Run (or resume) one claimed job to completion."""
+    from .optimiser import SolveCancelled, SolveProgress, build_schedule
+    from .resolved import resolve_block
+
+    job = spool._dir(job_id)
+    request: SolveRequest = pickle.loads((job / "request.pkl").read_bytes())
+    try:
+        state = json.loads((job / "state.json").read_text())
+    except (OSError, ValueError):
+        state = {}
+    best_df, best_score = request.warm_start_df, request.baseline_score
+    try:
+        best_df = unpack_frame((job / "best.pkl").read_bytes())
+        best_score = state.get("objective")
+    except OSError:
+        pass
+    state.update(state="running", target=float(request.target))
+    for key, default in (("elapsed", 0.0), ("wall_total", 0.0), ("segments", 0),
+                         ("improvements", 0), ("stale_rounds", 0)):
+        state.setdefault(key, default)
+    with beat.lock:
+        beat.job, beat.state, beat.segment_start, beat.sink = job, state, None, None
+    beat.write()
+
+    data, target = request.data, float(request.target)
+    block = resolve_block(data, request.ledger, label_carryover=request.label_carryover)
+    error = unknown = None
+    infeasible = False
+    while job.exists():
+        remaining = target - state["elapsed"]
+        if (job / "cancel").exists() or remaining <= 0.5:
+            break
+        this_chunk = min(spool.checkpoint_sec, remaining)
+        # Same seed diversification as the in-session runner: every segment
+        # after a fresh run's first explores from a new seed.
+        shift = request.seed_offset + state["segments"]
+        seg_data = data if shift == 0 else replace(data, seed=(data.seed or 0) + shift)
+        sink = SolveProgress()
+        had_warm = best_df is not None
+        with beat.lock:
+            state.update(this_chunk=this_chunk, warm=int(had_warm))
+            beat.segment_start, beat.sink = time.monotonic(), sink
+        try:
+            with solve_admission().admitted(job_id) as workers:
+                df = build_schedule(
+                    seg_data, env=request.env, ledger=request.ledger,
+                    label_carryover=request.label_carryover, time_limit_sec=this_chunk,
+                    warm_start_df=best_df, num_workers=workers,
+                    progress=sink, block=block if seg_data is data else block.with_data(seg_data),
+                )
+        except SolveCancelled:
+            # Stopped by the heartbeat before this segment found a schedule.
+            with beat.lock:
+                beat.segment_start = None
+            break
+        except RuntimeError as exc:
+            if "UNKNOWN" not in str(exc):
+                error, infeasible = str(exc), True
+                break
+            unknown = str(exc)
+            # No schedule inside this window: a spent segment, not a failure.
+            with beat.lock:
+                beat.segment_start = None
+                state["segments"] += 1
+                state["elapsed"] += this_chunk
+                state["wall_total"] += this_chunk
+                if best_df is not None:
+                    state["stale_rounds"] += 1
+            if state["stale_rounds"] >= _STALE_ROUNDS:
+                break
+            continue
+        except Exception as exc:  # noqa: BLE001 - reported to the UI
+            error = str(exc) or type(exc).__name__
+            break
+
+        attrs = getattr(df, "attrs", {}) or {}
+        seg_wall = float(attrs.get("wall_time_sec") or this_chunk)
+        found = int(getattr(sink, "solution_count", 0) or 0)
+        if had_warm and found > 0:
+            found -= 1  # the re-completed hint is not an improvement
+        score = attrs.get("objective")
+        if score is None:
+            score = points_spread(df, data)
+        if best_score is None:
+            # An edited warm start has no exact objective: judge this first
+            # segment against it with the fairness proxy instead.
+            improved = best_df is None or points_spread(df, data) <= points_spread(best_df, data)
+            take = improved
+        else:
+            improved = score < best_score - 1e-9
+            take = improved or (
+                attrs.get("solver_status") == "OPTIMAL" and score <= best_score + 1e-9
+            )
+        with beat.lock:
+            beat.segment_start = None
+            wall_before = state["wall_total"]
+            state["segments"] += 1
+            state["elapsed"] += this_chunk
+            state["wall_total"] = wall_before + seg_wall
+            state["improvements"] += found
+            state["stale_rounds"] = 0 if improved else state["stale_rounds"] + 1
+            state["solver_status"] = attrs.get("solver_status")
+        if take:
+            try:
+                _write_atomic(job / "best.pkl", pack_frame(df))
+            except OSError:
+                break  # discarded mid-segment
+            best_df, best_score = df, score
+            within = attrs.get("last_improvement_sec")
+            beat.write(
+                objective=score,
+                last_improve_wall=wall_before + float(within if within is not None else seg_wall),
+            )
+        else:
+            beat.write()
+        if attrs.get("solver_status") == "OPTIMAL" or state["stale_rounds"] >= _STALE_ROUNDS:
+            break
+
+    if error is None and best_df is None and not (job / "cancel").exists():
+        error = unknown  # the whole budget passed without a schedule
+    if not job.exists():
+        final = None  # fetched and discarded (a cancel that kept the checkpoint)
+    elif error is not None:
+        final = "failed"
+    elif (job / "cancel").exists():
+        final = "cancelled"
+    else:
+        final = "done"
+    if final is not None:
+        try:
+            if best_df is not None:
+                _write_atomic(job / "result.pkl", pack_frame(best_df))
+        except OSError:
+            pass
+        beat.write(state=final, error=error, infeasible=infeasible,
+                   cancel=final == "cancelled")
+    with beat.lock:
+        beat.job, beat.segment_start, beat.sink = None, None, None
+
+
+def run_worker(spool: SolveSpool, *, idle_exit: float = 30.0, poll: float = 0.5) -> int:
+    """Run queued jobs one at a time until the spool has been idle for
+    ``idle_exit`` seconds; returns how many jobs were run."""
+    ran = 0
+    idle_since = time.monotonic()
+    with _Heartbeat(spool) as beat:
+        spool.sweep()
+        while True:
+            job_id = spool.claim_next()
+            if job_id is None:
+                if time.monotonic() - idle_since >= idle_exit:
+                    return ran
+                time.sleep(poll)
+                continue
+            _run_job(spool, job_id, beat)
+            ran += 1
+            spool.sweep()
+            idle_since = time.monotonic()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run queued solves from a spool directory.")
+    parser.add_argument("root", nargs="?", help="spool directory (default: $SOLVE_SPOOL_DIR)")
+    parser.add_argument("--idle-exit", type=float, default=30.0,
+                        help="exit after this many idle seconds")
+    args = parser.parse_args(argv)
+    spool = spool_from_env(
+        {**os.environ, "SOLVE_SPOOL_DIR": args.root} if args.root else None
+    )
+    if spool is None:
+        parser.error("no spool directory: pass one or set SOLVE_SPOOL_DIR")
+    run_worker(spool, idle_exit=args.idle_exit)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,31 +1,21 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from datetime import timedelta
 import math
-from typing import List
+import threading
+from typing import Callable, List, NamedTuple, Sequence, Tuple
 
 try:
     import pandas as pd
 except ImportError:  # pragma: no cover - fallback when pandas missing
     from .pandas_stub import pd
 
-from .data_models import (
-    InputData,
-    blackout_night_before_dates,
-    blackout_person_windows,
-    is_regular_night_call,
-    normalized_blackouts,
-    normalized_closures,
-    normalized_leaves,
-    normalized_nf_assignments,
-    normalized_nf_coverage,
-    normalized_perks,
-    normalized_reductions,
-)
-from .closures import closed_cells_from_attr, resolve_closures
-from .night_float import nf_cells_from_attr, nf_leave_windows, resolve_night_float
+from .data_models import InputData, content_key, is_regular_night_call
+from .closures import closed_cells_from_attr
+from .night_float import nf_cells_from_attr
 from .points import classify_slot, slot_points
-from .reductions import reduction_caps
+from .resolved import ResolvedBlock, block_for
 from .utils import weekend_holiday_dates
 
 __all__ = ["validate_input", "config_warnings", "validate_schedule"]
@@ -39,7 +29,7 @@ def _finite_number(value) -> bool:
         return False
 
 
-def config_warnings(data: InputData) -> List[str]:
+def config_warnings(data: InputData, *, block: ResolvedBlock | None = None) -> List[str]:
     """Return non-blocking advisories about a valid-but-risky configuration.
 
     Unlike :func:`validate_input` (which blocks solving), these are hints that a
@@ -53,9 +43,18 @@ def config_warnings(data: InputData) -> List[str]:
     * block-level capacity facts (see :func:`_capacity_warnings`): min_gap
       shift ceilings vs slot counts, the weekly-rhythm weekend lock, and
       structural per-head workload gaps between the roles.
+
+    ``block`` is the :class:`~model.resolved.ResolvedBlock` of ``data`` when
+    the caller already resolved it; otherwise it is resolved only if a check
+    that reads it has to re-run. Memoised per section like
+    :func:`validate_input`.
     """
-    warnings: List[str] = []
+    return _run_checks(_WARNING_CHECKS, data, block)
 
+
+def _supply_warnings(data: InputData) -> List[str]:
+    """More shifts of a role per day than residents of that role."""
+    out: List[str] = []
     role_people = {"Junior": len(data.juniors), "Senior": len(data.seniors)}
     role_shifts: dict = {}
     for shift in data.shifts:
@@ -63,37 +62,38 @@ def config_warnings(data: InputData) -> List[str]:
     for role, n_shifts in role_shifts.items():
         n_people = role_people.get(role, 0)
         if n_shifts > n_people:
-            warnings.append(
+            out.append(
                 f"{n_shifts} {role} shift(s) per day but only {n_people} "
                 f"{role.lower()}(s); at least {n_shifts - n_people} slot(s) will "
                 "be unfilled each day."
             )
+    return out
 
+
+def _extra_point_warnings(data: InputData) -> List[str]:
+    """Extra points that cannot fit under the resident's max-total cap."""
+    out: List[str] = []
     max_total = data.max_total or {}
     for name, extra in (data.extra_points or {}).items():
         if extra > 0 and name in max_total and max_total[name] < extra:
-            warnings.append(
+            out.append(
                 f"'{name}' has {extra:g} extra points but a max-total cap of "
                 f"{max_total[name]:g}; the penalty can't fit under the cap and the "
                 "schedule will be infeasible."
             )
+    return out
 
+
+def _holiday_warnings(data: InputData) -> List[str]:
+    """Holidays outside the schedule dates."""
+    out: List[str] = []
     for h_date, _bonus, _weekend in (data.holidays or []):
         if h_date < data.start_date or h_date > data.end_date:
-            warnings.append(
+            out.append(
                 f"Holiday {h_date} is outside the schedule dates "
                 f"({data.start_date}–{data.end_date}) and has no effect."
             )
-
-    warnings.extend(_capacity_warnings(data))
-    warnings.extend(_leave_rotator_warnings(data))
-    warnings.extend(_exemption_perk_warnings(data))
-    warnings.extend(_blackout_warnings(data))
-    warnings.extend(_reduction_warnings(data))
-    warnings.extend(_preference_warnings(data))
-    warnings.extend(_avoid_pair_warnings(data))
-    warnings.extend(_night_float_warnings(data))
-    return warnings
+    return out
 
 
 def _capacity_warnings(data: InputData) -> List[str]:
@@ -169,10 +169,10 @@ def _capacity_warnings(data: InputData) -> List[str]:
     return out
 
 
-def _night_float_warnings(data: InputData) -> List[str]:
+def _night_float_warnings(data: InputData, block: ResolvedBlock) -> List[str]:
     """Advisories for the night-float overlay configuration."""
     out: List[str] = []
-    covered_labels = {c.label for c in normalized_nf_coverage(data.nf_coverage)}
+    covered_labels = {c.label for c in data.compiled().nf_coverage}
     for shift in data.shifts:
         if shift.night_float and shift.label not in covered_labels:
             out.append(
@@ -184,7 +184,7 @@ def _night_float_warnings(data: InputData) -> List[str]:
         return out
 
     # Covered dates with no assigned coverer fall back to regular scheduling.
-    _cells, gap_slots, _leaves = resolve_night_float(data)
+    gap_slots = block.nf_gaps
     if gap_slots:
         shown = ", ".join(f"{d} '{lbl}'" for d, lbl in sorted(gap_slots)[:5])
         more = f" (+{len(gap_slots) - 5} more)" if len(gap_slots) > 5 else ""
@@ -193,7 +193,7 @@ def _night_float_warnings(data: InputData) -> List[str]:
             f"regular scheduling: {shown}{more}."
         )
 
-    for a in normalized_nf_assignments(data.nf_assignments, default_rest=data.nf_rest_days):
+    for a in data.compiled().nf_assignments:
         if a.end < data.start_date or a.start > data.end_date:
             out.append(
                 f"Night-float assignment for '{a.name}' ({a.start}–{a.end}) is "
@@ -240,7 +240,7 @@ def _preference_warnings(data: InputData) -> List[str]:
     return out
 
 
-def _reduction_warnings(data: InputData) -> List[str]:
+def _reduction_warnings(data: InputData, block: ResolvedBlock) -> List[str]:
     """Advisories for load reductions that are likely mistakes or coverage risks."""
     out: List[str] = []
     if not data.reductions:
@@ -248,7 +248,7 @@ def _reduction_warnings(data: InputData) -> List[str]:
     named_groups = data.named_groups or {}
     start, end = data.start_date, data.end_date
 
-    for red in normalized_reductions(data.reductions):
+    for red in data.compiled().reductions:
         who = f"group '{red.group}'" if red.group is not None else "ad-hoc reduction"
         if red.factor >= 1.0:
             out.append(
@@ -269,7 +269,7 @@ def _reduction_warnings(data: InputData) -> List[str]:
     # Coverage risk: a label whose whole eligible pool is under a factor-0
     # reduction on some day cannot be assigned there at all.
     zero_caps: dict = {}
-    for cap in reduction_caps(data):
+    for cap in block.reduction_caps:
         if cap.factor <= 0:
             for label in cap.labels:
                 zero_caps.setdefault(label, []).append(cap)
@@ -321,9 +321,9 @@ def _unavailable_person_days(data: InputData) -> dict:
     for name, ws, we in data.rotators:
         rotator_windows.setdefault(name, []).append((ws, we))
     blocked_windows: dict = {}
-    for name, ws, we, _c in normalized_leaves(data.leaves):
+    for name, ws, we, _c in data.compiled().leaves:
         blocked_windows.setdefault(name, []).append((ws, we))
-    for name, windows in blackout_person_windows(data.blackouts, data.named_groups).items():
+    for name, windows in data.compiled().blackout_windows.items():
         for ws, we, _c in windows:
             blocked_windows.setdefault(name, []).append((ws, we))
 
@@ -351,7 +351,7 @@ def _blackout_warnings(data: InputData) -> List[str]:
     named_groups = data.named_groups or {}
     start, end = data.start_date, data.end_date
 
-    for b in normalized_blackouts(data.blackouts):
+    for b in data.compiled().blackouts:
         who = f"group '{b.group}'" if b.group is not None else "ad-hoc blackout"
         if b.group is not None and not named_groups.get(b.group):
             out.append(
@@ -396,7 +396,7 @@ def _blackout_warnings(data: InputData) -> List[str]:
 
     # Whole-block compensated blackout: full share kept but no days to earn it.
     comp_windows: dict = {}
-    for name, windows in blackout_person_windows(data.blackouts, data.named_groups).items():
+    for name, windows in data.compiled().blackout_windows.items():
         for ws, we, comp in windows:
             if comp:
                 comp_windows.setdefault(name, []).append((ws, we))
@@ -457,7 +457,7 @@ def _exemption_perk_warnings(data: InputData) -> List[str]:
                 )
 
     try:
-        perks = list(normalized_perks(data.perks))
+        perks = list(data.compiled().perks)
     except (TypeError, ValueError, IndexError) as exc:
         out.append(f"A perk entry has an invalid numeric load factor ({exc}).")
         perks = []
@@ -483,7 +483,7 @@ def _leave_rotator_warnings(data: InputData) -> List[str]:
         else []
     )
 
-    leaves3 = [(n, s, e) for n, s, e, _c in normalized_leaves(data.leaves)]
+    leaves3 = [(n, s, e) for n, s, e, _c in data.compiled().leaves]
 
     # Windows that fall entirely outside the schedule dates do nothing.
     for kind, windows in (("leave", leaves3), ("rotator", data.rotators)):
@@ -515,7 +515,7 @@ def _leave_rotator_warnings(data: InputData) -> List[str]:
     # earn it, so the resident is guaranteed a large deviation. (An uncompensated
     # whole-block leave just zeroes their quota, which is expected, so no warning.)
     comp_leave_windows: dict = {}
-    for name, ws, we, comp in normalized_leaves(data.leaves):
+    for name, ws, we, comp in data.compiled().leaves:
         if comp:
             comp_leave_windows.setdefault(name, []).append((ws, we))
     for name, windows in comp_leave_windows.items():
@@ -547,6 +547,55 @@ def _leave_rotator_warnings(data: InputData) -> List[str]:
     return out
 
 
+# -- Memoised checks -------------------------------------------------------
+# Each check reads only the configuration fields it names, so its result is
+# remembered against those fields' contents (``content_key``): a rerun over the
+# same configuration re-runs nothing, and an edit re-runs only the checks that
+# read the edited section. Results are keyed by content, not identity, so a
+# configuration rebuilt from the editors on every rerun still hits.
+_CHECK_RESULTS: "OrderedDict[tuple, Tuple[str, ...]]" = OrderedDict()
+_CHECK_RESULTS_MAX = 512
+_CHECK_RESULTS_LOCK = threading.Lock()
+
+
+class _Check(NamedTuple):
+    run: Callable[..., List[str]]
+    fields: Tuple[str, ...]
+    block: bool = False  # run(data, block) with the resolved block
+
+
+def _run_checks(
+    checks: Sequence[_Check], data: InputData, block: ResolvedBlock | None = None
+) -> List[str]:
+    """Concatenate the checks' results, re-running only those not remembered.
+
+    The block is resolved only when a check that needs it has to run.
+    """
+    keys: dict = {}
+    out: List[str] = []
+    for check in checks:
+        for name in check.fields:
+            if name not in keys:
+                keys[name] = content_key(getattr(data, name))
+        memo = (check.run.__name__,) + tuple(keys[name] for name in check.fields)
+        with _CHECK_RESULTS_LOCK:
+            found = _CHECK_RESULTS.get(memo)
+            if found is not None:
+                _CHECK_RESULTS.move_to_end(memo)
+        if found is None:
+            if check.block:
+                block = block_for(data, block)
+                found = tuple(check.run(data, block))
+            else:
+                found = tuple(check.run(data))
+            with _CHECK_RESULTS_LOCK:
+                _CHECK_RESULTS[memo] = found
+                while len(_CHECK_RESULTS) > _CHECK_RESULTS_MAX:
+                    _CHECK_RESULTS.popitem(last=False)
+        out.extend(found)
+    return out
+
+
 def validate_input(data: InputData) -> List[str]:
     """Return human-readable problems with a configuration *before* solving.
 
@@ -557,14 +606,27 @@ def validate_input(data: InputData) -> List[str]:
     listing people who are not in the roster, a name in both the junior and senior
     lists, and leave/rotator windows that reference unknown people or run
     backwards.
+
+    Each section's checks are memoised against that section's contents, so
+    repeat calls (the Review step on every rerun, then ``build_schedule`` at
+    Generate) re-check only what was edited.
     """
-    issues: List[str] = []
+    return _run_checks(_INPUT_CHECKS, data)
+
 
+def _date_issues(data: InputData) -> List[str]:
+    """The block's dates run forwards."""
+    issues: List[str] = []
     if data.end_date < data.start_date:
         issues.append(
             f"End date ({data.end_date}) is before start date ({data.start_date})."
         )
+    return issues
+
 
+def _shift_issues(data: InputData) -> List[str]:
+    """Shift templates: roles, points and unique, usable labels."""
+    issues: List[str] = []
     if not data.shifts:
         issues.append("Add at least one shift template.")
 
@@ -604,10 +666,14 @@ def validate_input(data: InputData) -> List[str]:
             issues.append("A shift has a blank label; give every shift a name.")
         seen_labels.add(sh.label)
         seen_folded.setdefault(folded, sh.label)
+    return issues
 
+
+def _roster_issues(data: InputData) -> List[str]:
+    """Each resident listed once, in one role; night-float pools within it."""
+    issues: List[str] = []
     juniors = set(data.juniors)
     seniors = set(data.seniors)
-    roster = juniors | seniors
 
     for name in juniors & seniors:
         issues.append(f"'{name}' is listed as both a Junior and a Senior.")
@@ -626,8 +692,15 @@ def validate_input(data: InputData) -> List[str]:
             issues.append(
                 f"Night-float-eligible senior '{name}' is not in the Seniors list."
             )
+    return issues
+
+
+def _window_issues(data: InputData) -> List[str]:
+    """Leave and rotator windows name known residents and run forwards."""
+    issues: List[str] = []
+    roster = set(data.juniors) | set(data.seniors)
 
-    leave_windows3 = [(n, s, e) for n, s, e, _c in normalized_leaves(data.leaves)]
+    leave_windows3 = [(n, s, e) for n, s, e, _c in data.compiled().leaves]
     for kind, windows in (("leave", leave_windows3), ("rotator", data.rotators)):
         for name, start, end in windows:
             if name not in roster:
@@ -639,7 +712,12 @@ def validate_input(data: InputData) -> List[str]:
                     f"{kind.capitalize()} window for '{name}' ends ({end}) before it "
                     f"starts ({start})."
                 )
+    return issues
+
 
+def _setting_issues(data: InputData) -> List[str]:
+    """Block-wide numeric settings and weekend days."""
+    issues: List[str] = []
     if not _finite_number(data.min_gap) or float(data.min_gap) < 0:
         issues.append("Minimum gap cannot be negative.")
     if not _finite_number(data.nf_block_length) or float(data.nf_block_length) < 1:
@@ -655,6 +733,13 @@ def validate_input(data: InputData) -> List[str]:
             issues.append(
                 f"Weekend day {weekday!r} is invalid (expected 0=Mon .. 6=Sun)."
             )
+    return issues
+
+
+def _cap_issues(data: InputData) -> List[str]:
+    """Per-resident caps and extra points."""
+    issues: List[str] = []
+    roster = set(data.juniors) | set(data.seniors)
 
     for label, caps in (("total", data.max_total), ("night-float", data.max_nights)):
         for name, value in (caps or {}).items():
@@ -668,7 +753,12 @@ def validate_input(data: InputData) -> List[str]:
             issues.append(f"Extra points reference unknown resident '{name}'.")
         if not _finite_number(value) or float(value) < 0:
             issues.append(f"Extra points for '{name}' cannot be negative.")
+    return issues
+
 
+def _weekday_point_issues(data: InputData) -> List[str]:
+    """Weekday point overrides."""
+    issues: List[str] = []
     shift_labels = {s.label for s in data.shifts}
     for (label, weekday), override_points in (data.weekday_points or {}).items():
         if label not in shift_labels:
@@ -683,10 +773,22 @@ def validate_input(data: InputData) -> List[str]:
                 f"Weekday point override for '{label}' must be a finite "
                 "non-negative number."
             )
+    return issues
+
 
+def _holiday_issues(data: InputData) -> List[str]:
+    """Holiday bonuses."""
+    issues: List[str] = []
     for holiday_date, bonus, _counts_weekend in (data.holidays or []):
         if not _finite_number(bonus):
             issues.append(f"Holiday {holiday_date} bonus must be a finite number.")
+    return issues
+
+
+def _group_factor_issues(data: InputData) -> List[str]:
+    """Load-factor groups and who is assigned to them."""
+    issues: List[str] = []
+    roster = set(data.juniors) | set(data.seniors)
 
     group_factors = data.group_factors or {}
     for group, factor in group_factors.items():
@@ -702,9 +804,16 @@ def validate_input(data: InputData) -> List[str]:
                 f"'{name}' is assigned to undefined group '{group}'; define the "
                 "group and its load factor first."
             )
+    return issues
+
+
+def _perk_issues(data: InputData) -> List[str]:
+    """Perk entries."""
+    issues: List[str] = []
+    roster = set(data.juniors) | set(data.seniors)
 
     try:
-        perks = list(normalized_perks(data.perks))
+        perks = list(data.compiled().perks)
     except (TypeError, ValueError, IndexError) as exc:
         issues.append(f"Perk entries must contain a valid numeric load factor ({exc}).")
         perks = []
@@ -721,6 +830,14 @@ def validate_input(data: InputData) -> List[str]:
                 f"Perk window for '{perk.name}' ends ({perk.end}) before it "
                 f"starts ({perk.start})."
             )
+    return issues
+
+
+def _exemption_issues(data: InputData) -> List[str]:
+    """Shift exemptions."""
+    issues: List[str] = []
+    roster = set(data.juniors) | set(data.seniors)
+    shift_labels = {s.label for s in data.shifts}
 
     for name, labels in (data.exempt_shifts or {}).items():
         if name not in roster:
@@ -730,6 +847,13 @@ def validate_input(data: InputData) -> List[str]:
                 issues.append(
                     f"'{name}' is exempted from unknown shift '{label}'."
                 )
+    return issues
+
+
+def _named_group_issues(data: InputData) -> List[str]:
+    """Named groups (used by blackouts and reductions)."""
+    issues: List[str] = []
+    roster = set(data.juniors) | set(data.seniors)
 
     for group, members in (data.named_groups or {}).items():
         if not str(group).strip():
@@ -739,9 +863,16 @@ def validate_input(data: InputData) -> List[str]:
                 issues.append(
                     f"Group '{group}' lists unknown resident '{member}'."
                 )
+    return issues
+
+
+def _blackout_issues(data: InputData) -> List[str]:
+    """Group and ad-hoc blackouts."""
+    issues: List[str] = []
+    roster = set(data.juniors) | set(data.seniors)
 
     named_groups = data.named_groups or {}
-    for b in normalized_blackouts(data.blackouts):
+    for b in data.compiled().blackouts:
         if b.group is not None and b.group not in named_groups:
             issues.append(f"Blackout references undefined group '{b.group}'.")
         if b.group is None:
@@ -759,9 +890,18 @@ def validate_input(data: InputData) -> List[str]:
             issues.append(
                 f"Blackout window for {who} ends ({b.end}) before it starts ({b.start})."
             )
+    return issues
+
+
+def _reduction_issues(data: InputData) -> List[str]:
+    """Load reductions."""
+    issues: List[str] = []
+    roster = set(data.juniors) | set(data.seniors)
+    shift_labels = {s.label for s in data.shifts}
+    named_groups = data.named_groups or {}
 
     try:
-        reductions = list(normalized_reductions(data.reductions))
+        reductions = list(data.compiled().reductions)
     except (TypeError, ValueError, IndexError) as exc:
         issues.append(
             f"Reduction entries must contain a valid numeric factor and fields ({exc})."
@@ -796,6 +936,14 @@ def validate_input(data: InputData) -> List[str]:
                 f"Reduction window for {who} ends ({red.end}) before it starts "
                 f"({red.start})."
             )
+    return issues
+
+
+def _preference_issues(data: InputData) -> List[str]:
+    """Shift and day-type preferences."""
+    issues: List[str] = []
+    roster = set(data.juniors) | set(data.seniors)
+    shift_labels = {s.label for s in data.shifts}
 
     for name, labels in (data.preferred_shifts or {}).items():
         if name not in roster:
@@ -813,6 +961,13 @@ def validate_input(data: InputData) -> List[str]:
                 f"Day-type preference for '{name}' must be 'weekend' or "
                 f"'weekday' (got '{day_kind}')."
             )
+    return issues
+
+
+def _avoid_pair_issues(data: InputData) -> List[str]:
+    """Avoid pairs."""
+    issues: List[str] = []
+    roster = set(data.juniors) | set(data.seniors)
 
     for pair in (data.avoid_pairs or []):
         first, second = pair[0], pair[1]
@@ -821,9 +976,19 @@ def validate_input(data: InputData) -> List[str]:
                 issues.append(f"Avoid pair references unknown resident '{name}'.")
         if first == second:
             issues.append(f"Avoid pair lists '{first}' with themselves.")
+    return issues
+
+
+def _night_float_issues(data: InputData) -> List[str]:
+    """Night-float coverage patterns and assignments."""
+    issues: List[str] = []
+    juniors = set(data.juniors)
+    seniors = set(data.seniors)
+    roster = juniors | seniors
+    shift_labels = {s.label for s in data.shifts}
 
     nf_labels = {s.label for s in data.shifts if s.night_float}
-    for cov in normalized_nf_coverage(data.nf_coverage):
+    for cov in data.compiled().nf_coverage:
         if cov.label not in shift_labels:
             issues.append(f"Night-float coverage references unknown shift '{cov.label}'.")
         elif cov.label not in nf_labels:
@@ -839,11 +1004,7 @@ def validate_input(data: InputData) -> List[str]:
                 )
     nf_pool = set(data.nf_juniors) | set(data.nf_seniors)
     nf_label_role = {s.label: s.role for s in data.shifts if s.night_float}
-    assignments = list(
-        normalized_nf_assignments(
-            data.nf_assignments, default_rest=data.nf_rest_days
-        )
-    )
+    assignments = list(data.compiled().nf_assignments)
     for a in assignments:
         coverer_role = (
             "Junior" if a.name in juniors else "Senior" if a.name in seniors else None
@@ -904,8 +1065,15 @@ def validate_input(data: InputData) -> List[str]:
                     f"'{right.name}' overlap on {overlap_start}–{overlap_end} "
                     f"for {overlap_label_text}; each NF cell must have exactly one coverer."
                 )
+    return issues
 
-    for c in normalized_closures(data.closures):
+
+def _closure_issues(data: InputData) -> List[str]:
+    """Shift closures."""
+    issues: List[str] = []
+    shift_labels = {s.label for s in data.shifts}
+
+    for c in data.compiled().closures:
         if c.label not in shift_labels:
             issues.append(
                 f"Shift closure names '{c.label}', which is not a configured shift."
@@ -921,7 +1089,12 @@ def validate_input(data: InputData) -> List[str]:
                     f"Shift closure for '{c.label}' has an invalid weekday {wd} "
                     "(expected 0=Mon .. 6=Sun)."
                 )
+    return issues
+
 
+def _slot_point_issues(data: InputData) -> List[str]:
+    """Effective slot values (overrides, holidays, weekend multiplier)."""
+    issues: List[str] = []
     # Overrides, holiday bonuses and the weekend multiplier combine into the
     # actual solver value. Even individually valid inputs must not produce a
     # negative or non-finite slot value.
@@ -933,19 +1106,91 @@ def validate_input(data: InputData) -> List[str]:
                     "must be finite and non-negative."
                 )
                 break
-
     return issues
 
 
-def validate_schedule(df: "pd.DataFrame", data: InputData) -> List[str]:
+_DATES = ("start_date", "end_date")
+_ROSTER = ("juniors", "seniors")
+_SLOT_VALUES = _DATES + (
+    "shifts", "weekday_points", "holidays", "weekend_multiplier", "weekend_days",
+)
+_NIGHT_FLOAT = _DATES + _ROSTER + ("shifts", "nf_coverage", "nf_assignments", "nf_rest_days")
+
+# In report order; each names every InputData field its check reads.
+_INPUT_CHECKS = (
+    _Check(_date_issues, _DATES),
+    _Check(_shift_issues, ("shifts",)),
+    _Check(_roster_issues, _ROSTER + ("nf_juniors", "nf_seniors")),
+    _Check(_window_issues, _ROSTER + ("leaves", "rotators")),
+    _Check(
+        _setting_issues,
+        ("min_gap", "nf_block_length", "weekend_multiplier", "weekend_days"),
+    ),
+    _Check(_cap_issues, _ROSTER + ("max_total", "max_nights", "extra_points")),
+    _Check(_weekday_point_issues, ("shifts", "weekday_points")),
+    _Check(_holiday_issues, ("holidays",)),
+    _Check(_group_factor_issues, _ROSTER + ("group_factors", "resident_groups")),
+    _Check(_perk_issues, _ROSTER + ("perks",)),
+    _Check(_exemption_issues, _ROSTER + ("shifts", "exempt_shifts")),
+    _Check(_named_group_issues, _ROSTER + ("named_groups",)),
+    _Check(_blackout_issues, _ROSTER + ("named_groups", "blackouts")),
+    _Check(_reduction_issues, _ROSTER + ("shifts", "named_groups", "reductions")),
+    _Check(
+        _preference_issues,
+        _ROSTER + ("shifts", "preferred_shifts", "preferred_day_type"),
+    ),
+    _Check(_avoid_pair_issues, _ROSTER + ("avoid_pairs",)),
+    _Check(
+        _night_float_issues,
+        _ROSTER + ("shifts", "nf_juniors", "nf_seniors", "nf_coverage",
+                   "nf_assignments", "nf_rest_days"),
+    ),
+    _Check(_closure_issues, ("shifts", "closures")),
+    _Check(_slot_point_issues, _SLOT_VALUES),
+)
+
+_WARNING_CHECKS = (
+    _Check(_supply_warnings, _ROSTER + ("shifts",)),
+    _Check(_extra_point_warnings, ("extra_points", "max_total")),
+    _Check(_holiday_warnings, _DATES + ("holidays",)),
+    _Check(_capacity_warnings, _SLOT_VALUES + _ROSTER + ("min_gap",)),
+    _Check(_leave_rotator_warnings, _DATES + ("leaves", "rotators")),
+    _Check(
+        _exemption_perk_warnings,
+        _DATES + _ROSTER + ("shifts", "exempt_shifts", "nf_juniors", "nf_seniors", "perks"),
+    ),
+    _Check(
+        _blackout_warnings,
+        _DATES + _ROSTER + ("shifts", "named_groups", "blackouts", "leaves",
+                            "rotators", "extra_points"),
+    ),
+    # Reads the block's reduction caps, whose entries (not their point
+    # shares) follow from the reductions, groups, roster and exemptions.
+    _Check(
+        _reduction_warnings,
+        _DATES + _ROSTER + ("shifts", "named_groups", "reductions", "exempt_shifts"),
+        block=True,
+    ),
+    _Check(_preference_warnings, _ROSTER + ("shifts", "exempt_shifts", "preferred_shifts")),
+    _Check(_avoid_pair_warnings, _ROSTER + ("shifts", "avoid_pairs")),
+    # Reads the block's night-float gaps.
+    _Check(_night_float_warnings, _NIGHT_FLOAT, block=True),
+)
+
+
+def validate_schedule(
+    df: "pd.DataFrame", data: InputData, *, block: ResolvedBlock | None = None
+) -> List[str]:
     """Return human-readable constraint violations for a schedule.
 
     Intended for revalidating a schedule after manual edits. An empty list means
     the schedule satisfies the solver's hard rules: authoritative NF/closure
     cells, role and exemptions, leave/NF-rest/rotator windows, one shift per
     person per day, avoid pairs, reductions, total caps, mandatory extra-point
-    floors, and the minimum gap.
+    floors, and the minimum gap. ``block`` is the
+    :class:`~model.resolved.ResolvedBlock` of ``data`` when the caller has it.
     """
+    block = block_for(data, block)
     issues: List[str] = []
     juniors = set(data.juniors)
     seniors = set(data.seniors)
@@ -953,14 +1198,14 @@ def validate_schedule(df: "pd.DataFrame", data: InputData) -> List[str]:
     rotator_windows: dict = {}
     for name, start, end in data.rotators:
         rotator_windows.setdefault(name, []).append((start, end))
-    blackout_windows = blackout_person_windows(data.blackouts, data.named_groups)
-    night_before = blackout_night_before_dates(data.blackouts, data.named_groups)
+    blackout_windows = block.blackout_windows
+    night_before = block.blackout_night_before
     # Reserved cells (night-float overlay + closed) are not regular assignments —
     # the regular rules below don't apply to them.
-    leave_windows = list(normalized_leaves(data.leaves))
-    nf_windows = list(nf_leave_windows(data))
-    expected_nf, _nf_gaps, _nf_leaves = resolve_night_float(data)
-    expected_closed = resolve_closures(data)
+    leave_windows = list(data.compiled().leaves)
+    nf_windows = block.nf_leaves
+    expected_nf = block.nf_cells
+    expected_closed = block.closed_cells
     expected_nf_attr = {
         (day.isoformat(), label): person
         for (day, label), person in expected_nf.items()
@@ -1070,7 +1315,7 @@ def validate_schedule(df: "pd.DataFrame", data: InputData) -> List[str]:
     records = df.to_dict("records")
     shift_by_label = {s.label: s for s in data.shifts}
     weekend_dates = weekend_holiday_dates(data)
-    for cap in reduction_caps(data):
+    for cap in block.reduction_caps:
         actual = 0.0
         for row in records:
             day = row.get("Date")
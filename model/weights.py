@@ -17,16 +17,12 @@ by the ledger under the stub-only CI job).
 from __future__ import annotations
 
 from datetime import date, timedelta
-from typing import Dict
-
-from .data_models import (
-    InputData,
-    blackout_person_windows,
-    normalized_leaves,
-    normalized_nf_assignments,
-    normalized_perks,
-    normalized_rotators,
-)
+from functools import reduce
+from itertools import accumulate, compress
+from operator import add
+from typing import Dict, Iterable, List, Tuple
+
+from .data_models import InputData
 from .points import block_days
 
 __all__ = ["person_factor", "availability_weights", "reference_weights"]
@@ -40,9 +36,7 @@ def person_factor(person: str, day: date, data: InputData) -> float:
     group = groups.get(person)
     if group is not None:
         factor *= group_factors.get(group, 1.0)
-    for perk in normalized_perks(data.perks):
-        if perk.name != person:
-            continue
+    for perk in data.compiled().perks_by_person.get(person, ()):
         if perk.start is not None and day < perk.start:
             continue
         if perk.end is not None and day > perk.end:
@@ -51,24 +45,60 @@ def person_factor(person: str, day: date, data: InputData) -> float:
     return factor
 
 
+def _day_flags(windows: Iterable[Tuple[date, date]], first: date, span: int) -> List[bool]:
+    """Per block day: does any ``(start, end)`` window cover it? (A difference array.)"""
+    diff = [0] * (span + 1)
+    for start, end in windows:
+        lo = max((start - first).days, 0)
+        hi = min((end - first).days, span - 1)
+        if lo <= hi:
+            diff[lo] += 1
+            diff[hi + 1] -= 1
+    return [count > 0 for count in accumulate(diff[:span])]
+
+
+def _day_factors(person: str, data: InputData, span: int) -> List[float]:
+    """:func:`person_factor` for every block day, in one sweep per perk.
+
+    Each day's factor is multiplied up in the same order as
+    :func:`person_factor` (group, then perks in entry order), so the values are
+    bit-for-bit the same.
+    """
+    factor = 1.0
+    group = (data.resident_groups or {}).get(person)
+    if group is not None:
+        factor *= (data.group_factors or {}).get(group, 1.0)
+    factors = [factor] * span
+    first = data.start_date
+    for perk in data.compiled().perks_by_person.get(person, ()):
+        lo = 0 if perk.start is None else max((perk.start - first).days, 0)
+        hi = span - 1 if perk.end is None else min((perk.end - first).days, span - 1)
+        if lo <= hi:
+            factors[lo:hi + 1] = [f * perk.factor for f in factors[lo:hi + 1]]
+    return factors
+
+
 def availability_weights(data: InputData) -> Dict[str, float]:
     """Fairness weight per participant: Σ load factor over their active days.
 
     With no rotators, no uncompensated leaves, no groups and no perks, every
     weight equals the block length and the targets reduce to an equal split
-    (the original behaviour).
+    (the original behaviour). Active days and factors are built as per-day
+    arrays (difference arrays for the windows, one sweep per perk) and summed
+    in day order, exactly as a day-by-day :func:`person_factor` loop would.
     """
+    view = data.compiled()
     rotator_windows: Dict[str, list] = {}
-    for res, start, end in normalized_rotators(data.rotators):
+    for res, start, end in view.rotators:
         rotator_windows.setdefault(res, []).append((start, end))
     uncomp_windows: Dict[str, list] = {}
-    for name, start, end, compensated in normalized_leaves(data.leaves):
+    for name, start, end, compensated in view.leaves:
         if not compensated:
             uncomp_windows.setdefault(name, []).append((start, end))
     # Only *uncompensated* blackout windows reduce the share; compensated
     # blackouts (the default) keep the full weight, so the missed load is made
     # up in-block or carried in the ledger as repayable debt — never excused.
-    for name, windows in blackout_person_windows(data.blackouts, data.named_groups).items():
+    for name, windows in view.blackout_windows.items():
         for start, end, compensated in windows:
             if not compensated:
                 uncomp_windows.setdefault(name, []).append((start, end))
@@ -76,25 +106,26 @@ def availability_weights(data: InputData) -> Dict[str, float]:
     # uncompensated leave: the floater does less regular work and — with the
     # ledger's no-catch-up policy — is never made to make it up (NF is outside
     # the regular point/fairness system).
-    for a in normalized_nf_assignments(data.nf_assignments, default_rest=data.nf_rest_days):
+    for a in view.nf_assignments:
         rest = max(0, int(a.rest_days))
         uncomp_windows.setdefault(a.name, []).append(
             (a.start, a.end + timedelta(days=rest))
         )
 
-    days = block_days(data)
+    first = data.start_date
+    span = len(block_days(data))
 
     def _weight(person: str) -> float:
+        factors: Iterable[float] = _day_factors(person, data, span)
         windows = rotator_windows.get(person)
-        uncomp = uncomp_windows.get(person, [])
-        total = 0.0
-        for day in days:
-            if windows and not any(s <= day <= e for s, e in windows):
-                continue  # outside rotator active window
-            if any(s <= day <= e for s, e in uncomp):
-                continue  # uncompensated leave day -> quota reduced
-            total += person_factor(person, day, data)
-        return total
+        uncomp = uncomp_windows.get(person)
+        if windows or uncomp:
+            # Inside a rotator window (if any) and outside uncompensated leave.
+            inside = _day_flags(windows, first, span) if windows else [True] * span
+            away = _day_flags(uncomp or (), first, span)
+            factors = compress(factors, [i and not a for i, a in zip(inside, away)])
+        # Left-to-right float addition, like the day-by-day total it replaces.
+        return reduce(add, factors, 0.0)
 
     return {p: _weight(p) for p in data.juniors + data.seniors}
 
@@ -2,7 +2,10 @@
 
 The spec targets a solve time of <= 60s for 40 residents x 28 days x 10 shift
 labels on Streamlit Cloud. This script times ``build_schedule`` across a few
-sizes so regressions in model size / solve time are easy to spot.
+sizes so regressions in model size / solve time are easy to spot. Each run
+prints a per-phase breakdown (validation, target resolution, model building,
+CP-SAT presolve and search, extraction) with the model size and objective, so a
+regression can be pinned to a phase.
 
 Usage::
 
@@ -34,12 +37,24 @@ def _make(people: int, days: int, shifts: int):
     return build_benchmark_input(BenchmarkCase(people, days, shifts))
 
 
+def _print_phases(result) -> None:
+    objective = "n/a" if result.objective is None else f"{result.objective:g}"
+    print(
+        f"    model: {result.variables or 0:,} variables, "
+        f"{result.constraints or 0:,} constraints; objective {objective}"
+    )
+    print(f"    {'phase':<24} {'seconds':>8} {'share':>7}")
+    for label, seconds, share in result.phase_rows():
+        print(f"    {label:<24} {seconds:8.3f} {share:7.1%}")
+
+
 def _run(people: int, days: int, shifts: int) -> None:
     result = run_benchmark(BenchmarkCase(people, days, shifts), env="prod")
     print(
         f"{people:>3} people x {days:>2} days x {shifts:>2} shifts: "
         f"{result.elapsed_seconds:6.2f}s  status={result.solver_status}  [{result.flag}]"
     )
+    _print_phases(result)
 
 
 def main() -> None:
@@ -0,0 +1,57 @@
+"""Cold-start import benchmark for the app and the model package.
+
+A freshly started app worker imports everything ``app.py`` needs before it
+renders a byte, so this script measures that with ``python -X importtime`` in
+fresh interpreters: ``app.py`` run bare (its first script run) and the
+solver's import path (``from model import build_schedule``) alone. It prints
+the total import time, the heaviest top-level imports, and any deferred
+dependency (OR-Tools, openpyxl, ReportLab, Altair, the RTL shaping libraries)
+that was loaded at startup anyway.
+
+Usage::
+
+    python scripts/startup_benchmark.py                   # report both targets
+    python scripts/startup_benchmark.py --budget 1.5      # fail if app.py > 1.5 s
+    python scripts/startup_benchmark.py --model-budget 0.8 --repeat 5
+
+Exits non-zero when a budget is exceeded or a deferred dependency was loaded
+at startup, so CI can keep cold start in check.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from model.benchmarking import measure_startup  # noqa: E402
+
+
+def _report(target: str, budget: float | None, repeat: int, top: int) -> bool:
+    result = measure_startup(target, repeat=repeat)
+    over = budget is not None and result.total_seconds > budget
+    verdict = "" if budget is None else f"  [{'OVER' if over else 'OK'} budget {budget:.2f}s]"
+    print(f"{target}: {result.total_seconds:.2f}s of imports (best of {repeat}){verdict}")
+    for timing in result.heaviest(top):
+        print(f"  {timing.cumulative_us / 1e6:6.3f}s  {timing.module}")
+    loaded = result.deferred_loaded
+    print(f"  deferred dependencies loaded at startup: {', '.join(loaded) or 'none'}")
+    return not over and not loaded
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=float, help="app.py import budget in seconds")
+    parser.add_argument("--model-budget", type=float, help="model import budget in seconds")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per target (best kept)")
+    parser.add_argument("--top", type=int, default=8, help="heaviest imports to list")
+    args = parser.parse_args(argv)
+    ok = _report("app", args.budget, args.repeat, args.top)
+    ok = _report("model", args.model_budget, args.repeat, args.top) and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
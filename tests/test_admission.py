@@ -0,0 +1,99 @@
+"""Process-wide solve admission (model/admission.py): CPU shares and fair queueing."""
+import sys, os
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from model.admission import AdmissionLoad, SolveAdmission, batch_split, host_cores
+
+
+def test_a_lone_solve_gets_the_box_and_the_next_waits_for_it():
+    admission = SolveAdmission(8)
+    first = admission.enqueue("s1")
+    assert admission.try_admit(first) == 8
+    second = admission.enqueue("s2")
+    assert admission.try_admit(second) is None
+    assert admission.position(second) == 1
+    assert admission.load() == AdmissionLoad(8, 8, 1, 1, 1)
+    admission.release(first)
+    assert admission.try_admit(second) == 8
+    assert admission.position(second) == 0
+
+
+def test_waiting_solves_split_the_free_cores():
+    admission = SolveAdmission(8)
+    tickets = [admission.enqueue(f"s{i}") for i in range(3)]
+    assert [admission.try_admit(t) for t in tickets] == [2, 3, 3]
+    late = admission.enqueue("s9")
+    assert admission.try_admit(late) is None  # no share left above the floor
+    admission.release(tickets[0])
+    assert admission.try_admit(late) == 2
+
+
+def test_sessions_take_turns_in_the_queue():
+    admission = SolveAdmission(1)
+    running = admission.enqueue("busy")
+    assert admission.try_admit(running) == 1
+    a1, a2 = admission.enqueue("a"), admission.enqueue("a")
+    b1 = admission.enqueue("b")
+    assert [admission.position(t) for t in (a1, b1, a2)] == [1, 2, 3]
+    admission.release(running)
+    assert admission.try_admit(a2) is None  # not its turn yet
+    assert admission.try_admit(b1) is None
+    assert admission.try_admit(a1) == 1
+
+
+def test_a_session_that_queues_a_batch_does_not_go_first_every_time():
+    admission = SolveAdmission(1)
+    batch = [admission.enqueue("a") for _ in range(3)]
+    late = admission.enqueue("b")
+    assert admission.try_admit(batch[0]) == 1
+    assert [admission.position(t) for t in (late, batch[1], batch[2])] == [1, 2, 3]
+    admission.release(batch[0])
+    assert admission.try_admit(batch[1]) is None
+    assert admission.try_admit(late) == 1
+
+
+def test_abandoned_tickets_are_dropped():
+    admission = SolveAdmission(2, stale_sec=0.05)
+    busy = admission.enqueue("busy")
+    admission.try_admit(busy)
+    gone = admission.enqueue("closed-tab")
+    time.sleep(0.1)
+    assert admission.load().queued == 0
+    assert admission.try_admit(gone) is None  # polling again rejoins at the back
+    assert admission.load().queued == 1
+
+
+def test_blocking_admission_releases_on_exit():
+    admission = SolveAdmission(2)
+    started = threading.Event()
+    with admission.admitted("s1") as workers:
+        assert workers == 2
+
+        def other():
+            with admission.admitted("s2", poll=0.01):
+                started.set()
+
+        thread = threading.Thread(target=other)
+        thread.start()
+        assert not started.wait(0.1)
+    assert started.wait(5)
+    thread.join()
+    assert admission.load().cores_in_use == 0
+
+
+def test_capacity_can_be_pinned_by_the_deployment():
+    assert host_cores({"SOLVE_MAX_CORES": "3"}) == 3
+    assert host_cores({"SOLVE_MAX_CORES": "x"}) >= 1
+
+
+def test_batch_split_keeps_every_solve_at_the_two_worker_floor():
+    assert batch_split(16, 14) == (8, 2)            # not 14 single-worker solves
+    assert batch_split(16, 3) == (3, 5)
+    assert batch_split(16, 14, requested=12) == (8, 2)  # capped to the floor
+    assert batch_split(16, 14, requested=4) == (4, 4)
+    assert batch_split(1, 5) == (1, 1)             # a one-core host still runs
+    assert batch_split(3, 5) == (1, 3)
+    assert batch_split(8, 4, min_share=1) == (4, 2)
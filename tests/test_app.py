@@ -6,6 +6,7 @@ test_manual_edit_*) the apply/revert manual-edit feature. The browser-level
 smoke test lives in scripts/smoke_app.py and stays complementary.
 """
 import os
+import time
 from datetime import date
 
 import pytest
@@ -24,6 +25,22 @@ def _at() -> AppTest:
     return AppTest.from_file(APP, default_timeout=60)
 
 
+def _run_until_settled(at: AppTest, timeout: float = 180) -> None:
+    """Rerun until the solve job ends. The running solve only refreshes its
+    progress fragment on a timer, which AppTest does not fire; waiting on the
+    running segment instead of rerunning leaves the solver the CPU, as an idle
+    page would."""
+    deadline = time.monotonic() + timeout
+    while (job := at.session_state["solve_job"]) is not None:
+        assert time.monotonic() < deadline, "solve never settled"
+        running = job.get("running")
+        if running is not None:
+            running["future"].exception(timeout=max(0.0, deadline - time.monotonic()))
+        else:
+            time.sleep(0.25)
+        at.run()
+
+
 def _result_fixture():
     """A small solved schedule + config for seeding session state directly."""
     shifts = [
@@ -50,7 +67,9 @@ def _result_fixture():
     return df, data
 
 
-def _seed_result(at: AppTest, df, data) -> None:
+def _seed_result(at: AppTest, df, data, workspace=None) -> None:
+    if workspace is not None:
+        at.session_state["results_workspace"] = workspace  # Results tabs are lazy
     at.session_state["result_df"] = df
     at.session_state["solver_df"] = df
     at.session_state["result_data"] = data
@@ -78,6 +97,55 @@ def test_app_loads_without_exception():
     assert any("No schedule generated yet" in item.value for item in at.markdown)
 
 
+def test_diagnostics_shows_the_benchmark_phase_breakdown():
+    from model.benchmarking import BenchmarkCase, BenchmarkResult
+
+    at = _at()
+    at.run()
+    at.session_state["benchmark_result"] = BenchmarkResult(
+        BenchmarkCase(10, 14, 5), 2.0, "OPTIMAL",
+        phases=(("resolve_targets", 0.5), ("search", 1.0)),
+        variables=900, constraints=300, objective=12.0,
+    )
+    at.run()
+    assert not at.exception
+    table = next(item.value for item in at.dataframe if "Phase" in item.value.columns)
+    assert list(table["Phase"]) == ["resolve_targets", "CP-SAT search", "Other"]
+    assert {m.label: m.value for m in at.metric}["Model variables"] == "900"
+
+
+def test_diagnostics_reports_session_memory():
+    df, data = _result_fixture()
+    at = _at()
+    at.run()
+    _seed_result(at, df, data)
+    at.run()
+    assert not at.exception
+    table = next(item.value for item in at.dataframe if "Key" in item.value.columns)
+    rows = table.set_index("Key")
+    assert rows.loc["solver_df", "Shared with"] == "result_df"
+    assert rows.loc["result_data", "Size (KB)"] > 0
+    assert {"Cap", "Counted against the cap"} <= {metric.label for metric in at.metric}
+
+
+def test_diagnostics_shows_the_rerun_profile_when_enabled(monkeypatch):
+    from ui import profiler
+
+    at = _at().run()
+    assert any("Profiling is off" in item.value for item in at.caption)
+
+    monkeypatch.setattr(profiler, "_WINDOW", 5)
+    profile = profiler.RerunProfile(window=5)
+    profile.record({"render_application": 0.25, "config_fingerprint": 0.01})
+    at.session_state["rerun_profile"] = profile
+    at.run()
+    assert not at.exception
+    table = next(item.value for item in at.dataframe if "Section" in item.value.columns)
+    assert list(table["Section"]) == ["render_application", "config_fingerprint"]
+    assert table["Median (ms)"].iloc[0] == 250.0
+    assert at.selectbox(key="rerun_profile_section").value == "render_application"
+
+
 def test_generate_with_empty_config_shows_validation_errors():
     at = _at().run()
     generate = [b for b in at.button if "Generate schedule" in b.label]
@@ -131,7 +199,7 @@ def test_resident_calendar_section_offers_tap_to_phone_link():
     df, data = _result_fixture()
     at = _at()
     at.run()
-    _seed_result(at, df, data)
+    _seed_result(at, df, data, workspace="Export")
     at.run()
     assert not at.exception
     picker = [s for s in at.selectbox if s.key == "resident_cal_pick"]
@@ -143,6 +211,53 @@ def test_resident_calendar_section_offers_tap_to_phone_link():
     assert any("data:text/calendar" in m.value for m in at.markdown)
 
 
+def test_exports_prerender_in_background_then_offer_downloads():
+    df, data = _result_fixture()
+    at = _at()
+    at.run()
+    _seed_result(at, df, data, workspace="Export")
+    at.run()
+    assert not at.exception
+    jobs = at.session_state["export_cache"]
+    for kind in ("excel", "pdf", "cal_handout", "ics_zip"):
+        jobs.future(kind).result(timeout=60)  # submitted by the Export tab
+    at.run()
+    assert not at.exception
+    assert not [b for b in at.button if (b.key or "").startswith("export_wait_")]
+    # A cosmetic rerun reuses the finished builds rather than starting anew.
+    excel = jobs.future("excel")
+    at.run()
+    assert jobs.future("excel") is excel
+
+
+def test_released_downloads_are_not_rebuilt_until_asked_for(monkeypatch):
+    monkeypatch.setenv("SESSION_MEMORY_MB", "0.001")  # always over the cap
+    df, data = _result_fixture()
+    at = _at()
+    at.run()
+    _seed_result(at, df, data, workspace="Export")
+    jobs = at.session_state["export_cache"]
+    jobs.request()  # what opening the Export tab does
+    at.run()
+    kinds = ("excel", "pdf", "cal_handout", "ics_zip", "resident_pdfs")
+    for kind in kinds:  # each is kept until its button has been offered
+        if jobs.state(kind) != "released":
+            jobs.future(kind).result(timeout=60)
+    at.run()  # offers the rest, then the budget releases them
+    assert not at.exception
+    assert "built downloads" in at.session_state["memory_released"]
+    for _ in range(2):  # later reruns leave them released: no rebuild loop
+        at.run()
+        assert all(jobs.state(kind) == "released" for kind in kinds)
+    prepare = next(b for b in at.button if b.key == "export_prepare_pdf")
+    prepare.click().run()
+    assert not at.exception
+    assert jobs.state("pdf") != "released" and jobs.state("excel") == "released"
+    jobs.future("pdf").result(timeout=60)
+    at.run()
+    assert any(b.label.startswith("Download PDF") for b in at.download_button)
+
+
 def test_chunk_seconds_prefers_few_large_segments():
     # Every segment re-pays CP-SAT presolve, so long runs use as few segments
     # as hosting tolerates: ~target/5, clamped to [150s, 300s].
@@ -174,6 +289,7 @@ def test_chunked_solve_runs_multiple_segments_and_finalizes(monkeypatch):
     generate = [b for b in at.button if "Generate schedule" in b.label]
     generate[0].click()
     at.run()
+    _run_until_settled(at)
     assert not at.exception
     res = at.session_state["result_df"]
     assert res is not None
@@ -185,6 +301,60 @@ def test_chunked_solve_runs_multiple_segments_and_finalizes(monkeypatch):
     assert res.attrs["wall_time_sec"] > 0
 
 
+def test_reloaded_page_reattaches_to_a_spooled_solve(monkeypatch, tmp_path):
+    # With SOLVE_SPOOL_DIR set a worker process runs the solve; a page opened
+    # with the job id in its URL (a reload mid-run) polls it and fetches the
+    # schedule as if it had been solved in the session.
+    from model.solve_worker import SolveRequest, spool_from_env
+
+    monkeypatch.setenv("SOLVE_SPOOL_DIR", str(tmp_path))
+    _df, data = _result_fixture()
+    job_id = spool_from_env().submit(SolveRequest(data, env="test", target=2.0))
+    at = _at()
+    at.query_params["solve"] = job_id
+    at.run(timeout=120)
+    _run_until_settled(at)
+    assert not at.exception
+    assert list(at.session_state["result_df"]["D"]) in (["Alice", "Bob"], ["Bob", "Alice"])
+    assert at.session_state["solve_job"] is None
+    assert any("Schedule generated" in s.value for s in at.success)
+    assert "solve" not in at.query_params
+    assert not list((tmp_path / "jobs").iterdir())  # fetched jobs leave nothing behind
+
+
+def test_stop_ends_a_running_solve_and_keeps_its_schedule():
+    # The solve runs in the background; Stop (in the progress fragment) ends
+    # the search at once and keeps the best schedule found so far.
+    juniors = [f"R{i}" for i in range(12)]
+    at = _at()
+    at.run()
+    at.session_state["solver_time_limit"] = 120
+    data = InputData(
+        start_date=date(2024, 3, 4), end_date=date(2024, 3, 31),
+        shifts=[
+            ShiftTemplate(label=f"S{i}", role="Junior", night_float=False,
+                          thu_weekend=False, points=1.0 + i)
+            for i in range(3)
+        ],
+        juniors=juniors, seniors=[], nf_juniors=[], nf_seniors=[],
+        leaves=[], rotators=[], min_gap=0,
+    )
+    at.session_state["retry_config"] = (data, None)
+    at.run()
+    deadline = time.monotonic() + 60
+    while not any("Better schedules" in c.value for c in at.caption):
+        assert time.monotonic() < deadline, "no schedule found"
+        time.sleep(0.25)
+        at.run()
+    started = time.monotonic()
+    at.button(key="cancel_solve_btn").click().run()
+    _run_until_settled(at, timeout=30)
+    assert time.monotonic() - started < 30  # not the 120s budget
+    assert not at.exception
+    assert at.session_state["result_df"] is not None
+    assert any("Stopped — current schedule kept" in s.value for s in at.success)
+
+
 def test_test_mode_generate_produces_schedule(monkeypatch):
     # dev budget (10s base, size-scaled to ~30s for the 45x28x10 demo roster)
     # reliably reaches FEASIBLE; test's 1s budget hits UNKNOWN.
@@ -196,6 +366,7 @@ def test_test_mode_generate_produces_schedule(monkeypatch):
     generate = [b for b in at.button if "Generate schedule" in b.label]
     generate[0].click()
     at.run()
+    _run_until_settled(at)
     assert not at.exception
     assert at.session_state["result_df"] is not None
     assert at.session_state["result_version"] == 1
@@ -272,6 +443,28 @@ def test_seeded_results_survive_rerun():
     assert at.session_state["result_version"] == 1
 
 
+def test_results_render_only_the_open_workspace():
+    df, data = _result_fixture()
+    at = _at()
+    at.run()
+    _seed_result(at, df, data)
+    at.run()
+    assert not [b for b in at.button if b.key == "apply_edits"]  # Overview only
+    at.session_state["results_workspace"] = "Schedule"
+    at.run()
+    assert [b for b in at.button if b.key == "apply_edits"]
+    assert not any("Schedule quality" in m.label for m in at.metric)
+    at.selectbox(key="color_mode").select_index(1).run()
+    chosen = at.session_state["color_mode"]
+    # A choice made in one workspace outlives a visit to another.
+    at.session_state["results_workspace"] = "Fairness"
+    at.run()
+    assert not at.exception
+    at.session_state["results_workspace"] = "Schedule"
+    at.run()
+    assert at.selectbox(key="color_mode").value == chosen
+
+
 def test_fairness_workspace_splits_roles_and_lists_annotations():
     from model.data_models import Blackout
 
@@ -299,7 +492,7 @@ def test_fairness_workspace_splits_roles_and_lists_annotations():
     df.attrs["target_total_map"] = {"Alice": 1.0, "Bob": 1.0, "Sam": 2.0}
     at = _at()
     at.run()
-    _seed_result(at, df, data)
+    _seed_result(at, df, data, workspace="Fairness")
     at.session_state["result_prior_ledger"] = {"Alice": {"total": 3.0, "weekend": 0.0}}
     at.run()
     assert not at.exception
@@ -333,7 +526,7 @@ def test_apply_edits_persists_and_revert_restores():
     df, data = _result_fixture()
     at = _at()
     at.run()
-    _seed_result(at, df, data)
+    _seed_result(at, df, data, workspace="Schedule")
     at.run()
 
     apply_btn = [b for b in at.button if b.key == "apply_edits"]
@@ -347,8 +540,14 @@ def test_apply_edits_persists_and_revert_restores():
     assert at.session_state["result_df"].attrs["target_total_map"] == {
         "Alice": 1.0, "Bob": 1.0,
     }
+    # The pristine frame is only needed for revert now, so it is kept compact.
+    assert str(at.session_state["solver_df"]["D"].dtype) == "category"
+    at.session_state["results_workspace"] = "Overview"
+    at.run()
     assert any("manually edited" in w.value for w in at.warning)
 
+    at.session_state["results_workspace"] = "Schedule"
+    at.run()
     revert_btn = [b for b in at.button if b.key == "revert_edits"]
     assert revert_btn, "Revert button not rendered after apply"
     revert_btn[0].click()
@@ -356,6 +555,10 @@ def test_apply_edits_persists_and_revert_restores():
     assert not at.exception
     assert at.session_state["manually_edited"] is False
     assert at.session_state["result_version"] == 3
+    assert at.session_state["result_df"] is at.session_state["solver_df"]
+    assert str(at.session_state["result_df"]["D"].dtype) != "category"
+    at.session_state["results_workspace"] = "Overview"
+    at.run()
     assert not any("manually edited" in w.value for w in at.warning)
 
 
@@ -517,7 +720,7 @@ def test_fill_column_button_populates_extra_vals():
     df, data = _result_fixture()
     at = _at()
     at.run()
-    _seed_result(at, df, data)
+    _seed_result(at, df, data, workspace="Schedule")
     at.session_state["extra_cols"] = ["Consultant"]
     at.run()
     at.text_area(key="fill_names").set_value("Dr X, Dr Y")
@@ -538,7 +741,7 @@ def test_apply_theme_shades_recolours_palette():
     df, data = _result_fixture()
     at = _at()
     at.run()
-    _seed_result(at, df, data)
+    _seed_result(at, df, data, workspace="Schedule")
     at.run()
     theme_btn = [b for b in at.button if b.key == "pal_theme_apply"]
     assert theme_btn, "Apply theme shades button not rendered"
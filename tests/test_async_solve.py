@@ -0,0 +1,93 @@
+"""Asyncio solve API (model/async_solve.py): events, concurrency, cancellation."""
+import sys, os
+import asyncio
+import time
+from datetime import date
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+pytest.importorskip("pandas")
+pytest.importorskip("ortools")
+
+from model.async_solve import solve_async
+from model.data_models import InputData, ShiftTemplate
+from model.optimiser import SolveCancelled, SolveProgress
+
+
+def _data(juniors=("A", "B", "C"), days=7, shifts=1):
+    return InputData(
+        start_date=date(2024, 3, 4), end_date=date(2024, 3, 3 + days),
+        shifts=[
+            ShiftTemplate(label=f"S{i}", role="Junior", night_float=False, thu_weekend=False,
+                          points=1.0 + i)
+            for i in range(shifts)
+        ],
+        juniors=list(juniors), seniors=[], nf_juniors=[], nf_seniors=[],
+        leaves=[], rotators=[], min_gap=0,
+    )
+
+
+async def _collect(data, **kwargs):
+    return [event async for event in solve_async(data, time_limit_sec=10, **kwargs)]
+
+
+def test_events_run_from_preparing_to_a_finished_schedule():
+    events = asyncio.run(_collect(_data()))
+    phases = [e.phase for e in events if e.kind == "phase"]
+    assert phases == ["preparing", "searching", "extracting", "done"]
+    incumbents = [e for e in events if e.kind == "incumbent"]
+    assert incumbents and incumbents[-1].objective is not None
+    assert incumbents[-1].best_bound <= incumbents[-1].objective
+    finished = events[-1]
+    assert finished.kind == "finished" and len(finished.schedule) == 7
+    assert finished.schedule.attrs["cancelled"] is False
+
+
+def test_concurrent_solves_share_one_event_loop():
+    async def both():
+        return await asyncio.gather(
+            _collect(_data(("A", "B")), num_workers=1),
+            _collect(_data(("C", "D", "E")), num_workers=1),
+        )
+
+    first, second = asyncio.run(both())
+    assert set(first[-1].schedule["S0"]) <= {"A", "B"}
+    assert set(second[-1].schedule["S0"]) <= {"C", "D", "E"}
+
+
+def test_cancelling_keeps_the_best_schedule_so_far():
+    big = _data(tuple("ABCDEFGHIJKL"), days=28, shifts=3)
+
+    async def run():
+        progress = SolveProgress()
+        async for event in solve_async(big, progress=progress, time_limit_sec=60, tick=0.1):
+            if event.kind == "incumbent":
+                progress.cancel()
+            if event.kind == "finished":
+                return event.schedule
+
+    started = time.monotonic()
+    df = asyncio.run(run())
+    assert time.monotonic() - started < 30
+    assert len(df) == 28 and df.attrs["solver_status"] in ("FEASIBLE", "OPTIMAL")
+
+
+def test_leaving_early_stops_the_search():
+    big = _data(tuple("ABCDEFGHIJKL"), days=28, shifts=3)
+
+    async def run():
+        async for event in solve_async(big, time_limit_sec=60, tick=0.1):
+            if event.phase == "searching":
+                break
+
+    started = time.monotonic()
+    asyncio.run(run())
+    assert time.monotonic() - started < 30
+
+
+def test_a_solve_cancelled_before_it_starts_raises():
+    progress = SolveProgress()
+    progress.cancel()
+    with pytest.raises(SolveCancelled):
+        asyncio.run(_collect(_data(), progress=progress))
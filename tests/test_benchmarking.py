@@ -59,8 +59,10 @@ def test_run_benchmark_returns_structured_timing(monkeypatch):
     monkeypatch.setattr(benchmarking, "ORTOOLS_AVAILABLE", True)
     monkeypatch.setattr(benchmarking.time, "perf_counter", lambda: next(ticks))
 
-    def fake_build(data, env):
+    def fake_build(data, env, timings):
         calls.append((data, env))
+        timings.seconds.update(validation=0.5, search=1.5)
+        timings.variables, timings.constraints, timings.objective = 120, 40, 7.0
         return _Frame("FEASIBLE")
 
     monkeypatch.setattr(benchmarking, "build_schedule", fake_build)
@@ -74,13 +76,20 @@ def test_run_benchmark_returns_structured_timing(monkeypatch):
     assert result.within_target is True
     assert result.flag == "OK"
     assert calls[0][1] == "test"
+    assert result.phases == (("validation", 0.5), ("search", 1.5))
+    assert (result.variables, result.constraints, result.objective) == (120, 40, 7.0)
+    assert result.phase_rows() == [
+        ("Validation", 0.5, 0.2), ("CP-SAT search", 1.5, 0.6), ("Other", 0.5, 0.2),
+    ]
 
 
 def test_run_benchmark_marks_slow_and_preserves_missing_status(monkeypatch):
     ticks = iter((10.0, 12.0))
     monkeypatch.setattr(benchmarking, "ORTOOLS_AVAILABLE", True)
     monkeypatch.setattr(benchmarking.time, "perf_counter", lambda: next(ticks))
-    monkeypatch.setattr(benchmarking, "build_schedule", lambda data, env: _Frame(None))
+    monkeypatch.setattr(
+        benchmarking, "build_schedule", lambda data, env, timings: _Frame(None)
+    )
 
     result = run_benchmark(BenchmarkCase(10, 14, 5, target_seconds=1))
 
@@ -89,6 +98,22 @@ def test_run_benchmark_marks_slow_and_preserves_missing_status(monkeypatch):
     assert result.flag == "SLOW"
 
 
+def test_real_benchmark_breaks_the_solve_into_phases():
+    pytest.importorskip("ortools")
+
+    result = run_benchmark(BenchmarkCase(4, 7, 2), env="dev")
+
+    phases = dict(result.phases)
+    assert list(phases) == [
+        "validation", "nf_closures", "resolve_targets", "variables", "constraints",
+        "objective", "presolve", "search", "extraction", "min_gap_check",
+    ]
+    assert all(seconds >= 0 for seconds in phases.values())
+    assert sum(phases.values()) <= result.elapsed_seconds
+    assert result.variables > 0 and result.constraints > 0
+    assert result.objective is not None
+
+
 def test_run_benchmark_rejects_stub_timings(monkeypatch):
     monkeypatch.setattr(benchmarking, "ORTOOLS_AVAILABLE", False)
 
@@ -110,3 +135,42 @@ def test_run_benchmark_suite_keeps_order_and_environment(monkeypatch):
 
     assert [result.case for result in results] == cases
     assert seen == [(cases[0], "dev"), (cases[1], "dev")]
+
+
+def test_parse_importtime_keeps_depth_and_ignores_other_output():
+    text = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |     zipimport",
+        "import time:       300 |        420 |   encodings",
+        "import time:       500 |       1500 | app",
+        "Thread 'MainThread': missing ScriptRunContext!",
+        "import time:        80 |       2000 | altair.vegalite",
+    ])
+
+    timings = benchmarking.parse_importtime(text)
+    result = benchmarking.StartupResult("app", timings)
+
+    assert [(t.module, t.depth) for t in timings] == [
+        ("zipimport", 2), ("encodings", 1), ("app", 0), ("altair.vegalite", 0),
+    ]
+    assert result.total_seconds == 0.0035
+    assert [t.module for t in result.heaviest(1)] == ["altair.vegalite"]
+    assert result.deferred_loaded == ("altair",)
+
+
+def test_model_and_chart_imports_defer_heavy_dependencies():
+    import os
+    import subprocess
+    import sys
+
+    pytest.importorskip("pandas")
+    probe = (
+        "import sys, model, model.optimiser, model.benchmarking, model.exporters, "
+        "model.availability, model.calendar_pdf, ui.charts; "
+        f"print(','.join(n for n in {benchmarking.DEFERRED_IMPORTS!r} if n in sys.modules))"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run(
+        [sys.executable, "-c", probe], cwd=root, capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == ""
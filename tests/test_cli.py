@@ -0,0 +1,78 @@
+"""Headless batch CLI (model/cli.py): configs in, schedules and a summary out."""
+import sys, os
+import json
+from datetime import date
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+pytest.importorskip("pandas")
+
+from model.cli import main
+from model.config_io import input_data_to_json
+from model.data_models import InputData, ShiftTemplate
+from model.ledger import ledger_from_json, ledger_to_json
+
+
+def _config(tmp_path, name, juniors):
+    data = InputData(
+        start_date=date(2024, 3, 4), end_date=date(2024, 3, 10),
+        shifts=[ShiftTemplate(label="D", role="Junior", night_float=False, thu_weekend=False, points=1.0)],
+        juniors=juniors, seniors=[], nf_juniors=[], nf_seniors=[],
+        leaves=[], rotators=[], min_gap=0,
+    )
+    path = tmp_path / name
+    path.write_text(input_data_to_json(data))
+    return path
+
+
+def test_solves_a_batch_in_parallel_and_writes_every_output(tmp_path, capsys):
+    a = _config(tmp_path, "cardio.json", ["A", "B"])
+    b = _config(tmp_path, "neuro.json", ["C", "D", "E"])
+    ledger = tmp_path / "cardio_ledger.json"
+    ledger.write_text(ledger_to_json({"A": {"total": 3.0, "weekend": 1.0}}))
+    empty = tmp_path / "empty.json"
+    empty.write_text("{}")
+    out = tmp_path / "out"
+    code = main([
+        "solve", str(a), str(b), "--ledger", str(ledger), "--ledger", str(empty),
+        "--out", str(out), "--time-limit", "5", "--jobs", "2",
+    ])
+    assert code == 0
+    summary = json.loads((out / "summary.json").read_text())
+    assert [entry["config"] for entry in summary["jobs"]] == [str(a), str(b)]
+    assert all(entry["status"] == "ok" for entry in summary["jobs"])
+    files = set(os.listdir(out / "cardio"))
+    expected = {"schedule.csv", "fairness_log.txt", "fairness_ledger_through_2024-03-10.json"}
+    assert expected <= files
+    assert set(summary["jobs"][0]["files"]) == files
+    updated = ledger_from_json((out / "cardio" / "fairness_ledger_through_2024-03-10.json").read_text())
+    assert updated["A"]["total"] > 3.0  # carried history plus this block
+    assert "2/2 solved" in capsys.readouterr().out
+
+
+def test_a_failed_job_is_reported_and_fails_the_run(tmp_path):
+    good = _config(tmp_path, "good.json", ["A", "B"])
+    bad = tmp_path / "bad.json"
+    bad.write_text("{not json")
+    out = tmp_path / "out"
+    assert main(["solve", str(good), str(bad), "--out", str(out), "--formats", "csv,log"]) == 1
+    jobs = json.loads((out / "summary.json").read_text())["jobs"]
+    assert [entry["status"] for entry in jobs] == ["ok", "failed"]
+    assert jobs[1]["error"]
+    assert sorted(os.listdir(out / "good")) == ["fairness_log.txt", "schedule.csv"]
+
+
+def test_batch_keeps_two_workers_per_solve(tmp_path, monkeypatch):
+    monkeypatch.setenv("SOLVE_MAX_CORES", "2")
+    configs = [str(_config(tmp_path, f"c{i}.json", ["A", "B"])) for i in range(2)]
+    out = tmp_path / "out"
+    assert main(["solve", *configs, "--out", str(out), "--formats", "csv", "--jobs", "2"]) == 0
+    summary = json.loads((out / "summary.json").read_text())
+    assert (summary["processes"], summary["workers_per_job"]) == (1, 2)
+
+
+def test_ledgers_must_pair_with_configs(tmp_path):
+    a = _config(tmp_path, "a.json", ["A", "B"])
+    with pytest.raises(SystemExit):
+        main(["solve", str(a), str(a), "--ledger", str(a), "--out", str(tmp_path / "o")])
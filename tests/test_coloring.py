@@ -2,6 +2,8 @@ import sys, os
 import re
 from datetime import date
 
+import pytest
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 try:
@@ -259,3 +261,30 @@ def test_theme_palette_golden_and_deterministic():
     }
     assert theme_palette("#4a90d9") == expected
     assert theme_palette("#4a90d9") == theme_palette("#4a90d9")
+
+
+def test_shared_block_slot_table_colours_without_reclassifying(monkeypatch):
+    from model import coloring
+    from model.resolved import resolve_block
+
+    df, data = _sample()
+    expected = {mode: schedule_cell_colors(df, data, mode) for mode in COLOR_MODES.values()}
+    block = resolve_block(data)
+    block.slot_table
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("slot re-classified")
+
+    monkeypatch.setattr(coloring, "effective_points", fail)
+    monkeypatch.setattr(coloring, "is_weekend", fail)
+    for mode, colors in expected.items():
+        assert schedule_cell_colors(df, data, mode, block=block) == colors
+
+
+def test_dates_outside_the_slot_table_still_colour():
+    pytest.importorskip("pandas")
+    df, data = _sample()
+    shifted = df.copy()
+    shifted["Date"] = [pd.Timestamp(2023, 1, 7), pd.Timestamp(2023, 1, 9)]
+    for mode in COLOR_MODES.values():
+        assert schedule_cell_colors(shifted, data, mode) == schedule_cell_colors(df, data, mode)
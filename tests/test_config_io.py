@@ -355,3 +355,32 @@ def test_nf_coverage_date_exceptions_round_trip():
     }
     restored = input_data_from_json(input_data_to_json(data))
     assert restored.nf_coverage == data.nf_coverage
+
+
+def test_config_fingerprint_matches_exactly_when_the_saved_config_does():
+    from model.data_models import Leave
+    from ui.state import config_fingerprint
+
+    data = _sample_data()
+    ledger = {"A": {"total": 3.0, "weekend": 1.0, "labels": {"NF": 2.0}}}
+    base = config_fingerprint(data, ledger)
+    # Targets are not saved; equivalent leave spellings save the same.
+    assert config_fingerprint(replace(data, target_total=9.0), ledger) == base
+    same_leave = [Leave("A", date(2023, 1, 5), date(2023, 1, 7), False)]
+    assert config_fingerprint(replace(data, leaves=same_leave), ledger) == base
+    # Anything the saved JSON tells apart, the fingerprint does too.
+    changed = [
+        config_fingerprint(replace(data, min_gap=1), ledger),
+        config_fingerprint(replace(data, max_total={"A": 12}), ledger),
+        config_fingerprint(replace(data, max_total={"A": -0.0}), ledger),
+        config_fingerprint(replace(data, max_total={"A": 0.0}), ledger),
+        config_fingerprint(data, {"A": {**ledger["A"], "total": 4.0}}),
+        config_fingerprint(data, None),
+        config_fingerprint(data, ledger, label_carryover=False),
+    ]
+    assert len({base, *changed}) == len(changed) + 1
+    # In-place edits are seen, and undoing them restores the fingerprint.
+    data.leaves.append(("B", date(2023, 1, 9), date(2023, 1, 9), True))
+    assert config_fingerprint(data, ledger) != base
+    data.leaves.pop()
+    assert config_fingerprint(data, ledger) == base
@@ -0,0 +1,94 @@
+"""Opt-in shared artifact store (ui/export_store.py): atomic, LRU-bounded."""
+import sys, os
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from ui.export_store import ExportStore, store_from_env
+
+
+def _files(root: Path):
+    return sorted(p.name for p in root.glob("*/*"))
+
+
+def test_store_is_off_unless_the_deployment_configures_it(tmp_path):
+    assert store_from_env({}) is None
+    assert store_from_env({"EXPORT_CACHE_DIR": "  "}) is None
+    store = store_from_env({"EXPORT_CACHE_DIR": str(tmp_path), "EXPORT_CACHE_MAX_MB": "2"})
+    assert store == ExportStore(tmp_path, 2 * 1024 * 1024)
+
+
+def test_round_trip_leaves_no_temp_files(tmp_path):
+    store = ExportStore(tmp_path)
+    assert store.get("ab12") is None
+    store.put("ab12", b"artifact")
+    assert store.get("ab12") == b"artifact"
+    assert _files(tmp_path) == ["ab12"]
+    store.put("ab12", b"rebuilt")  # replaced whole, never appended
+    assert store.get("ab12") == b"rebuilt"
+
+
+def test_eviction_drops_least_recently_used_first(tmp_path):
+    store = ExportStore(tmp_path, max_bytes=25)
+    for age, key in enumerate(["aa01", "bb02"]):
+        store.put(key, b"x" * 10)
+        os.utime(store._path(key), (1000 + age, 1000 + age))
+    assert store.get("aa01") == b"x" * 10  # read: now the most recent
+    store.put("cc03", b"x" * 10)
+    assert _files(tmp_path) == ["aa01", "cc03"]
+
+
+def test_puts_scan_the_store_only_when_its_tracked_size_goes_over(tmp_path, monkeypatch):
+    store = ExportStore(tmp_path, max_bytes=100)
+    scans = []
+    evict = ExportStore.evict
+    monkeypatch.setattr(ExportStore, "evict", lambda self: scans.append(1) or evict(self))
+    for n in range(9):
+        store.put(f"k{n:03}", b"x" * 10)
+    assert len(scans) == 1  # the first put seeds the running total
+    store.put("k100", b"x" * 10)
+    store.put("k101", b"x" * 10)  # 110 bytes: over the bound
+    assert len(scans) == 2
+    assert len(_files(tmp_path)) == 9  # evicted down to 90%, room for one more
+    store.put("k102", b"x" * 10)
+    assert len(scans) == 2
+
+
+def test_overwriting_a_key_counts_its_bytes_once(tmp_path):
+    store = ExportStore(tmp_path, max_bytes=100)
+    for _ in range(20):
+        store.put("k000", b"x" * 40)  # never grows past one artifact
+    store.put("k001", b"x" * 40)
+    assert _files(tmp_path) == ["k000", "k001"]
+    assert (tmp_path / ".usage").read_text() == "80"
+
+
+def _fill(root, writer, count):
+    store = ExportStore(Path(root), max_bytes=1_000_000)
+    for n in range(count):
+        store.put(f"{writer}{n:04}", os.urandom(50_000))
+
+
+def test_the_bound_holds_across_writer_processes(tmp_path):
+    import multiprocessing
+
+    context = multiprocessing.get_context("fork")
+    writers = [
+        context.Process(target=_fill, args=(str(tmp_path), f"w{i}", 30)) for i in range(4)
+    ]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join(60)
+        assert writer.exitcode == 0
+    on_disk = sum(path.stat().st_size for path in tmp_path.glob("*/*"))
+    assert 0 < on_disk <= 1_000_000
+    assert int((tmp_path / ".usage").read_text()) == on_disk
+
+
+def test_unwritable_store_is_just_a_miss(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_bytes(b"")
+    store = ExportStore(blocker)  # root is a file: nothing can be created
+    store.put("ab12", b"artifact")
+    assert store.get("ab12") is None
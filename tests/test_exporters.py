@@ -477,6 +477,49 @@ def test_excel_widths_follow_long_resident_content():
     assert fair.column_dimensions[resident_col].width >= 30
 
 
+def test_spreadsheet_safe_frame_matches_scalar_rule_on_mixed_columns():
+    from model.exporters import spreadsheet_safe_frame, spreadsheet_safe_text
+
+    frame = pd.DataFrame({
+        "=head": ["=1", " -2", "ok", None, 3, "\tx", ""],
+        "n": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0],
+        "d": [date(2023, 1, d) for d in range(1, 8)],
+    })
+    safe = spreadsheet_safe_frame(frame)
+    assert list(safe.columns) == ["'=head", "n", "d"]
+    for column, original in zip(safe.columns, frame.columns):
+        expected = [spreadsheet_safe_text(v) for v in frame[original]]
+        assert [v if v == v else None for v in safe[column]] == expected
+    assert frame["=head"].iloc[0] == "=1"  # the caller's frame is untouched
+
+
+def test_excel_sheets_stream_with_header_style_formats_and_filters():
+    pytest.importorskip("openpyxl")
+    from openpyxl import load_workbook
+
+    df, data = _df_and_data()
+    df.loc[1, "D"] = None
+    out = schedule_to_excel_bytes(df, data, color_mode="auto", validation_issues=[])
+    book = load_workbook(io.BytesIO(out))
+    assert book.sheetnames == ["Schedule", "Fairness", "Per-call", "Policy & validation"]
+    schedule = book["Schedule"]
+    assert schedule.freeze_panes == "B2"
+    assert schedule.auto_filter.ref == "A1:D3"
+    assert schedule.sheet_view.showGridLines is False
+    head = schedule["A1"]
+    assert head.font.b and head.font.color.rgb == "00FFFFFF"
+    assert head.fill.fgColor.rgb == "00333333"
+    assert schedule["A2"].number_format == "ddd dd mmm"
+    assert schedule["C3"].value == "Unfilled" and schedule["C3"].fill.fill_type == "solid"
+    assert schedule.column_dimensions["A"].width == 16
+    per_call = book["Per-call"]
+    assert per_call["A2"].number_format == "YYYY-MM-DD"
+    assert per_call.auto_filter.ref == per_call.dimensions
+    policy = book["Policy & validation"]
+    assert policy["B2"].alignment.wrap_text and policy["B2"].alignment.vertical == "top"
+    assert policy.column_dimensions["B"].width == 60
+
+
 def test_cumulative_frame_distinguishes_actual_and_policy_adjusted_standing():
     from model.exporters import build_cumulative_frame
 
@@ -550,3 +593,62 @@ def test_register_pdf_fonts_unicode_shaping():
     _normal, _bold, unicode_supported = _register_pdf_fonts()
     if unicode_supported:
         assert "U+" not in _pdf_safe_text("محمد", unicode_font=True)
+
+
+def test_pdf_fonts_register_once_and_text_shaping_is_memoised(monkeypatch):
+    pytest.importorskip("reportlab")
+    from model import exporters
+
+    probes = []
+    real_probe = exporters._probe_pdf_fonts
+    monkeypatch.setattr(exporters, "_PDF_FONTS", None)
+    monkeypatch.setattr(
+        exporters, "_probe_pdf_fonts", lambda: probes.append(1) or real_probe()
+    )
+    first = exporters._register_pdf_fonts()
+    assert exporters._register_pdf_fonts() == first and probes == [1]
+
+    exporters._shape_pdf_text.cache_clear()
+    for _ in range(3):
+        assert exporters._pdf_safe_text("محمد – 1") == "[U+0645][U+062D][U+0645][U+062F] - 1"
+    info = exporters._shape_pdf_text.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_shared_components_rebuild_nothing_on_a_recolour(monkeypatch):
+    pytest.importorskip("openpyxl")
+    pytest.importorskip("reportlab")
+    from openpyxl import load_workbook
+
+    from model import exporters
+    from model.coloring import schedule_cell_colors
+    from model.exporters import report_components
+
+    df, data = _df_and_data()
+    components = report_components(df, data)
+    baseline = schedule_to_excel_bytes(df, data, color_mode="auto")
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("component rebuilt")
+
+    for name in ("build_fairness_frame", "build_assignment_frame",
+                 "build_policy_snapshot_frame", "calculate_points"):
+        monkeypatch.setattr(exporters, name, fail)
+    colors = schedule_cell_colors(df, data, "auto", None)
+    shared = schedule_to_excel_bytes(
+        df, data, color_mode="auto", components=components, cell_colors=colors
+    )
+    assert schedule_to_pdf_bytes(
+        df, data, color_mode="auto", components=components, cell_colors=colors
+    ).startswith(b"%PDF")
+
+    def cells(blob):
+        book = load_workbook(io.BytesIO(blob))
+        return {
+            sheet.title: [
+                [(c.value, c.fill.fgColor.rgb) for c in row] for row in sheet.iter_rows()
+            ]
+            for sheet in book
+        }
+
+    assert cells(shared) == cells(baseline)
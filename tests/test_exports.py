@@ -0,0 +1,221 @@
+"""Background export pipeline (ui/exports.py): shared bundle, per-artifact jobs."""
+import sys, os
+import io
+import pickle
+import threading
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+pd = pytest.importorskip("pandas")
+
+from model.data_models import InputData, ShiftTemplate
+from model.fairness import calculate_points
+from model.resolved import resolve_block
+from ui import exports
+from ui.export_store import ExportStore
+from ui.exports import (
+    BUILDERS,
+    EXPORT_KINDS,
+    ExportBundle,
+    ExportJobs,
+    StoredArtifact,
+    export_key,
+    submit_exports,
+)
+
+
+@pytest.fixture(autouse=True)
+def thread_pool(monkeypatch):
+    # Keep builds in-process so monkeypatched builders are the ones that run.
+    pool = ThreadPoolExecutor(max_workers=len(EXPORT_KINDS))
+    monkeypatch.setattr(exports, "_EXECUTOR", pool)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+def _bundle():
+    shifts = [
+        ShiftTemplate(label="D", role="Junior", night_float=False, thu_weekend=False, points=1.0),
+        ShiftTemplate(label="N", role="Junior", night_float=False, thu_weekend=False, points=2.0),
+    ]
+    data = InputData(
+        start_date=date(2023, 1, 7), end_date=date(2023, 1, 8), shifts=shifts,
+        juniors=["Alice", "Bob"], seniors=[], nf_juniors=[], nf_seniors=[],
+        leaves=[], rotators=[], min_gap=0,
+    )
+    df = pd.DataFrame([
+        {"Date": date(2023, 1, 7), "Day": "Saturday", "D": "Alice", "N": "Bob"},
+        {"Date": date(2023, 1, 8), "Day": "Sunday", "D": "Bob", "N": "Alice"},
+    ])
+    return ExportBundle(
+        df, df, data, points=calculate_points(df, data), issues=[],
+        color_mode="auto", palette={}, block=resolve_block(data),
+    )
+
+
+def test_every_artifact_builds_from_one_bundle():
+    pytest.importorskip("openpyxl")
+    pytest.importorskip("reportlab")
+    from openpyxl import load_workbook
+
+    jobs = submit_exports(ExportJobs(), _bundle(), {kind: 1 for kind in EXPORT_KINDS})
+    built = {kind: jobs.future(kind).result(timeout=60) for kind in EXPORT_KINDS}
+    assert all(jobs.state(kind) == "ready" for kind in EXPORT_KINDS)
+    assert not jobs.pending()
+    assert "Per-call" in load_workbook(io.BytesIO(built["excel"])).sheetnames
+    assert built["pdf"].startswith(b"%PDF") and built["cal_handout"].startswith(b"%PDF")
+    names = zipfile.ZipFile(io.BytesIO(built["ics_zip"])).namelist()
+    assert len(names) == 2 and all(name.endswith(".ics") for name in names)
+    names = zipfile.ZipFile(io.BytesIO(built["resident_pdfs"])).namelist()
+    assert len(names) == 2 and all(name.endswith(".pdf") for name in names)
+    assert jobs.progress("resident_pdfs") == (2, 2)
+
+
+def test_same_signature_reuses_the_build_and_a_new_one_supersedes_it(monkeypatch):
+    calls = []
+    monkeypatch.setitem(BUILDERS, "excel", lambda bundle: calls.append(bundle) or b"x")
+    jobs = ExportJobs()
+    bundle = _bundle()
+    first = jobs.submit("excel", ("v1",), bundle)
+    assert jobs.submit("excel", ("v1",), bundle) is first
+    first.result(timeout=10)
+    second = jobs.submit("excel", ("v2",), bundle)
+    assert second is not first and second.result(timeout=10) == b"x"
+    assert jobs.future("excel", ("v1",)) is None
+    assert jobs.future("excel", ("v2",)) is second
+    assert len(calls) == 2
+
+
+def test_states_track_building_ready_and_failed(monkeypatch):
+    release = threading.Event()
+
+    def slow(bundle):
+        release.wait(10)
+        return b"pdf"
+
+    def broken(bundle):
+        raise ValueError("boom")
+
+    monkeypatch.setitem(BUILDERS, "pdf", slow)
+    monkeypatch.setitem(BUILDERS, "excel", broken)
+    jobs = ExportJobs()
+    assert jobs.state("pdf") == "missing"
+    jobs.submit("pdf", 1, _bundle())
+    jobs.submit("excel", 1, _bundle())
+    jobs.future("excel").exception(timeout=10)
+    assert jobs.state("pdf") == "building" and jobs.pending()
+    assert jobs.state("excel") == "failed"
+    release.set()
+    jobs.future("pdf").result(timeout=10)
+    assert jobs.state("pdf") == "ready" and not jobs.pending()
+
+
+def test_bundle_pickles_for_worker_processes():
+    bundle = _bundle()
+    bundle.block.reduction_caps
+    clone = pickle.loads(pickle.dumps(bundle))
+    assert clone.data == bundle.data
+    assert list(clone.df["D"]) == ["Alice", "Bob"]
+    assert "reduction_caps" in clone.block.__dict__
+
+
+def test_store_serves_identical_requests_without_rebuilding(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setitem(BUILDERS, "pdf", lambda bundle: calls.append(1) or b"%PDF")
+    bundle = _bundle()
+    for _session in range(2):
+        jobs = ExportJobs(store=ExportStore(tmp_path))
+        assert jobs.submit("pdf", 1, bundle).result(timeout=10) == b"%PDF"
+    assert len(calls) == 1
+
+
+def test_large_builds_stay_in_the_store_until_downloaded(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setitem(BUILDERS, "pdf", lambda bundle: calls.append(1) or b"%PDF" * 100)
+    jobs = ExportJobs(store=ExportStore(tmp_path), offload_min=100)
+    stored = jobs.submit("pdf", 1, _bundle()).result(timeout=10)
+    assert isinstance(stored, StoredArtifact) and stored.size == 400
+    assert jobs.state("pdf") == "ready"
+    read = jobs.download("pdf")
+    assert callable(read) and read() == b"%PDF" * 100
+    assert jobs.release_built() == 0  # nothing of it is held in memory
+
+    stored.store._path(stored.key).unlink()  # evicted by the store meanwhile
+    assert read() == b"%PDF" * 100 and len(calls) == 2
+
+
+def test_store_key_follows_content_not_identity():
+    bundle = _bundle()
+    same = _bundle()
+    assert export_key("pdf", bundle) == export_key("pdf", same)
+    assert export_key("pdf", bundle) != export_key("excel", bundle)
+    recoloured = ExportBundle(
+        bundle.final_df, bundle.df, bundle.data, points=bundle.points,
+        issues=[], color_mode="none", palette={},
+    )
+    assert export_key("pdf", recoloured) != export_key("pdf", bundle)
+    assert export_key("ics_zip", recoloured) == export_key("ics_zip", bundle)
+    edited = bundle.df.copy()
+    edited.loc[0, "D"] = "Bob"
+    moved = ExportBundle(bundle.final_df, edited, bundle.data, points={}, issues=[])
+    assert export_key("ics_zip", moved) != export_key("ics_zip", bundle)
+
+
+def test_components_are_kept_per_key():
+    jobs = ExportJobs()
+    built = []
+    first = jobs.component("colors", ("v1", "auto"), lambda: built.append(1) or {"a": 1})
+    assert jobs.component("colors", ("v1", "auto"), lambda: built.append(2)) is first
+    assert jobs.component("report", ("v1",), lambda: built.append(3) or "r") == "r"
+    assert jobs.component("colors", ("v1", "none"), lambda: built.append(4) or {}) == {}
+    assert built == [1, 3, 4]
+
+
+def test_fanned_builds_report_progress_and_drop_superseded_reports(monkeypatch):
+    release = threading.Event()
+    totals = iter([5, 3])
+
+    def parts(bundle, executor=None, progress=None):
+        total = next(totals)
+        if total == 5:  # the superseded build reports only after its successor
+            release.wait(10)
+        progress(0, total)
+        futures = [executor.submit(str, n) for n in range(total)]
+        for done, future in enumerate(futures, 1):
+            future.result()
+            progress(done, total)
+        return b"zip"
+
+    monkeypatch.setitem(BUILDERS, "resident_pdfs", parts)
+    jobs = ExportJobs()
+    assert jobs.progress("resident_pdfs") is None
+    old = jobs.submit("resident_pdfs", 1, _bundle())
+    new = jobs.submit("resident_pdfs", 2, _bundle())
+    assert new.result(timeout=10) == b"zip"
+    assert jobs.progress("resident_pdfs") == (3, 3)
+    release.set()
+    old.result(timeout=10)
+    assert jobs.progress("resident_pdfs") == (3, 3)
+
+
+def test_a_released_build_waits_to_be_requested_again():
+    jobs = ExportJobs(store=None)
+    future: Future = Future()
+    future.set_result(b"pdf bytes")
+    jobs._jobs["pdf"] = ("v1", future)
+    assert jobs.held_bytes() == 9
+    revision = jobs.memory_revision()
+    assert jobs.release_built() == 9
+    assert jobs.memory_revision() != revision and jobs.held_bytes() == 0
+    assert jobs.state("pdf") == "released"
+    assert jobs.released("pdf", "v1") and not jobs.released("pdf", "v2")
+    jobs.request("pdf")
+    assert not jobs.released("pdf", "v1") and jobs.state("pdf") == "missing"
+    jobs._jobs["pdf"] = ("v1", future)  # resubmitted on request
+    assert jobs.release_built() == 0  # kept until offered
+    assert jobs.download("pdf") == b"pdf bytes"
+    assert jobs.release_built() == 9
@@ -153,3 +153,110 @@ def test_calendar_handout_is_compact_and_has_one_add_all_per_resident():
     assert len(add_all) == len(scheduled)
     # Compact: 24 residents fit a page, not one section each.
     assert doc.page_count <= 2
+
+
+def test_events_index_matches_per_resident_scan_and_feeds_the_zip():
+    from model.ics import events_by_resident
+
+    df, data = _sample()
+    index = events_by_resident(df, data)
+    assert index["Alice"] == resident_events(df, data, "Alice")
+    assert [e["label"] for e in index["Bob Ödberg"]] == ["Ward", "Ward"]
+    assert "Unfilled" in index and "Nobody" not in index
+    blob = schedule_calendars_zip(df, data, now=NOW)
+    with zipfile.ZipFile(io.BytesIO(blob)) as archive:
+        assert archive.read("Alice.ics").decode("utf-8") == resident_ics(
+            df, data, "Alice", now=NOW, events=index["Alice"]
+        )
+
+
+def test_personal_pdfs_zip_has_one_page_per_scheduled_resident():
+    pytest.importorskip("reportlab")
+    from concurrent.futures import ThreadPoolExecutor
+
+    from model.calendar_pdf import resident_pdfs_zip
+
+    df, data = _sample()
+    seen = []
+    blob = resident_pdfs_zip(df, data, progress=lambda done, total: seen.append((done, total)))
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        fanned = resident_pdfs_zip(df, data, executor=pool)
+    for archive_bytes in (blob, fanned):
+        with zipfile.ZipFile(io.BytesIO(archive_bytes)) as archive:
+            names = sorted(archive.namelist())
+            assert len(names) == 2 and all(name.endswith(".pdf") for name in names)
+            assert all(archive.read(name).startswith(b"%PDF") for name in names)
+    assert seen == [(0, 2), (1, 2), (2, 2)]
+
+
+
+def _pdf_page_count(blob: bytes) -> int:
+    # reportlab writes its page objects uncompressed.
+    import re
+
+    return len(re.findall(rb"/Type /Page\b(?!s)", blob))
+
+
+@pytest.mark.parametrize("per_day", [1, 3])
+def test_personal_pdf_fits_a_whole_year_on_one_page(per_day):
+    pytest.importorskip("reportlab")
+    from datetime import timedelta
+
+    from model.calendar_pdf import resident_calendar_pdf_bytes
+
+    _df, data = _sample()
+    labels = ["ER, night", "Ward", "Cardiology consult"][:per_day]
+    events = [
+        {"day": date(2026, 1, 1) + timedelta(days=i), "label": label}
+        for i in range(365) for label in labels
+    ]
+    blob = resident_calendar_pdf_bytes("Alice", events, data)
+    assert _pdf_page_count(blob) == 1
+    assert blob.count(b"calendar.google.com") == len(events)  # no date dropped
+
+
+def test_personal_pdf_keeps_full_size_type_until_it_needs_columns():
+    pytest.importorskip("reportlab")
+    from model.calendar_pdf import _fit_rows, _handout_styles
+
+    row = _handout_styles()["row"]
+    short = [{"day": date(2026, 3, 2), "label": "Ward"}] * 10
+    columns, size = _fit_rows(short, 500, 600, row)
+    assert columns == 1 and size == pytest.approx(row.fontSize * 0.98)
+    columns, size = _fit_rows(short * 40, 500, 600, row)
+    assert columns > 1 and size * row.leading / row.fontSize * -(-400 // columns) <= 600
+
+
+def test_archives_keep_one_file_per_resident_when_names_slug_alike():
+    from model.calendar_pdf import resident_pdfs_zip
+    from model.ics import member_names
+
+    roster = ["محمد", "علي", "Sara Ali", "Sara-Ali", "Sara_Ali"]
+    assert member_names(roster + ["علي"], ".ics") == {
+        "resident.ics": "محمد", "resident-2.ics": "علي", "Sara_Ali.ics": "Sara Ali",
+        "Sara-Ali.ics": "Sara-Ali", "Sara_Ali-2.ics": "Sara_Ali",
+    }
+    shifts = [ShiftTemplate(label="D", role="Junior", night_float=False, thu_weekend=False, points=1.0)]
+    days = [date(2026, 3, 2 + i) for i in range(len(roster))]
+    data = InputData(
+        start_date=days[0], end_date=days[-1], shifts=shifts, juniors=roster, seniors=[],
+        nf_juniors=[], nf_seniors=[], leaves=[], rotators=[], min_gap=0,
+    )
+    df = pd.DataFrame([{"Date": d, "Day": d.strftime("%a"), "D": p} for d, p in zip(days, roster)])
+    archives = [schedule_calendars_zip(df, data, now=NOW)]
+    if _has_reportlab():
+        archives.append(resident_pdfs_zip(df, data))
+    for blob in archives:
+        with zipfile.ZipFile(io.BytesIO(blob)) as archive:
+            assert len(archive.namelist()) == len(roster)
+    with zipfile.ZipFile(io.BytesIO(archives[0])) as archive:
+        assert "محمد" in archive.read("resident.ics").decode("utf-8")
+        assert "علي" in archive.read("resident-2.ics").decode("utf-8")
+
+
+def _has_reportlab() -> bool:
+    try:
+        import reportlab  # noqa: F401
+    except ImportError:
+        return False
+    return True
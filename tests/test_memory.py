@@ -0,0 +1,119 @@
+"""Session memory accounting and budget (ui/memory.py)."""
+import sys, os
+from concurrent.futures import Future
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+pd = pytest.importorskip("pandas")
+
+from ui.exports import ExportJobs
+from ui.memory import (
+    budget_from_env,
+    compact_schedule,
+    enforce_session_budget,
+    expand_schedule,
+    heavy_footprint,
+    session_footprint,
+)
+
+
+def _schedule():
+    df = pd.DataFrame({
+        "Date": ["2024-03-04", "2024-03-05", "2024-03-06"],
+        "Day": ["Mon", "Tue", "Wed"],
+        "D": ["Alice", "Bob", "Alice"],
+        "N": ["Bob", "Unfilled", "Alice"],
+    })
+    df.attrs["target_total_map"] = {"Alice": 1.5, "Bob": 1.5}
+    return df
+
+
+def _jobs_holding(blob: bytes) -> ExportJobs:
+    jobs = ExportJobs(store=None)
+    future: Future = Future()
+    future.set_result(blob)
+    jobs._jobs["pdf"] = (1, future)
+    return jobs
+
+
+def test_budget_defaults_and_can_be_turned_off():
+    assert budget_from_env({}) == 256 * 1024 * 1024
+    assert budget_from_env({"SESSION_MEMORY_MB": "0"}) == 0
+    assert budget_from_env({"SESSION_MEMORY_MB": "1.5"}) == 1536 * 1024
+    assert budget_from_env({"SESSION_MEMORY_MB": "lots"}) == 256 * 1024 * 1024
+
+
+def test_footprint_counts_a_shared_frame_once():
+    df = _schedule()
+    state = {"result_df": df, "solver_df": df, "export_cache": _jobs_holding(b"x" * 50_000)}
+    rows = {row.key: row for row in session_footprint(state)}
+    assert rows["solver_df"].shared_with == "result_df" and rows["solver_df"].bytes == 0
+    assert rows["result_df"].bytes > 0
+    assert rows["export_cache"].bytes >= 50_000
+    assert next(iter(session_footprint(state))).key == "export_cache"  # largest first
+
+
+def test_compact_schedule_round_trips_values_and_attrs():
+    df = _schedule()
+    compact = compact_schedule(df)
+    assert str(compact["D"].dtype) == "category"
+    assert compact["Date"].dtype == df["Date"].dtype  # dates and weekdays stay as they are
+    assert compact.attrs == df.attrs
+    assert compact_schedule(compact) is compact
+    expanded = expand_schedule(compact)
+    pd.testing.assert_frame_equal(expanded, df)
+    assert expand_schedule(df) is df
+
+
+def test_budget_releases_regenerable_artifacts_cheapest_first():
+    jobs = _jobs_holding(b"x" * 200_000)
+    jobs.component("points", (1,), lambda: {"Alice": 1.0})
+    state = {"result_df": _schedule(), "export_cache": jobs}
+
+    assert enforce_session_budget(state, budget=0) == []
+    assert enforce_session_budget(state, budget=10**9) == []
+    assert jobs.state("pdf") == "ready"
+
+    released = enforce_session_budget(state, budget=50_000)
+    assert released == ["export components", "built downloads"]
+    assert state["memory_released"] == released
+    assert jobs.state("pdf") == "released" and not jobs._components
+    assert state["result_df"] is not None  # the schedule is never released
+
+
+def test_budget_weighs_only_the_heavy_entries():
+    df = _schedule()
+    state = {
+        "result_df": df, "solver_df": df,
+        "export_cache": _jobs_holding(b"x" * 50_000),
+        "ledger_rows": ["y" * 1000] * 1000,  # configuration: never weighed
+    }
+    parts = heavy_footprint(state)
+    assert parts["built downloads"] == 50_000
+    assert 0 < parts["schedules"] < 50_000  # the shared frame counted once
+    assert sum(parts.values()) < 200_000
+
+
+def test_budget_reweighs_only_when_the_result_or_the_exports_change(monkeypatch):
+    from ui import memory
+
+    weighed = []
+    heavy = memory.heavy_footprint
+    monkeypatch.setattr(
+        memory, "heavy_footprint", lambda state: weighed.append(1) or heavy(state)
+    )
+    jobs = _jobs_holding(b"x" * 200_000)
+    state = {"result_version": 1, "result_df": _schedule(), "export_cache": jobs}
+    for _ in range(3):
+        assert enforce_session_budget(state, budget=10**9) == []
+    assert len(weighed) == 1  # plain reruns reuse the weighed total
+    state["result_version"] = 2
+    enforce_session_budget(state, budget=10**9)
+    jobs.component("points", (2,), dict)
+    enforce_session_budget(state, budget=10**9)
+    assert len(weighed) == 3
+
+    assert enforce_session_budget(state, budget=50_000)[-1] == "built downloads"
+    assert enforce_session_budget(state, budget=50_000) == []  # nothing new to weigh
+    assert len(weighed) == 4
@@ -179,6 +179,40 @@ def test_resolve_night_float_covered_gap_and_leaves():
     assert nf_duty_days(nf_cells) == {"A": 2}
 
 
+def test_compiled_calendar_masks_and_coverer_priority():
+    data = _data(
+        end_date=date(2023, 1, 8),
+        shifts=[_nf_shift(), _reg_shift("Clinic")],
+        juniors=["A", "B", "C"],
+        nf_coverage={"NF": NightFloatCoverage(
+            "NF", weekdays=(0, 1, 2, 9), include_dates=(date(2023, 1, 7),),
+            exclude_dates=(date(2023, 1, 3),),
+        )},
+        nf_assignments=[
+            NightFloatAssignment("B", date(2023, 1, 1), date(2023, 1, 7), (), 0),
+            NightFloatAssignment("A", date(2023, 1, 1), date(2023, 1, 2), (), 0),
+            NightFloatAssignment("C", date(2022, 12, 30), date(2023, 1, 4), ("D",), 0),
+        ],
+        closures=[("Clinic", date(2022, 12, 1), date(2023, 1, 31), (5, 6))],
+    )
+    view = data.compiled()
+    # Mon, Wed, Sat (include), not Tue (excluded); weekday 9 matches nothing.
+    assert view.nf_mask("NF") == 0b0100101
+    assert view.closed_mask("Clinic") == 0b1100000
+    # Earliest start wins, then name; C's labels do not include NF.
+    assert view.nf_coverers("NF", "Junior")[:3] == ("A", "B", "B")
+    nf_cells, gaps, _ = resolve_night_float(data)
+    assert nf_cells == {
+        (date(2023, 1, 2), "NF"): "A",
+        (date(2023, 1, 4), "NF"): "B",
+        (date(2023, 1, 7), "NF"): "B",
+    }
+    assert not gaps
+    # Days outside the block still answer from the entries themselves.
+    assert nf_covered(date(2023, 1, 9), _nf_shift(), data)
+    assert not nf_covered(date(2023, 1, 12), _nf_shift(), data)
+
+
 def test_nf_cells_attr_round_trip_is_serializable():
     # df.attrs is serialized by pandas/Streamlit, which rejects tuple keys, so
     # the overlay stores {date-iso: {label: name}} and reads it back to tuples.
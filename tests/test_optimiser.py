@@ -32,6 +32,36 @@ def test_simple_schedule():
     assert list(df["Day"]) == ["Sunday", "Monday"]
 
 
+def test_num_workers_caps_the_search(monkeypatch):
+    pytest.importorskip("ortools")
+    from model import optimiser as opt
+
+    seen = []
+    real = opt._cp_model().CpSolver
+
+    class Recording(real):
+        def Solve(self, *args):
+            seen.append(self.parameters.num_workers)
+            return super().Solve(*args)
+
+    monkeypatch.setattr(opt._cp_model(), "CpSolver", Recording)
+    data = InputData(
+        start_date=date(2023, 1, 1),
+        end_date=date(2023, 1, 2),
+        shifts=[ShiftTemplate(label="Shift1", role="Junior", night_float=False, thu_weekend=False, points=1.0)],
+        juniors=["A", "B"],
+        seniors=[],
+        nf_juniors=[],
+        nf_seniors=[],
+        leaves=[],
+        rotators=[],
+        min_gap=1,
+    )
+    df = build_schedule(data, time_limit_sec=5, num_workers=2)
+    assert seen == [2]
+    assert set(df["Shift1"]) <= {"A", "B"}
+
+
 def test_schedule_with_strict_cpmodel(strict_cp):
     """Scheduler should not fail if CpModel disallows new attributes."""
 
@@ -0,0 +1,77 @@
+"""Opt-in rerun profiler (ui/profiler.py): off by default, per-section samples."""
+import sys, os
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from ui import profiler
+from ui.profiler import RerunProfile, profiled, window_from_env
+
+
+def test_profiling_is_off_unless_the_deployment_enables_it():
+    assert window_from_env({}) == 0
+    assert window_from_env({"RERUN_PROFILE": "0"}) == 0
+    assert window_from_env({"RERUN_PROFILE": "on"}) == 50
+    assert window_from_env({"RERUN_PROFILE": "1", "RERUN_PROFILE_RERUNS": "5"}) == 5
+    assert window_from_env({"RERUN_PROFILE": "1", "RERUN_PROFILE_RERUNS": "lots"}) == 50
+
+
+def test_disabled_profiling_leaves_functions_untouched(monkeypatch):
+    monkeypatch.setattr(profiler, "_WINDOW", 0)
+
+    def render():
+        return 1
+
+    assert profiled()(render) is render
+
+
+@pytest.fixture
+def recorded(monkeypatch):
+    profile = RerunProfile(window=2)
+    monkeypatch.setattr(profiler, "_WINDOW", 2)
+    monkeypatch.setattr(profiler, "current_profile", lambda: profile)
+    return profile
+
+
+def test_outermost_call_records_one_sample_per_section(recorded):
+    @profiled("chart")
+    def chart():
+        return "chart"
+
+    @profiled()
+    def render_page():
+        return [chart(), chart()]
+
+    assert render_page.__name__ == "render_page"
+    assert render_page() == ["chart", "chart"]
+    assert recorded.runs == 1
+    assert set(recorded.sections) == {"render_page", "chart"}
+    # Two calls in one rerun are one sample; nested time is inclusive.
+    assert len(recorded.samples("chart")) == 1
+    assert recorded.samples("render_page")[0] >= recorded.samples("chart")[0]
+
+    chart()  # a fragment-style run on its own
+    assert recorded.runs == 2 and len(recorded.samples("chart")) == 2
+
+
+def test_failed_sections_are_still_timed(recorded):
+    @profiled()
+    def broken():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        broken()
+    assert len(recorded.samples("broken")) == 1
+
+
+def test_profile_keeps_a_rolling_window_and_sorts_slowest_first():
+    profile = RerunProfile(window=3)
+    for seconds in (0.1, 0.2, 0.3, 0.4):
+        profile.record({"slow": seconds, "fast": seconds / 10})
+    assert profile.samples("slow") == [0.2, 0.3, 0.4]
+    slow, fast = profile.stats()
+    assert slow.section == "slow" and fast.section == "fast"
+    assert (slow.samples, slow.last, slow.median, slow.max) == (3, 0.4, 0.3, 0.4)
+    profile.clear()
+    assert profile.stats() == [] and profile.runs == 0
@@ -0,0 +1,212 @@
+"""ResolvedBlock: configuration state resolved once and shared by consumers."""
+import sys, os
+import pickle
+from dataclasses import FrozenInstanceError, replace
+from datetime import date
+from types import MappingProxyType
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from model import resolved as resolved_module
+from model.closures import resolve_closures
+from model.data_models import (
+    InputData,
+    LoadReduction,
+    NightFloatAssignment,
+    NightFloatCoverage,
+    ShiftClosure,
+    ShiftTemplate,
+)
+from model.ledger import block_adjustments
+from model.night_float import resolve_night_float
+from model.optimiser import resolve_targets
+from model.reductions import reduction_caps, reduction_target_relief
+from model.resolved import ResolvedBlock, block_for, resolve_block
+from model.weights import availability_weights
+
+
+def _data(**over):
+    shifts = [
+        ShiftTemplate(label="D", role="Junior", night_float=False, thu_weekend=False, points=1.0),
+        ShiftTemplate(label="N", role="Junior", night_float=True, thu_weekend=False, points=2.0),
+    ]
+    base = dict(
+        start_date=date(2023, 1, 2),
+        end_date=date(2023, 1, 15),
+        shifts=shifts,
+        juniors=["A", "B", "C"],
+        seniors=[],
+        nf_juniors=["A", "B"],
+        nf_seniors=[],
+        leaves=[],
+        rotators=[],
+        min_gap=0,
+        nf_coverage={"N": NightFloatCoverage("N", (0, 1, 2))},
+        nf_assignments=[NightFloatAssignment("A", date(2023, 1, 2), date(2023, 1, 4))],
+        closures=[ShiftClosure(date(2023, 1, 7), date(2023, 1, 8), ("D",))],
+        reductions=[
+            LoadReduction(None, ("B",), ("D",), 0.5, date(2023, 1, 2), date(2023, 1, 10))
+        ],
+    )
+    base.update(over)
+    return InputData(**base)
+
+
+def test_block_matches_the_standalone_resolvers():
+    data = _data()
+    block = resolve_block(data)
+    nf_cells, gaps, leaves = resolve_night_float(data)
+    assert dict(block.nf_cells) == nf_cells
+    assert set(block.nf_gaps) == gaps
+    assert list(block.nf_leaves) == leaves
+    assert set(block.closed_cells) == resolve_closures(data)
+    assert block.reserved_cells == set(nf_cells) | resolve_closures(data)
+    assert dict(block.availability_weights) == availability_weights(data)
+    assert list(block.reduction_caps) == reduction_caps(data)
+    assert dict(block.reduction_relief) == reduction_target_relief(data)
+
+
+def test_block_targets_match_resolve_targets():
+    data = _data()
+    ledger = {"A": {"total": 4.0, "weekend": 1.0}, "B": {"total": 1.0, "weekend": 0.0}}
+    block = resolve_block(data, ledger)
+    expected = resolve_targets(
+        data, ledger, nf_cells=block.nf_cells, closed_cells=block.closed_cells
+    )
+    assert block.solve_data.target_total_map == expected.target_total_map
+    assert block.solve_data.target_weekend == expected.target_weekend
+    assert block.solve_data.target_label == expected.target_label
+    assert data.target_total_map is None  # the caller's config is untouched
+
+
+def test_each_piece_is_resolved_once(monkeypatch):
+    calls = {"nf": 0, "weights": 0}
+    real_nf = resolved_module.resolve_night_float
+    real_weights = resolved_module.availability_weights
+
+    def counting_nf(data):
+        calls["nf"] += 1
+        return real_nf(data)
+
+    def counting_weights(data):
+        calls["weights"] += 1
+        return real_weights(data)
+
+    monkeypatch.setattr(resolved_module, "resolve_night_float", counting_nf)
+    monkeypatch.setattr(resolved_module, "availability_weights", counting_weights)
+    data = _data()
+    block = resolve_block(data)
+    block.solve_data
+    block.reduction_relief
+    block_adjustments({}, data, block=block)
+    assert calls == {"nf": 1, "weights": 1}
+
+
+def test_block_is_read_only():
+    block = resolve_block(_data())
+    with pytest.raises(FrozenInstanceError):
+        block.data = _data()
+    with pytest.raises(TypeError):
+        block.nf_cells[(date(2023, 1, 2), "N")] = "C"
+
+
+def test_block_for_rejects_a_block_from_other_data():
+    data = _data()
+    block = resolve_block(data)
+    assert block_for(data, block) is block
+    other = block_for(_data(), block)
+    assert other is not block and isinstance(other, ResolvedBlock)
+
+
+def test_with_data_keeps_resolved_state_but_not_targets():
+    data = _data()
+    block = resolve_block(data)
+    weights = block.availability_weights
+    block.solve_data
+    reseeded = block.with_data(replace(data, seed=7))
+    assert reseeded.availability_weights is weights
+    assert "solve_data" not in reseeded.__dict__
+    assert reseeded.solve_data.seed == 7
+
+
+def test_forget_drops_resolved_state_until_next_use():
+    data = _data()
+    block = resolve_block(data, {"A": {"total": 1.0, "weekend": 0.0}})
+    weights = dict(block.availability_weights)
+    block.solve_data
+    block.forget()
+    assert set(block.__dict__) == {"data", "ledger", "label_carryover"}
+    assert dict(block.availability_weights) == weights
+
+
+def test_block_pickles_with_its_resolved_state():
+    data = _data()
+    block = resolve_block(data)
+    block.reduction_relief
+    block.blackout_windows
+    clone = pickle.loads(pickle.dumps(block))
+    assert "reduction_relief" in clone.__dict__  # carried over, not re-resolved
+    assert dict(clone.nf_cells) == dict(block.nf_cells)
+    assert clone.reduction_caps == block.reduction_caps
+    with pytest.raises(TypeError):
+        clone.nf_cells[(date(2023, 1, 2), "N")] = "C"  # still read-only
+    assert isinstance(clone.reduction_relief, MappingProxyType)
+    assert isinstance(clone.blackout_windows, MappingProxyType)
+
+
+def test_block_pickling_leaves_mappingproxy_pickling_alone():
+    import copyreg
+
+    assert MappingProxyType not in copyreg.dispatch_table
+    with pytest.raises(TypeError):
+        pickle.dumps(MappingProxyType({"A": 1}))
+
+
+def test_compiled_view_normalises_once_and_matches_the_generators():
+    from model.data_models import (
+        blackout_night_before_dates,
+        blackout_person_windows,
+        normalized_leaves,
+        normalized_nf_assignments,
+        normalized_reductions,
+    )
+
+    data = _data(
+        leaves=[("C", date(2023, 1, 3), date(2023, 1, 4))],
+        named_groups={"G": ["B", "C"]},
+        blackouts=[("G", (), date(2023, 1, 9), date(2023, 1, 10))],
+    )
+    view = data.compiled()
+    assert data.compiled() is view
+    assert view.leaves == tuple(normalized_leaves(data.leaves))
+    assert view.reductions == tuple(normalized_reductions(data.reductions))
+    assert view.nf_assignments == tuple(
+        normalized_nf_assignments(data.nf_assignments, default_rest=data.nf_rest_days)
+    )
+    assert view.leaves_by_person["C"][0].compensated is True
+    windows = blackout_person_windows(data.blackouts, data.named_groups)
+    assert {k: list(v) for k, v in view.blackout_windows.items()} == windows
+    assert dict(view.blackout_night_before) == {
+        k: frozenset(v)
+        for k, v in blackout_night_before_dates(data.blackouts, data.named_groups).items()
+    }
+    assert [b.start for b in view.blackouts_by_person["C"]] == [date(2023, 1, 9)]
+    assert view.nf_coverage_by_label["N"].weekdays == (0, 1, 2)
+    assert dict(view.closures_by_label) == {c.label: (c,) for c in data.closures}
+    assert {view: 1}[view] == 1  # hashable, so usable as a cache key
+
+
+def test_compiled_view_is_a_snapshot_dropped_by_copies():
+    import copy
+
+    data = _data()
+    view = data.compiled()
+    assert replace(data, seed=3).compiled() is not view
+    assert "_compiled" not in copy.copy(data).__dict__
+    assert "_compiled" not in pickle.loads(pickle.dumps(data)).__dict__
+    data.leaves.append(("A", date(2023, 1, 5), date(2023, 1, 5)))
+    assert view.leaves == ()  # edits in place are not seen by an existing view
+    with pytest.raises(FrozenInstanceError):
+        view.nf_rest_days = 2
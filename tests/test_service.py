@@ -0,0 +1,166 @@
+"""Local HTTP/JSON solve service (model/service.py): submit, follow, download."""
+import sys, os
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from datetime import date
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+pytest.importorskip("pandas")
+
+from model.admission import SolveAdmission
+from model.config_io import input_data_to_json
+from model.data_models import InputData, ShiftTemplate
+from model.ledger import ledger_from_json
+from model.service import SolveService, make_server
+
+
+def _config(juniors=("A", "B")):
+    data = InputData(
+        start_date=date(2024, 3, 4), end_date=date(2024, 3, 10),
+        shifts=[ShiftTemplate(label="D", role="Junior", night_float=False, thu_weekend=False, points=1.0)],
+        juniors=list(juniors), seniors=[], nf_juniors=[], nf_seniors=[],
+        leaves=[], rotators=[], min_gap=0,
+    )
+    return json.loads(input_data_to_json(data))
+
+
+@pytest.fixture
+def base_url():
+    server = make_server("127.0.0.1", 0, SolveService(SolveAdmission(2)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+    server.service.shutdown()
+
+
+def _call(url, payload=None, method=None, headers=None):
+    body = None if payload is None else json.dumps(payload).encode()
+    if headers is None:
+        headers = {} if body is None else {"Content-Type": "application/json"}
+    request = urllib.request.Request(url, data=body, method=method, headers=headers)
+    with urllib.request.urlopen(request, timeout=60) as response:
+        return response.status, response.headers, response.read()
+
+
+def _wait(base_url, job_id):
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        status = json.loads(_call(f"{base_url}/jobs/{job_id}")[2])
+        if status["state"] in ("done", "failed"):
+            return status
+        time.sleep(0.2)
+    raise AssertionError("job never finished")
+
+
+def test_submit_poll_and_download(base_url):
+    code, _, body = _call(f"{base_url}/jobs", {
+        "config": _config(), "ledger": {"A": {"total": 3.0, "weekend": 1.0}}, "time_limit": 5,
+    })
+    assert code == 202
+    job_id = json.loads(body)["id"]
+    status = _wait(base_url, job_id)
+    assert status["state"] == "done", status
+    assert status["unfilled"] == 0 and status["workers"] >= 1
+
+    rows = json.loads(_call(f"{base_url}/jobs/{job_id}/schedule")[2])
+    assert len(rows) == 7 and rows[0]["Date"] == "2024-03-04"
+    _, headers, csv = _call(f"{base_url}/jobs/{job_id}/schedule.csv")
+    assert headers["Content-Type"].startswith("text/csv")
+    assert csv.decode().splitlines()[0].startswith("Date")
+    assert _call(f"{base_url}/jobs/{job_id}/fairness_log.txt")[2]
+    _, headers, ledger = _call(f"{base_url}/jobs/{job_id}/ledger.json")
+    assert "fairness_ledger_through_2024-03-10.json" in headers["Content-Disposition"]
+    assert ledger_from_json(ledger.decode())["A"]["total"] > 3.0
+
+    assert _call(f"{base_url}/jobs/{job_id}", method="DELETE")[0] == 200
+    with pytest.raises(urllib.error.HTTPError) as gone:
+        _call(f"{base_url}/jobs/{job_id}")
+    assert gone.value.code == 404
+
+
+def test_events_stream_until_the_job_finishes(base_url):
+    job_id = json.loads(_call(f"{base_url}/jobs", {"config": _config(), "time_limit": 5})[2])["id"]
+    _, headers, body = _call(f"{base_url}/jobs/{job_id}/events")
+    assert headers["Content-Type"] == "application/x-ndjson"
+    events = [json.loads(line) for line in body.decode().splitlines()]
+    assert events and events[-1]["state"] == "done"
+    assert events[-1]["solutions"] >= 1
+
+
+def test_bad_requests_are_rejected(base_url):
+    for payload in ({}, {"config": "{not json"}, {"config": _config(), "time_limit": "soon"}):
+        with pytest.raises(urllib.error.HTTPError) as rejected:
+            _call(f"{base_url}/jobs", payload)
+        assert rejected.value.code == 400
+        assert json.loads(rejected.value.read())["error"]
+    health = json.loads(_call(f"{base_url}/health")[2])
+    assert health["ok"] and health["load"]["capacity"] == 2
+
+
+def _rejected(url, payload=None, headers=None):
+    with pytest.raises(urllib.error.HTTPError) as rejected:
+        _call(url, payload, headers=headers)
+    assert json.loads(rejected.value.read())["error"]
+    return rejected.value.code
+
+
+def test_requests_for_another_host_are_refused(base_url):
+    port = base_url.rsplit(":", 1)[1]
+    json_body = {"Content-Type": "application/json"}
+    # A DNS-rebound page still sends its own host name.
+    assert _rejected(f"{base_url}/jobs", headers={"Host": f"evil.example:{port}"}) == 421
+    assert _rejected(f"{base_url}/health", headers={"Host": "localhost:1"}) == 421
+    assert _rejected(
+        f"{base_url}/jobs", {"config": _config()}, {**json_body, "Host": "evil.example"}
+    ) == 421
+    for host in (f"localhost:{port}", f"127.0.0.1:{port}"):
+        assert _call(f"{base_url}/health", headers={"Host": host})[0] == 200
+
+
+def test_posts_that_are_not_json_are_refused(base_url):
+    # What a cross-site form can send without a preflight.
+    for content_type in ("text/plain", "application/x-www-form-urlencoded", None):
+        headers = {} if content_type is None else {"Content-Type": content_type}
+        assert _rejected(f"{base_url}/jobs", {"config": _config()}, headers) == 415
+    assert json.loads(_call(f"{base_url}/jobs")[2]) == []  # nothing was queued
+    status, _headers, _body = _call(
+        f"{base_url}/jobs", {"config": _config()},
+        headers={"Content-Type": "application/json; charset=utf-8"},
+    )
+    assert status == 202
+
+
+def test_only_loopback_addresses_are_served():
+    with pytest.raises(ValueError):
+        make_server("0.0.0.0", 0, SolveService(SolveAdmission(1)))
+
+
+def test_clients_take_turns_in_the_solve_queue(monkeypatch):
+    import model.optimiser
+
+    started = []
+
+    def solve(data, **_kwargs):
+        started.append(data.juniors[0])
+        time.sleep(0.05)
+
+    monkeypatch.setattr(model.optimiser, "build_schedule", solve)
+    service = SolveService(SolveAdmission(2))  # room for one solve at a time
+    try:
+        jobs = [service.submit({"config": _config(("A", "B"))}, client="a") for _ in range(4)]
+        jobs.append(service.submit({"config": _config(("B", "A"))}, client="b"))
+        deadline = time.monotonic() + 30
+        while any(job.finished is None for job in jobs):
+            assert time.monotonic() < deadline, "jobs never finished"
+            time.sleep(0.05)
+    finally:
+        service.shutdown()
+    assert [job.state for job in jobs] == ["done"] * 5
+    assert started == ["A", "B", "A", "A", "A"]
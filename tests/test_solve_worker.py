@@ -0,0 +1,244 @@
+"""Opt-in spool-backed solve worker (model/solve_worker.py)."""
+import sys, os
+import json
+import subprocess
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+pd = pytest.importorskip("pandas")
+
+from model.data_models import InputData, ShiftTemplate
+from model.solve_worker import (
+    SolveRequest,
+    SolveSpool,
+    pack_frame,
+    run_worker,
+    spool_from_env,
+    unpack_frame,
+)
+
+
+def _data():
+    shifts = [
+        ShiftTemplate(label="JCall", role="Junior", night_float=False, thu_weekend=False, points=1.0),
+        ShiftTemplate(label="SCall", role="Senior", night_float=False, thu_weekend=False, points=2.0),
+    ]
+    return InputData(
+        start_date=date(2024, 1, 1), end_date=date(2024, 1, 10), shifts=shifts,
+        juniors=[f"J{i}" for i in range(6)], seniors=[f"S{i}" for i in range(4)],
+        nf_juniors=[], nf_seniors=[], leaves=[], rotators=[], min_gap=1, seed=0,
+    )
+
+
+def _frame():
+    days = [date(2024, 1, 1) + timedelta(days=i) for i in range(3)]
+    df = pd.DataFrame({
+        "Date": days,
+        "Day": [d.strftime("%A") for d in days],
+        "JCall": ["J1", "Unfilled", "J2"],
+        "SCall": ["S1", None, "Closed"],
+    })
+    df.attrs.update(solver_status="FEASIBLE", objective=12.0, nf_cells={"x": 1})
+    return df
+
+
+def test_spool_is_off_unless_the_deployment_configures_it(tmp_path):
+    assert spool_from_env({}) is None
+    assert spool_from_env({"SOLVE_SPOOL_DIR": " "}) is None
+    spool = spool_from_env({
+        "SOLVE_SPOOL_DIR": str(tmp_path), "SOLVE_SPOOL_CHECKPOINT_SEC": "30",
+        "SOLVE_SPOOL_TTL_HOURS": "bad",
+    })
+    assert spool == SolveSpool(tmp_path, checkpoint_sec=30.0, ttl_sec=24 * 3600)
+
+
+def test_frames_round_trip_compactly():
+    df = _frame()
+    clone = unpack_frame(pack_frame(df))
+    assert list(clone.columns) == list(df.columns)
+    assert clone.to_dict("list") == df.to_dict("list")
+    assert clone.attrs == df.attrs
+    big = pd.concat([df] * 200, ignore_index=True)
+    assert len(pack_frame(big)) < len(big.to_csv()) / 10
+
+
+def test_worker_runs_a_job_and_the_ui_fetches_it(tmp_path):
+    spool = SolveSpool(tmp_path, checkpoint_sec=2.0)
+    job_id = spool.submit(SolveRequest(_data(), env="test", target=2.0), start_worker=False)
+    assert spool.status(job_id).state == "queued"
+    assert run_worker(spool, idle_exit=0) == 1
+    status = spool.status(job_id)
+    assert status.finished and status.state == "done" and status.segments >= 1
+    fetched = spool.fetch(job_id)
+    assert list(fetched.df.columns)[:2] == ["Date", "Day"]
+    assert fetched.request.data == _data()
+    spool.discard(job_id)
+    assert spool.status(job_id) is None and not list((tmp_path / "jobs").iterdir())
+
+
+def test_orphaned_job_resumes_from_its_checkpoint(tmp_path):
+    spool = SolveSpool(tmp_path)
+    job_id = spool.submit(SolveRequest(_data(), env="test", target=60.0), start_worker=False)
+    job = tmp_path / "jobs" / job_id
+    (job / "claim").write_text(json.dumps({"worker": "dead", "generation": 0}))
+    (job / "best.pkl").write_bytes(pack_frame(_frame()))
+    state = {"state": "running", "elapsed": 60.0, "segments": 3, "objective": 12.0}
+    (job / "state.json").write_text(json.dumps(state))
+    assert spool.claim_next() is None  # its worker may still be alive
+    old = time.time() - 60
+    for name in ("claim", "state.json"):
+        os.utime(job / name, (old, old))
+    run_worker(spool, idle_exit=0)
+    status = spool.status(job_id)
+    assert status.state == "done" and status.segments == 3  # budget already spent
+    assert spool.fetch(job_id).df.to_dict("list") == _frame().to_dict("list")
+
+
+def _orphan(spool):
+    job_id = spool.submit(SolveRequest(_data(), env="test", target=60.0), start_worker=False)
+    job = spool.root / "jobs" / job_id
+    (job / "claim").write_text(json.dumps({"worker": "dead", "generation": 0}))
+    (job / "state.json").write_text(json.dumps({"state": "running"}))
+    old = time.time() - 60
+    for name in ("claim", "state.json"):
+        os.utime(job / name, (old, old))
+    return job_id
+
+
+def test_concurrent_workers_take_over_a_stale_claim_exactly_once(tmp_path):
+    import threading
+
+    spool = SolveSpool(tmp_path)
+    for _ in range(20):
+        job_id = _orphan(spool)
+        barrier = threading.Barrier(2)
+        won = {}
+
+        def claim(worker):
+            barrier.wait()
+            won[worker] = spool.claim_next(worker)
+
+        threads = [threading.Thread(target=claim, args=(w,)) for w in ("A", "B")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted(won.values(), key=str) == [job_id, None]
+        winner = next(w for w, got in won.items() if got)
+        assert SolveSpool._read_claim(tmp_path / "jobs" / job_id) == (winner, 1)
+        spool.discard(job_id)
+
+
+def test_a_late_takeover_of_an_already_replaced_claim_loses(tmp_path):
+    spool = SolveSpool(tmp_path)
+    job_id = _orphan(spool)
+    job = tmp_path / "jobs" / job_id
+    assert spool.claim_next("A") == job_id
+    # B judged generation 0 stale before A replaced it, and only now acts.
+    assert not spool._take_over(job, 0, "B")
+    assert SolveSpool._read_claim(job) == ("A", 1)
+    assert spool.claim_next("B") is None  # A's claim is fresh
+
+
+def test_a_claim_that_does_not_parse_is_never_taken_over(tmp_path):
+    spool = SolveSpool(tmp_path)
+    job_id = _orphan(spool)
+    job = tmp_path / "jobs" / job_id
+    (job / "claim").write_text("999999")
+    old = time.time() - 60
+    os.utime(job / "claim", (old, old))
+    assert spool.claim_next("A") is None
+    assert (job / "claim").read_text() == "999999"
+
+
+def _segment_until_stopped(monkeypatch):
+    """Patch in a solve that runs its whole window unless it is cancelled."""
+    import model.optimiser
+    from model.optimiser import SolveCancelled
+
+    def solve(data, *, progress, time_limit_sec, **_kwargs):
+        deadline = time.monotonic() + time_limit_sec
+        while not progress.cancelled:
+            if time.monotonic() > deadline:
+                raise RuntimeError("CP-SAT status UNKNOWN")
+            time.sleep(0.05)
+        raise SolveCancelled("The solve was stopped before it found a schedule.")
+
+    monkeypatch.setattr(model.optimiser, "build_schedule", solve)
+
+
+def _run_in_background(spool, job_id):
+    import threading
+
+    thread = threading.Thread(target=run_worker, args=(spool,), kwargs={"idle_exit": 0})
+    thread.start()
+    deadline = time.monotonic() + 10
+    while spool.status(job_id) is None or spool.status(job_id).state != "running":
+        assert time.monotonic() < deadline, "the job never started"
+        time.sleep(0.05)
+    return thread
+
+
+@pytest.mark.parametrize("stop", ["cancel", "discard"])
+def test_cancel_or_discard_stops_the_running_segment(tmp_path, monkeypatch, stop):
+    _segment_until_stopped(monkeypatch)
+    spool = SolveSpool(tmp_path, checkpoint_sec=60.0)
+    job_id = spool.submit(SolveRequest(_data(), env="test", target=60.0), start_worker=False)
+    thread = _run_in_background(spool, job_id)
+    started = time.monotonic()
+    getattr(spool, stop)(job_id)
+    thread.join(30)
+    assert not thread.is_alive() and time.monotonic() - started < 10
+    if stop == "cancel":
+        status = spool.status(job_id)
+        assert status.state == "cancelled" and status.error is None
+        assert not status.infeasible
+    else:
+        assert spool.status(job_id) is None
+
+
+def test_worker_segments_use_the_deployment_core_cap(tmp_path, monkeypatch):
+    import model.admission
+    import model.optimiser
+
+    monkeypatch.setenv("SOLVE_MAX_CORES", "3")
+    monkeypatch.setattr(model.admission, "_ADMISSION", None)
+    workers = []
+
+    def solve(data, *, num_workers=None, **_kwargs):
+        workers.append(num_workers)
+        df = _frame()
+        df.attrs["solver_status"] = "OPTIMAL"
+        return df
+
+    monkeypatch.setattr(model.optimiser, "build_schedule", solve)
+    spool = SolveSpool(tmp_path)
+    job_id = spool.submit(SolveRequest(_data(), env="test", target=60.0), start_worker=False)
+    run_worker(spool, idle_exit=0)
+    assert spool.status(job_id).state == "done" and workers == [3]
+
+
+def test_cancel_before_a_schedule_finishes_without_one(tmp_path):
+    spool = SolveSpool(tmp_path)
+    job_id = spool.submit(SolveRequest(_data(), env="test", target=60.0), start_worker=False)
+    spool.cancel(job_id)
+    assert spool.status(job_id).cancel
+    run_worker(spool, idle_exit=0)
+    fetched = spool.fetch(job_id)
+    assert fetched.status.state == "cancelled" and fetched.df is None
+    assert spool.status("../../etc") is None
+
+
+def test_worker_module_runs_as_a_process(tmp_path):
+    spool = SolveSpool(tmp_path)
+    job_id = spool.submit(SolveRequest(_data(), env="test", target=1.0), start_worker=False)
+    root = Path(__file__).resolve().parent.parent
+    subprocess.run(
+        [sys.executable, "-m", "model.solve_worker", str(tmp_path), "--idle-exit", "0"],
+        cwd=root, check=True, timeout=120,
+    )
+    assert spool.status(job_id).finished
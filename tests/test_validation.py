@@ -512,3 +512,73 @@ def test_no_capacity_warnings_for_comfortable_config():
         "min_gap" in w or "Structural workload" in w or "very tight" in w
         for w in warns
     )
+
+
+def test_checks_rerun_only_for_the_edited_section(monkeypatch):
+    import dataclasses
+    import functools
+
+    from model import validation
+
+    ran = []
+
+    def counted(check):
+        @functools.wraps(check.run)
+        def run(*args):
+            ran.append(check.run.__name__)
+            return check.run(*args)
+
+        return check._replace(run=run)
+
+    for name in ("_INPUT_CHECKS", "_WARNING_CHECKS"):
+        monkeypatch.setattr(validation, name, tuple(map(counted, getattr(validation, name))))
+    resolved = []
+    real_block_for = validation.block_for
+    monkeypatch.setattr(
+        validation, "block_for", lambda data, block: resolved.append(1) or real_block_for(data, block)
+    )
+    monkeypatch.setattr(validation, "_CHECK_RESULTS", type(validation._CHECK_RESULTS)())
+
+    data = _data(avoid_pairs=[("A", "B")])
+    first = (validate_input(data), config_warnings(data))
+    assert len(ran) == len(validation._INPUT_CHECKS) + len(validation._WARNING_CHECKS)
+    ran.clear()
+    resolved.clear()
+    # An identical configuration rebuilt from scratch runs nothing, not even
+    # the block resolution the night-float and reduction advisories read.
+    rebuilt = _data(avoid_pairs=[("A", "B")])
+    assert (validate_input(rebuilt), config_warnings(rebuilt)) == first
+    assert ran == [] and resolved == []
+
+    edited = dataclasses.replace(rebuilt, avoid_pairs=[("A", "A")])
+    problems = validate_input(edited)
+    assert ran == ["_avoid_pair_issues"]
+    assert "Avoid pair lists 'A' with themselves." in problems
+    config_warnings(edited)
+    ran.clear()
+    config_warnings(
+        dataclasses.replace(edited, leaves=[("A", date(2023, 1, 1), date(2023, 1, 4))])
+    )
+    assert set(ran) == {"_leave_rotator_warnings", "_blackout_warnings"}
+    assert not resolved
+
+
+def test_memoised_results_match_a_fresh_run():
+    import dataclasses
+
+    from model import validation
+
+    data = _data()
+    edits = [
+        dict(leaves=[("A", date(2023, 1, 1), date(2023, 1, 4))]),
+        dict(juniors=["A"]),
+        dict(min_gap=-1),
+        dict(extra_points={"A": 3.0}, max_total={"A": 1.0}),
+        dict(juniors=["A", "B"], min_gap=0),
+        dict(leaves=[]),
+    ]
+    for edit in edits:
+        data = dataclasses.replace(data, **edit)
+        memoised = (validate_input(data), config_warnings(data))
+        validation._CHECK_RESULTS.clear()
+        assert (validate_input(data), config_warnings(data)) == memoised
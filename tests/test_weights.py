@@ -110,6 +110,53 @@ def test_rotator_and_factor_compose():
     assert availability_weights(data)["A"] == pytest.approx(4 * 0.5)
 
 
+def test_weights_equal_the_day_by_day_sum_exactly():
+    # Overlapping perks, open-ended and out-of-block windows, a group factor,
+    # an uncompensated blackout and NF rest days: the array build must give
+    # bit-for-bit the same totals as summing person_factor day by day.
+    from datetime import timedelta
+
+    from model.data_models import Blackout, NightFloatAssignment
+
+    start, end = date(2023, 1, 2), date(2023, 3, 5)
+    data = _data(
+        start_date=start,
+        end_date=end,
+        juniors=["A", "B", "C"],
+        seniors=["D"],
+        perks=[
+            Perk("A", 0.9, date(2022, 12, 1), date(2023, 1, 20)),
+            Perk("A", 1 / 3, date(2023, 1, 10), None),
+            Perk("B", 0.7777),
+        ],
+        group_factors={"R2": 0.85},
+        resident_groups={"A": "R2", "C": "R2"},
+        rotators=[("C", date(2023, 1, 15), date(2023, 2, 10)), ("C", date(2023, 3, 1), date(2023, 4, 1))],
+        leaves=[("B", date(2023, 2, 1), date(2023, 2, 3), False), ("D", date(2023, 1, 1), date(2023, 1, 5), True)],
+        named_groups={"G": ["D"]},
+        blackouts=[Blackout("G", (), date(2023, 2, 20), date(2023, 2, 22), True, False)],
+        nf_assignments=[NightFloatAssignment("A", date(2023, 2, 6), date(2023, 2, 10), (), 2)],
+    )
+    off = {
+        "B": [(date(2023, 2, 1), date(2023, 2, 3))],
+        "D": [(date(2023, 2, 20), date(2023, 2, 22))],
+        "A": [(date(2023, 2, 6), date(2023, 2, 12))],
+    }
+    rotating = {"C": [(date(2023, 1, 15), date(2023, 2, 10)), (date(2023, 3, 1), date(2023, 4, 1))]}
+    expected = {}
+    for person in ["A", "B", "C", "D"]:
+        total = 0.0
+        for i in range((end - start).days + 1):
+            day = start + timedelta(days=i)
+            if person in rotating and not any(s <= day <= e for s, e in rotating[person]):
+                continue
+            if any(s <= day <= e for s, e in off.get(person, ())):
+                continue
+            total += person_factor(person, day, data)
+        expected[person] = total
+    assert availability_weights(data) == expected
+
+
 def test_reference_weights_ignore_everything():
     data = _data(
         rotators=[("A", MON, THU)],
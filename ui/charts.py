@@ -17,9 +17,13 @@ value labels and the table above it.
 """
 from __future__ import annotations
 
-import altair as alt
 import pandas as pd
 
+from ui.profiler import profiled
+
+# Altair is imported inside the builders below: it is the heaviest import on
+# the page, and only a chart that is actually drawn needs it.
+
 __all__ = [
     "ROLE_HUES",
     "WEEKEND_HUE",
@@ -102,6 +106,7 @@ def _split_columns(order, spec) -> list:
 
 def _resident_axis(order, spec):
     """A y-axis that always shows every resident's name."""
+    import altair as alt
     return alt.Y(
         "Resident:N",
         sort=list(order),
@@ -119,6 +124,7 @@ def _resident_axis(order, spec):
 
 
 def _value_axis(title: str, headroom_max: float | None, spec):
+    import altair as alt
     scale = alt.Scale(domainMin=0, domainMax=headroom_max, nice=False) if headroom_max \
         else alt.Scale(domainMin=0)
     return alt.X(
@@ -136,6 +142,7 @@ def _value_axis(title: str, headroom_max: float | None, spec):
 
 
 def _title(text: str, subtitle: str):
+    import altair as alt
     return alt.Title(
         text, subtitle=subtitle, anchor="start",
         fontSize=15, color=_INK, subtitleFontSize=11, subtitleColor=_INK_MUTED,
@@ -144,6 +151,7 @@ def _title(text: str, subtitle: str):
 
 
 def _legend(spec, title=None):
+    import altair as alt
     return alt.Legend(
         title=title, orient="top", direction="horizontal",
         labelFontSize=spec["name_font"] + 1, labelColor=_INK,
@@ -163,6 +171,7 @@ def _finish(chart):
 
 def _workload_column(long, order, hue, target, spec, show_legend: bool):
     """One column of the workload chart (all of it, unless compact splits it)."""
+    import altair as alt
     subset = long[long["Resident"].isin(order)]
     peak = float(long["Points"].max() or 0.0)
     headroom = max(peak * 1.12, (target or 0.0) * 1.12, 1.0)
@@ -229,6 +238,7 @@ def _workload_column(long, order, hue, target, spec, show_legend: bool):
     )
 
 
+@profiled()
 def workload_chart(role_frame, role: str, target: float | None, density: str = COMFORTABLE):
     """Grouped bars per resident: total points and, beside them, weekend points.
 
@@ -238,6 +248,7 @@ def workload_chart(role_frame, role: str, target: float | None, density: str = C
     long roster out in two side-by-side columns (still every resident, still
     every name) so a big department fits one screen.
     """
+    import altair as alt
     hue = ROLE_HUES.get(role, ROLE_HUES["Junior"])["main"]
     long = role_frame.melt(
         id_vars=["Resident"],
@@ -265,6 +276,7 @@ def workload_chart(role_frame, role: str, target: float | None, density: str = C
     )
 
 
+@profiled()
 def cumulative_chart(cum_frame, role: str, density: str = COMFORTABLE):
     """Stacked bars: what each resident carried in, plus what they earned now.
 
@@ -272,6 +284,7 @@ def cumulative_chart(cum_frame, role: str, density: str = COMFORTABLE):
     surface-coloured gap, with the cumulative figure labelled at the end of
     each bar so the standing is readable without hovering.
     """
+    import altair as alt
     hues = ROLE_HUES.get(role, ROLE_HUES["Junior"])
     totals = (
         cum_frame.drop_duplicates("Resident")[["Resident", "Cumulative"]]
@@ -348,8 +361,10 @@ def cumulative_chart(cum_frame, role: str, density: str = COMFORTABLE):
     )
 
 
+@profiled()
 def standings_chart(ledger: dict, density: str = COMFORTABLE):
     """The ledger panel's carried-in standings (total + weekend side by side)."""
+    import altair as alt
     rows = [
         {"Resident": person, "Kind": kind, "Points": float(entry.get(dim, 0.0))}
         for person, entry in (ledger or {}).items()
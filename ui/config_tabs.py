@@ -2,7 +2,11 @@
 from __future__ import annotations
 
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import replace
+from importlib.util import find_spec
 
 import pandas as pd
 import streamlit as st
@@ -31,8 +35,12 @@ from model.data_models import (
     normalized_nf_assignments,
     normalized_reductions,
 )
+from model.admission import solve_admission
 from model.demo_data import sample_shifts, sample_names
-from model.optimiser import SolveProgress, build_schedule, compute_time_limit
+from model.fairness import points_spread
+from model.optimiser import SolveCancelled, SolveProgress, build_schedule, compute_time_limit
+from model.resolved import resolve_block
+from model.solve_worker import SolveRequest, spool_from_env
 from model.validation import validate_input, config_warnings
 
 from ui.editors import (
@@ -57,10 +65,15 @@ from ui.editors import (
 )
 from ui.diagnostics import render_diagnostics
 from ui.ledger_panel import render_ledger_panel
+from ui.profiler import profiled
 from ui.state import Keys, config_fingerprint, flash, restore_display_state, set_result
 from ui.theme import card_container, render_section_header, render_status
 from ui.uploads import consume_upload_once
 
+# Timed where the UI calls them; the model layer carries no UI hooks.
+validate_input = profiled("validate_input")(validate_input)
+config_warnings = profiled("config_warnings")(config_warnings)
+
 
 def load_demo_data_once() -> None:
     """Preload example shifts/names the first time Test mode is ticked."""
@@ -302,16 +315,17 @@ def _availability_import_section(people: list) -> None:
             mime="text/csv",
             width="stretch",
         )
-        try:
+        if find_spec("openpyxl") is not None:
+            # Built on click, so openpyxl is only imported when someone wants it.
             tcols[1].download_button(
                 "Template (Excel)",
-                availability_template_xlsx(),
+                availability_template_xlsx,
                 file_name="availability_template.xlsx",
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                 width="stretch",
             )
-        except RuntimeError as exc:  # pragma: no cover - openpyxl missing
-            tcols[1].info(str(exc))
+        else:  # pragma: no cover - openpyxl missing
+            tcols[1].info("openpyxl is required to build the .xlsx template.")
         uploaded = st.file_uploader(
             "Upload responses (xlsx / csv)", type=["xlsx", "csv"], key="avail_upload"
         )
@@ -387,6 +401,7 @@ def _inline_config_hints(config: InputData) -> list:
     ]
 
 
+@profiled()
 def session_config_from_state() -> InputData:
     """Assemble the active configuration from canonical session state."""
     weekend_days = [
@@ -423,6 +438,7 @@ def _display_state() -> dict:
     }
 
 
+@profiled()
 def _render_setup_workspace() -> None:
     render_section_header(
         "Build the scheduling block",
@@ -491,6 +507,7 @@ def _render_setup_workspace() -> None:
             roster_editor()
 
 
+@profiled()
 def _render_coverage_workspace() -> None:
     render_section_header(
         "Shape coverage and availability",
@@ -546,6 +563,7 @@ def _render_coverage_workspace() -> None:
             closures_editor(shift_labels, default_start=start_date, default_end=end_date)
 
 
+@profiled()
 def _render_policies_workspace() -> None:
     render_section_header(
         "Tune fairness and operational policy",
@@ -594,6 +612,7 @@ def _render_policies_workspace() -> None:
             holidays_editor(default_date=start_date)
 
 
+@profiled()
 def _render_history_workspace(session_config: InputData) -> dict | None:
     render_section_header(
         "Move safely between blocks",
@@ -720,6 +739,7 @@ def _rule_count() -> int:
     return sum(len(st.session_state.get(key) or {}) for key in keys)
 
 
+@profiled()
 def _render_review_workspace(session_config: InputData, carryover_ledger) -> None:
     render_section_header(
         "Review, validate, and generate",
@@ -823,6 +843,7 @@ def apply_pending_updates() -> None:
         )
 
 
+@profiled()
 def render_application() -> None:
     """Render the complete seven-workspace application in one stable script run."""
     apply_pending_updates()
@@ -928,6 +949,8 @@ _SOLVE_CHUNK_MAX = 300.0    # largest segment (within demonstrated hosting toler
 _SOLVE_MAX_SEGMENTS = 5.0   # aim for at most ~5 presolve payments per run
 _SOLVE_SINGLE_MAX = 300.0   # at/below this total, solve once — no chunking overhead
 _SOLVE_STALE_ROUNDS = 3     # consecutive no-improvement segments before stopping early
+_PROGRESS_POLL_SEC = 1.0    # progress-panel refresh while a solve runs
+_SPOOL_QUERY = "solve"      # URL parameter that lets a reloaded page re-attach
 
 
 def _chunk_seconds(target: float) -> float:
@@ -949,26 +972,14 @@ def _attr(df, key):
         return None
 
 
-def _solve_total_score(df, data) -> float:
-    """A small fairness score (lower = fairer) used only to detect when extra
-    segments stop helping, so a long run can stop early once it has settled."""
-    try:
-        from model.fairness import calculate_points
-        pts = calculate_points(df, data)
-        totals = [v.get("total", 0.0) for v in pts.values()] or [0.0]
-        weekends = [v.get("weekend", 0.0) for v in pts.values()] or [0.0]
-        return (max(totals) - min(totals)) + 0.5 * (max(weekends) - min(weekends))
-    except Exception:  # pragma: no cover - never let scoring break a solve
-        return float("inf")
-
-
 def _begin_solve_job(
     *, data, env, ledger, label_carryover, target, warm_start_df, note,
     seed_offset: int = 0,
 ) -> None:
     """Queue a (possibly chunked) solve. The first segment runs on the next
     script pass via ``_advance_solve_job``."""
-    st.session_state[Keys.SOLVE_SUMMARY] = None  # a new run supersedes the last summary
+    st.session_state[Keys.SOLVE_SUMMARY] = None  # a new run supersedes the last outcome
+    st.session_state[Keys.SOLVE_FAILURE] = None
     # A continue starts from a schedule whose stored objective is exact and
     # comparable (same data/ledger -> same model) — unless the user manually
     # edited it, which invalidates the stored value. Seeding best_score with it
@@ -976,9 +987,26 @@ def _begin_solve_job(
     baseline_score = None
     if warm_start_df is not None and not st.session_state.get(Keys.MANUALLY_EDITED):
         baseline_score = _attr(warm_start_df, "objective")
+    spool = spool_from_env()
+    if spool is not None:
+        # Opt-in out-of-process worker: this session only keeps the job id (in
+        # the URL too, so a reloaded page picks the run up again).
+        request = SolveRequest(
+            data=data, ledger=ledger, label_carryover=label_carryover, env=env,
+            target=float(target) if target and target > 0 else _SOLVE_CHUNK_SEC,
+            warm_start_df=warm_start_df, baseline_score=baseline_score,
+            seed_offset=int(seed_offset),
+        )
+        job_id = spool.submit(request)
+        st.query_params[_SPOOL_QUERY] = job_id
+        st.session_state[Keys.SOLVE_JOB] = {"spool_id": job_id, "note": note}
+        return
     st.session_state[Keys.SOLVE_JOB] = {
         "data": data, "env": env, "ledger": ledger,
         "label_carryover": label_carryover,
+        # Resolved once for the whole run: every segment and the Results page
+        # share the overlay, closures, weights, caps and targets.
+        "block": resolve_block(data, ledger, label_carryover=label_carryover),
         "target": float(target) if target and target > 0 else 0.0,
         "elapsed": 0.0,           # budget accounting (requested chunk seconds)
         "chunk": _chunk_seconds(float(target)) if target and target > 0 else _SOLVE_CHUNK_SEC,
@@ -1000,8 +1028,11 @@ def _finalize_solve_job(job) -> None:
     next pass to show, then clear the job. Rendering is deferred to
     ``_render_last_solve_summary`` so the trailing rerun can't wipe it."""
     st.session_state[Keys.SOLVE_JOB] = None
+    solve_admission().release(job.get("ticket"))  # stopped while queued
     df = job.get("best_df")
     if df is None:
+        if job.get("cancel"):
+            flash("Stopped before the solver found a schedule.")
         return
     # Rewrite the run timings to describe the WHOLE run rather than the last
     # ~25s segment, so the results-tab verdict ("still improving — try Ns")
@@ -1018,7 +1049,7 @@ def _finalize_solve_job(job) -> None:
             df.attrs["last_improvement_sec"] = job.get("last_improve_wall")
         except (AttributeError, TypeError):  # pragma: no cover - stub frames
             pass
-    set_result(df, job["data"], job["ledger"])
+    set_result(df, job["data"], job["ledger"], block=job.get("block"))
     shift_cols = [c for c in df.columns if c not in ("Date", "Day")]
     unfilled = int((df[shift_cols] == "Unfilled").sum().sum()) if shift_cols else 0
     st.session_state[Keys.SOLVE_SUMMARY] = {
@@ -1054,47 +1085,170 @@ def _render_last_solve_summary() -> None:
             st.rerun()
 
 
-def _advance_solve_job(job) -> None:
-    """Run one solve segment, show progress, then rerun for the next segment or
-    finalize. Called on every pass while a solve job is active."""
-    data = job["data"]
-    target = job["target"]
-    elapsed = job["elapsed"]
-    remaining = (target - elapsed) if target else _SOLVE_CHUNK_SEC
-    if job.get("cancel") or (target and remaining <= 0.5):
+def _offer_min_gap_retry(data) -> None:
+    """After an infeasible solve, offer a one-click retry with a smaller gap."""
+    if data.min_gap > 0:
+        st.caption("No feasible schedule — relax a constraint and try again:")
+        if st.button(f"Retry with min_gap {data.min_gap - 1}"):
+            st.session_state[Keys.RETRY_CONFIG] = (
+                replace(data, min_gap=data.min_gap - 1),
+                f"Relaxed minimum gap to {data.min_gap - 1} to find a feasible schedule.",
+            )
+            st.session_state[Keys.PENDING_STATE] = {Keys.MIN_GAP: data.min_gap - 1}
+            st.rerun()
+
+
+def _fail_solve_job(job, message: str, *, retry_data=None) -> None:
+    """End a run on an error. Any schedule it already found becomes the
+    result; the message (with a relaxed-gap retry when ``retry_data`` is given)
+    is shown under the Generate button until the next solve begins."""
+    st.session_state[Keys.SOLVE_JOB] = None
+    st.session_state[Keys.SOLVE_FAILURE] = {"message": message, "retry": retry_data}
+    if job.get("best_df") is not None:
+        _finalize_solve_job(job)  # never discard schedules already found
+
+
+def _render_last_solve_failure() -> None:
+    failure = st.session_state.get(Keys.SOLVE_FAILURE)
+    if not failure:
+        return
+    st.error(failure["message"])
+    if failure.get("retry") is not None:
+        _offer_min_gap_retry(failure["retry"])
+
+
+def _finish_spool_job(spool, job_id, fetched) -> None:
+    """Hand a spooled run's schedule to the session exactly as the in-session
+    runner would, delete the job from the spool, then rerun the page."""
+    status, request = fetched.status, fetched.request
+    spool.discard(job_id)
+    st.query_params.pop(_SPOOL_QUERY, None)
+    st.session_state[Keys.SOLVE_JOB] = None
+    job = {
+        "data": request.data, "ledger": request.ledger, "best_df": fetched.df,
+        "target": status.target, "wall_total": status.wall_total,
+        "last_improve_wall": status.last_improve_wall,
+        "cancel": status.cancel or status.state == "cancelled",
+    }
+    if status.state == "failed":
+        _fail_solve_job(
+            job, status.error or "The background solve failed.",
+            retry_data=request.data if status.infeasible and fetched.df is None else None,
+        )
+    else:
         _finalize_solve_job(job)
-        st.rerun()  # show the summary / Generate controls right away
+    st.rerun()
+
 
+def _cancel_solve_job() -> None:
+    """Stop button callback: mark the run stopped and end the running search
+    now, keeping the best schedule found so far."""
+    job = st.session_state.get(Keys.SOLVE_JOB)
+    if job is None:
+        return
+    if "spool_id" in job:
+        spool = spool_from_env()
+        if spool is not None:
+            spool.cancel(job["spool_id"])
+        job["cancelling"] = True
+        return
+    job["cancel"] = True
+    running = job.get("running")
+    if running is not None:
+        running["progress"].cancel()
+
+
+def _poll_spool_job(job) -> None:
+    """Progress panel for a run on the out-of-process worker: poll its status
+    and fetch the schedule once it finishes (or at once on Stop, from the last
+    checkpoint)."""
+    job_id = job["spool_id"]
+    spool = spool_from_env()
+    status = spool.status(job_id) if spool is not None else None
+    if status is None:
+        st.query_params.pop(_SPOOL_QUERY, None)
+        _fail_solve_job(job, "The background solve is no longer available. Generate again.")
+        st.rerun()
+    if status.finished or status.cancel:
+        fetched = spool.fetch(job_id)
+        if fetched is not None and (status.finished or fetched.df is not None):
+            _finish_spool_job(spool, job_id, fetched)
+    spool.ensure_worker()  # relaunch a worker that died or idled out
+
+    if job.get("note"):
+        st.info(job["note"])
+    target = status.target
+    if status.state == "queued":
+        st.progress(0.0, text="Queued — waiting for the solve worker…")
+    else:
+        st.progress(
+            min(0.99, status.elapsed / target) if target else 0.5,
+            text=f"Optimising… {status.elapsed:.0f}s / {target:.0f}s",
+        )
+    if status.improvements:
+        st.caption(f"Better schedules found so far: {status.improvements}")
+    if status.objective is not None:
+        st.caption(f"Best objective so far: {status.objective:,.0f} (lower is fairer)")
+    if status.cancel or job.get("cancelling"):
+        st.caption("Stopping — finishing the current segment to keep its schedule…")
+    else:
+        st.caption(
+            "This runs in a background worker, so it keeps going if the page "
+            "reloads or the app restarts. You can leave this page."
+        )
+        st.button(
+            "✖ Stop and keep the current schedule", key="cancel_solve_btn",
+            on_click=_cancel_solve_job,
+        )
+
+
+_SEGMENT_POOL: ThreadPoolExecutor | None = None
+_SEGMENT_POOL_LOCK = threading.Lock()
+
+
+def _segment_pool() -> ThreadPoolExecutor:
+    """Threads running in-session solve segments, shared by every session.
+
+    Admission bounds how many segments run at once, so one thread per core of
+    its capacity is always enough.
+    """
+    global _SEGMENT_POOL
+    with _SEGMENT_POOL_LOCK:
+        if _SEGMENT_POOL is None:
+            _SEGMENT_POOL = ThreadPoolExecutor(
+                max_workers=solve_admission().capacity, thread_name_prefix="solve-segment"
+            )
+        return _SEGMENT_POOL
+
+
+def _start_segment(job) -> None:
+    """Queue the next segment for a CPU share and, once admitted, start it on
+    the segment pool. The progress panel collects it when it finishes."""
+    data = job["data"]
+    target = job["target"]
+    remaining = (target - job["elapsed"]) if target else _SOLVE_CHUNK_SEC
     # A short total solves in one segment; a long one is chunked so the page
     # returns often enough to survive reconnects. ``chunk`` can grow while the
-    # run has found no schedule yet (see the UNKNOWN branch below).
+    # run has found no schedule yet (see the UNKNOWN branch of
+    # ``_collect_segment``).
     chunk = float(job.get("chunk") or _SOLVE_CHUNK_SEC)
     if target and target <= _SOLVE_SINGLE_MAX:
         this_chunk = target
     else:
         this_chunk = min(chunk, remaining) if target else chunk
 
-    if job.get("note"):
-        st.info(job["note"])
-    bar_frac = min(0.99, elapsed / target) if target else 0.5
-    label = (
-        f"Optimising… {elapsed:.0f}s / {target:.0f}s"
-        if target else f"Optimising… {elapsed:.0f}s"
-    )
-    st.progress(bar_frac, text=label)
-    found = int(job.get("improvements") or 0)
-    if found:
-        st.caption(f"Better schedules found so far: {found}")
-    st.caption(
-        "This runs in short bursts and picks up where it left off, so it keeps "
-        "going even if the page reloads. Leave this tab open."
-    )
-    if st.button("✖ Stop and keep the current schedule", key="cancel_solve_btn"):
-        job["cancel"] = True
-        st.session_state[Keys.SOLVE_JOB] = job
-        st.rerun()
-
-    progress_sink = SolveProgress()
+    # Every segment queues for a share of the host's cores, so concurrent
+    # sessions split the CPU instead of oversubscribing it.
+    admission = solve_admission()
+    ticket = job.get("ticket")
+    if ticket is None:
+        ticket = job["ticket"] = admission.enqueue(st.session_state[Keys.SESSION_ID])
+    workers = admission.try_admit(ticket)
+    if workers is None:
+        return  # still queued: the next refresh asks again
+    job["ticket"] = None  # the segment gives its share back when it ends
+
+    sink = SolveProgress()
     had_warm = job.get("best_df") is not None
     seg = int(job.get("segment") or 0)
     job["segment"] = seg + 1
@@ -1107,13 +1261,38 @@ def _advance_solve_job(job) -> None:
     # for reproducibility.
     shift = int(job.get("seed_offset") or 0) + seg
     seg_data = data if shift == 0 else replace(data, seed=(data.seed or 0) + shift)
+    block = job.get("block")
+    if block is not None and seg_data is not data:
+        block = block.with_data(seg_data)  # only the seed differs
+    future = _segment_pool().submit(
+        build_schedule, seg_data, env=job["env"], ledger=job["ledger"],
+        label_carryover=job["label_carryover"],
+        time_limit_sec=this_chunk, warm_start_df=job.get("best_df"),
+        progress=sink, block=block, num_workers=workers,
+    )
+    future.add_done_callback(lambda _: admission.release(ticket))
+    job["running"] = {
+        "future": future, "progress": sink, "chunk": this_chunk,
+        "had_warm": had_warm, "started": time.monotonic(),
+    }
+
+
+def _collect_segment(job, running) -> bool:
+    """Fold a finished segment into the run. Returns False once the run has
+    ended (finalized or failed), True while it should continue."""
+    data = job["data"]
+    target = job["target"]
+    elapsed = job["elapsed"]
+    this_chunk = running["chunk"]
+    chunk = float(job.get("chunk") or _SOLVE_CHUNK_SEC)
     try:
-        df = build_schedule(
-            seg_data, env=job["env"], ledger=job["ledger"],
-            label_carryover=job["label_carryover"],
-            time_limit_sec=this_chunk, warm_start_df=job.get("best_df"),
-            progress=progress_sink,
-        )
+        df = running["future"].result()
+    except SolveCancelled:
+        # Stopped before this segment found a schedule: the run keeps what it has.
+        spent = min(this_chunk, time.monotonic() - running["started"])
+        job["elapsed"] = elapsed + spent
+        job["wall_total"] = job.get("wall_total", 0.0) + spent
+        return True
     except RuntimeError as exc:
         if "UNKNOWN" in str(exc):
             # The window closed before this segment produced a schedule. With a
@@ -1128,34 +1307,18 @@ def _advance_solve_job(job) -> None:
                 job["stale_rounds"] = job.get("stale_rounds", 0) + 1
                 if out_of_budget or job["stale_rounds"] >= _SOLVE_STALE_ROUNDS:
                     _finalize_solve_job(job)
-                else:
-                    st.session_state[Keys.SOLVE_JOB] = job
-                st.rerun()
+                    return False
+                return True
             if not out_of_budget:
                 job["chunk"] = min(chunk * 2, _SOLVE_CHUNK_MAX)
-                st.session_state[Keys.SOLVE_JOB] = job
-                st.rerun()
-        st.session_state[Keys.SOLVE_JOB] = None
-        st.error(str(exc))
-        if job.get("best_df") is not None:
-            _finalize_solve_job(job)  # never discard schedules already found
-            return
-        if data.min_gap > 0:
-            st.caption("No feasible schedule — relax a constraint and try again:")
-            if st.button(f"Retry with min_gap {data.min_gap - 1}"):
-                st.session_state[Keys.RETRY_CONFIG] = (
-                    replace(data, min_gap=data.min_gap - 1),
-                    f"Relaxed minimum gap to {data.min_gap - 1} to find a feasible schedule.",
-                )
-                st.session_state[Keys.PENDING_STATE] = {Keys.MIN_GAP: data.min_gap - 1}
-                st.rerun()
-        return
+                return True
+        _fail_solve_job(
+            job, str(exc), retry_data=data if job.get("best_df") is None else None
+        )
+        return False
     except Exception as exc:  # noqa: BLE001
-        st.session_state[Keys.SOLVE_JOB] = None
-        st.error(str(exc))
-        if job.get("best_df") is not None:
-            _finalize_solve_job(job)  # never discard schedules already found
-        return
+        _fail_solve_job(job, str(exc))
+        return False
 
     seg_wall = _attr(df, "wall_time_sec")
     wall_before = job.get("wall_total", 0.0)
@@ -1164,8 +1327,8 @@ def _advance_solve_job(job) -> None:
     # Count genuinely better schedules: a warm-started segment's first solution
     # is just the hint being re-completed, not an improvement — counting it made
     # a stalled run look productive ("better schedules found" with no change).
-    seg_found = int(getattr(progress_sink, "solution_count", 0) or 0)
-    if had_warm and seg_found > 0:
+    seg_found = int(getattr(running["progress"], "solution_count", 0) or 0)
+    if running["had_warm"] and seg_found > 0:
         seg_found -= 1
     job["improvements"] = int(job.get("improvements") or 0) + seg_found
 
@@ -1180,12 +1343,12 @@ def _advance_solve_job(job) -> None:
     status_name = _attr(df, "solver_status")
     score = _attr(df, "objective")
     if score is None:
-        score = _solve_total_score(df, data)
+        score = points_spread(df, data)
     prev = job.get("best_score")
     if prev is None:
         baseline = job.get("best_df")
         improved = baseline is None or (
-            _solve_total_score(df, data) <= _solve_total_score(baseline, data)
+            points_spread(df, data) <= points_spread(baseline, data)
         )
         take = improved
     else:
@@ -1203,9 +1366,89 @@ def _advance_solve_job(job) -> None:
     converged = status_name == "OPTIMAL" or job["stale_rounds"] >= _SOLVE_STALE_ROUNDS
     if converged or (target and job["elapsed"] >= target - 0.5):
         _finalize_solve_job(job)
+        return False
+    return True
+
+
+def _render_solve_progress(job) -> None:
+    """Bar, improvements, best objective and the Stop button for a run."""
+    running = job.get("running")
+    target = job["target"]
+    elapsed = job["elapsed"]
+    sink = running["progress"] if running is not None else None
+    if running is not None:
+        elapsed += min(running["chunk"], time.monotonic() - running["started"])
+    if job.get("note"):
+        st.info(job["note"])
+    bar_frac = min(0.99, elapsed / target) if target else 0.5
+    if running is None:
+        ticket = job.get("ticket")
+        ahead = solve_admission().position(ticket) - 1 if ticket is not None else 0
+        label = (
+            f"Queued — {ahead} solve(s) ahead of this one" if ahead
+            else "Queued — starting as soon as a CPU share frees up"
+        )
+    elif target:
+        label = f"Optimising… {elapsed:.0f}s / {target:.0f}s"
     else:
-        st.session_state[Keys.SOLVE_JOB] = job
-    st.rerun()
+        label = f"Optimising… {elapsed:.0f}s"
+    st.progress(bar_frac, text=label)
+    found = int(job.get("improvements") or 0)
+    if sink is not None:
+        found += max(0, sink.solution_count - int(running["had_warm"]))
+    if found:
+        st.caption(f"Better schedules found so far: {found}")
+    objective = sink.objective if sink is not None else None
+    if objective is None and job.get("best_df") is not None:
+        objective = _attr(job["best_df"], "objective")
+    if objective is not None:
+        st.caption(f"Best objective so far: {objective:,.0f} (lower is fairer)")
+    if job.get("cancel"):
+        st.caption("Stopping — keeping the best schedule found so far…")
+        return
+    st.caption(
+        "This runs in short bursts and picks up where it left off, so it keeps "
+        "going even if the page reloads. Leave this tab open."
+    )
+    st.button(
+        "✖ Stop and keep the current schedule", key="cancel_solve_btn",
+        on_click=_cancel_solve_job,
+    )
+
+
+def _advance_solve_job(job) -> None:
+    """Drive an in-session run from the progress panel: fold in a finished
+    segment, start the next once admitted, and show progress. Only the end of
+    the run reruns the page."""
+    running = job.get("running")
+    if running is not None and running["future"].done():
+        job["running"] = None
+        if not _collect_segment(job, running):
+            st.rerun()
+    if job.get("running") is None:
+        target = job["target"]
+        if job.get("cancel") or (target and target - job["elapsed"] <= 0.5):
+            _finalize_solve_job(job)
+            st.rerun()  # show the summary / Generate controls right away
+        _start_segment(job)
+    _render_solve_progress(job)
+
+
+@profiled()
+def _solve_panel() -> None:
+    """The live progress of the active run.
+
+    Rendered as a fragment refreshing every ``_PROGRESS_POLL_SEC``: while a
+    solve runs only this panel re-executes, not the editors and validation of
+    every workspace. The page reruns once, when the run ends.
+    """
+    job = st.session_state.get(Keys.SOLVE_JOB)
+    if job is None:
+        st.rerun()  # ended on an earlier refresh
+    if "spool_id" in job:
+        _poll_spool_job(job)
+    else:
+        _advance_solve_job(job)
 
 
 def render_generate_and_solve(session_config, carryover_ledger) -> None:
@@ -1215,8 +1458,11 @@ def render_generate_and_solve(session_config, carryover_ledger) -> None:
     # A solve already in flight: show only its progress panel and advance it.
     # Never render a second Generate control while one is running.
     active = st.session_state.get(Keys.SOLVE_JOB)
+    if active is None and st.query_params.get(_SPOOL_QUERY) and spool_from_env():
+        active = {"spool_id": st.query_params[_SPOOL_QUERY]}  # reloaded mid-run
+        st.session_state[Keys.SOLVE_JOB] = active
     if active is not None:
-        _advance_solve_job(active)
+        st.fragment(_solve_panel, run_every=_PROGRESS_POLL_SEC)()
         return
 
     st.number_input(
@@ -1234,6 +1480,7 @@ def render_generate_and_solve(session_config, carryover_ledger) -> None:
     generate_clicked = st.button(
         "⚙️ Generate schedule", type="primary", width="stretch"
     )
+    _render_last_solve_failure()
     _render_last_solve_summary()
 
     # Precedence: a "keep optimising" continue warm-starts from the current
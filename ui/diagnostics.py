@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import pandas as pd
 import streamlit as st
 
+from model.admission import solve_admission
 from model.benchmarking import (
     SAFE_BENCHMARK_PRESETS,
     BenchmarkCase,
     benchmark_available,
     run_benchmark,
 )
+from ui.memory import budget_from_env, heavy_footprint, session_footprint
+from ui.profiler import current_profile, profiled, profiling_enabled
 from ui.state import Keys
 from ui.theme import card_container, render_section_header, render_status
 
@@ -19,6 +23,122 @@ def _preset_label(case: BenchmarkCase) -> str:
     return f"{scale} · {case.dimensions}"
 
 
+def _render_solver_load() -> None:
+    load = solve_admission().load()
+    with card_container(
+        "Solver load",
+        "Solves from every session share this server's cores; extra ones queue "
+        "until a share frees up.",
+    ):
+        cols = st.columns(4)
+        cols[0].metric("Cores in use", f"{load.cores_in_use} / {load.capacity}")
+        cols[1].metric("Running solves", load.running)
+        cols[2].metric("Queued solves", load.queued)
+        cols[3].metric("Sessions waiting", load.sessions_waiting)
+
+
+def _render_session_memory() -> None:
+    with card_container(
+        "Session memory",
+        "What this session keeps between reruns. The cap weighs only the heavy "
+        "entries; in the table, an object held under several keys counts once "
+        "and keys under 1 KB are left out.",
+    ):
+        rows = session_footprint(st.session_state)
+        budget = budget_from_env()
+        total = sum(row.bytes for row in rows)
+        counted = sum(heavy_footprint(st.session_state).values())
+        cols = st.columns(4)
+        cols[0].metric("This session", f"{total / 2**20:.1f} MB")
+        cols[1].metric("Counted against the cap", f"{counted / 2**20:.1f} MB")
+        cols[2].metric("Cap", f"{budget / 2**20:.0f} MB" if budget else "None")
+        jobs = st.session_state.get(Keys.EXPORT_CACHE)
+        offloaded = jobs is not None and jobs.store is not None
+        cols[3].metric("Large downloads", "On disk" if offloaded else "In memory")
+        released = st.session_state.get(Keys.MEMORY_RELEASED)
+        if released:
+            st.caption(
+                "Over the cap, this session last released: " + ", ".join(released)
+                + ". Each is rebuilt when next needed."
+            )
+        st.dataframe(
+            pd.DataFrame(
+                [
+                    {
+                        "Key": row.key,
+                        "Size (KB)": round(row.bytes / 1024, 1),
+                        "Shared with": row.shared_with or "",
+                    }
+                    for row in rows
+                    if row.shared_with or row.bytes >= 1024
+                ]
+            ),
+            hide_index=True,
+            width="stretch",
+        )
+
+
+def _render_rerun_profile() -> None:
+    with card_container(
+        "Rerun profile",
+        "Time spent in each part of the page over this session's recent reruns.",
+    ):
+        profile = current_profile() if profiling_enabled() else None
+        if profile is None:
+            st.caption(
+                "Profiling is off. Start the app with `RERUN_PROFILE=1` to time every "
+                "rerun section by section (`RERUN_PROFILE_RERUNS` sets how many reruns "
+                "are kept, default 50)."
+            )
+            return
+        rows = profile.stats()
+        if not rows:
+            st.caption("No reruns recorded yet; interact with the app, then come back.")
+            return
+        st.caption(
+            f"{profile.runs} run(s) recorded, including fragment refreshes; the "
+            f"latest {profile.window} samples per section are kept. This rerun is "
+            "not included yet."
+        )
+        st.dataframe(
+            pd.DataFrame(
+                [
+                    {
+                        "Section": row.section,
+                        "Samples": row.samples,
+                        "Last (ms)": round(row.last * 1000, 1),
+                        "Median (ms)": round(row.median * 1000, 1),
+                        "p90 (ms)": round(row.p90 * 1000, 1),
+                        "Max (ms)": round(row.max * 1000, 1),
+                    }
+                    for row in rows
+                ]
+            ),
+            hide_index=True,
+            width="stretch",
+        )
+        section = st.selectbox(
+            "Histogram for", [row.section for row in rows], key="rerun_profile_section"
+        )
+        import altair as alt
+
+        samples = pd.DataFrame({"ms": [s * 1000 for s in profile.samples(section)]})
+        st.altair_chart(
+            alt.Chart(samples)
+            .mark_bar()
+            .encode(
+                alt.X("ms:Q", bin=alt.Bin(maxbins=20), title="Duration (ms)"),
+                alt.Y("count():Q", title="Reruns"),
+            )
+            .properties(height=180),
+            width="stretch",
+        )
+        if st.button("Clear profile", key="rerun_profile_clear"):
+            profile.clear()
+            st.rerun()
+
+
+@profiled()
 def render_diagnostics() -> None:
     """Render a bounded benchmark lab that never touches the live configuration."""
     render_section_header(
@@ -34,6 +154,9 @@ def render_diagnostics() -> None:
         title="Run on demand",
         label="Heads-up",
     )
+    _render_solver_load()
+    _render_session_memory()
+    _render_rerun_profile()
 
     if not benchmark_available():
         st.error("OR-Tools is not installed, so benchmark timings would be meaningless.")
@@ -106,6 +229,24 @@ def render_diagnostics() -> None:
     metrics[0].metric("Elapsed", f"{result.elapsed_seconds:.2f}s")
     metrics[1].metric("Target", f"≤ {result.case.target_seconds:g}s")
     metrics[2].metric("Solver status", result.solver_status or "Unknown")
+    rows = result.phase_rows()
+    if rows:
+        size = st.columns(3)
+        size[0].metric("Model variables", f"{result.variables or 0:,}")
+        size[1].metric("Model constraints", f"{result.constraints or 0:,}")
+        size[2].metric(
+            "Objective", "n/a" if result.objective is None else f"{result.objective:g}"
+        )
+        st.dataframe(
+            pd.DataFrame(
+                [
+                    {"Phase": label, "Seconds": round(seconds, 3), "Share": f"{share:.1%}"}
+                    for label, seconds, share in rows
+                ]
+            ),
+            hide_index=True,
+            width="stretch",
+        )
 
 
 __all__ = ["render_diagnostics"]
@@ -0,0 +1,171 @@
+"""Opt-in on-disk store for built export artifacts, shared across sessions.
+
+Off unless the deployment sets ``EXPORT_CACHE_DIR``: by default the app keeps
+no resident data on disk (see *Privacy and persistence* in the README). When
+a deployer opts in, every built download — Excel, PDF, calendar handout,
+calendar ZIP, personal PDFs — is written under that directory, named by a
+content hash of everything that went into it, so an identical request from
+any session (a reopened schedule, a colour toggled back) is served from disk
+instead of being rebuilt.
+
+* Writes are atomic (a private temp file in the same directory, then
+  ``os.replace``), so a reader never sees a half-written artifact.
+* The directory is bounded by ``EXPORT_CACHE_MAX_MB`` (default 512). The
+  bytes it holds are counted in a ``.usage`` file that every writer — the
+  app and each export worker process — updates under an exclusive lock
+  (``.lock``, ``flock``), so the bound holds across processes without
+  scanning the directory on every write. Only when the count goes over the
+  bound is the directory scanned and the least recently used artifacts
+  evicted, down to 90% of it so the next few writes need no scan. Reads
+  refresh an artifact's mtime, which is what "recently used" means. Where
+  ``flock`` is unavailable, every write scans instead.
+* Every failure is a miss: a cache that cannot be read or written never
+  stops a download from being built.
+
+Standard library only; the store is a plain value, so it travels to export
+worker processes with each job.
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Mapping
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not on POSIX
+    fcntl = None  # type: ignore[assignment]
+
+__all__ = ["ExportStore", "store_from_env"]
+
+_DEFAULT_MAX_MB = 512
+_TEMP_PREFIX = ".tmp-"
+# Eviction stops at this fraction of the bound, leaving room for more writes.
+_LOW_WATER = 0.9
+_USAGE_FILE = ".usage"
+_LOCK_FILE = ".lock"
+
+
+@dataclass(frozen=True)
+class ExportStore:
+    """A size-bounded, content-addressed directory of artifact bytes."""
+
+    root: Path
+    max_bytes: int = _DEFAULT_MAX_MB * 1024 * 1024
+
+    def _path(self, key: str) -> Path:
+        # Two-character shards keep any one directory listing short.
+        return self.root / key[:2] / key
+
+    def get(self, key: str) -> bytes | None:
+        """The artifact stored under ``key``, or None on a miss."""
+        path = self._path(key)
+        try:
+            blob = path.read_bytes()
+            os.utime(path)  # mark as recently used
+        except OSError:
+            return None
+        return blob
+
+    @contextmanager
+    def _locked(self) -> Iterator[bool]:
+        """Hold the store's write lock; yields False when there is none to take."""
+        if fcntl is None:
+            yield False
+            return
+        with open(self.root / _LOCK_FILE, "a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield True
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _usage(self) -> int | None:
+        try:
+            return int((self.root / _USAGE_FILE).read_text())
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, blob: bytes) -> bool:
+        """Store ``blob`` under ``key`` atomically, evicting if over the bound.
+
+        Returns False when it could not be written.
+        """
+        path = self._path(key)
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=_TEMP_PREFIX, dir=path.parent)
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(blob)
+                with self._locked() as locked:
+                    try:
+                        replaced = path.stat().st_size
+                    except OSError:
+                        replaced = 0
+                    os.replace(tmp, path)
+                    total = self._usage() if locked else None
+                    if total is None or total + len(blob) - replaced > self.max_bytes:
+                        total = self.evict()
+                    else:
+                        total += len(blob) - replaced
+                    if locked:
+                        _write_usage(self.root, total)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except OSError:
+            return False
+        return True
+
+    def evict(self) -> int:
+        """Scan the store, drop least-recently-used artifacts if over its bound,
+        and return the bytes left. Callers hold the lock."""
+        entries = []
+        total = 0
+        for path in self.root.glob("*/*"):
+            if path.name.startswith(_TEMP_PREFIX):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:  # removed meanwhile
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        if total > self.max_bytes:
+            entries.sort()
+            for _mtime, size, path in entries:
+                if total <= self.max_bytes * _LOW_WATER:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+        return total
+
+
+def _write_usage(root: Path, total: int) -> None:
+    try:
+        fd, tmp = tempfile.mkstemp(prefix=_TEMP_PREFIX, dir=root)
+        with os.fdopen(fd, "w") as handle:
+            handle.write(str(total))
+        os.replace(tmp, root / _USAGE_FILE)
+    except OSError:
+        pass  # the next write finds no count and scans
+
+
+def store_from_env(environ: Mapping[str, str] | None = None) -> ExportStore | None:
+    """The store the deployment configured, or None (the default: no disk cache).
+
+    ``EXPORT_CACHE_DIR`` enables it; ``EXPORT_CACHE_MAX_MB`` bounds its size.
+    """
+    environ = os.environ if environ is None else environ
+    root = environ.get("EXPORT_CACHE_DIR", "").strip()
+    if not root:
+        return None
+    try:
+        max_mb = float(environ.get("EXPORT_CACHE_MAX_MB", _DEFAULT_MAX_MB))
+    except ValueError:
+        max_mb = _DEFAULT_MAX_MB
+    return ExportStore(Path(root).expanduser(), max(0, int(max_mb * 1024 * 1024)))
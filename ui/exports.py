@@ -0,0 +1,509 @@
+"""Background export pipeline: every download pre-rendered off the script thread.
+
+The Excel, PDF, calendar-handout, ICS-zip and personal-PDF downloads used
+to be built on the first visit to the Export tab, one after another, each
+blocking the page while it ran. Now, as soon as a result is stored, all of
+them are submitted together to a process-wide worker pool; the Export tab
+shows each one as "preparing" until its build lands and then offers the
+download, so the wait is roughly the slowest single artifact rather than
+their sum.
+
+An artifact made of many independent parts — the personal PDF pack, one
+document per resident — is split further: a coordinator thread fans its
+parts out to the same pool and assembles the result as they finish,
+reporting progress (:meth:`ExportJobs.progress`) along the way.
+
+Every builder reads one :class:`ExportBundle`: the frames, the stored
+:class:`~model.resolved.ResolvedBlock` (with everything it has already
+resolved), the fairness points, the display-independent report components
+and the colour map are computed once in the session and shipped to the
+workers rather than re-derived per artifact. The session keeps them under
+their own keys (:meth:`ExportJobs.component`), so a recolour recomputes the
+colour map only.
+
+The builders are pure Python, so the pool is a spawn-context process pool
+(one worker per CPU, up to eight) — threads would just take turns on the
+GIL with the page itself. On a single-CPU host, or where worker
+processes cannot be started, it falls back to a thread pool: the page still
+never blocks on a build.
+
+Nothing is written to disk unless the deployment opts in to the shared
+artifact store (:mod:`ui.export_store`); then each build is first looked up
+there by :func:`export_key`, a content hash of what the artifact is built
+from, and stored after building. Artifacts of ``offload_min`` bytes or more
+then stay on disk: the session keeps a :class:`StoredArtifact` handle and
+reads the bytes back only when the download is clicked.
+
+No Streamlit here: :class:`ExportJobs` lives in session state and is only
+ever touched from the script thread (a coordinator only posts progress).
+"""
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import multiprocessing
+import os
+import threading
+from concurrent.futures import (
+    BrokenExecutor,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Dict, List, Mapping, Tuple
+
+from ui.export_store import ExportStore, store_from_env
+
+__all__ = [
+    "EXPORT_KINDS",
+    "BUILDERS",
+    "ExportBundle",
+    "ExportJobs",
+    "StoredArtifact",
+    "build_export",
+    "export_key",
+    "submit_exports",
+]
+
+EXPORT_KINDS = ("excel", "pdf", "cal_handout", "ics_zip", "resident_pdfs")
+
+# Kinds built from many parts: their parts fan out to the pool.
+_FANNED_KINDS = ("resident_pdfs",)
+
+_MAX_PROCESSES = 8
+
+# With a store configured, artifacts this large are left on disk rather than
+# held in session memory.
+_OFFLOAD_MIN_BYTES = 256 * 1024
+
+# Part of every store key: bump whenever a builder's output changes, so
+# artifacts built by older code are never served.
+_STORE_FORMAT = 1
+
+_EXECUTOR: Executor | None = None
+_EXECUTOR_LOCK = threading.Lock()
+# Fanned builds wait on their parts here, never inside the pool they feed.
+_COORDINATOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="export-fanout")
+
+
+def _make_executor(processes: bool = True) -> Executor:
+    workers = min(_MAX_PROCESSES, os.cpu_count() or 1)
+    if processes and workers > 1:
+        try:
+            return ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        except (OSError, NotImplementedError, ImportError):  # no process support here
+            pass
+    return ThreadPoolExecutor(max_workers=len(EXPORT_KINDS), thread_name_prefix="export")
+
+
+def _submit(fn, *args) -> Future:
+    """Submit to the shared export pool, made on first use.
+
+    A pool whose worker processes died (or could never start) is replaced by
+    a thread pool and the submission retried, so exports keep working.
+    """
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = _make_executor()
+        try:
+            return _EXECUTOR.submit(fn, *args)
+        except (BrokenExecutor, OSError, RuntimeError):
+            _EXECUTOR.shutdown(wait=False, cancel_futures=True)
+            _EXECUTOR = _make_executor(processes=False)
+            return _EXECUTOR.submit(fn, *args)
+
+
+class _SharedPool(Executor):
+    """The shared export pool as an ``Executor``, for fanned-out parts."""
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        if kwargs:
+            fn = partial(fn, **kwargs)
+        return _submit(fn, *args)
+
+
+@dataclass(frozen=True, eq=False)
+class ExportBundle:
+    """Everything the export artifacts are built from, shared between them.
+
+    ``final_df`` is the display frame (cosmetic columns, chosen order) and
+    ``df`` the authoritative schedule; ``points`` and ``issues`` are its
+    fairness points and validation issues, resolved once by the session.
+    ``components`` (:class:`~model.exporters.ReportComponents`) and
+    ``cell_colors`` are passed to the report builders when the session has
+    them; otherwise the builders derive them.
+    """
+
+    final_df: object
+    df: object
+    data: object
+    points: Mapping
+    issues: List[str]
+    color_mode: str = "none"
+    palette: Mapping[str, str] | None = None
+    prior_ledger: object = None
+    policy: object = None
+    block: object = None
+    components: object = None
+    cell_colors: Mapping | None = None
+
+
+def _build_excel(bundle: ExportBundle) -> bytes:
+    from model.exporters import schedule_to_excel_bytes
+
+    return schedule_to_excel_bytes(
+        bundle.final_df, bundle.data, points=bundle.points,
+        color_mode=bundle.color_mode, palette=bundle.palette,
+        prior_ledger=bundle.prior_ledger,
+        authoritative_df=bundle.df,
+        validation_issues=bundle.issues,
+        ledger_policy=bundle.policy,
+        block=bundle.block,
+        components=bundle.components,
+        cell_colors=bundle.cell_colors,
+    )
+
+
+def _build_pdf(bundle: ExportBundle) -> bytes:
+    from model.exporters import schedule_to_pdf_bytes
+
+    return schedule_to_pdf_bytes(
+        bundle.final_df, bundle.data, points=bundle.points,
+        color_mode=bundle.color_mode, palette=bundle.palette,
+        prior_ledger=bundle.prior_ledger,
+        authoritative_df=bundle.df,
+        validation_issues=bundle.issues,
+        ledger_policy=bundle.policy,
+        block=bundle.block,
+        components=bundle.components,
+        cell_colors=bundle.cell_colors,
+    )
+
+
+def _build_cal_handout(bundle: ExportBundle) -> bytes:
+    from model.calendar_pdf import calendar_handout_pdf_bytes
+
+    return calendar_handout_pdf_bytes(bundle.df, bundle.data)
+
+
+def _build_ics_zip(bundle: ExportBundle) -> bytes:
+    from model.ics import schedule_calendars_zip
+
+    return schedule_calendars_zip(bundle.df, bundle.data)
+
+
+def _build_resident_pdfs(bundle: ExportBundle, executor=None, progress=None) -> bytes:
+    from model.calendar_pdf import resident_pdfs_zip
+
+    return resident_pdfs_zip(bundle.df, bundle.data, executor=executor, progress=progress)
+
+
+BUILDERS: Dict[str, Callable[..., bytes]] = {
+    "excel": _build_excel,
+    "pdf": _build_pdf,
+    "cal_handout": _build_cal_handout,
+    "ics_zip": _build_ics_zip,
+    "resident_pdfs": _build_resident_pdfs,
+}
+
+
+def _canonical(value):
+    """``value`` as JSON-ready nesting, independent of dict and set order."""
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        value = {f.name: getattr(value, f.name) for f in dataclasses.fields(value)}
+    if isinstance(value, Mapping):
+        items = [[_canonical(k), _canonical(v)] for k, v in value.items()]
+        return sorted(items, key=lambda item: repr(item[0]))
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonical(v) for v in value), key=repr)
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return repr(value)
+
+
+def _frame_payload(frame) -> dict:
+    return {
+        "columns": [str(column) for column in frame.columns],
+        "rows": frame.to_dict("records"),
+        "attrs": dict(getattr(frame, "attrs", {}) or {}),
+    }
+
+
+def export_key(kind: str, bundle: ExportBundle) -> str:
+    """Content hash of everything ``kind`` is built from (its store key).
+
+    The calendar files depend only on the schedule and its config; the
+    reports also on the display frame, colours, ledger and policy. Mappings
+    and sets hash independently of their order; other values by ``repr``.
+    """
+    payload = {
+        "format": _STORE_FORMAT,
+        "kind": kind,
+        "schedule": _frame_payload(bundle.df),
+        "data": bundle.data,
+    }
+    if kind in ("excel", "pdf"):
+        payload.update(
+            display=_frame_payload(bundle.final_df),
+            issues=list(bundle.issues),
+            color_mode=bundle.color_mode,
+            palette=dict(bundle.palette or {}),
+            prior_ledger=bundle.prior_ledger,
+            policy=bundle.policy,
+        )
+    text = json.dumps(_canonical(payload), separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class StoredArtifact:
+    """A built artifact left in the shared store instead of session memory."""
+
+    store: ExportStore
+    key: str
+    size: int
+
+
+def build_export(
+    kind: str,
+    bundle: ExportBundle,
+    store: ExportStore | None = None,
+    *,
+    executor: Executor | None = None,
+    progress: Callable[[int, int], None] | None = None,
+    offload_min: int | None = None,
+) -> bytes | StoredArtifact:
+    """Build one artifact (what the pool's workers run), via ``store`` if given.
+
+    A fanned kind renders its parts on ``executor`` and reports
+    ``progress(done, total)``; other kinds ignore both. With a store and
+    ``offload_min``, an artifact at least that large that is safely on disk
+    comes back as a :class:`StoredArtifact` instead of its bytes.
+    """
+    def build() -> bytes:
+        if kind in _FANNED_KINDS:
+            return BUILDERS[kind](bundle, executor=executor, progress=progress)
+        return BUILDERS[kind](bundle)
+
+    if store is None:
+        return build()
+    key = export_key(kind, bundle)
+    blob = store.get(key)
+    stored = blob is not None
+    if blob is None:
+        blob = build()
+        stored = store.put(key, blob)
+    if stored and offload_min is not None and len(blob) >= offload_min:
+        return StoredArtifact(store, key, len(blob))
+    return blob
+
+
+class ExportJobs:
+    """One session's export builds: a future per artifact kind, tagged by signature.
+
+    Submitting a kind again under the same signature returns the existing
+    future, so every rerun can re-submit freely; a new signature (a new
+    result version, other colours, other columns) supersedes the old build.
+    Builds go through ``store`` — by default the deployment's shared store,
+    if it configured one — and any at least ``offload_min`` bytes are left
+    there (:meth:`download` reads them back on demand).
+
+    A build dropped by :meth:`release_built` stays released under its
+    signature — :meth:`released`, state ``"released"`` — until
+    :meth:`request` asks for it again, so a session short of memory does not
+    rebuild what it just let go on its very next rerun. A requested build is
+    kept until its download has been offered once (:meth:`download`).
+    """
+
+    def __init__(
+        self, store: ExportStore | None = None, offload_min: int = _OFFLOAD_MIN_BYTES
+    ) -> None:
+        self._jobs: Dict[str, Tuple[object, Future]] = {}
+        self._components: Dict[str, Tuple[object, object]] = {}
+        self._progress: Dict[str, Tuple[object, int, int]] = {}
+        # Kept for offloaded builds only: a store miss at download time
+        # (evicted meanwhile) rebuilds from it.
+        self._bundles: Dict[str, ExportBundle] = {}
+        self._released: Dict[str, object] = {}  # kind -> signature it was built under
+        self._pinned: set[str] = set()  # requested, not yet offered: never released
+        # Bumped whenever what the session holds changes (see memory_revision).
+        self._revision = 0
+        self.store = store if store is not None else store_from_env()
+        self.offload_min = offload_min
+
+    def component(self, name: str, key, factory: Callable[[], object]):
+        """The ``name`` export component for ``key``, built by ``factory`` on a miss.
+
+        One entry per name: a new key replaces the old value, so a component
+        is rebuilt only when something it depends on changed.
+        """
+        current = self._components.get(name)
+        if current is None or current[0] != key:
+            current = (key, factory())
+            self._components[name] = current
+            self._revision += 1
+        return current[1]
+
+    def components(self) -> List[object]:
+        """Every cached component value."""
+        return [value for _key, value in self._components.values()]
+
+    def submit(self, kind: str, signature, bundle: ExportBundle) -> Future:
+        current = self._jobs.get(kind)
+        if current is not None and current[0] == signature:
+            return current[1]
+        if current is not None:
+            current[1].cancel()  # only stops a build that has not started yet
+        offload_min = self.offload_min if self.store is not None else None
+        if kind in _FANNED_KINDS:
+            token = object()
+            self._progress[kind] = (token, 0, 0)
+            future = _COORDINATOR.submit(
+                build_export, kind, bundle, self.store,
+                executor=_SharedPool(),
+                progress=partial(self._report, kind, token),
+                offload_min=offload_min,
+            )
+        else:
+            future = _submit(
+                partial(build_export, offload_min=offload_min), kind, bundle, self.store
+            )
+        self._jobs[kind] = (signature, future)
+        self._released.pop(kind, None)
+        self._revision += 1
+        if offload_min is None:
+            self._bundles.pop(kind, None)
+        else:
+            self._bundles[kind] = bundle
+        return future
+
+    def _report(self, kind: str, token, done: int, total: int) -> None:
+        # Called from the coordinator; a superseded build's reports are dropped.
+        if self._progress.get(kind, (None,))[0] is token:
+            self._progress[kind] = (token, done, total)
+
+    def progress(self, kind: str) -> Tuple[int, int] | None:
+        """``(done, total)`` parts of a fanned build, once it has counted them."""
+        current = self._progress.get(kind)
+        if current is None or not current[2]:
+            return None
+        return current[1], current[2]
+
+    def future(self, kind: str, signature=None) -> Future | None:
+        """The build for ``kind`` (only under ``signature`` when one is given)."""
+        current = self._jobs.get(kind)
+        if current is None or (signature is not None and current[0] != signature):
+            return None
+        return current[1]
+
+    def state(self, kind: str) -> str:
+        """``"missing"``, ``"released"``, ``"building"``, ``"ready"`` or ``"failed"``."""
+        future = self.future(kind)
+        if future is None:
+            return "released" if kind in self._released else "missing"
+        if not future.done():
+            return "building"
+        if future.cancelled() or future.exception() is not None:
+            return "failed"
+        return "ready"
+
+    def pending(self) -> bool:
+        """True while any submitted build is still running or queued."""
+        return any(self.state(kind) == "building" for kind in self._jobs)
+
+    def download(self, kind: str) -> bytes | Callable[[], bytes]:
+        """A ready build's data for ``st.download_button``.
+
+        The bytes themselves, or for an offloaded build a callable that reads
+        them from the store when the download is clicked (rebuilding them if
+        the store has evicted them since).
+        """
+        result = self._jobs[kind][1].result()
+        self._pinned.discard(kind)
+        if not isinstance(result, StoredArtifact):
+            return result
+        bundle = self._bundles[kind]
+
+        def read() -> bytes:
+            blob = result.store.get(result.key)
+            if blob is None:
+                blob = build_export(kind, bundle)
+                result.store.put(result.key, blob)
+            return blob
+
+        return read
+
+    def release_built(self) -> int:
+        """Forget every finished build still held in memory; returns its bytes.
+
+        Each is marked released: submitting it again under the same signature
+        waits for :meth:`request` (a new signature builds straight away).
+        Requested builds not yet offered for download are kept.
+        """
+        released = 0
+        for kind in list(self._jobs):
+            if kind in self._pinned:
+                continue
+            signature, future = self._jobs[kind]
+            if not future.done() or future.cancelled() or future.exception() is not None:
+                continue
+            result = future.result()
+            if isinstance(result, bytes):
+                released += len(result)
+                del self._jobs[kind]
+                self._progress.pop(kind, None)
+                self._released[kind] = signature
+        if released:
+            self._revision += 1
+        return released
+
+    def released(self, kind: str, signature) -> bool:
+        """True while ``kind``'s build under ``signature`` is released."""
+        return kind in self._released and self._released[kind] == signature
+
+    def request(self, kind: str | None = None) -> None:
+        """Let a released build (every one, by default) be submitted again,
+        and keep it until its download has been offered."""
+        kinds = EXPORT_KINDS if kind is None else (kind,)
+        for name in kinds:
+            self._released.pop(name, None)
+        self._pinned.update(kinds)
+        self._revision += 1
+
+    def release_components(self) -> None:
+        """Forget every cached component; each is rebuilt on its next use."""
+        if self._components:
+            self._components.clear()
+            self._revision += 1
+
+    def held_bytes(self) -> int:
+        """Bytes of the finished builds held in memory (offloaded ones excluded)."""
+        held = 0
+        for _signature, future in self._jobs.values():
+            if future.done() and not future.cancelled() and future.exception() is None:
+                result = future.result()
+                if isinstance(result, bytes):
+                    held += len(result)
+        return held
+
+    def memory_revision(self) -> Tuple[int, int]:
+        """Changes whenever the builds or components this session holds do."""
+        return self._revision, sum(future.done() for _sig, future in self._jobs.values())
+
+
+def submit_exports(
+    jobs: ExportJobs, bundle: ExportBundle, signatures: Mapping[str, object]
+) -> ExportJobs:
+    """Submit every artifact in ``signatures`` (kind → signature) for ``bundle``."""
+    for kind, signature in signatures.items():
+        jobs.submit(kind, signature, bundle)
+    return jobs
@@ -32,6 +32,7 @@ from model.ledger import (
     rows_to_ledger,
 )
 from ui.charts import standings_chart
+from ui.profiler import profiled
 from ui.state import Keys, flash
 from ui.uploads import consume_upload_once
 
@@ -210,6 +211,7 @@ def _reconcile_section(ledger: dict, roster: list, shift_labels: list) -> None:
             st.rerun()
 
 
+@profiled()
 def render_ledger_panel(roster: list, shift_labels: list | None = None) -> dict | None:
     """Render the ledger uploader + reconcile step + editable grid.
 
@@ -0,0 +1,256 @@
+"""Per-session memory accounting and the session memory budget.
+
+Each session holds its live and pristine schedules, the result's resolved
+configuration, the prior ledger, the export builds and their shared
+components. On a small instance serving several people at once that adds
+up, so:
+
+* :func:`session_footprint` estimates what each session-state key holds.
+  An object reachable from several keys is counted once, under the first in
+  key order, which is how the live and pristine schedules show as shared
+  while they are the same frame.
+* :func:`compact_schedule` stores a schedule's person columns as
+  categoricals (integer codes plus one copy of each name). The pristine
+  solver frame is kept that way once manual edits make the live frame a
+  different one, and expanded again on revert.
+* :func:`enforce_session_budget` runs after each full rerun. It counts only
+  the known heavy entries (:func:`heavy_footprint`): the result frames, the
+  result block's resolved values, the cached export components and the
+  built downloads held in memory. The total is recomputed only when the
+  result version or the export builds change, so a plain rerun pays nothing
+  for it. Over the ``SESSION_MEMORY_MB`` cap (default 256; 0 turns it off)
+  it releases what the session can rebuild, cheapest first: export
+  components, the block's resolved maps, then built downloads. Released
+  downloads are rebuilt only when the Export tab is opened or one is asked
+  for (:meth:`~ui.exports.ExportJobs.request`). The schedules, the
+  configuration and the ledger are never released.
+
+Downloads of 256 KB or more never count against the cap when the deployer
+opted in to the shared artifact store: they stay on disk
+(:class:`~ui.exports.StoredArtifact`).
+"""
+from __future__ import annotations
+
+import io
+import os
+import sys
+import threading
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import Future
+from types import FunctionType, MethodType, ModuleType
+from typing import Any, NamedTuple
+
+import pandas as pd
+
+from ui.profiler import profiled
+
+__all__ = [
+    "KeyFootprint",
+    "budget_from_env",
+    "compact_schedule",
+    "enforce_session_budget",
+    "expand_schedule",
+    "heavy_footprint",
+    "session_footprint",
+]
+
+_DEFAULT_BUDGET_MB = 256
+_MAX_DEPTH = 8
+_FIXED_COLUMNS = ("Date", "Day")
+_OPAQUE = (type, ModuleType, FunctionType, MethodType, type(threading.Lock()))
+# A ResolvedBlock's own configuration: kept by ``forget``, so not its weight.
+_BLOCK_CONFIG = ("data", "ledger", "label_carryover")
+
+
+def budget_from_env(environ: Mapping[str, str] | None = None) -> int:
+    """The per-session cap in bytes from ``SESSION_MEMORY_MB``, or 0 for none."""
+    environ = os.environ if environ is None else environ
+    try:
+        budget_mb = float(environ.get("SESSION_MEMORY_MB", _DEFAULT_BUDGET_MB))
+    except ValueError:
+        budget_mb = _DEFAULT_BUDGET_MB
+    return max(0, int(budget_mb * 1024 * 1024))
+
+
+def _sizeof(value: Any, seen: set[int], depth: int = 0) -> int:
+    """Approximate bytes reachable from ``value`` that are not in ``seen``."""
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    if isinstance(value, (bytes, bytearray)):
+        return sys.getsizeof(value)
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return sys.getsizeof(value)
+    if isinstance(value, io.BytesIO):  # uploaded files
+        return value.getbuffer().nbytes
+    if isinstance(value, _OPAQUE) or depth >= _MAX_DEPTH:
+        return sys.getsizeof(value)
+    usage = getattr(value, "memory_usage", None)
+    if callable(usage) and hasattr(value, "columns"):
+        try:
+            frame = int(usage(index=True, deep=True).sum())
+        except (TypeError, ValueError):  # pragma: no cover - stub frames
+            frame = sys.getsizeof(value)
+        return frame + _sizeof(getattr(value, "attrs", None), seen, depth + 1)
+    if isinstance(value, Future):
+        if value.done() and not value.cancelled() and value.exception() is None:
+            return sys.getsizeof(value) + _sizeof(value.result(), seen, depth + 1)
+        return sys.getsizeof(value)
+    size = sys.getsizeof(value)
+    if isinstance(value, Mapping):
+        for key, item in value.items():
+            size += _sizeof(key, seen, depth + 1) + _sizeof(item, seen, depth + 1)
+    elif isinstance(value, (list, tuple, set, frozenset, deque)):
+        for item in value:
+            size += _sizeof(item, seen, depth + 1)
+    elif hasattr(value, "__dict__"):
+        size += _sizeof(vars(value), seen, depth + 1)
+    return size
+
+
+class KeyFootprint(NamedTuple):
+    """What one session-state key holds, beyond what earlier keys already did."""
+
+    key: str
+    bytes: int
+    shared_with: str | None = None  # the key already holding this very object
+
+
+def session_footprint(state: Mapping[str, Any]) -> list[KeyFootprint]:
+    """Estimated size of every key in ``state``, largest first."""
+    seen: set[int] = set()
+    owners: dict[int, str] = {}
+    rows = []
+    for key in sorted(state.keys()):
+        value = state[key]
+        if value is None or isinstance(value, (bool, int, float)):
+            continue
+        # Equal strings are often one interned object: not worth calling shared.
+        shared_with = key if isinstance(value, str) else owners.setdefault(id(value), key)
+        rows.append(KeyFootprint(
+            key, _sizeof(value, seen), shared_with if shared_with != key else None
+        ))
+    rows.sort(key=lambda row: (-row.bytes, row.key))
+    return rows
+
+
+def compact_schedule(df):
+    """``df`` with its person columns as categoricals (a copy, same ``attrs``)."""
+    columns = [
+        column for column in df.columns
+        if column not in _FIXED_COLUMNS
+        and not isinstance(df[column].dtype, pd.CategoricalDtype)
+        and (pd.api.types.is_object_dtype(df[column]) or pd.api.types.is_string_dtype(df[column]))
+    ]
+    if not columns:
+        return df
+    compact = df.copy()
+    for column in columns:
+        compact[column] = compact[column].astype("category")
+    compact.attrs = dict(df.attrs)
+    return compact
+
+
+def expand_schedule(df):
+    """Undo :func:`compact_schedule`: the columns' original dtypes again."""
+    columns = [
+        column for column in df.columns if isinstance(df[column].dtype, pd.CategoricalDtype)
+    ]
+    if not columns:
+        return df
+    expanded = df.copy()
+    for column in columns:
+        expanded[column] = expanded[column].astype(expanded[column].cat.categories.dtype)
+    expanded.attrs = dict(df.attrs)
+    return expanded
+
+
+def heavy_footprint(state: Mapping[str, Any]) -> dict[str, int]:
+    """Bytes of the entries the budget can weigh, by what would release them.
+
+    ``"schedules"`` (the live and pristine frames, counted once when shared)
+    is never released; ``"export components"``, ``"resolved result maps"``
+    and ``"built downloads"`` are, in that order.
+    """
+    from ui.state import Keys  # local: ui.state imports this module
+
+    seen: set[int] = set()
+    frames = 0
+    for key in (Keys.RESULT_DF, Keys.SOLVER_DF):
+        frame = state.get(key)
+        if frame is not None:
+            frames += _sizeof(frame, seen)
+    block = state.get(Keys.RESULT_BLOCK)
+    resolved = 0
+    if block is not None:
+        resolved = sum(
+            _sizeof(value, seen)
+            for name, value in vars(block).items() if name not in _BLOCK_CONFIG
+        )
+    jobs = state.get(Keys.EXPORT_CACHE)
+    components = built = 0
+    if jobs is not None:
+        components = sum(_sizeof(value, seen) for value in jobs.components())
+        built = jobs.held_bytes()
+    return {
+        "schedules": frames,
+        "export components": components,
+        "resolved result maps": resolved,
+        "built downloads": built,
+    }
+
+
+def _revision(state: Mapping[str, Any]) -> tuple:
+    from ui.state import Keys
+
+    jobs = state.get(Keys.EXPORT_CACHE)
+    return (
+        state.get(Keys.RESULT_VERSION),
+        id(state.get(Keys.RESULT_BLOCK)),
+        jobs.memory_revision() if jobs is not None else None,
+    )
+
+
+@profiled()
+def enforce_session_budget(state=None, budget: int | None = None) -> list[str]:
+    """Release regenerable artifacts until the session fits ``budget``.
+
+    ``state`` defaults to ``st.session_state`` and ``budget`` to
+    :func:`budget_from_env`. The weighed total is kept in state and reused
+    while nothing it counts has changed. Returns what was released, in order.
+    """
+    from ui.state import Keys  # local: ui.state imports this module
+
+    if state is None:
+        import streamlit as st
+
+        state = st.session_state
+    budget = budget_from_env() if budget is None else budget
+    if not budget:
+        return []
+    cached = state.get(Keys.MEMORY_TOTAL)
+    if cached is not None and cached[0] == (_revision(state), budget):
+        return []  # weighed (and released, if it had to) since the last change
+    parts = heavy_footprint(state)
+    total = sum(parts.values())
+    released = []
+    if total > budget:
+        jobs = state.get(Keys.EXPORT_CACHE)
+        block = state.get(Keys.RESULT_BLOCK)
+        steps = [
+            ("export components", jobs.release_components if jobs is not None else None),
+            ("resolved result maps", block.forget if block is not None else None),
+            ("built downloads", jobs.release_built if jobs is not None else None),
+        ]
+        for label, release in steps:
+            if release is None:
+                continue
+            release()
+            released.append(label)
+            total -= parts[label]
+            if total <= budget:
+                break
+        state[Keys.MEMORY_RELEASED] = released
+    state[Keys.MEMORY_TOTAL] = ((_revision(state), budget), total)
+    return released
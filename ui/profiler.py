@@ -0,0 +1,175 @@
+"""Opt-in per-section timing of Streamlit reruns.
+
+Off unless the deployment sets ``RERUN_PROFILE`` (any of ``1``/``true``/
+``yes``/``on``). Sections are declared with :func:`profiled`, which decides
+once, at import time, whether to wrap: with profiling off it returns the
+function itself, so the app runs exactly the code it would without the
+decorator.
+
+With profiling on, every call to a profiled function is timed. Nested
+sections are timed inclusively (``render_application`` covers everything
+under it), and a section called several times in one rerun counts once, with
+the total. When the outermost profiled call of a run returns — a full rerun,
+or a fragment refreshing on its own — each section's total is appended to
+that session's :class:`RerunProfile`, which keeps the last
+``RERUN_PROFILE_RERUNS`` (default 50) samples per section. Calls made off the
+script thread (export workers, solver threads) are not recorded.
+"""
+from __future__ import annotations
+
+import functools
+import os
+import threading
+import time
+from collections import deque
+from statistics import median
+from typing import Any, Callable, Mapping, NamedTuple, TypeVar
+
+__all__ = [
+    "RerunProfile",
+    "SectionStats",
+    "current_profile",
+    "profiled",
+    "profiling_enabled",
+    "window_from_env",
+]
+
+_DEFAULT_RERUNS = 50
+_TRUTHY = {"1", "true", "yes", "on"}
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def window_from_env(environ: Mapping[str, str] | None = None) -> int:
+    """Reruns kept per section, or 0 when profiling is off (the default).
+
+    ``RERUN_PROFILE`` enables it; ``RERUN_PROFILE_RERUNS`` sets the window.
+    """
+    environ = os.environ if environ is None else environ
+    if environ.get("RERUN_PROFILE", "").strip().lower() not in _TRUTHY:
+        return 0
+    try:
+        window = int(environ.get("RERUN_PROFILE_RERUNS", _DEFAULT_RERUNS))
+    except ValueError:
+        window = _DEFAULT_RERUNS
+    return max(1, window)
+
+
+_WINDOW = window_from_env()
+
+
+class SectionStats(NamedTuple):
+    """Summary of one section's recent samples, in seconds."""
+
+    section: str
+    samples: int
+    last: float
+    median: float
+    p90: float
+    max: float
+
+
+class RerunProfile:
+    """Rolling per-section durations for one session."""
+
+    def __init__(self, window: int = _DEFAULT_RERUNS) -> None:
+        self.window = window
+        self.sections: dict[str, deque[float]] = {}
+        self.runs = 0
+
+    def record(self, timings: Mapping[str, float]) -> None:
+        """Add one run's per-section totals."""
+        self.runs += 1
+        for section, seconds in timings.items():
+            samples = self.sections.get(section)
+            if samples is None:
+                samples = self.sections[section] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def samples(self, section: str) -> list[float]:
+        return list(self.sections.get(section, ()))
+
+    def stats(self) -> list[SectionStats]:
+        """One row per section, slowest median first."""
+        rows = []
+        for section, samples in self.sections.items():
+            ordered = sorted(samples)
+            rows.append(SectionStats(
+                section,
+                len(ordered),
+                samples[-1],
+                median(ordered),
+                ordered[min(len(ordered) - 1, int(0.9 * len(ordered)))],
+                ordered[-1],
+            ))
+        rows.sort(key=lambda row: (-row.median, row.section))
+        return rows
+
+    def clear(self) -> None:
+        self.sections.clear()
+        self.runs = 0
+
+
+def profiling_enabled() -> bool:
+    return _WINDOW > 0
+
+
+def current_profile() -> RerunProfile | None:
+    """This session's profile, or None off the script thread or when disabled."""
+    if not _WINDOW:
+        return None
+    import streamlit as st
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    from ui.state import Keys
+
+    if get_script_run_ctx(suppress_warning=True) is None:
+        return None
+    profile = st.session_state.get(Keys.RERUN_PROFILE)
+    if profile is None:
+        profile = st.session_state[Keys.RERUN_PROFILE] = RerunProfile(_WINDOW)
+    return profile
+
+
+# Per thread: the timings of the run in progress and how deep we are in it.
+_active = threading.local()
+
+
+def _timed(section: str, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+    timings = getattr(_active, "timings", None)
+    outermost = timings is None
+    if outermost:
+        timings = _active.timings = {}
+    started = time.perf_counter()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        timings[section] = timings.get(section, 0.0) + time.perf_counter() - started
+        if outermost:
+            _active.timings = None
+            try:
+                profile = current_profile()
+            except Exception:  # pragma: no cover - never let timing break a page
+                profile = None
+            if profile is not None:
+                profile.record(timings)
+
+
+def profiled(section: str | None = None) -> Callable[[F], F]:
+    """Time calls to the decorated function as ``section`` (default: its name).
+
+    A no-op unless profiling was enabled when this module was imported.
+    """
+
+    def decorate(fn: F) -> F:
+        if not _WINDOW:
+            return fn
+        name = section or fn.__name__
+
+        @functools.wraps(fn)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            return _timed(name, fn, args, kwargs)
+
+        return timed  # type: ignore[return-value]
+
+    return decorate
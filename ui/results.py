@@ -8,9 +8,7 @@ from model.coloring import COLOR_MODES, DEFAULT_PALETTE, schedule_cell_colors, t
 from model.exporters import (
     build_assignment_frame,
     build_cumulative_frame,
-    build_fairness_frame,
-    schedule_to_excel_bytes,
-    schedule_to_pdf_bytes,
+    report_components,
     spreadsheet_safe_frame,
 )
 from model.fairness import (
@@ -34,18 +32,25 @@ from ui.charts import (
     workload_chart,
 )
 from ui.editors import custom_columns_editor
+from ui.exports import EXPORT_KINDS, ExportBundle, ExportJobs, submit_exports
+from ui.profiler import profiled
 from ui.state import Keys, apply_manual_edits, normalize_edited_schedule, revert_manual_edits
 from ui.theme import render_card, render_section_header, render_status
 
+# Timed where the UI calls it; the model layer carries no UI hooks.
+validate_schedule = profiled("validate_schedule")(validate_schedule)
 
-def style_schedule(df, data, color_mode, palette=None):
+
+def style_schedule(df, data, color_mode, palette=None, color_map=None):
     """Return a Styler shading the grid by ``color_mode`` (unfilled always flagged).
 
     Uses the same ``schedule_cell_colors`` map the Excel/PDF exports use, so the
-    on-screen view and the downloads agree cell-for-cell. ``palette`` recolours
-    the named roles. Cosmetic custom columns are simply left unshaded.
+    on-screen view and the downloads agree cell-for-cell; pass ``color_map``
+    when it is already built. ``palette`` recolours the named roles. Cosmetic
+    custom columns are simply left unshaded.
     """
-    color_map = schedule_cell_colors(df, data, color_mode, palette)
+    if color_map is None:
+        color_map = schedule_cell_colors(df, data, color_mode, palette)
     columns = list(df.columns)
     records = df.to_dict("records")
 
@@ -110,21 +115,216 @@ def reconcile_column_order(all_cols) -> None:
     st.session_state[Keys.COL_ORDER] = order
 
 
-def cached_export(kind, signature, builder):
-    """Memoise an expensive export so a download click doesn't rebuild it.
+# Seconds between readiness checks while background export builds run.
+_EXPORT_POLL_SECONDS = 1.0
+
+# Per artifact: the name its messages use and the optional package it needs.
+_EXPORT_LABELS = {
+    "excel": ("Excel export", "openpyxl"),
+    "pdf": ("PDF export", "reportlab"),
+    "cal_handout": ("Handout PDF", "reportlab"),
+    "ics_zip": ("Calendar ZIP", None),
+    "resident_pdfs": ("Personal PDFs", "reportlab"),
+}
+
+
+def _export_signatures(final_df, color_mode, palette, policy) -> dict:
+    """Per-artifact build signatures: a build is reused while its signature holds.
+
+    The reports follow the result version, colours, columns, ledger policy and
+    custom-column values; the calendar files only follow the result itself.
+    """
+    version = st.session_state[Keys.RESULT_VERSION]
+    report_sig = (
+        version,
+        color_mode,
+        tuple(sorted(palette.items())),
+        tuple(final_df.columns),
+        policy.no_refund_penalties,
+        policy.no_catchup_excused,
+        tuple(
+            (name, tuple(sorted(vals.items())))
+            for name, vals in sorted(st.session_state[Keys.EXTRA_VALS].items())
+        ),
+    )
+    return {
+        "excel": report_sig,
+        "pdf": report_sig,
+        "cal_handout": (version,),
+        "ics_zip": (version,),
+        "resident_pdfs": (version,),
+    }
+
+
+def _report_components(df, data, points, policy):
+    """This result's display-independent report parts (fairness, per-call, policy).
+
+    Kept until the result or the ledger policy changes, and shared by the
+    Fairness and Audit workspaces and both report exports.
+    """
+    jobs = st.session_state[Keys.EXPORT_CACHE]
+    return jobs.component(
+        "report",
+        (st.session_state[Keys.RESULT_VERSION], policy),
+        lambda: report_components(
+            df, data, points, st.session_state.get(Keys.RESULT_PRIOR_LEDGER),
+            ledger_policy=policy, block=_result_block(),
+        ),
+    )
+
+
+def _result_component(name: str, build):
+    """A result-derived value kept until the result version changes, so a
+    rerun that only touches one workspace reuses the others' inputs."""
+    jobs = st.session_state[Keys.EXPORT_CACHE]
+    return jobs.component(name, (st.session_state[Keys.RESULT_VERSION],), build)
+
+
+def _cell_colors(df, data, color_mode, palette):
+    """The result's cell colour map for these colours (None when uncoloured).
+
+    Kept per (result, mode, palette): the only report part a recolour changes.
+    """
+    if not color_mode or color_mode == "none":
+        return None
+    jobs = st.session_state[Keys.EXPORT_CACHE]
+    return jobs.component(
+        "colors",
+        (
+            st.session_state[Keys.RESULT_VERSION],
+            color_mode,
+            tuple(sorted((palette or {}).items())),
+        ),
+        lambda: schedule_cell_colors(df, data, color_mode, palette, block=_result_block()),
+    )
+
+
+def _display_order(all_cols) -> list:
+    """The column order the Schedule workspace will show, without touching state.
+
+    Mirrors ``reconcile_column_order`` (unknown columns are appended) so the
+    exports started straight after a solve match what the page later asks for.
+    """
+    known = st.session_state[Keys.KNOWN_COLS]
+    order = [c for c in st.session_state[Keys.COL_ORDER] if c in all_cols]
+    order += [c for c in all_cols if c not in known and c not in order]
+    return order or list(all_cols)
+
+
+def _display_settings(df) -> tuple:
+    """``(final_df, color_mode, palette)`` as the Schedule workspace shows them,
+    read from session state so the Export workspace needs no Schedule render."""
+    color_mode = COLOR_MODES.get(
+        st.session_state.get(Keys.COLOR_MODE), next(iter(COLOR_MODES.values()))
+    )
+    all_cols = list(df.columns) + list(st.session_state[Keys.EXTRA_COLS])
+    final_df = final_schedule_df(
+        df, st.session_state[Keys.EXTRA_COLS], st.session_state[Keys.EXTRA_VALS],
+        _display_order(all_cols),
+    )
+    return final_df, color_mode, st.session_state[Keys.PALETTE]
 
-    Every Streamlit download click is a full rerun; regenerating the Excel/PDF
-    (seconds on a large roster) each time blanks the results while it runs — the
-    "download makes the schedule disappear" bug. Caching by ``signature`` (result
-    version + colours + columns) keeps downloads instant and the view stable.
+
+def prerender_exports(final_df=None, color_mode=None, palette=None, points=None) -> ExportJobs:
+    """Start building every download of the stored result in the background.
+
+    ``set_result`` calls this with nothing: the display options then come
+    from session state, as the Schedule workspace will read them. The Export
+    tab calls it again with what it actually rendered, which resubmits only
+    the artifacts whose signature changed. A build the session budget
+    released is left alone until it is requested again (the Export tab
+    opening, or its Prepare button). Returns the session's
+    :class:`~ui.exports.ExportJobs`.
     """
-    cache = st.session_state[Keys.EXPORT_CACHE]
-    if cache.get("signature") != signature:
-        cache.clear()
-        cache["signature"] = signature
-    if kind not in cache:
-        cache[kind] = builder()
-    return cache[kind]
+    jobs = st.session_state[Keys.EXPORT_CACHE]
+    df = st.session_state[Keys.RESULT_DF]
+    if df is None:
+        return jobs
+    data = st.session_state[Keys.RESULT_DATA]
+    if final_df is None or color_mode is None or palette is None:
+        shown_df, shown_mode, shown_palette = _display_settings(df)
+        final_df = shown_df if final_df is None else final_df
+        color_mode = shown_mode if color_mode is None else color_mode
+        palette = shown_palette if palette is None else palette
+    policy = _current_ledger_policy()
+    signatures = {
+        kind: signature
+        for kind, signature in _export_signatures(final_df, color_mode, palette, policy).items()
+        if jobs.future(kind, signature) is None and not jobs.released(kind, signature)
+    }
+    if not signatures:
+        return jobs
+    if points is None:
+        points = _result_component("points", lambda: calculate_points(df, data))
+    components = _report_components(df, data, points, policy)
+    bundle = ExportBundle(
+        final_df, df, data,
+        points=points,
+        issues=components.issues,
+        color_mode=color_mode,
+        palette=dict(palette),
+        prior_ledger=st.session_state.get(Keys.RESULT_PRIOR_LEDGER),
+        policy=policy,
+        block=_result_block(),
+        components=components,
+        cell_colors=_cell_colors(df, data, color_mode, palette),
+    )
+    return submit_exports(jobs, bundle, signatures)
+
+
+def _export_download(container, jobs: ExportJobs, kind: str, label: str, **kwargs) -> None:
+    """``kind``'s download button once built; until then a disabled placeholder."""
+    name, needs = _EXPORT_LABELS[kind]
+    state = jobs.state(kind)
+    if state == "ready":
+        container.download_button(label, jobs.download(kind), **kwargs)
+    elif state == "released":
+        container.button(
+            f"Prepare {name}",
+            key=f"export_prepare_{kind}",
+            help="Released to keep this session within its memory cap; builds it again.",
+            on_click=jobs.request,
+            args=(kind,),
+            width=kwargs.get("width", "content"),
+        )
+    elif state == "failed":
+        future = jobs.future(kind)
+        exc = None if future.cancelled() else future.exception()
+        if needs and isinstance(exc, ImportError):  # pragma: no cover - optional dep
+            container.info(f"{name} needs {needs}: {exc}")
+        else:
+            container.error(f"{name} failed: {exc}")
+    else:
+        container.button(
+            f"⏳ {label} — preparing…",
+            key=f"export_wait_{kind}",
+            disabled=True,
+            width=kwargs.get("width", "content"),
+        )
+
+
+def _export_progress(jobs: ExportJobs) -> None:
+    """Per-artifact readiness while builds run; one full rerun once they settle.
+
+    Runs as a fragment polling every ``_EXPORT_POLL_SECONDS``: only this line
+    redraws while waiting, and the single rerun at the end swaps every
+    placeholder for its download button.
+    """
+    if not jobs.pending():
+        st.rerun()
+    marks = {"ready": "✅", "failed": "⚠️", "released": "⏸️"}
+
+    def mark(kind):
+        state = jobs.state(kind)
+        counted = jobs.progress(kind) if state == "building" else None
+        if counted:
+            return f"⏳ {counted[0]}/{counted[1]}"
+        return marks.get(state, "⏳")
+
+    st.caption(
+        "Preparing downloads in the background — "
+        + " · ".join(f"{_EXPORT_LABELS[kind][0]} {mark(kind)}" for kind in EXPORT_KINDS)
+    )
 
 
 def _reset_palette() -> None:
@@ -184,12 +384,15 @@ def _render_customisation(df) -> tuple:
             "Colour cells by",
             list(COLOR_MODES),
             index=0,
+            key=Keys.COLOR_MODE,
+            persist_state="page",
             help="Shade the grid; the same colours flow into the Excel and PDF downloads.",
         )
         tc = st.columns([2, 2, 4], vertical_alignment="bottom")
         with tc[0]:
             st.color_picker(
                 "Theme colour", DEFAULT_PALETTE["points"], key="pal_theme",
+                persist_state="page",
                 help="Pick one colour and apply — the role shades below are "
                 "derived from it automatically (unfilled stays the warning red).",
             )
@@ -211,6 +414,7 @@ def _render_customisation(df) -> tuple:
                 lbl,
                 st.session_state[Keys.PALETTE].get(key, DEFAULT_PALETTE[key]),
                 key=f"{Keys.PAL_PREFIX}{key}",
+                persist_state="page",
             )
         # on_click runs before the next script pass, so the pickers genuinely
         # re-initialise from the defaults (a same-run pop left them stale).
@@ -220,12 +424,18 @@ def _render_customisation(df) -> tuple:
     return COLOR_MODES[color_label], st.session_state[Keys.PALETTE]
 
 
+def _result_block():
+    """The stored result's :class:`~model.resolved.ResolvedBlock` (or None)."""
+    return st.session_state.get(Keys.RESULT_BLOCK)
+
+
 def _ledger_policy_notes(policy, prior_ledger, data) -> list:
     """Human-readable summary of the adjustments baked into the saved ledger."""
     if not (policy.no_refund_penalties or policy.no_catchup_excused):
         return []
     notes = []
-    for person, adj in sorted(block_adjustments(prior_ledger, data).items()):
+    adjustments = block_adjustments(prior_ledger, data, block=_result_block())
+    for person, adj in sorted(adjustments.items()):
         if policy.no_refund_penalties and adj["penalty"]:
             notes.append(f"{person} +{adj['penalty']:g} penalty not carried")
         if policy.no_catchup_excused and abs(adj["excused_total"]) > 1e-9:
@@ -241,22 +451,15 @@ def _current_ledger_policy() -> LedgerPolicy:
     )
 
 
+@profiled()
 def _render_downloads(final_df, df, data, points, color_mode, palette, prior_ledger) -> None:
     st.subheader("Downloads")
-    log_text = format_fairness_log(df, data, points=points)
+    block = _result_block()
+    log_text = format_fairness_log(df, data, points=points, block=block)
     policy = _current_ledger_policy()
-    export_sig = (
-        st.session_state[Keys.RESULT_VERSION],
-        color_mode,
-        tuple(sorted(palette.items())),
-        tuple(final_df.columns),
-        policy.no_refund_penalties,
-        policy.no_catchup_excused,
-        tuple(
-            (name, tuple(sorted(vals.items())))
-            for name, vals in sorted(st.session_state[Keys.EXTRA_VALS].items())
-        ),
-    )
+    jobs = prerender_exports(final_df, color_mode, palette, points)
+    if jobs.pending():
+        st.fragment(_export_progress, run_every=_EXPORT_POLL_SECONDS)(jobs)
     dcols = st.columns(3)
     dcols[0].download_button(
         "Download CSV (schedule)",
@@ -265,48 +468,18 @@ def _render_downloads(final_df, df, data, points, color_mode, palette, prior_led
         mime="text/csv",
         width="stretch",
     )
-    try:
-        excel_bytes = cached_export(
-            "excel", export_sig,
-            lambda: schedule_to_excel_bytes(
-                final_df, data, points=points, color_mode=color_mode, palette=palette,
-                prior_ledger=prior_ledger,
-                authoritative_df=df,
-                ledger_policy=policy,
-            ),
-        )
-        dcols[1].download_button(
-            "Download Excel (schedule + fairness)",
-            excel_bytes,
-            file_name="schedule.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            width="stretch",
-        )
-    except ImportError as exc:  # pragma: no cover - openpyxl not installed
-        dcols[1].info(f"Excel export needs openpyxl: {exc}")
-    except Exception as exc:
-        dcols[1].error(f"Excel export failed: {exc}")
-    try:
-        pdf_bytes = cached_export(
-            "pdf", export_sig,
-            lambda: schedule_to_pdf_bytes(
-                final_df, data, points=points, color_mode=color_mode, palette=palette,
-                prior_ledger=prior_ledger,
-                authoritative_df=df,
-                ledger_policy=policy,
-            ),
-        )
-        dcols[2].download_button(
-            "Download PDF (schedule + fairness)",
-            pdf_bytes,
-            file_name="schedule.pdf",
-            mime="application/pdf",
-            width="stretch",
-        )
-    except ImportError as exc:  # pragma: no cover - reportlab not installed
-        dcols[2].info(f"PDF export needs reportlab: {exc}")
-    except Exception as exc:
-        dcols[2].error(f"PDF export failed: {exc}")
+    _export_download(
+        dcols[1], jobs, "excel", "Download Excel (schedule + fairness)",
+        file_name="schedule.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        width="stretch",
+    )
+    _export_download(
+        dcols[2], jobs, "pdf", "Download PDF (schedule + fairness)",
+        file_name="schedule.pdf",
+        mime="application/pdf",
+        width="stretch",
+    )
     dcols2 = st.columns(2)
     dcols2[0].download_button(
         "Download Fairness Log",
@@ -316,7 +489,7 @@ def _render_downloads(final_df, df, data, points, color_mode, palette, prior_led
     )
     dcols2[1].download_button(
         "Download updated ledger (for next block)",
-        ledger_to_json(update_ledger(prior_ledger, df, data, policy=policy)),
+        ledger_to_json(update_ledger(prior_ledger, df, data, policy=policy, block=block)),
         file_name=f"fairness_ledger_through_{data.end_date.isoformat()}.json",
         mime="application/json",
         width="stretch",
@@ -332,10 +505,10 @@ def _render_downloads(final_df, df, data, points, color_mode, palette, prior_led
     if st.checkbox("Show Fairness Log"):
         st.text(log_text)
     st.divider()
-    _render_resident_calendars(df, data)
+    _render_resident_calendars(df, data, jobs)
 
 
-def _render_resident_calendars(df, data) -> None:
+def _render_resident_calendars(df, data, jobs: ExportJobs) -> None:
     """Per-resident calendar delivery: pick a name → put the on-calls on a phone.
 
     Every path here is chosen to survive hostile hosting: the personal .ics is
@@ -344,13 +517,11 @@ def _render_resident_calendars(df, data) -> None:
     plain Google Calendar URLs, and the handout PDF carries those same links so
     it stays useful after being forwarded around.
     """
-    from model.calendar_pdf import calendar_handout_pdf_bytes
     from model.ics import (
         google_calendar_url,
         ics_data_uri,
         resident_events,
         resident_ics,
-        schedule_calendars_zip,
     )
 
     st.subheader("Resident calendars")
@@ -358,52 +529,48 @@ def _render_resident_calendars(df, data) -> None:
         "Two ways to hand the rota to people. The **PDF** is the one file to "
         "post in a group chat — tapping a date adds that shift on any phone. "
         "The **ZIP** holds one calendar file per resident: whoever opens their "
-        "own file gets every shift added at once."
+        "own file gets every shift added at once. **Personal PDFs** are the "
+        "same per-resident split as printable pages."
     )
     ccols = st.columns(2)
-    try:
-        handout = cached_export(
-            "cal_handout", (st.session_state[Keys.RESULT_VERSION],),
-            lambda: calendar_handout_pdf_bytes(df, data),
-        )
-        ccols[0].download_button(
-            "📄 Calendar handout (PDF — send to the group)",
-            handout,
-            file_name=f"on_call_handout_{data.end_date.isoformat()}.pdf",
-            mime="application/pdf",
-            width="stretch",
-            type="primary",
-            help="Two compact columns, the whole department on a page or two. "
-            "Every date is a tappable link that adds that one shift — it keeps "
-            "working wherever the PDF is forwarded, with no connection back to "
-            "this app.",
-        )
-    except ImportError as exc:  # pragma: no cover - reportlab not installed
-        ccols[0].info(f"Handout PDF needs reportlab: {exc}")
-    except Exception as exc:  # noqa: BLE001 - never block the rest of the tab
-        ccols[0].error(f"Handout PDF failed: {exc}")
-    try:
-        ics_zip = cached_export(
-            "ics_zip", (st.session_state[Keys.RESULT_VERSION],),
-            lambda: schedule_calendars_zip(df, data),
-        )
-        ccols[1].download_button(
-            "🗂️ All calendar files (ZIP — one per resident)",
-            ics_zip,
-            file_name=f"on_call_calendars_{data.end_date.isoformat()}.zip",
-            mime="application/zip",
-            width="stretch",
-            help="Send each person their own .ics: they tap it once and the "
-            "phone offers to add every one of their shifts together.",
-        )
-    except Exception as exc:  # noqa: BLE001
-        ccols[1].error(f"Calendar ZIP failed: {exc}")
+    _export_download(
+        ccols[0], jobs, "cal_handout",
+        "📄 Calendar handout (PDF — send to the group)",
+        file_name=f"on_call_handout_{data.end_date.isoformat()}.pdf",
+        mime="application/pdf",
+        width="stretch",
+        type="primary",
+        help="Two compact columns, the whole department on a page or two. "
+        "Every date is a tappable link that adds that one shift — it keeps "
+        "working wherever the PDF is forwarded, with no connection back to "
+        "this app.",
+    )
+    _export_download(
+        ccols[1], jobs, "ics_zip",
+        "🗂️ All calendar files (ZIP — one per resident)",
+        file_name=f"on_call_calendars_{data.end_date.isoformat()}.zip",
+        mime="application/zip",
+        width="stretch",
+        help="Send each person their own .ics: they tap it once and the "
+        "phone offers to add every one of their shifts together.",
+    )
+    _export_download(
+        st, jobs, "resident_pdfs",
+        "👤 Personal PDFs (ZIP — one page per resident)",
+        file_name=f"personal_calendars_{data.end_date.isoformat()}.zip",
+        mime="application/zip",
+        width="stretch",
+        help="One single-page PDF per resident with only their own shifts, "
+        "each date a tappable “add to calendar” link — for sending people "
+        "their schedule privately.",
+    )
 
     roster = list(data.juniors) + list(data.seniors)
     person = st.selectbox(
         "Or add one resident's on-calls to this device now",
         roster,
         key="resident_cal_pick",
+        persist_state="page",
         help="Hand the phone over (or share your screen): pick the name, tap "
         "the calendar link, done.",
     )
@@ -413,7 +580,7 @@ def _render_resident_calendars(df, data) -> None:
         return
     # The whole .ics rides inside this link (data: URI): tapping it opens the
     # phone's calendar import — no server round-trip that could have expired.
-    href = ics_data_uri(resident_ics(df, data, person))
+    href = ics_data_uri(resident_ics(df, data, person, events=events))
     filename = f"{person}_on_calls.ics".replace(" ", "_")
     st.markdown(
         f'<a href="{href}" download="{filename}" '
@@ -475,7 +642,8 @@ def _render_manual_edit(df, result_data) -> None:
             "Set a regular cell to **Unfilled** for a coverage gap. Configured "
             "closures and night-float overlay cells are protected because they "
             "define demand before optimisation; change those policies and "
-            "regenerate instead."
+            "regenerate instead. Apply before leaving this workspace: unapplied "
+            "changes are not kept."
         )
         # Dropdown cells restricted to role/NF-eligible residents stop typos at
         # the source; constraint issues (min-gap etc.) are still surfaced below.
@@ -493,7 +661,7 @@ def _render_manual_edit(df, result_data) -> None:
             column_config=column_config,
         )
         preview = normalize_edited_schedule(edited, df)
-        issues = validate_schedule(preview, result_data)
+        issues = validate_schedule(preview, result_data, block=_result_block())
         if issues:
             st.error(f"{len(issues)} constraint issue(s):")
             for issue in issues:
@@ -532,14 +700,15 @@ def _render_rationale(df, result_data) -> None:
         labels = [s.label for s in result_data.shifts]
         dates = [row.get("Date") for row in df.to_dict("records")]
         if labels and dates:
-            why_date = st.selectbox("Date", dates, key="why_date")
-            why_label = st.selectbox("Shift", labels, key="why_label")
+            why_date = st.selectbox("Date", dates, key="why_date", persist_state="page")
+            why_label = st.selectbox("Shift", labels, key="why_label", persist_state="page")
             for line in assignment_rationale(df, result_data, why_date, why_label):
                 st.write(f"- {line}")
         else:
             st.caption("Generate a schedule with at least one shift to use this.")
 
 
+@profiled()
 def _render_overview(df, data, points, quality) -> None:
     """Render solver health, schedule quality, and preference outcomes."""
     render_section_header(
@@ -556,7 +725,7 @@ def _render_overview(df, data, points, quality) -> None:
             "reflect your edits, not the raw solver output. Use 'Revert to "
             "solver result' in the manual-edit panel to undo."
         )
-        edit_issues = validate_schedule(df, data)
+        edit_issues = validate_schedule(df, data, block=_result_block())
         if edit_issues:
             st.error(
                 f"The edited schedule violates {len(edit_issues)} constraint(s); "
@@ -575,7 +744,7 @@ def _render_overview(df, data, points, quality) -> None:
         f"({quality['balance_weekend']:.0%})"
     )
     if quality["score"] < 90:
-        reasons = quality_diagnosis(df, data, quality)
+        reasons = quality_diagnosis(df, data, quality, block=_result_block())
         if reasons:
             with st.expander("Why isn't the quality higher?", expanded=True):
                 for reason in reasons:
@@ -591,7 +760,8 @@ def _render_overview(df, data, points, quality) -> None:
         )
 
 
-def _render_schedule_workspace(df, data) -> tuple:
+@profiled()
+def _render_schedule_workspace(df, data) -> None:
     """Render the schedule grid, cosmetic controls, and manual-edit workflow."""
     render_section_header(
         "Schedule workspace",
@@ -609,6 +779,7 @@ def _render_schedule_workspace(df, data) -> tuple:
         "The schedule columns always stay visible; only custom columns can be hidden.",
         all_cols,
         key=Keys.COL_ORDER,
+        persist_state="page",
     )
     order = chosen or all_cols
     final_df = final_schedule_df(
@@ -617,7 +788,11 @@ def _render_schedule_workspace(df, data) -> tuple:
 
     try:
         st.dataframe(
-            style_schedule(final_df, data, color_mode, palette), width="stretch"
+            style_schedule(
+                final_df, data, color_mode, palette,
+                color_map=_cell_colors(df, data, color_mode, palette),
+            ),
+            width="stretch",
         )
     except Exception:
         # Colouring must never take down the results; fall back to plain.
@@ -625,7 +800,6 @@ def _render_schedule_workspace(df, data) -> tuple:
         st.dataframe(final_df, width="stretch")
 
     _render_manual_edit(df, data)
-    return final_df, color_mode, palette
 
 
 def _chart_density() -> str:
@@ -664,7 +838,8 @@ def _render_role_fairness(
     )
     if prior_ledger:
         cum_frame = build_cumulative_frame(
-            role_points, prior_ledger, data, ledger_policy=ledger_policy
+            role_points, prior_ledger, data, ledger_policy=ledger_policy,
+            block=_result_block(),
         )
         if len(cum_frame):
             st.altair_chart(
@@ -672,6 +847,7 @@ def _render_role_fairness(
             )
 
 
+@profiled()
 def _render_fairness_workspace(df, data, points, prior_ledger) -> None:
     """Render per-role workload ranges, detail tables, charts, and downloads."""
     render_section_header(
@@ -690,9 +866,7 @@ def _render_fairness_workspace(df, data, points, prior_ledger) -> None:
         return
 
     ledger_policy = _current_ledger_policy()
-    fair_frame = build_fairness_frame(
-        points, data, df, prior_ledger, ledger_policy=ledger_policy
-    )
+    fair_frame = _report_components(df, data, points, ledger_policy).fairness
     if not len(fair_frame):
         return
     st.caption(
@@ -708,6 +882,7 @@ def _render_fairness_workspace(df, data, points, prior_ledger) -> None:
         "Chart layout",
         list(DENSITY_LABELS),
         key=Keys.CHART_DENSITY,
+        persist_state="page",
         horizontal=True,
         help="Compact keeps every resident and every name — it just tightens "
         "the rows and splits a long roster into two side-by-side columns, "
@@ -765,6 +940,7 @@ def _render_fairness_workspace(df, data, points, prior_ledger) -> None:
         )
 
 
+@profiled()
 def _render_audit_workspace(df, data) -> None:
     """Render assignment-level evidence and the rationale explorer."""
     render_section_header(
@@ -778,7 +954,11 @@ def _render_audit_workspace(df, data) -> None:
             "Every (date, shift) slot with who took it and what it was worth — "
             "download and archive it for future reference."
         )
-        call_frame = build_assignment_frame(df, data)
+        call_frame = _report_components(
+            df, data, None, _current_ledger_policy()
+        ).assignments
+        if call_frame is None:
+            call_frame = build_assignment_frame(df, data)
         st.dataframe(call_frame, width="stretch")
         st.download_button(
             "Download per-call CSV",
@@ -789,12 +969,22 @@ def _render_audit_workspace(df, data) -> None:
     _render_rationale(df, data)
 
 
+def _workspace_changed() -> None:
+    """Opening the Export tab asks again for every download the budget released."""
+    if st.session_state.get(Keys.RESULTS_WORKSPACE) == "Export":
+        st.session_state[Keys.EXPORT_CACHE].request()
+
+
+@profiled()
 def render_results() -> None:
-    """Render the persistent result as five eager, task-focused workspaces.
+    """Render the persistent result as five lazy, task-focused workspaces.
 
     Results come from ``session_state`` so they survive cosmetic reruns without
-    re-solving. Streamlit tabs are intentionally eager: every existing widget
-    remains mounted and every export is prepared from the same display frame.
+    re-solving. Only the open workspace runs: the tabs track the selection and
+    rerun on a switch, so a palette tweak on Schedule never rebuilds the
+    Fairness charts. Result-derived inputs are kept per result version, and
+    the Export workspace reads the display options from session state rather
+    than from a Schedule render.
     """
     render_section_header(
         "Results studio",
@@ -828,25 +1018,36 @@ def render_results() -> None:
             "results still reflect the saved solve; generate again before "
             "publishing or carrying its ledger forward."
         )
-    points = calculate_points(df, data)
-    quality = schedule_quality(df, data, points=points)
+    points = _result_component("points", lambda: calculate_points(df, data))
 
     overview_tab, schedule_tab, fairness_tab, audit_tab, export_tab = st.tabs(
-        ["Overview", "Schedule", "Fairness", "Audit trail", "Export"]
-    )
-    with overview_tab:
-        _render_overview(df, data, points, quality)
-    with schedule_tab:
-        final_df, color_mode, palette = _render_schedule_workspace(df, data)
-    with fairness_tab:
-        _render_fairness_workspace(df, data, points, prior_ledger)
-    with audit_tab:
-        _render_audit_workspace(df, data)
-    with export_tab:
-        render_section_header(
-            "Publish and carry forward",
-            "Download the schedule, its evidence, and the ledger needed to keep future blocks fair.",
-            eyebrow="Export",
-            level=3,
-        )
-        _render_downloads(final_df, df, data, points, color_mode, palette, prior_ledger)
+        ["Overview", "Schedule", "Fairness", "Audit trail", "Export"],
+        key=Keys.RESULTS_WORKSPACE,
+        on_change=_workspace_changed,
+    )
+    if overview_tab.open:
+        with overview_tab:
+            quality = _result_component(
+                "quality", lambda: schedule_quality(df, data, points=points)
+            )
+            _render_overview(df, data, points, quality)
+    if schedule_tab.open:
+        with schedule_tab:
+            _render_schedule_workspace(df, data)
+    if fairness_tab.open:
+        with fairness_tab:
+            _render_fairness_workspace(df, data, points, prior_ledger)
+    if audit_tab.open:
+        with audit_tab:
+            _render_audit_workspace(df, data)
+    if export_tab.open:
+        with export_tab:
+            render_section_header(
+                "Publish and carry forward",
+                "Download the schedule, its evidence, and the ledger needed to keep future "
+                "blocks fair.",
+                eyebrow="Export",
+                level=3,
+            )
+            final_df, color_mode, palette = _display_settings(df)
+            _render_downloads(final_df, df, data, points, color_mode, palette, prior_ledger)
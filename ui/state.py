@@ -1,13 +1,21 @@
 """Session-state management: key registry, defaults, and result lifecycle."""
 from __future__ import annotations
 
+from collections import OrderedDict
+import dataclasses
 from datetime import date, timedelta
 import hashlib
 import json
+import secrets
+import threading
 
 import streamlit as st
 
 from model.coloring import DEFAULT_PALETTE
+from model.data_models import InputData, content_key
+from ui.exports import ExportJobs
+from ui.memory import compact_schedule, expand_schedule
+from ui.profiler import profiled
 
 
 class Keys:
@@ -69,6 +77,7 @@ class Keys:
     CONTINUE_SOLVE = "continue_solve_secs"  # queued warm-start "keep optimising" seconds
     SOLVE_JOB = "solve_job"  # in-flight chunked solve state (survives reruns)
     SOLVE_SUMMARY = "solve_summary"  # outcome of the last completed solve (persisted note)
+    SOLVE_FAILURE = "solve_failure"  # error of the last failed solve, with its retry offer
     # Queued cross-tab updates, applied at the top of the NEXT run before any
     # widget renders (Streamlit forbids writing a keyed widget's state after
     # the widget was instantiated in the same run).
@@ -76,11 +85,13 @@ class Keys:
     PENDING_STATE = "pending_widget_state"  # {session key: value} e.g. min_gap write-back
     NORMALIZE_NAMES = "normalize_names"
     BENCHMARK_RESULT = "benchmark_result"
+    SESSION_ID = "session_id"        # this session's turn key in the solve queue
 
     # Result state
     RESULT_DF = "result_df"          # the live schedule (may carry manual edits)
     SOLVER_DF = "solver_df"          # pristine solver output (for revert)
     RESULT_DATA = "result_data"
+    RESULT_BLOCK = "result_block"    # ResolvedBlock of RESULT_DATA + prior ledger
     RESULT_PRIOR_LEDGER = "result_prior_ledger"
     RESULT_VERSION = "result_version"
     RESULT_CONFIG_FINGERPRINT = "result_config_fingerprint"
@@ -94,10 +105,15 @@ class Keys:
     PALETTE = "palette"
     COL_ORDER = "col_order"
     KNOWN_COLS = "known_cols"
-    EXPORT_CACHE = "export_cache"
+    EXPORT_CACHE = "export_cache"     # ExportJobs: background download builds
+    COLOR_MODE = "color_mode"         # "Colour cells by" label (exports read it too)
     PAL_PREFIX = "pal_"
     FLASH = "flash_message"
+    RESULTS_WORKSPACE = "results_workspace"   # the open Results tab (lazy tabs)
     CHART_DENSITY = "chart_density"   # fairness chart layout (comfortable/compact)
+    RERUN_PROFILE = "rerun_profile"   # RerunProfile, when RERUN_PROFILE is set
+    MEMORY_RELEASED = "memory_released"  # what the session budget last released
+    MEMORY_TOTAL = "memory_total"     # ((revision, cap), bytes) the budget last weighed
 
 
 def _default_chart_density() -> str:
@@ -161,11 +177,16 @@ def _defaults() -> dict:
         Keys.CONTINUE_SOLVE: None,
         Keys.SOLVE_JOB: None,
         Keys.SOLVE_SUMMARY: None,
+        Keys.SOLVE_FAILURE: None,
         Keys.NORMALIZE_NAMES: False,
         Keys.BENCHMARK_RESULT: None,
+        Keys.RERUN_PROFILE: None,
+        Keys.MEMORY_RELEASED: None,
+        Keys.MEMORY_TOTAL: None,
         Keys.RESULT_DF: None,
         Keys.SOLVER_DF: None,
         Keys.RESULT_DATA: None,
+        Keys.RESULT_BLOCK: None,
         Keys.RESULT_PRIOR_LEDGER: None,
         Keys.RESULT_VERSION: 0,
         Keys.RESULT_CONFIG_FINGERPRINT: None,
@@ -176,9 +197,10 @@ def _defaults() -> dict:
         Keys.PALETTE: dict(DEFAULT_PALETTE),
         Keys.COL_ORDER: [],
         Keys.KNOWN_COLS: [],
-        Keys.EXPORT_CACHE: {},
+        Keys.EXPORT_CACHE: ExportJobs(),
         Keys.CHART_DENSITY: _default_chart_density(),
         Keys.DEMO_LOADED: False,
+        Keys.SESSION_ID: secrets.token_hex(8),
     }
 
 
@@ -194,26 +216,73 @@ def bump_result_version() -> None:
     st.session_state[Keys.RESULT_VERSION] += 1
 
 
+# Digests of configuration sections, keyed by each section's raw contents
+# (see ``content_key``), so a rerun re-hashes only the sections that changed.
+_SECTION_DIGESTS: "OrderedDict[tuple, str]" = OrderedDict()
+_SECTION_DIGESTS_MAX = 256
+_SECTION_DIGESTS_LOCK = threading.Lock()
+
+# The saved sections: every InputData field but the solver-derived targets.
+_CONFIG_SECTIONS = tuple(
+    f.name for f in dataclasses.fields(InputData) if not f.name.startswith("target_")
+)
+# Sections whose saved form also reads other fields.
+_SECTION_INPUTS = {"nf_assignments": ("nf_assignments", "nf_rest_days")}
+
+def _json_digest(value) -> str:
+    payload = json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _section_digests(keys: dict, build) -> dict:
+    """Digest per section name; ``build(missing)`` gives the misses' JSON values."""
+    with _SECTION_DIGESTS_LOCK:
+        digests = {}
+        for name, key in keys.items():
+            digest = _SECTION_DIGESTS.get(key)
+            if digest is not None:
+                _SECTION_DIGESTS.move_to_end(key)
+                digests[name] = digest
+    missing = [name for name in keys if name not in digests]
+    if missing:
+        values = build(missing)
+        fresh = {keys[name]: _json_digest(values[name]) for name in missing}
+        with _SECTION_DIGESTS_LOCK:
+            _SECTION_DIGESTS.update(fresh)
+            while len(_SECTION_DIGESTS) > _SECTION_DIGESTS_MAX:
+                _SECTION_DIGESTS.popitem(last=False)
+        digests.update(zip(missing, fresh.values()))
+    return digests
+
+
+@profiled()
 def config_fingerprint(data, prior_ledger=None, *, label_carryover: bool = True) -> str:
     """Return a stable fingerprint of the solver-relevant configuration.
 
-    Solver-derived targets are excluded by ``input_data_to_json``. The digest
-    covers inputs, prior ledger contents, and label-carryover policy, but does
-    not change when a result adds resolved targets to its ``InputData``.
+    Two fingerprints match exactly when the saved configurations
+    (``input_data_payload``, so solver-derived targets are excluded), prior
+    ledgers and label-carryover policies do. Each section is hashed on its own
+    and its digest remembered against its raw contents, so an unchanged
+    section is looked up rather than re-serialised on every rerun.
     """
-    from model.config_io import input_data_to_json
-
-    from model.ledger import ledger_to_json
+    from model.config_io import input_data_payload
 
-    parsed = {
-        "config": json.loads(input_data_to_json(data)),
-        "prior_ledger": (
-            json.loads(ledger_to_json(prior_ledger)) if prior_ledger else None
-        ),
-        "label_carryover": bool(label_carryover),
+    keys = {
+        name: (name,) + tuple(
+            content_key(getattr(data, field)) for field in _SECTION_INPUTS.get(name, (name,))
+        )
+        for name in _CONFIG_SECTIONS
     }
-    payload = json.dumps(parsed, sort_keys=True, separators=(",", ":")).encode("utf-8")
-    return hashlib.sha256(payload).hexdigest()
+    keys["prior_ledger"] = ("prior_ledger", content_key(prior_ledger or None))
+
+    def build(missing):
+        values = {"prior_ledger": prior_ledger or None}
+        if missing != ["prior_ledger"]:
+            values.update(input_data_payload(data))
+        return values
+
+    digests = _section_digests(keys, build)
+    return _json_digest([sorted(digests.items()), bool(label_carryover)])
 
 
 def flash(message: str) -> None:
@@ -239,19 +308,34 @@ def show_flash() -> None:
         st.success(message)
 
 
-def set_result(df, data, prior_ledger) -> None:
-    """Store a fresh solver result and reset the manual-edit state."""
+def set_result(df, data, prior_ledger, block=None) -> None:
+    """Store a fresh solver result and reset the manual-edit state.
+
+    ``block`` is the solve's :class:`~model.resolved.ResolvedBlock`; the
+    Results page and every export reuse it instead of re-deriving the
+    night-float overlay, closures, weights and caps on each rerun. The
+    downloads start building in the background straight away.
+    """
+    from model.resolved import resolve_block
+
+    label_carryover = st.session_state.get(Keys.LEDGER_LABEL_CARRYOVER, True)
+    if block is None or block.data is not data:
+        block = resolve_block(data, prior_ledger, label_carryover=label_carryover)
     st.session_state[Keys.RESULT_DF] = df
     st.session_state[Keys.SOLVER_DF] = df
     st.session_state[Keys.RESULT_DATA] = data
+    st.session_state[Keys.RESULT_BLOCK] = block
     st.session_state[Keys.RESULT_PRIOR_LEDGER] = prior_ledger
     st.session_state[Keys.RESULT_CONFIG_FINGERPRINT] = config_fingerprint(
         data,
         prior_ledger,
-        label_carryover=st.session_state.get(Keys.LEDGER_LABEL_CARRYOVER, True),
+        label_carryover=label_carryover,
     )
     st.session_state[Keys.MANUALLY_EDITED] = False
     bump_result_version()
+    from ui.results import prerender_exports  # local: results imports this module
+
+    prerender_exports()
 
 
 def with_attrs(new_df, source_df):
@@ -354,21 +438,31 @@ def apply_manual_edits(edited) -> None:
     cleaned = normalize_edited_schedule(edited, base)
     from model.validation import validate_schedule
 
-    issues = validate_schedule(cleaned, st.session_state[Keys.RESULT_DATA])
+    issues = validate_schedule(
+        cleaned,
+        st.session_state[Keys.RESULT_DATA],
+        block=st.session_state.get(Keys.RESULT_BLOCK),
+    )
     if issues:
         raise ValueError(
             "Manual edits violate schedule constraints: " + "; ".join(issues)
         )
     cleaned.attrs["manually_edited"] = True
     st.session_state[Keys.RESULT_DF] = cleaned
+    solver_df = st.session_state.get(Keys.SOLVER_DF)
+    if solver_df is not None:
+        # Only revert reads the pristine frame now: keep it compact.
+        st.session_state[Keys.SOLVER_DF] = compact_schedule(solver_df)
     st.session_state[Keys.MANUALLY_EDITED] = True
     bump_result_version()  # invalidates the cached Excel/PDF exports
     st.session_state.pop(Keys.SCHEDULE_EDITOR, None)
 
 
 def revert_manual_edits() -> None:
-    """Restore the pristine solver result."""
-    st.session_state[Keys.RESULT_DF] = st.session_state[Keys.SOLVER_DF]
+    """Restore the pristine solver result (one frame shared by both keys)."""
+    restored = expand_schedule(st.session_state[Keys.SOLVER_DF])
+    st.session_state[Keys.RESULT_DF] = restored
+    st.session_state[Keys.SOLVER_DF] = restored
     st.session_state[Keys.MANUALLY_EDITED] = False
     bump_result_version()
     st.session_state.pop(Keys.SCHEDULE_EDITOR, None)